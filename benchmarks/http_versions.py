@@ -0,0 +1,77 @@
+"""
+Compare HTTP/1.1 and HTTP/2 on the same high fan-out `get_offers` workload.
+
+The benchmark runs against the API configured through the usual SDK settings
+(API_BASE_URL, REFRESH_TOKEN, .env or config.yaml) and always uses the httpx backend.
+HTTP/2 requires the `h2` package (`pip install 'httpx[http2]'`); without it the
+HTTP/2 run silently falls back to HTTP/1.1 and both rows measure the same thing.
+
+Usage:
+    python benchmarks/http_versions.py PRODUCT_ID [--requests 2000] [--concurrency 500] [--max-connections 10]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from uuid import UUID
+
+from sdk import OffersClient
+from sdk.config.pool_config import PoolConfig
+
+
+async def run_workload(
+    product_id: UUID,
+    *,
+    http2: bool,
+    total_requests: int,
+    concurrency: int,
+    max_connections: int,
+) -> dict[str, float]:
+    pool_config: PoolConfig = PoolConfig(max_connections=max_connections, http2=http2)
+    latencies: list[float] = []
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(concurrency)
+
+    async with OffersClient(backend_name="httpx", cache_ttl_seconds=0, pool_config=pool_config) as client:
+        # Warm up the token and the first connection outside of the measurement
+        await client.offers.get_offers(product_id, force_refresh=True)
+
+        async def one_request() -> None:
+            async with semaphore:
+                started_at: float = time.perf_counter()
+                await client.offers.get_offers(product_id, force_refresh=True)
+                latencies.append(time.perf_counter() - started_at)
+
+        started_at: float = time.perf_counter()
+        await asyncio.gather(*(one_request() for _ in range(total_requests)))
+        elapsed: float = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        "throughput_rps": total_requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("product_id", type=UUID)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--max-connections", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'protocol':<10}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for protocol, http2 in (("HTTP/1.1", False), ("HTTP/2", True)):
+        result = await run_workload(
+            args.product_id,
+            http2=http2,
+            total_requests=args.requests,
+            concurrency=args.concurrency,
+            max_connections=args.max_connections,
+        )
+        print(f"{protocol:<10}{result['throughput_rps']:>10.1f}{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,23 +1,42 @@
-from typing import Any
+import logging
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator
 
 from sdk.api.constatns import HTTPMethod
+from sdk.http.deadline import deadline, enforce_deadline
 from sdk.http.interfaces import BaseResponse, HTTPBackend
-from sdk.utils.logger import logger
+from sdk.http.response import StreamingResponse
+from sdk.utils.logger import logger, payload_sampled, redact_params
+from sdk.plugins.chain import MiddlewareChain, RouteStages
 from sdk.plugins.interfaces import RequestPlugin, ResponsePlugin
-from sdk.utils.exceptions import OffersAPIError, PluginError, RequestExecutionError
+from sdk.utils.exceptions import OffersAPIError, RequestExecutionError
 from sdk.http.utils import raise_for_status_with_text
 
+_EMPTY_CHAIN: MiddlewareChain = MiddlewareChain()
+
 
 class BaseAPI:
     def __init__(
         self,
         http_backend: HTTPBackend,
-        base_url: str
+        base_url: str,
+        *,
+        deadline_seconds: float | None = None,
     ) -> None:
         self._http_backend: HTTPBackend = http_backend
         self._base_url: str = base_url
-        self._request_plugins: list[RequestPlugin] = []
-        self._response_plugins: list[ResponsePlugin] = []
+        # Plugins and hooks draw from the same deadline as the request they prepare or inspect
+        self._deadline_seconds: float | None = deadline_seconds
+        self._middleware: MiddlewareChain = _EMPTY_CHAIN
+
+    def set_middleware(self, middleware: MiddlewareChain) -> None:
+        """
+        Set the compiled plugins and request hooks that every request of the API runs through.
+
+        Args:
+            middleware (MiddlewareChain): The chain, usually shared by all APIs of a client.
+        """
+        self._middleware = middleware
 
     def set_plugins(self, request_plugins: list[RequestPlugin], response_plugins: list[ResponsePlugin]) -> None:
         """
@@ -27,13 +46,14 @@ class BaseAPI:
             request_plugins (list[RequestPlugin]): Plugins to process requests.
             response_plugins (list[ResponsePlugin]): Plugins to process responses.
         """
-        self._request_plugins = request_plugins
-        self._response_plugins = response_plugins
+        self.set_middleware(MiddlewareChain(request_plugins, response_plugins))
 
     async def _request(
         self,
         http_method: HTTPMethod,
         endpoint_path: str,
+        *,
+        endpoint_template: str | None = None,
         **request_params: Any,
     ) -> BaseResponse:
         """
@@ -42,6 +62,8 @@ class BaseAPI:
         Args:
             http_method (HTTPMethod): The HTTP method to use (e.g., GET, POST).
             endpoint_path (str): The endpoint path to append to the base URL.
+            endpoint_template (str | None): The path before its parameters were filled in, which
+                identifies the endpoint for rate limiting. Defaults to `endpoint_path`.
             **request_params (Any): Additional parameters for the HTTP request.
 
         Returns:
@@ -49,34 +71,109 @@ class BaseAPI:
 
         Raises:
             PluginError: If a plugin fails during request or response processing.
+            DeadlineExceededError: If the deadline passes before the response plugins have run.
             OffersAPIError: If the API response indicates an error.
         """
         full_url: str = f"{self._base_url}{endpoint_path}"
-        logger.debug(f"[{self.__class__.__name__}] {http_method} {full_url} | {request_params=}")
-
-        # Process request plugins
-        for request_plugin in self._request_plugins:
-            try:
-                await request_plugin.process_request(http_method, full_url, request_params)
-            except Exception as plugin_error:
-                raise PluginError(f"Request plugin {request_plugin.__class__.__name__} failed: {str(plugin_error)}")
+        route: str = endpoint_template or endpoint_path
+        self._log_request(http_method, full_url, request_params)
 
+        stages: RouteStages = self._middleware.stages(http_method, route)
         try:
-            response: BaseResponse = await self._http_backend.request(http_method, full_url, **request_params)
+            with deadline(self._deadline_seconds):
+                await self._process_request_stages(stages, http_method, full_url, request_params)
+                response: BaseResponse = await self._http_backend.request(
+                    http_method, full_url, endpoint=route, **request_params
+                )
+                await self._process_response_stages(stages, response)
         except RequestExecutionError as execution_error:
             raise execution_error
 
-        # Process response plugins
-        for response_plugin in self._response_plugins:
-            try:
-                await response_plugin.process_response(response)
-            except Exception as plugin_error:
-                raise PluginError(f"Response plugin {response_plugin.__class__.__name__} failed: {str(plugin_error)}")
+        self._raise_for_status(http_method, full_url, response)
+        return response
 
+    @asynccontextmanager
+    async def _stream(
+        self,
+        http_method: HTTPMethod,
+        endpoint_path: str,
+        *,
+        endpoint_template: str | None = None,
+        **request_params: Any,
+    ) -> AsyncIterator[StreamingResponse]:
+        """
+        Perform an HTTP request whose response body is read incrementally.
+
+        Error responses are read in full before plugins and error handling see them,
+        so they behave as in `_request`. Successful responses reach the response
+        plugins with their body unread.
+
+        Args:
+            http_method (HTTPMethod): The HTTP method to use (e.g., GET, POST).
+            endpoint_path (str): The endpoint path to append to the base URL.
+            endpoint_template (str | None): The path before its parameters were filled in, which
+                identifies the endpoint for rate limiting. Defaults to `endpoint_path`.
+            **request_params (Any): Additional parameters for the HTTP request.
+
+        Yields:
+            StreamingResponse: The successful response, with its body not yet read.
+
+        Raises:
+            PluginError: If a plugin fails during request or response processing.
+            OffersAPIError: If the API response indicates an error.
+        """
+        full_url: str = f"{self._base_url}{endpoint_path}"
+        route: str = endpoint_template or endpoint_path
+        self._log_request(http_method, full_url, request_params, stream=True)
+
+        stages: RouteStages = self._middleware.stages(http_method, route)
+        async with AsyncExitStack() as stream_stack:
+            # Like the backend's own deadline, it covers opening the stream, not reading a successful body
+            with deadline(self._deadline_seconds):
+                await self._process_request_stages(stages, http_method, full_url, request_params)
+                response: StreamingResponse = await stream_stack.enter_async_context(
+                    self._http_backend.stream(http_method, full_url, endpoint=route, **request_params)
+                )
+                if not 200 <= response.status_code < 400:
+                    async with enforce_deadline("response"):
+                        await response.aread()
+                await self._process_response_stages(stages, response)
+            self._raise_for_status(http_method, full_url, response)
+            yield response
+
+    def _log_request(
+        self, http_method: str, full_url: str, request_params: dict[str, Any], *, stream: bool = False
+    ) -> None:
+        """
+        Log a request at DEBUG level, with its parameters only if its payload is sampled.
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        request_kind: str = "stream " if stream else ""
+        if payload_sampled():
+            logger.debug("[%s] %s%s %s | request_params=%r", self.__class__.__name__, request_kind,
+                         http_method, full_url, redact_params(request_params))
+        else:
+            logger.debug("[%s] %s%s %s", self.__class__.__name__, request_kind, http_method, full_url)
+
+    @staticmethod
+    async def _process_request_stages(
+        stages: RouteStages, http_method: str, full_url: str, request_params: dict[str, Any]
+    ) -> None:
+        if stages.request_stages:
+            async with enforce_deadline("request hooks"):
+                await stages.process_request(http_method, full_url, request_params)
+
+    @staticmethod
+    async def _process_response_stages(stages: RouteStages, response: BaseResponse | StreamingResponse) -> None:
+        if stages.response_plugins:
+            async with enforce_deadline("response plugins"):
+                await stages.process_response(response)
+
+    @staticmethod
+    def _raise_for_status(http_method: str, full_url: str, response: BaseResponse | StreamingResponse) -> None:
         try:
             raise_for_status_with_text(response)
         except OffersAPIError as api_error:
-            logger.warning(f"API error on {http_method} {full_url}: {api_error}")
+            logger.warning("API error on %s %s: %s", http_method, full_url, api_error)
             raise
-
-        return response
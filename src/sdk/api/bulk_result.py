@@ -0,0 +1,193 @@
+from array import array
+from enum import IntEnum
+from typing import Any, Iterator
+
+from pydantic import ValidationError
+
+from sdk.utils.exceptions import (
+    AuthenticationError,
+    AuthRequestError,
+    ConflictError,
+    NotFoundError,
+    OffersAPIError,
+    PluginError,
+    RateLimitError,
+    RequestExecutionError,
+    ServerError,
+    TimeoutError,
+)
+
+
+class ItemCategory(IntEnum):
+    """
+    Outcome category of a single item in a bulk operation.
+
+    The first three categories mean the item is done; all others are failures.
+    """
+    OK = 0
+    ALREADY_REGISTERED = 1
+    SKIPPED = 2
+    VALIDATION = 3
+    AUTHENTICATION = 4
+    NOT_FOUND = 5
+    CONFLICT = 6
+    RATE_LIMIT = 7
+    TIMEOUT = 8
+    SERVER = 9
+    CLIENT = 10
+    NETWORK = 11
+    PLUGIN = 12
+    UNEXPECTED = 13
+
+
+DONE_CATEGORIES = frozenset({ItemCategory.OK, ItemCategory.ALREADY_REGISTERED, ItemCategory.SKIPPED})
+
+# Checked in order, so subclasses must come before their base classes
+_EXCEPTION_CATEGORIES: tuple[tuple[type[BaseException], ItemCategory], ...] = (
+    (ValidationError, ItemCategory.VALIDATION),
+    (AuthenticationError, ItemCategory.AUTHENTICATION),
+    (AuthRequestError, ItemCategory.AUTHENTICATION),
+    (NotFoundError, ItemCategory.NOT_FOUND),
+    (ConflictError, ItemCategory.CONFLICT),
+    (RateLimitError, ItemCategory.RATE_LIMIT),
+    (TimeoutError, ItemCategory.TIMEOUT),
+    (ServerError, ItemCategory.SERVER),
+    (RequestExecutionError, ItemCategory.NETWORK),
+    (PluginError, ItemCategory.PLUGIN),
+    (OffersAPIError, ItemCategory.CLIENT),
+)
+
+
+def categorize_exception(error: BaseException) -> tuple[int, ItemCategory]:
+    """
+    Map an exception raised for a bulk item to its HTTP status code and category.
+
+    Args:
+        error (BaseException): The exception raised while processing the item.
+
+    Returns:
+        tuple[int, ItemCategory]: The HTTP status code (0 if none was received) and the category.
+    """
+    status_code: int = getattr(error, "status_code", None) or 0
+    for exception_type, category in _EXCEPTION_CATEGORIES:
+        if isinstance(error, exception_type):
+            return status_code, category
+    return status_code, ItemCategory.UNEXPECTED
+
+
+class BulkResult:
+    """
+    Compact, index-aligned outcome of a bulk operation.
+
+    Status codes and categories are stored in typed arrays with one small integer
+    per input item instead of one exception object per failure. Position `i` of the
+    result always describes position `i` of the input list.
+
+    Examples:
+        >>> result = await client.products.register_products(products)
+        >>> if not result.all_ok:
+        >>>     result = await client.products.register_products(result.failed())
+    """
+
+    def __init__(self, inputs: list[Any]) -> None:
+        """
+        Create a result where every item is still marked as unexpected failure.
+
+        Args:
+            inputs (list[Any]): The input items of the bulk operation.
+        """
+        self._inputs: list[Any] = inputs
+        self._payloads: list[Any | None] = [None] * len(inputs)
+        self.status_codes: array = array("H", bytes(2 * len(inputs)))
+        self.categories: array = array("B", [ItemCategory.UNEXPECTED]) * len(inputs)
+
+    def __len__(self) -> int:
+        return len(self._inputs)
+
+    def __repr__(self) -> str:
+        return f"BulkResult(total={len(self)}, failed={len(self.failed_indices())})"
+
+    def set_success(
+        self,
+        index: int,
+        payload: Any,
+        *,
+        status_code: int = 200,
+        category: ItemCategory = ItemCategory.OK,
+    ) -> None:
+        """
+        Record a completed item.
+
+        Args:
+            index (int): Input position of the item.
+            payload (Any): The data returned for the item.
+            status_code (int): HTTP status code of the item, 0 if no request was sent.
+            category (ItemCategory): One of the done categories.
+        """
+        self._payloads[index] = payload
+        self.status_codes[index] = status_code
+        self.categories[index] = category
+
+    def set_failure(self, index: int, error: BaseException) -> None:
+        """
+        Record a failed item from the exception that made it fail.
+
+        Args:
+            index (int): Input position of the item.
+            error (BaseException): The exception raised for the item.
+        """
+        status_code, category = categorize_exception(error)
+        self._payloads[index] = None
+        self.status_codes[index] = status_code
+        self.categories[index] = category
+
+    def category(self, index: int) -> ItemCategory:
+        return ItemCategory(self.categories[index])
+
+    def is_done(self, index: int) -> bool:
+        return self.categories[index] in DONE_CATEGORIES
+
+    @property
+    def all_ok(self) -> bool:
+        return all(category in DONE_CATEGORIES for category in self.categories)
+
+    def payload(self, index: int) -> Any | None:
+        """
+        Return the data returned for an item, or None if it failed.
+        """
+        return self._payloads[index]
+
+    def succeeded(self) -> list[Any]:
+        """
+        Return the payloads of all completed items, in input order.
+        """
+        return [self._payloads[index] for index in range(len(self)) if self.is_done(index)]
+
+    def failed_indices(self) -> list[int]:
+        """
+        Return the input positions of all failed items.
+        """
+        return [index for index, category in enumerate(self.categories) if category not in DONE_CATEGORIES]
+
+    def failed(self) -> list[Any]:
+        """
+        Return the input items that failed, ready to be passed back for a selective retry.
+        """
+        return [self._inputs[index] for index in self.failed_indices()]
+
+    def counts(self) -> dict[str, int]:
+        """
+        Return the number of items per category name, omitting empty categories.
+        """
+        counts: dict[str, int] = {}
+        for category in self.categories:
+            category_name: str = ItemCategory(category).name
+            counts[category_name] = counts.get(category_name, 0) + 1
+        return counts
+
+    def __iter__(self) -> Iterator[tuple[int, ItemCategory, Any | None]]:
+        """
+        Iterate over (status_code, category, payload) for every input item.
+        """
+        for index in range(len(self)):
+            yield self.status_codes[index], ItemCategory(self.categories[index]), self._payloads[index]
@@ -2,8 +2,15 @@ from enum import Enum
 
 
 PRODUCTS_ENDPOINT = "/products/register"
+PRODUCTS_BATCH_ENDPOINT = "/products/register/batch"
 GET_OFFERS_ENDPOINT = "/products/{product_id}/offers"
 
+# Status codes the batch endpoint answers with when batching is not available
+BATCH_UNSUPPORTED_STATUS_CODES = frozenset({404, 405, 501})
+
+# Streamed offers prefer NDJSON, and fall back to a JSON array when the server does not offer it
+OFFERS_STREAM_ACCEPT = "application/x-ndjson, application/json;q=0.9"
+
 
 class HTTPMethod(str, Enum):
     GET = "GET"
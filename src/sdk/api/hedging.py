@@ -0,0 +1,127 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+from sdk.config.hedging_config import HedgingConfig
+from sdk.utils.logger import logger
+from sdk.utils.metrics import MetricsRegistry
+
+T = TypeVar("T")
+
+HEDGING_HEDGED = "hedging.hedged"
+HEDGING_HEDGE_WINS = "hedging.hedge_wins"
+HEDGING_DELAY_SECONDS = "hedging.delay_seconds"
+
+
+class RequestHedger:
+    """
+    Sends a backup copy of a slow idempotent request and keeps the first success.
+
+    The hedge delay is the configured percentile of the latencies of recent successful
+    requests, so only the slowest few percent of requests are hedged. A cap on the
+    share of hedged requests keeps a general slowdown from doubling the load.
+
+    Examples:
+        >>> hedger = RequestHedger(HedgingConfig(enabled=True, percentile=0.9))
+        >>> response = await hedger.run(lambda: api._request(HTTPMethod.GET, path))
+    """
+
+    def __init__(self, config: HedgingConfig, metrics: MetricsRegistry | None = None) -> None:
+        """
+        Initialize the hedger.
+
+        Args:
+            config (HedgingConfig): Percentile, delay floor, hedge ratio cap and window sizes.
+            metrics (MetricsRegistry | None): Registry receiving the hedge counts and the current delay.
+        """
+        self._config: HedgingConfig = config
+        self._metrics: MetricsRegistry | None = metrics
+        self._latencies: deque[float] = deque(maxlen=config.window_size)
+        # Whether each recent request was hedged, for the hedge ratio cap
+        self._hedged_flags: deque[bool] = deque(maxlen=config.window_size)
+
+    @property
+    def hedge_delay(self) -> float | None:
+        """
+        Seconds after which a request is hedged, or None until enough latencies were observed.
+        """
+        if len(self._latencies) < self._config.min_samples:
+            return None
+        ordered_latencies: list[float] = sorted(self._latencies)
+        percentile_latency: float = ordered_latencies[int(self._config.percentile * (len(ordered_latencies) - 1))]
+        return max(self._config.min_delay_seconds, percentile_latency)
+
+    async def run(self, send: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a request, hedging it if it is slower than the hedge delay.
+
+        Args:
+            send (Callable[[], Awaitable[T]]): Sends the request; called once more for the hedge.
+
+        Returns:
+            T: The result of the first request to succeed.
+
+        Raises:
+            Exception: The first request's error, if every request sent failed.
+        """
+        hedge_delay: float | None = self.hedge_delay
+        if hedge_delay is not None and self._metrics is not None:
+            self._metrics.set_gauge(HEDGING_DELAY_SECONDS, hedge_delay)
+
+        primary: asyncio.Task = asyncio.create_task(self._timed(send))
+        hedge: asyncio.Task | None = None
+        try:
+            if hedge_delay is not None:
+                await asyncio.wait({primary}, timeout=hedge_delay)
+            if primary.done() or hedge_delay is None or not self._may_hedge():
+                self._hedged_flags.append(False)
+                return await self._settle(primary)
+
+            self._hedged_flags.append(True)
+            if self._metrics is not None:
+                self._metrics.increment(HEDGING_HEDGED)
+            logger.debug("Request still pending after %.3fs, sending a hedge.", hedge_delay)
+            hedge = asyncio.create_task(self._timed(send))
+            return await self._first_success(primary, hedge)
+        finally:
+            # Cancels the loser, or both requests if the caller was cancelled
+            await _cancel_pending(*(task for task in (primary, hedge) if task is not None))
+
+    async def _first_success(self, primary: asyncio.Task, hedge: asyncio.Task) -> T:
+        pending: set[asyncio.Task] = {primary, hedge}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in (primary, hedge):
+                if task in done and not task.cancelled() and task.exception() is None:
+                    if task is hedge and self._metrics is not None:
+                        self._metrics.increment(HEDGING_HEDGE_WINS)
+                    return await self._settle(task)
+        # Both failed; report the error of the original request
+        return await self._settle(primary)
+
+    async def _timed(self, send: Callable[[], Awaitable[T]]) -> tuple[T, float]:
+        started_at: float = time.monotonic()
+        result: T = await send()
+        return result, time.monotonic() - started_at
+
+    async def _settle(self, task: asyncio.Task) -> T:
+        result, latency = await task
+        self._latencies.append(latency)
+        return result
+
+    def _may_hedge(self) -> bool:
+        hedged_count: int = sum(self._hedged_flags)
+        return hedged_count + 1 <= self._config.max_hedge_ratio * (len(self._hedged_flags) + 1)
+
+
+async def _cancel_pending(*tasks: asyncio.Task) -> None:
+    pending_tasks: list[asyncio.Task] = [task for task in tasks if not task.done()]
+    for task in pending_tasks:
+        task.cancel()
+    if pending_tasks:
+        await asyncio.gather(*pending_tasks, return_exceptions=True)
+    for task in tasks:
+        # Marks the loser's error as retrieved, so asyncio does not log it
+        if task.done() and not task.cancelled():
+            task.exception()
@@ -0,0 +1,103 @@
+import os
+from pathlib import Path
+from typing import IO, Any, Iterable
+
+from sdk.utils.logger import logger
+
+
+class RegistrationJournal:
+    """
+    Append-only on-disk checkpoint of product IDs whose registration has completed.
+
+    Each completed product ID is written as one line and flushed immediately, so a
+    crashed import leaves behind an accurate record of the work already done. On open,
+    the journal is replayed into an in-memory set that serves membership checks, and a
+    trailing line cut short by a crash is discarded from the file.
+
+    Examples:
+        >>> with RegistrationJournal("import.journal") as journal:
+        >>>     await client.products.register_products(products, journal=journal)
+    """
+
+    def __init__(self, journal_path: str | os.PathLike[str], *, fsync: bool = False) -> None:
+        """
+        Open (or create) a registration journal.
+
+        Args:
+            journal_path (str | os.PathLike[str]): Path to the journal file.
+            fsync (bool): If True, every write is also fsync'ed to survive power loss,
+                not only process crashes. Defaults to False.
+        """
+        self._journal_path: Path = Path(journal_path)
+        self._fsync: bool = fsync
+        self._completed_ids: set[str] = set()
+
+        self._load()
+        self._journal_file: IO[str] = open(self._journal_path, "a", encoding="utf-8")
+
+    def __contains__(self, product_id: object) -> bool:
+        return str(product_id) in self._completed_ids
+
+    def __len__(self) -> int:
+        return len(self._completed_ids)
+
+    def __enter__(self) -> "RegistrationJournal":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _load(self) -> None:
+        """
+        Replay the journal file into the in-memory set of completed IDs.
+
+        A partially written last line is truncated away, so the next entry starts on a line of its own.
+        """
+        if not self._journal_path.exists():
+            return
+
+        journal_bytes: bytes = self._journal_path.read_bytes()
+        complete_length: int = journal_bytes.rfind(b"\n") + 1
+        if complete_length < len(journal_bytes):
+            logger.warning("Discarding incomplete trailing entry in journal %s", self._journal_path)
+            os.truncate(self._journal_path, complete_length)
+
+        journal_lines: list[str] = journal_bytes[:complete_length].decode("utf-8").split("\n")
+        self._completed_ids.update(line for line in journal_lines if line)
+
+        logger.debug("Loaded %s completed product IDs from %s", len(self._completed_ids), self._journal_path)
+
+    def record(self, product_id: object) -> None:
+        """
+        Mark a single product ID as completed.
+
+        Args:
+            product_id (object): The product ID; it is stored in its string form.
+        """
+        self.record_many([product_id])
+
+    def record_many(self, product_ids: Iterable[object]) -> None:
+        """
+        Mark several product IDs as completed with a single write.
+
+        Args:
+            product_ids (Iterable[object]): The product IDs; they are stored in their string form.
+        """
+        new_ids: list[str] = []
+        for product_id in product_ids:
+            product_key: str = str(product_id)
+            if product_key not in self._completed_ids:
+                self._completed_ids.add(product_key)
+                new_ids.append(product_key)
+
+        if not new_ids:
+            return
+
+        self._journal_file.write("".join(f"{product_key}\n" for product_key in new_ids))
+        self._journal_file.flush()
+        if self._fsync:
+            os.fsync(self._journal_file.fileno())
+
+    def close(self) -> None:
+        if not self._journal_file.closed:
+            self._journal_file.close()
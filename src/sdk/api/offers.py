@@ -1,14 +1,21 @@
 import time
+from contextlib import aclosing
+from typing import AsyncIterator
 from uuid import UUID
 
 from pydantic import ValidationError
 
 from sdk.api.base_api import BaseAPI
-from sdk.api.constatns import GET_OFFERS_ENDPOINT, HTTPMethod
+from sdk.api.constatns import GET_OFFERS_ENDPOINT, OFFERS_STREAM_ACCEPT, HTTPMethod
+from sdk.api.hedging import RequestHedger
+from sdk.config.hedging_config import HedgingConfig
+from sdk.http.deadline import deadline, enforce_deadline
 from sdk.http.interfaces import HTTPBackend
 from sdk.utils.logger import logger
 from sdk.models.offer import Offer
 from sdk.utils.exceptions import OffersAPIError
+from sdk.utils.json_stream import NDJSON_CONTENT_TYPES, iter_json_items
+from sdk.utils.metrics import MetricsRegistry
 
 
 class OffersAPI(BaseAPI):
@@ -17,53 +24,142 @@ class OffersAPI(BaseAPI):
         http_backend: HTTPBackend,
         base_url: str,
         cache_ttl_seconds: int = 60,
+        *,
+        hedging_config: HedgingConfig | None = None,
+        metrics: MetricsRegistry | None = None,
+        deadline_seconds: float | None = None,
     ) -> None:
         super().__init__(
             http_backend=http_backend,
             base_url=base_url,
+            deadline_seconds=deadline_seconds,
         )
         self._cache_ttl_seconds: int = cache_ttl_seconds
         self._cache: dict[UUID, tuple[list[Offer], float]] = {}
+        self.hedger: RequestHedger | None = (
+            RequestHedger(hedging_config, metrics) if hedging_config is not None and hedging_config.enabled else None
+        )
 
-    async def get_offers(self, product_id: UUID) -> list[Offer]:
+    async def get_offers(self, product_id: UUID, force_refresh: bool = False) -> list[Offer]:
         """
         Retrieve offers for a specific product.
 
+        With hedging enabled, a second request is sent when the first one is slower
+        than the configured latency percentile, and the first response is used.
+
         Args:
             product_id (UUID): The unique identifier of the product.
+            force_refresh (bool): If True, skips the cache and always fetches fresh offers.
+                Defaults to False.
 
         Returns:
             list[Offer]: A list of offer models.
 
         Raises:
             OffersAPIError: If the response contains invalid offer data.
+            DeadlineExceededError: If the deadline passes before the offers are parsed.
         """
         current_time: float = time.time()
         cached_data: tuple[list[Offer], float] | None = self._cache.get(product_id)
 
-        if cached_data:
+        if cached_data and not force_refresh:
             offers, timestamp = cached_data
             if current_time - timestamp < self._cache_ttl_seconds:
-                logger.debug(f"Returning cached offers for product_id: {product_id}")
+                logger.debug("Returning cached offers for product_id: %s", product_id)
                 return offers
             else:
-                logger.debug(f"Cache expired for product_id: {product_id}")
+                logger.debug("Cache expired for product_id: %s", product_id)
                 self._cache.pop(product_id)
 
-        logger.debug(f"Fetching offers for product_id: {product_id}")
+        logger.debug("Fetching offers for product_id: %s", product_id)
 
-        response = await self._request(
-            http_method=HTTPMethod.GET,
-            endpoint_path=GET_OFFERS_ENDPOINT.format(product_id=product_id),
-        )
+        def send_request():
+            return self._request(
+                http_method=HTTPMethod.GET,
+                endpoint_path=GET_OFFERS_ENDPOINT.format(product_id=product_id),
+                endpoint_template=GET_OFFERS_ENDPOINT,
+            )
+
+        # The hedge and the parsing of the response share the deadline of the call
+        with deadline(self._deadline_seconds):
+            response = await (self.hedger.run(send_request) if self.hedger is not None else send_request())
 
-        logger.debug(f"Offers Response status code: {response.status_code}")
-        try:
-            response_data: list[dict] = await response.json()
-            offers: list[Offer] = [Offer.model_validate(offer) for offer in response_data]
-        except (ValidationError, ValueError, TypeError) as error:
-            raise OffersAPIError(f"Invalid offer data in response: {str(error)}") from error
+            logger.debug("Offers Response status code: %s", response.status_code)
+            async with enforce_deadline("response parsing"):
+                try:
+                    response_data: list[dict] = await response.json()
+                    offers: list[Offer] = [Offer.model_validate(offer) for offer in response_data]
+                except (ValidationError, ValueError, TypeError) as error:
+                    raise OffersAPIError(f"Invalid offer data in response: {str(error)}") from error
 
-        logger.debug(f"Parsed {len(offers)} offers.")
+        logger.debug("Parsed %s offers.", len(offers))
         self._cache[product_id] = (offers, current_time)
         return offers
+
+    async def iter_offers(self, product_id: UUID) -> AsyncIterator[Offer]:
+        """
+        Stream the offers of a product, validating each one as it arrives.
+
+        The response is decoded incrementally, as NDJSON when the server offers it
+        or as a JSON array otherwise, so memory use does not grow with the number
+        of offers. Streamed offers bypass the cache.
+
+        Args:
+            product_id (UUID): The unique identifier of the product.
+
+        Yields:
+            Offer: Each offer, in response order.
+
+        Raises:
+            OffersAPIError: If the response contains invalid offer data.
+        """
+        logger.debug("Streaming offers for product_id: %s", product_id)
+
+        async with self._stream(
+            http_method=HTTPMethod.GET,
+            endpoint_path=GET_OFFERS_ENDPOINT.format(product_id=product_id),
+            endpoint_template=GET_OFFERS_ENDPOINT,
+            headers={"Accept": OFFERS_STREAM_ACCEPT},
+        ) as response:
+            media_type: str = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            offer_count: int = 0
+            try:
+                async for offer_data in iter_json_items(
+                    response.aiter_bytes(),
+                    ndjson=media_type in NDJSON_CONTENT_TYPES,
+                    encoding=response.encoding or "utf-8",
+                ):
+                    offer: Offer = Offer.model_validate(offer_data)
+                    offer_count += 1
+                    yield offer
+            except (ValidationError, ValueError, TypeError) as error:
+                raise OffersAPIError(f"Invalid offer data in response: {str(error)}") from error
+
+        logger.debug("Streamed %s offers.", offer_count)
+
+    async def iter_offer_chunks(self, product_id: UUID, chunk_size: int = 1000) -> AsyncIterator[list[Offer]]:
+        """
+        Stream the offers of a product in lists of at most `chunk_size` offers.
+
+        Args:
+            product_id (UUID): The unique identifier of the product.
+            chunk_size (int): Maximum number of offers per chunk.
+
+        Yields:
+            list[Offer]: Consecutive chunks of validated offers.
+
+        Raises:
+            OffersAPIError: If the response contains invalid offer data.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive.")
+
+        chunk: list[Offer] = []
+        async with aclosing(self.iter_offers(product_id)) as offers:
+            async for offer in offers:
+                chunk.append(offer)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
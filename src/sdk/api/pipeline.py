@@ -0,0 +1,181 @@
+import asyncio
+from typing import Any, AsyncIterable, AsyncIterator, Iterable
+
+from sdk.api.offers import OffersAPI
+from sdk.api.products import ProductsAPI
+from sdk.models.offer import Offer
+from sdk.utils.exceptions import ConflictError
+from sdk.utils.logger import logger
+
+# Marks the end of a stage's input queue
+_END_OF_STREAM: Any = object()
+
+
+class OnboardingResult:
+    """
+    Outcome of one product passing through the onboarding pipeline.
+
+    Attributes:
+        index (int): Position of the product in the input stream.
+        product (dict[str, Any]): The input product data.
+        registered_product (dict[str, Any] | None): Data returned by registration, if it completed.
+        offers (list[Offer] | None): Offers of the product, if they were fetched.
+        error (Exception | None): The exception that stopped the product, if any.
+    """
+    __slots__ = ("index", "product", "registered_product", "offers", "error")
+
+    def __init__(
+        self,
+        index: int,
+        product: dict[str, Any],
+        registered_product: dict[str, Any] | None = None,
+        offers: list[Offer] | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self.index: int = index
+        self.product: dict[str, Any] = product
+        self.registered_product: dict[str, Any] | None = registered_product
+        self.offers: list[Offer] | None = offers
+        self.error: Exception | None = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return (f"OnboardingResult(index={self.index}, ok={self.ok}, "
+                f"offers={len(self.offers) if self.offers is not None else None})")
+
+
+class OnboardingPipeline:
+    """
+    Two-stage pipeline that registers products and fetches their offers.
+
+    Each stage runs its own pool of workers, and the stages are connected by bounded
+    queues. Offers for a product are fetched as soon as its registration completes,
+    while other registrations are still in flight. A full queue blocks the upstream
+    stage, so memory stays bounded however long the input stream is.
+    """
+
+    def __init__(
+        self,
+        products_api: ProductsAPI,
+        offers_api: OffersAPI,
+        *,
+        register_concurrency: int = 10,
+        offers_concurrency: int = 10,
+        queue_size: int = 100,
+    ) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            products_api (ProductsAPI): API used for the registration stage.
+            offers_api (OffersAPI): API used for the offers stage.
+            register_concurrency (int): Number of concurrent registration requests.
+            offers_concurrency (int): Number of concurrent offers requests.
+            queue_size (int): Capacity of each queue between stages.
+        """
+        if register_concurrency < 1 or offers_concurrency < 1 or queue_size < 1:
+            raise ValueError("Stage concurrency and queue size must be positive.")
+
+        self._products_api: ProductsAPI = products_api
+        self._offers_api: OffersAPI = offers_api
+        self._register_concurrency: int = register_concurrency
+        self._offers_concurrency: int = offers_concurrency
+        self._queue_size: int = queue_size
+
+    async def run(
+        self,
+        products: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+    ) -> AsyncIterator[OnboardingResult]:
+        """
+        Stream products through registration and offer retrieval.
+
+        A product that already exists (409 Conflict) still goes through the offers stage.
+
+        Args:
+            products (Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]]): Products to onboard.
+
+        Yields:
+            OnboardingResult: One result per input product, in completion order.
+        """
+        register_queue: asyncio.Queue = asyncio.Queue(self._queue_size)
+        offers_queue: asyncio.Queue = asyncio.Queue(self._queue_size)
+        result_queue: asyncio.Queue = asyncio.Queue(self._queue_size)
+
+        async def feed() -> None:
+            index: int = 0
+            cancelled: bool = False
+            try:
+                if isinstance(products, AsyncIterable):
+                    async for product_data in products:
+                        await register_queue.put((index, product_data))
+                        index += 1
+                else:
+                    for product_data in products:
+                        await register_queue.put((index, product_data))
+                        index += 1
+            except asyncio.CancelledError:
+                # The workers are cancelled along with the feed, and nothing would drain a full queue
+                cancelled = True
+                raise
+            finally:
+                if not cancelled:
+                    for _ in range(self._register_concurrency):
+                        await register_queue.put(_END_OF_STREAM)
+
+        async def register_worker() -> None:
+            while (item := await register_queue.get()) is not _END_OF_STREAM:
+                index, product_data = item
+                try:
+                    registered_product: dict[str, Any] = await self._products_api.register_product(product_data)
+                except ConflictError:
+                    registered_product = product_data
+                except Exception as error:
+                    await result_queue.put(OnboardingResult(index, product_data, error=error))
+                    continue
+                await offers_queue.put(OnboardingResult(index, product_data, registered_product=registered_product))
+
+        async def offers_worker() -> None:
+            while (result := await offers_queue.get()) is not _END_OF_STREAM:
+                product_id: Any = (result.registered_product or {}).get("id") or result.product.get("id")
+                try:
+                    result.offers = await self._offers_api.get_offers(product_id)
+                except Exception as error:
+                    result.error = error
+                await result_queue.put(result)
+            await result_queue.put(_END_OF_STREAM)
+
+        async def close_register_stage(register_workers: list[asyncio.Task]) -> None:
+            await asyncio.gather(*register_workers)
+            for _ in range(self._offers_concurrency):
+                await offers_queue.put(_END_OF_STREAM)
+
+        register_workers: list[asyncio.Task] = [
+            asyncio.create_task(register_worker()) for _ in range(self._register_concurrency)
+        ]
+        tasks: list[asyncio.Task] = [
+            asyncio.create_task(feed()),
+            *register_workers,
+            *(asyncio.create_task(offers_worker()) for _ in range(self._offers_concurrency)),
+            asyncio.create_task(close_register_stage(register_workers)),
+        ]
+
+        try:
+            finished_workers: int = 0
+            while finished_workers < self._offers_concurrency:
+                result = await result_queue.get()
+                if result is _END_OF_STREAM:
+                    finished_workers += 1
+                    continue
+                yield result
+
+            # Surface errors raised outside of per-product handling, e.g. by the input iterable
+            for task in tasks:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.debug("Onboarding pipeline stopped.")
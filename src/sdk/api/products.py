@@ -1,42 +1,209 @@
 import asyncio
-from typing import Any
-
-from pydantic import ValidationError
+import json
+from typing import Any, Iterator
 
 from sdk.api.base_api import BaseAPI
-from sdk.api.constatns import PRODUCTS_ENDPOINT, HTTPMethod
-from sdk.utils.logger import logger
-from sdk.utils.exceptions import OffersAPIError, RequestExecutionError
+from sdk.api.bulk_result import BulkResult, ItemCategory
+from sdk.api.journal import RegistrationJournal
+from sdk.api.constatns import (
+    BATCH_UNSUPPORTED_STATUS_CODES,
+    PRODUCTS_BATCH_ENDPOINT,
+    PRODUCTS_ENDPOINT,
+    HTTPMethod,
+)
+from sdk.config.compression_config import CompressionConfig
+from sdk.http.compression import compress_request_body
+from sdk.http.interfaces import HTTPBackend
+from sdk.http.utils import exception_for_status
+from sdk.utils.logger import logger, payload_sampled
+from sdk.utils.exceptions import ConflictError, OffersAPIError
+from sdk.utils.metrics import MetricsRegistry
 
 
 class ProductsAPI(BaseAPI):
-    async def register_products(self, product_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def __init__(
+        self,
+        http_backend: HTTPBackend,
+        base_url: str,
+        *,
+        compression_config: CompressionConfig | None = None,
+        metrics: MetricsRegistry | None = None,
+        deadline_seconds: float | None = None,
+    ) -> None:
+        super().__init__(
+            http_backend=http_backend,
+            base_url=base_url,
+            deadline_seconds=deadline_seconds,
+        )
+        self._compression_config: CompressionConfig = compression_config or CompressionConfig()
+        self._metrics: MetricsRegistry | None = metrics
+        # Flipped off once the server reports that the batch endpoint is unavailable
+        self._batch_supported: bool = True
+
+    async def register_products(
+        self,
+        product_list: list[dict[str, Any]],
+        *,
+        journal: RegistrationJournal | None = None,
+    ) -> BulkResult:
         """
         Register multiple products concurrently.
 
         Args:
             product_list (list[dict[str, Any]]): List of product data.
+            journal (RegistrationJournal | None): Optional checkpoint journal. Products whose ID is
+                already journaled are skipped, completed products are journaled as they finish,
+                and a 409 Conflict is treated as already registered.
+
+        Returns:
+            BulkResult: Index-aligned status codes and categories for every input product.
+                Use `succeeded()` for the registered products and `failed()` for a selective retry.
+        """
+        bulk_result: BulkResult = BulkResult(product_list)
+        pending_indices: list[int] = _pending_indices(product_list, bulk_result, journal)
+
+        async def register_one(index: int) -> None:
+            try:
+                outcome: tuple[int, dict[str, Any]] | Exception = await self._register_product_with_status(
+                    product_list[index]
+                )
+            except Exception as error:
+                outcome = error
+            _settle_item(bulk_result, product_list, index, outcome, journal)
+            if journal is not None:
+                _journal_completed(journal, bulk_result, product_list, [index])
+
+        await asyncio.gather(*(register_one(index) for index in pending_indices))
+
+        _log_bulk_summary(bulk_result)
+        return bulk_result
+
+    async def register_products_batch(
+        self,
+        product_list: list[dict[str, Any]],
+        *,
+        max_batch_size: int = 100,
+        max_batch_bytes: int = 1_000_000,
+        compress: bool | None = None,
+        max_concurrent_batches: int = 4,
+        journal: RegistrationJournal | None = None,
+    ) -> BulkResult:
+        """
+        Register multiple products through the batch endpoint.
+
+        Products are split into chunks bounded by item count and encoded size, and
+        each chunk is sent as a single request. If the server reports that batching
+        is unsupported, the remaining products are registered with concurrent single
+        requests instead.
+
+        Args:
+            product_list (list[dict[str, Any]]): List of product data.
+            max_batch_size (int): Maximum number of products per batch request.
+            max_batch_bytes (int): Maximum encoded JSON size of a batch request body.
+            compress (bool | None): If True, batch bodies are always sent gzip-compressed, if False never.
+                By default, bodies are compressed according to the client's compression settings.
+            max_concurrent_batches (int): Maximum number of batch requests in flight.
+            journal (RegistrationJournal | None): Optional checkpoint journal, see `register_products`.
 
         Returns:
-            list[dict[str, Any]]: List of registered products.
+            BulkResult: Index-aligned status codes and categories for every input product.
         """
-        tasks: list[Any] = [
-            self.register_product(product_data) for product_data in product_list
+        if max_batch_size < 1 or max_batch_bytes < 1 or max_concurrent_batches < 1:
+            raise ValueError("Batch size, batch bytes and concurrency limits must be positive.")
+
+        bulk_result: BulkResult = BulkResult(product_list)
+        pending_indices: list[int] = _pending_indices(product_list, bulk_result, journal)
+        encoded_products: list[bytes] = [
+            json.dumps(product_list[index], separators=(",", ":")).encode("utf-8") for index in pending_indices
         ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent_batches)
+
+        async def send_chunk(start_index: int, encoded_chunk: list[bytes]) -> None:
+            chunk_indices: list[int] = pending_indices[start_index:start_index + len(encoded_chunk)]
+
+            async with semaphore:
+                chunk_outcomes: list[tuple[int, dict[str, Any]] | BaseException] | None = None
+                if self._batch_supported:
+                    try:
+                        chunk_outcomes = await self._send_batch(encoded_chunk, compress=compress)
+                    except Exception as batch_error:
+                        logger.error("Batch of %s products starting at #%s failed: %s",
+                                     len(encoded_chunk), chunk_indices[0], batch_error)
+                        chunk_outcomes = [batch_error] * len(encoded_chunk)
+
+                if chunk_outcomes is None:
+                    chunk_outcomes = await asyncio.gather(
+                        *(self._register_product_with_status(product_list[index]) for index in chunk_indices),
+                        return_exceptions=True,
+                    )
+
+            for index, outcome in zip(chunk_indices, chunk_outcomes):
+                _settle_item(bulk_result, product_list, index, outcome, journal)
+            if journal is not None:
+                _journal_completed(journal, bulk_result, product_list, chunk_indices)
 
-        registered_products: list[dict[str, Any]] = []
-        for index, result in enumerate(results):
-            if isinstance(result, ValidationError):
-                logger.warning(f"Validation failed on product #{index}: {result}")
-            elif isinstance(result, (OffersAPIError, RequestExecutionError)):
-                logger.error(f"API error on product #{index}: {result}")
-            elif isinstance(result, Exception):
-                logger.error(f"Unexpected error on product #{index}: {result}")
-            else:
-                registered_products.append(result)
+        await asyncio.gather(*(
+            send_chunk(start_index, encoded_chunk)
+            for start_index, encoded_chunk in _chunk_encoded(encoded_products, max_batch_size, max_batch_bytes)
+        ))
 
-        return registered_products
+        _log_bulk_summary(bulk_result)
+        return bulk_result
+
+    async def _send_batch(
+        self,
+        encoded_chunk: list[bytes],
+        *,
+        compress: bool | None,
+    ) -> list[tuple[int, dict[str, Any]] | Exception] | None:
+        """
+        Send one chunk of pre-encoded products to the batch endpoint.
+
+        Args:
+            encoded_chunk (list[bytes]): JSON-encoded products of the chunk.
+            compress (bool | None): Whether to gzip-compress the body, None to follow the compression settings.
+
+        Returns:
+            list[tuple[int, dict[str, Any]] | Exception] | None: Per-item status code and data, or
+                the item's exception, aligned with the chunk; None if the server does not support batching.
+
+        Raises:
+            OffersAPIError: If the batch request fails or the response is malformed.
+        """
+        request_body: bytes = b"[" + b",".join(encoded_chunk) + b"]"
+
+        try:
+            response = await self._request(
+                http_method=HTTPMethod.POST,
+                endpoint_path=PRODUCTS_BATCH_ENDPOINT,
+                **await self._json_body_params(request_body, compress=compress),
+            )
+        except OffersAPIError as api_error:
+            if api_error.status_code in BATCH_UNSUPPORTED_STATUS_CODES:
+                logger.warning("Batch registration is not supported by the server, falling back to single requests.")
+                self._batch_supported = False
+                return None
+            raise
+
+        try:
+            response_data: list[dict[str, Any]] = await response.json()
+        except (ValueError, TypeError) as error:
+            raise OffersAPIError(f"Invalid JSON in batch registration response: {error}") from error
+
+        if not isinstance(response_data, list) or len(response_data) != len(encoded_chunk):
+            raise OffersAPIError("Batch registration response does not match the number of submitted products.")
+
+        chunk_outcomes: list[tuple[int, dict[str, Any]] | Exception] = []
+        for position, item_result in enumerate(response_data):
+            if not isinstance(item_result, dict):
+                # Fails only this item; the others in the chunk keep their results
+                chunk_outcomes.append(OffersAPIError(f"Malformed batch item #{position} in registration response."))
+                continue
+            status_code: int = item_result.get("status_code", 200)
+            item_error: OffersAPIError | None = exception_for_status(status_code, str(item_result.get("detail", "")))
+            chunk_outcomes.append(item_error if item_error is not None else (status_code, item_result.get("data", {})))
+
+        return chunk_outcomes
 
     async def register_product(self, product_data: dict[str, Any]) -> dict[str, Any]:
         """
@@ -51,17 +218,169 @@ class ProductsAPI(BaseAPI):
         Raises:
             OffersAPIError: If the response contains invalid JSON.
         """
+        _, response_data = await self._register_product_with_status(product_data)
+        return response_data
+
+    async def _register_product_with_status(self, product_data: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        """
+        Register a new product and keep the response status code.
+
+        Args:
+            product_data (dict[str, Any]): Dictionary with keys `id`, `name`, `description`.
+
+        Returns:
+            tuple[int, dict[str, Any]]: The response status code and the registered product data.
+
+        Raises:
+            OffersAPIError: If the response contains invalid JSON.
+        """
+        if self._compression_config.compress_requests:
+            body_params: dict[str, Any] = await self._json_body_params(
+                json.dumps(product_data, separators=(",", ":")).encode("utf-8"), compress=None
+            )
+        else:
+            body_params = {"json": product_data}
+
         response = await self._request(
             http_method=HTTPMethod.POST,
             endpoint_path=PRODUCTS_ENDPOINT,
-            json=product_data
+            **body_params
         )
-        logger.debug(f"Registering Response status code: {response.status_code}")
+        logger.debug("Registering Response status code: %s", response.status_code)
 
         try:
             response_data: dict[str, Any] = await response.json()
         except (ValueError, TypeError) as error:
             raise OffersAPIError(f"Invalid JSON in register_product response: {error}") from error
 
-        logger.debug(f"Registering Response data: {response_data}")
-        return response_data
+        if payload_sampled():
+            logger.debug("Registering Response data: %s", response_data)
+        return response.status_code, response_data
+
+    async def _json_body_params(self, request_body: bytes, *, compress: bool | None) -> dict[str, Any]:
+        """
+        Build the request parameters for a JSON body, gzip-compressing it when required.
+
+        Args:
+            request_body (bytes): The encoded JSON body.
+            compress (bool | None): Force compression on or off, or None to compress bodies
+                of at least `min_compress_bytes` when `compress_requests` is enabled.
+
+        Returns:
+            dict[str, Any]: The `content` and `headers` request parameters.
+        """
+        if compress is None:
+            compress = (self._compression_config.compress_requests
+                        and len(request_body) >= self._compression_config.min_compress_bytes)
+
+        headers: dict[str, str] = {"Content-Type": "application/json"}
+        if compress:
+            request_body = await compress_request_body(request_body, self._compression_config, self._metrics)
+            headers["Content-Encoding"] = "gzip"
+        return {"content": request_body, "headers": headers}
+
+
+def _pending_indices(
+    product_list: list[dict[str, Any]],
+    bulk_result: BulkResult,
+    journal: RegistrationJournal | None,
+) -> list[int]:
+    """
+    Return the input indexes of products that still have to be sent.
+
+    Products already recorded in the journal are marked as skipped in the result.
+    Products without an `id` cannot be journaled and are always pending.
+    """
+    if journal is None:
+        return list(range(len(product_list)))
+
+    pending_indices: list[int] = []
+    for index, product_data in enumerate(product_list):
+        if product_data.get("id") is not None and product_data["id"] in journal:
+            bulk_result.set_success(index, product_data, status_code=0, category=ItemCategory.SKIPPED)
+        else:
+            pending_indices.append(index)
+
+    logger.info("Journal: skipping %s already registered products.", len(product_list) - len(pending_indices))
+    return pending_indices
+
+
+def _settle_item(
+    bulk_result: BulkResult,
+    product_list: list[dict[str, Any]],
+    index: int,
+    outcome: tuple[int, dict[str, Any]] | BaseException,
+    journal: RegistrationJournal | None,
+) -> None:
+    """
+    Record the outcome of one product in the bulk result.
+
+    In journaled mode a 409 Conflict means the product was registered by an earlier run.
+    """
+    if isinstance(outcome, ConflictError) and journal is not None:
+        bulk_result.set_success(
+            index, product_list[index], status_code=409, category=ItemCategory.ALREADY_REGISTERED
+        )
+    elif isinstance(outcome, BaseException):
+        bulk_result.set_failure(index, outcome)
+        logger.debug("Registration of product #%s failed: %s", index, outcome)
+    else:
+        status_code, response_data = outcome
+        bulk_result.set_success(index, response_data, status_code=status_code)
+
+
+def _journal_completed(
+    journal: RegistrationJournal,
+    bulk_result: BulkResult,
+    product_list: list[dict[str, Any]],
+    indices: list[int],
+) -> None:
+    """
+    Record the IDs of the completed products among the given indexes in the journal.
+    """
+    journal.record_many(
+        product_list[index]["id"] for index in indices
+        if bulk_result.is_done(index) and product_list[index].get("id") is not None
+    )
+
+
+def _log_bulk_summary(bulk_result: BulkResult) -> None:
+    failed_count: int = len(bulk_result.failed_indices())
+    if failed_count:
+        logger.warning("%s of %s products failed to register: %s", failed_count, len(bulk_result), bulk_result.counts())
+
+
+def _chunk_encoded(
+    encoded_items: list[bytes],
+    max_items: int,
+    max_bytes: int,
+) -> Iterator[tuple[int, list[bytes]]]:
+    """
+    Split encoded items into chunks bounded by item count and total size.
+
+    An item larger than max_bytes is sent alone in its own chunk.
+
+    Args:
+        encoded_items (list[bytes]): JSON-encoded items.
+        max_items (int): Maximum number of items per chunk.
+        max_bytes (int): Maximum size of a chunk, including the array brackets and commas.
+
+    Yields:
+        tuple[int, list[bytes]]: The input index of the first item and the items of the chunk.
+    """
+    chunk: list[bytes] = []
+    chunk_start: int = 0
+    chunk_bytes: int = 2
+
+    for index, encoded_item in enumerate(encoded_items):
+        item_bytes: int = len(encoded_item) + (1 if chunk else 0)
+        if chunk and (len(chunk) >= max_items or chunk_bytes + item_bytes > max_bytes):
+            yield chunk_start, chunk
+            chunk, chunk_start, chunk_bytes = [], index, 2
+            item_bytes = len(encoded_item)
+
+        chunk.append(encoded_item)
+        chunk_bytes += item_bytes
+
+    if chunk:
+        yield chunk_start, chunk
@@ -0,0 +1,226 @@
+import asyncio
+import heapq
+import inspect
+import random
+import time
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+from sdk.api.offers import OffersAPI
+from sdk.models.offer import Offer
+from sdk.utils.logger import logger
+
+OffersChangeCallback = Callable[[UUID, list[Offer]], Awaitable[None] | None]
+
+
+class _WatchEntry:
+    __slots__ = ("interval_seconds", "callback", "fingerprint", "generation")
+
+    def __init__(self, interval_seconds: float, callback: OffersChangeCallback, generation: int) -> None:
+        self.interval_seconds: float = interval_seconds
+        self.callback: OffersChangeCallback = callback
+        self.fingerprint: int | None = None
+        self.generation: int = generation
+
+
+def _offers_fingerprint(offers: list[Offer]) -> int:
+    """
+    Compute an order-independent fingerprint of a list of offers.
+    """
+    return hash(frozenset((offer.id, offer.price, offer.items_in_stock) for offer in offers))
+
+
+class OffersWatcher:
+    """
+    Polls offers for many products on per-product intervals and reports changes.
+
+    All watched products share a single scheduler task backed by a heap of due times,
+    and a fixed pool of workers performs the polls, so the number of tasks does not
+    grow with the number of watched products. Every poll time is jittered and the first
+    poll of each product is spread uniformly over its interval, which avoids bursts
+    when many products are watched at once. Polls go through the client's `OffersAPI`
+    and therefore share its HTTP backend and connection pool.
+
+    Examples:
+        >>> async def on_change(product_id, offers):
+        >>>     print(product_id, len(offers))
+        >>>
+        >>> async with client.create_watcher(max_concurrency=20) as watcher:
+        >>>     for product_id in product_ids:
+        >>>         watcher.watch(product_id, interval_seconds=30, callback=on_change)
+        >>>     await asyncio.sleep(3600)
+    """
+
+    def __init__(
+        self,
+        offers_api: OffersAPI,
+        *,
+        max_concurrency: int = 10,
+        jitter_ratio: float = 0.1,
+    ) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            offers_api (OffersAPI): The API used to fetch offers.
+            max_concurrency (int): Number of polls that may run at the same time.
+            jitter_ratio (float): Relative random deviation applied to every poll interval.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive.")
+        if not 0 <= jitter_ratio < 1:
+            raise ValueError("jitter_ratio must be in the range [0, 1).")
+
+        self._offers_api: OffersAPI = offers_api
+        self._max_concurrency: int = max_concurrency
+        self._jitter_ratio: float = jitter_ratio
+
+        self._entries: dict[UUID, _WatchEntry] = {}
+        self._schedule: list[tuple[float, int, UUID, int]] = []
+        self._sequence: int = 0
+        # Never reused, so schedule entries left behind by `unwatch` cannot match a later `watch`
+        self._generation: int = 0
+        self._schedule_changed: asyncio.Event = asyncio.Event()
+        self._due_queue: asyncio.Queue = asyncio.Queue(max_concurrency)
+        self._tasks: list[asyncio.Task] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def __aenter__(self) -> "OffersWatcher":
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.stop()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def watch(
+        self,
+        product_id: UUID,
+        *,
+        interval_seconds: float,
+        callback: OffersChangeCallback,
+    ) -> None:
+        """
+        Start watching a product, or update the interval and callback of a watched one.
+
+        The callback is called with the product ID and the new offers on the first
+        successful poll and whenever the offers differ from the previous poll.
+        It may be a regular function or a coroutine function.
+
+        Args:
+            product_id (UUID): The product to watch.
+            interval_seconds (float): Average time between two polls of the product.
+            callback (OffersChangeCallback): Called when the offers change.
+        """
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive.")
+
+        previous_entry: _WatchEntry | None = self._entries.get(product_id)
+        self._generation += 1
+        entry: _WatchEntry = _WatchEntry(interval_seconds, callback, self._generation)
+        if previous_entry:
+            entry.fingerprint = previous_entry.fingerprint
+        self._entries[product_id] = entry
+
+        # Spread the first polls of all products evenly over their interval
+        self._schedule_poll(product_id, entry, time.monotonic() + random.uniform(0, interval_seconds))
+
+    def unwatch(self, product_id: UUID) -> None:
+        """
+        Stop watching a product. Its pending schedule entry is discarded lazily.
+
+        Args:
+            product_id (UUID): The product to stop watching.
+        """
+        self._entries.pop(product_id, None)
+
+    def start(self) -> None:
+        """
+        Start the scheduler and the poll workers on the running event loop.
+        """
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._run_scheduler())]
+        self._tasks.extend(asyncio.create_task(self._run_worker()) for _ in range(self._max_concurrency))
+        logger.debug("Offers watcher started with %s workers.", self._max_concurrency)
+
+    async def stop(self) -> None:
+        """
+        Stop polling. Watched products are kept, so the watcher can be started again.
+        """
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Polls that were due but not started are rescheduled on the next start
+        while not self._due_queue.empty():
+            product_id, generation = self._due_queue.get_nowait()
+            entry: _WatchEntry | None = self._entries.get(product_id)
+            if entry and entry.generation == generation:
+                self._schedule_poll(product_id, entry, time.monotonic())
+
+    def _schedule_poll(self, product_id: UUID, entry: _WatchEntry, due_time: float) -> None:
+        self._sequence += 1
+        heapq.heappush(self._schedule, (due_time, self._sequence, product_id, entry.generation))
+        if self._schedule[0][1] == self._sequence:
+            self._schedule_changed.set()
+
+    def _next_due_time(self, entry: _WatchEntry) -> float:
+        jitter: float = random.uniform(-self._jitter_ratio, self._jitter_ratio)
+        return time.monotonic() + entry.interval_seconds * (1 + jitter)
+
+    async def _run_scheduler(self) -> None:
+        while True:
+            self._schedule_changed.clear()
+            if not self._schedule:
+                await self._schedule_changed.wait()
+                continue
+
+            due_time, _, product_id, generation = self._schedule[0]
+            delay: float = due_time - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._schedule_changed.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self._schedule)
+            entry: _WatchEntry | None = self._entries.get(product_id)
+            if entry is None or entry.generation != generation:
+                continue
+
+            # Blocks while all workers are busy, which delays polls instead of piling them up
+            await self._due_queue.put((product_id, generation))
+
+    async def _run_worker(self) -> None:
+        while True:
+            product_id, generation = await self._due_queue.get()
+            entry: _WatchEntry | None = self._entries.get(product_id)
+            if entry is None or entry.generation != generation:
+                continue
+
+            try:
+                await self._poll(product_id, entry)
+            except Exception as poll_error:
+                logger.warning("Polling offers for product %s failed: %s", product_id, poll_error)
+            finally:
+                if self._entries.get(product_id) is entry:
+                    self._schedule_poll(product_id, entry, self._next_due_time(entry))
+
+    async def _poll(self, product_id: UUID, entry: _WatchEntry) -> None:
+        offers: list[Offer] = await self._offers_api.get_offers(product_id, force_refresh=True)
+        fingerprint: int = _offers_fingerprint(offers)
+        if fingerprint == entry.fingerprint:
+            return
+
+        entry.fingerprint = fingerprint
+        callback_result = entry.callback(product_id, offers)
+        if inspect.isawaitable(callback_result):
+            await callback_result
@@ -4,15 +4,30 @@ import httpx
 from pydantic import ValidationError
 
 from sdk.auth.constants import AUTH_ENDPOINT, TOKEN_LIFETIME_SECONDS
-from sdk.utils.logger import logger
+from sdk.utils.logger import logger, redact
 from sdk.models.auth import AuthApiResponse
 from sdk.utils.exceptions import AuthRequestError
 
 
 class AuthClient:
-    def __init__(self, refresh_token: str | None, base_url: str | None = None) -> None:
+    def __init__(
+        self,
+        refresh_token: str | None,
+        base_url: str | None = None,
+        *,
+        unix_socket_path: str | None = None,
+    ) -> None:
+        """
+        Initialize the auth client.
+
+        Args:
+            refresh_token (str | None): The long-lived refresh token exchanged for access tokens.
+            base_url (str | None): Base URL of the API that issues the tokens.
+            unix_socket_path (str | None): Unix domain socket to send token requests through instead of TCP.
+        """
         self._refresh_token: str | None = refresh_token
         self._base_url: str | None = base_url
+        self._unix_socket_path: str | None = unix_socket_path
 
         self._access_token: str | None = None
         self._token_expiry_timestamp: float = 0.0
@@ -65,10 +80,13 @@ class AuthClient:
         if not self._base_url:
             raise AuthRequestError("Base URL is not set. Please provide a valid base URL.")
 
-        async with httpx.AsyncClient() as http_client:
+        transport: httpx.AsyncHTTPTransport | None = (
+            httpx.AsyncHTTPTransport(uds=self._unix_socket_path) if self._unix_socket_path else None
+        )
+        async with httpx.AsyncClient(transport=transport) as http_client:
             auth_url: str = f"{self._base_url}{AUTH_ENDPOINT}"
             headers: dict[str, str] = {"Bearer": refresh_token}
-            logger.debug(f"Auth Request to: {auth_url}")
+            logger.debug("Auth Request to: %s", auth_url)
 
             try:
                 response = await http_client.post(auth_url, headers=headers)
@@ -87,7 +105,7 @@ class AuthClient:
             try:
                 auth_response = AuthApiResponse(**response.json())
                 access_token: str = auth_response.access_token
-                logger.debug(f"Received new access token: {access_token}")
+                logger.debug("Received new access token: %s", redact(access_token))
 
             except (ValidationError, TypeError, ValueError) as parse_error:
                 raise AuthRequestError(
@@ -1,16 +1,44 @@
-from typing import Any, Callable, TypeVar
+import time
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterable, TypeVar
 
 from sdk.api.offers import OffersAPI
+from sdk.api.pipeline import OnboardingPipeline, OnboardingResult
+from sdk.api.watcher import OffersWatcher
 from sdk.api.products import ProductsAPI
 from sdk.auth.client import AuthClient
+from sdk.config.circuit_breaker_config import CircuitBreakerConfig
+from sdk.config.compression_config import CompressionConfig
+from sdk.config.concurrency_config import ConcurrencyConfig
+from sdk.config.hedging_config import HedgingConfig
+from sdk.config.pool_config import PoolConfig
+from sdk.config.rate_limit_config import RateLimitConfig
+from sdk.config.retry_config import RetryConfig
+from sdk.config.routing_config import RoutingConfig
 from sdk.config.sdk_config import SDKConfig
+from sdk.config.warmup_config import WarmupConfig
 from sdk.http.backends.aiohttp_backend import AioHttpBackend
 from sdk.http.backends.httpx_backend import HttpxBackend
 from sdk.http.backends.requests_backend import RequestsBackend
+from sdk.http.circuit_breaker import CircuitBreakerRegistry, CircuitState
+from sdk.http.concurrency import AdaptiveConcurrencyLimiter
+from sdk.http.rate_limit import ClientRateLimiter
+from sdk.http.retry import RetryPolicy
+from sdk.http.routing import EndpointRouter
+from sdk.http.transport import SharedTransport
+from sdk.http.warmup import (
+    WARMUP_CONNECTIONS_SECONDS,
+    WARMUP_TOKEN_SECONDS,
+    WARMUP_VALIDATORS_SECONDS,
+    WarmupReport,
+    preload_validators,
+)
 from sdk.http.hooks.type import RequestHook
 from sdk.http.interfaces import HTTPBackend
+from sdk.plugins.chain import MiddlewareChain
 from sdk.plugins.interfaces import Plugin, RequestPlugin, ResponsePlugin
 from sdk.utils.exceptions import SDKConfigError
+from sdk.utils.logger import configure_logging, logger
+from sdk.utils.metrics import MetricsRegistry
 
 T = TypeVar("T", bound="OffersClient")
 
@@ -42,9 +70,25 @@ class OffersClient:
         *,
         refresh_token: str | None = None,
         base_url: str | None = None,
+        base_urls: list[str] | None = None,
         backend_name: str | None = None,
+        transport: SharedTransport | None = None,
+        unix_socket: str | None = None,
         config_file_path: str | None = None,
         cache_ttl_seconds: int | None = None,
+        deadline_seconds: float | None = None,
+        max_response_bytes: int | None = None,
+        log_level: str | None = None,
+        log_payload_sample_rate: float | None = None,
+        pool_config: PoolConfig | None = None,
+        compression_config: CompressionConfig | None = None,
+        concurrency_config: ConcurrencyConfig | None = None,
+        rate_limit_config: RateLimitConfig | None = None,
+        retry_config: RetryConfig | None = None,
+        circuit_breaker_config: CircuitBreakerConfig | None = None,
+        hedging_config: HedgingConfig | None = None,
+        warmup_config: WarmupConfig | None = None,
+        routing_config: RoutingConfig | None = None,
         plugins: list[Plugin] | None = None,
         request_hooks: list[RequestHook] | None = None,
         auth_client_factory: Callable[..., AuthClient] = AuthClient
@@ -54,12 +98,35 @@ class OffersClient:
 
         Args:
             refresh_token (str | None): Token for authentication.
-            base_url (str | None): Base URL for the API.
+            base_url (str | None): Base URL for the API; with `base_urls`, the primary one that issues tokens.
+            base_urls (list[str] | None): Base URLs of replicas of the API to route requests across,
+                by latency and health. Access tokens are always fetched from the primary base URL.
             backend_name (str | None): Name of the HTTP backend to use.
+            transport (SharedTransport | None): Connection pool shared with other clients. It sets the
+                backend, pool settings and Unix socket of API requests; the client's own are not used.
+                It is closed when the last client attached to it is closed.
+            unix_socket (str | None): Unix domain socket, e.g. "unix:///run/offers.sock", that auth and API
+                requests are sent through instead of TCP; `base_url` must then be an http:// URL.
             config_file_path (str | None): Path to the configuration file.
             cache_ttl_seconds (int | None): Time-to-live for cached data.
+            deadline_seconds (float | None): Time budget of each request, across token acquisition,
+                plugins and request hooks, attempts and retry backoff. Use `sdk.http.deadline.deadline` for per-call budgets.
+            max_response_bytes (int | None): Largest response body to read, 64 MiB by default; larger bodies
+                raise `ResponseTooLargeError` without being read into memory.
+            log_level (str | None): Level of the process-wide "sdk" logger, WARNING unless set.
+            log_payload_sample_rate (float | None): Share of requests whose parameters and response bodies
+                are logged at DEBUG level, 1.0 unless set.
+            pool_config (PoolConfig | None): Connection pool and timeout settings of the HTTP backend.
+            compression_config (CompressionConfig | None): Request and response compression settings.
+            concurrency_config (ConcurrencyConfig | None): Adaptive limit on requests in flight.
+            rate_limit_config (RateLimitConfig | None): Client-side request rate limits per endpoint.
+            retry_config (RetryConfig | None): Retry policy of all requests.
+            circuit_breaker_config (CircuitBreakerConfig | None): Per-endpoint circuit breaker settings.
+            hedging_config (HedgingConfig | None): Hedged request settings of `offers.get_offers`.
+            warmup_config (WarmupConfig | None): Settings of `warmup`, and whether it runs on `__aenter__`.
+            routing_config (RoutingConfig | None): Latency averaging and ejection settings of `base_urls`.
             plugins (list[Plugin] | None): List of plugins for request/response processing.
-            request_hooks (list[RequestHook] | None): Hooks for modifying requests.
+            request_hooks (list[RequestHook] | None): Hooks for modifying requests, run after the request plugins.
             auth_client_factory (Callable[..., AuthClient]): Factory for creating the AuthClient.
         """
         # Initialize configuration
@@ -67,23 +134,50 @@ class OffersClient:
             self._config: SDKConfig = SDKConfig(
                 refresh_token=refresh_token,
                 api_base_url=base_url,
+                api_base_urls=base_urls,
                 backend=backend_name,
+                unix_socket=unix_socket,
                 config_path=config_file_path,
-                ttl_seconds=cache_ttl_seconds
+                ttl_seconds=cache_ttl_seconds,
+                deadline_seconds=deadline_seconds,
+                max_response_bytes=max_response_bytes,
+                log_level=log_level,
+                log_payload_sample_rate=log_payload_sample_rate,
+                pool_config=pool_config,
+                compression_config=compression_config,
+                concurrency_config=concurrency_config,
+                rate_limit_config=rate_limit_config,
+                retry_config=retry_config,
+                circuit_breaker_config=circuit_breaker_config,
+                hedging_config=hedging_config,
+                warmup_config=warmup_config,
+                routing_config=routing_config,
             )
         except SDKConfigError as config_error:
             raise ValueError("Failed to initialize SDK configuration.") from config_error
+        configure_logging(self._config.log_level, payload_sample_rate=self._config.log_payload_sample_rate)
 
         # Initialize authentication client
+        auth_params: dict[str, Any] = {}
+        if self._config.unix_socket:
+            # Only passed when set, so factories written before Unix sockets keep working
+            auth_params["unix_socket_path"] = self._config.unix_socket
         self._auth_client: AuthClient = auth_client_factory(
             refresh_token=self._config.refresh_token,
-            base_url=self._config.api_base_url
+            base_url=self._config.api_base_url,
+            **auth_params,
         )
 
         # Initialize Middleware Hooks
         self._request_hooks: list[RequestHook] = request_hooks or []
 
-        # Select the appropriate HTTP backend
+        # Select the appropriate HTTP backend; a shared transport dictates its own
+        if transport is not None:
+            if backend_name is not None and backend_name != transport.backend_name:
+                raise ValueError(
+                    f"Backend {backend_name} does not match the shared transport's backend {transport.backend_name}."
+                )
+            self._config.backend = transport.backend_name
         if self._config.backend not in BACKEND_MAPPING:
             raise ValueError(
                 f"Unsupported backend: {self._config.backend}. "
@@ -92,24 +186,85 @@ class OffersClient:
 
         backend_cls = BACKEND_MAPPING[self._config.backend]
 
-        self._http_backend: HTTPBackend = backend_cls(auth_client=self._auth_client, request_hooks=self._request_hooks)
+        # Counters and gauges recorded by the backend and the APIs of this client
+        self.metrics: MetricsRegistry = MetricsRegistry()
+
+        # Shared by all requests of this client; None unless adaptive concurrency is enabled
+        self.concurrency_limiter: AdaptiveConcurrencyLimiter | None = None
+        if self._config.concurrency_config.enabled:
+            self.concurrency_limiter = AdaptiveConcurrencyLimiter(self._config.concurrency_config, self.metrics)
+
+        # Shared by all requests of this client; None unless rate limiting is enabled
+        self.rate_limiter: ClientRateLimiter | None = None
+        if self._config.rate_limit_config.enabled:
+            self.rate_limiter = ClientRateLimiter(self._config.rate_limit_config, self.metrics)
+
+        # One retry budget for all requests of this client
+        self.retry_policy: RetryPolicy = RetryPolicy(self._config.retry_config, self.metrics)
+
+        # One circuit breaker per endpoint template; None unless circuit breaking is enabled
+        self.circuit_breakers: CircuitBreakerRegistry | None = None
+        if self._config.circuit_breaker_config.enabled:
+            self.circuit_breakers = CircuitBreakerRegistry(self._config.circuit_breaker_config, self.metrics)
+
+        # Spreads requests across replicas; None with a single base URL. Requests are built
+        # against the primary base URL, which also issues the tokens all replicas accept.
+        self.router: EndpointRouter | None = None
+        if len(self._config.api_base_urls) > 1:
+            self.router = EndpointRouter(self._config.api_base_urls, self._config.routing_config, self.metrics)
+
+        self._http_backend: HTTPBackend = backend_cls(
+            auth_client=self._auth_client,
+            pool_config=self._config.pool_config,
+            unix_socket_path=self._config.unix_socket,
+            compression_config=self._config.compression_config,
+            metrics=self.metrics,
+            concurrency_limiter=self.concurrency_limiter,
+            rate_limiter=self.rate_limiter,
+            retry_policy=self.retry_policy,
+            circuit_breakers=self.circuit_breakers,
+            router=self.router,
+            deadline_seconds=self._config.deadline_seconds,
+            max_response_bytes=self._config.max_response_bytes,
+            transport=transport,
+        )
 
         # Initialize API clients
-        self.products: ProductsAPI = ProductsAPI(self._http_backend, self._config.api_base_url)
+        self.products: ProductsAPI = ProductsAPI(
+            self._http_backend,
+            self._config.api_base_url,
+            compression_config=self._config.compression_config,
+            metrics=self.metrics,
+            deadline_seconds=self._config.deadline_seconds,
+        )
         self.offers: OffersAPI = OffersAPI(
             self._http_backend,
             self._config.api_base_url,
-            cache_ttl_seconds=self._config.ttl_seconds
+            cache_ttl_seconds=self._config.ttl_seconds,
+            hedging_config=self._config.hedging_config,
+            metrics=self.metrics,
+            deadline_seconds=self._config.deadline_seconds,
         )
 
         # Initialize API Plugins
         self._request_plugins: list[RequestPlugin] = []
         self._response_plugins: list[ResponsePlugin] = []
+        # Plugins and request hooks compiled into one chain, rebuilt by `register_plugins`
+        self._middleware: MiddlewareChain = MiddlewareChain(request_hooks=self._request_hooks)
 
         for plugin in plugins or []:
             self.register_plugins(plugin)
+        if not plugins and not self._middleware.empty:
+            self._install_middleware()
 
     async def __aenter__(self: T) -> T:
+        if self._config.warmup_config.on_enter:
+            try:
+                await self.warmup()
+            except BaseException:
+                # __aexit__ is not called when __aenter__ fails, so the pools would leak
+                await self.aclose()
+                raise
         return self
 
     async def __aexit__(self, *args: Any) -> None:
@@ -118,13 +273,78 @@ class OffersClient:
     async def aclose(self) -> None:
         await self._http_backend.aclose()
 
+    async def warmup(self, connections: int | None = None) -> WarmupReport:
+        """
+        Pay the start-up costs of the client before its first request.
+
+        Fetches the access token, opens pooled connections to the base URL on the
+        selected backend and prepares the response model validators. Each step is
+        timed, and the durations are also recorded in `metrics`.
+
+        Args:
+            connections (int | None): Number of connections to open; defaults to the warmup config's.
+
+        Returns:
+            WarmupReport: The duration of each step and the number of connections opened.
+
+        Raises:
+            AuthRequestError: If the access token cannot be fetched. Connection failures
+                are only logged, since requests open their own connections.
+
+        Examples:
+            >>> client = OffersClient(...)
+            >>> report = await client.warmup(connections=8)
+            >>> logger.info("Client warmed up in %.2fs", report.total_seconds)
+        """
+        connection_count: int = self._config.warmup_config.connections if connections is None else connections
+
+        started_at: float = time.monotonic()
+        await self._auth_client.get_access_token()
+        token_seconds: float = time.monotonic() - started_at
+
+        started_at = time.monotonic()
+        connections_opened: int = await self._http_backend.warm_connections(
+            self._config.api_base_url, connection_count
+        )
+        connections_seconds: float = time.monotonic() - started_at
+
+        started_at = time.monotonic()
+        preload_validators()
+        validators_seconds: float = time.monotonic() - started_at
+
+        self.metrics.set_gauge(WARMUP_TOKEN_SECONDS, token_seconds)
+        self.metrics.set_gauge(WARMUP_CONNECTIONS_SECONDS, connections_seconds)
+        self.metrics.set_gauge(WARMUP_VALIDATORS_SECONDS, validators_seconds)
+        report: WarmupReport = WarmupReport(token_seconds, connections_seconds, connections_opened, validators_seconds)
+        logger.info("Client warmed up: %s", report)
+        return report
+
     def __repr__(self) -> str:
         return f"OffersClient(base_url={self._config.api_base_url}, backend={self._config.backend})"
 
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """
+        Return the circuit breaker state of every endpoint template called so far.
+
+        Returns:
+            dict[str, CircuitState]: States keyed by endpoint template, e.g. "/products/{product_id}/offers";
+                empty when circuit breaking is disabled.
+
+        Examples:
+            >>> if client.circuit_states().get(GET_OFFERS_ENDPOINT) is CircuitState.OPEN:
+            >>>     return cached_or_default_offers()
+        """
+        if self.circuit_breakers is None:
+            return {}
+        return self.circuit_breakers.states()
+
     def register_plugins(self, plugin: Plugin | list[Plugin]) -> None:
         """
         Register one or more plugins for request and response processing.
 
+        The plugins and request hooks of the client are compiled into a new chain, so
+        registering plugins is slower than running them; register them up front.
+
         Args:
             plugin (Plugin | list[Plugin]): A single plugin or a list of plugins to register.
         """
@@ -137,5 +357,63 @@ class OffersClient:
             if isinstance(single_plugin, ResponsePlugin) and single_plugin not in self._response_plugins:
                 self._response_plugins.append(single_plugin)
 
-        self.products.set_plugins(self._request_plugins, self._response_plugins)
-        self.offers.set_plugins(self._request_plugins, self._response_plugins)
+        self._middleware = MiddlewareChain(self._request_plugins, self._response_plugins, self._request_hooks)
+        self._install_middleware()
+
+    def _install_middleware(self) -> None:
+        self.products.set_middleware(self._middleware)
+        self.offers.set_middleware(self._middleware)
+
+    async def onboard_products(
+        self,
+        products: Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]],
+        *,
+        register_concurrency: int = 10,
+        offers_concurrency: int = 10,
+        queue_size: int = 100,
+    ) -> AsyncIterator[OnboardingResult]:
+        """
+        Register products and fetch their offers in one pipelined pass.
+
+        Offers retrieval starts as soon as the first registration completes, so both
+        stages run at the same time with their own concurrency limits.
+
+        Args:
+            products (Iterable[dict[str, Any]] | AsyncIterable[dict[str, Any]]): Products to onboard.
+            register_concurrency (int): Maximum number of registration requests in flight.
+            offers_concurrency (int): Maximum number of offers requests in flight.
+            queue_size (int): Capacity of the bounded queues between stages.
+
+        Yields:
+            OnboardingResult: One result per product, in completion order.
+
+        Examples:
+            >>> async for result in client.onboard_products(products, register_concurrency=20):
+            >>>     if result.ok:
+            >>>         print(result.product["id"], len(result.offers))
+        """
+        pipeline: OnboardingPipeline = OnboardingPipeline(
+            self.products,
+            self.offers,
+            register_concurrency=register_concurrency,
+            offers_concurrency=offers_concurrency,
+            queue_size=queue_size,
+        )
+        async for result in pipeline.run(products):
+            yield result
+
+    def create_watcher(self, *, max_concurrency: int = 10, jitter_ratio: float = 0.1) -> OffersWatcher:
+        """
+        Create a watcher that polls offers of many products through this client.
+
+        The watcher shares the client's HTTP backend and connection pool. It must be
+        started (or used as an async context manager) and stopped before the client is closed.
+
+        Args:
+            max_concurrency (int): Number of polls that may run at the same time.
+            jitter_ratio (float): Relative random deviation applied to every poll interval.
+
+        Returns:
+            OffersWatcher: A watcher bound to this client's Offers API.
+        """
+        return OffersWatcher(self.offers, max_concurrency=max_concurrency, jitter_ratio=jitter_ratio)
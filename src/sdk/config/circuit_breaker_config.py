@@ -0,0 +1,62 @@
+from sdk.utils.exceptions import SDKConfigError
+
+
+class CircuitBreakerConfig:
+    """
+    Settings of the circuit breakers the HTTP backends keep per endpoint template.
+
+    A closed circuit records the outcome of the last `window_size` calls. Once at least
+    `minimum_calls` were recorded, it opens when the share of failures (network errors
+    and 5xx responses) reaches `failure_rate_threshold`, or when the share of calls
+    slower than `slow_call_seconds` reaches `slow_call_rate_threshold`. An open circuit
+    rejects calls immediately with `CircuitOpenError` for `open_seconds`, then lets
+    `half_open_calls` probe calls through: the circuit closes if all of them succeed
+    and opens again otherwise.
+
+    Attributes:
+        enabled (bool): Whether requests go through circuit breakers.
+        failure_rate_threshold (float): Share of failed calls that opens the circuit.
+        slow_call_rate_threshold (float): Share of slow calls that opens the circuit.
+        slow_call_seconds (float): Duration from which a call counts as slow.
+        window_size (int): Number of recent calls the rates are computed over.
+        minimum_calls (int): Calls needed in the window before the circuit can open.
+        open_seconds (float): Time an open circuit rejects calls before probing.
+        half_open_calls (int): Number of probe calls of a half-open circuit.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 0.8,
+        slow_call_seconds: float = 5.0,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 3,
+    ) -> None:
+        if not 0 < failure_rate_threshold <= 1 or not 0 < slow_call_rate_threshold <= 1:
+            raise SDKConfigError("Circuit breaker rate thresholds must be in the range (0, 1].")
+        if not 1 <= minimum_calls <= window_size:
+            raise SDKConfigError("Circuit breaker windows must satisfy 1 <= minimum_calls <= window_size.")
+        if slow_call_seconds <= 0 or open_seconds < 0:
+            raise SDKConfigError("slow_call_seconds must be positive and open_seconds must not be negative.")
+        if half_open_calls < 1:
+            raise SDKConfigError("half_open_calls must be at least 1.")
+
+        self.enabled: bool = enabled
+        self.failure_rate_threshold: float = failure_rate_threshold
+        self.slow_call_rate_threshold: float = slow_call_rate_threshold
+        self.slow_call_seconds: float = slow_call_seconds
+        self.window_size: int = window_size
+        self.minimum_calls: int = minimum_calls
+        self.open_seconds: float = open_seconds
+        self.half_open_calls: int = half_open_calls
+
+    def __repr__(self) -> str:
+        return (f"CircuitBreakerConfig(enabled={self.enabled}, failure_rate_threshold={self.failure_rate_threshold}, "
+                f"slow_call_rate_threshold={self.slow_call_rate_threshold}, "
+                f"slow_call_seconds={self.slow_call_seconds}, window_size={self.window_size}, "
+                f"minimum_calls={self.minimum_calls}, open_seconds={self.open_seconds}, "
+                f"half_open_calls={self.half_open_calls})")
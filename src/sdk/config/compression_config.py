@@ -0,0 +1,46 @@
+from sdk.utils.exceptions import SDKConfigError
+
+
+class CompressionConfig:
+    """
+    Opt-in content encoding settings shared by all HTTP backends.
+
+    With `accept_encoding`, every request advertises the encodings the SDK can
+    decode (gzip, plus br and zstd when `brotli` and `zstandard` are installed),
+    and the SDK decodes responses itself, so all backends behave the same way.
+    With `compress_requests`, `ProductsAPI` sends gzip-compressed bodies once they
+    reach `min_compress_bytes`. Payloads of at least `thread_offload_bytes` are
+    compressed and decompressed in a worker thread instead of on the event loop.
+
+    Attributes:
+        accept_encoding (bool): Whether to negotiate compressed responses.
+        compress_requests (bool): Whether to compress large request bodies.
+        min_compress_bytes (int): Smallest request body that is compressed.
+        compression_level (int): gzip compression level, from 1 (fastest) to 9 (smallest).
+        thread_offload_bytes (int): Smallest payload that is (de)compressed in a worker thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        accept_encoding: bool = False,
+        compress_requests: bool = False,
+        min_compress_bytes: int = 1024,
+        compression_level: int = 6,
+        thread_offload_bytes: int = 256 * 1024,
+    ) -> None:
+        if min_compress_bytes < 0 or thread_offload_bytes < 0:
+            raise SDKConfigError("Compression size thresholds must not be negative.")
+        if not 1 <= compression_level <= 9:
+            raise SDKConfigError("compression_level must be between 1 and 9.")
+
+        self.accept_encoding: bool = accept_encoding
+        self.compress_requests: bool = compress_requests
+        self.min_compress_bytes: int = min_compress_bytes
+        self.compression_level: int = compression_level
+        self.thread_offload_bytes: int = thread_offload_bytes
+
+    def __repr__(self) -> str:
+        return (f"CompressionConfig(accept_encoding={self.accept_encoding}, "
+                f"compress_requests={self.compress_requests}, min_compress_bytes={self.min_compress_bytes}, "
+                f"compression_level={self.compression_level}, thread_offload_bytes={self.thread_offload_bytes})")
@@ -0,0 +1,49 @@
+from sdk.utils.exceptions import SDKConfigError
+
+
+class ConcurrencyConfig:
+    """
+    Settings of the adaptive limit on requests in flight, shared by all HTTP backends.
+
+    When enabled, the backend starts with `initial_limit` concurrent requests and
+    adapts the limit between `min_limit` and `max_limit`: it grows while latency
+    stays within `latency_tolerance` times the baseline, and is multiplied by
+    `decrease_factor` on 429, 5xx, network errors or latency spikes.
+
+    Attributes:
+        enabled (bool): Whether requests go through the adaptive limiter.
+        initial_limit (int): Concurrency limit before any adjustment.
+        min_limit (int): Lowest value the limit is cut to.
+        max_limit (int): Highest value the limit grows to.
+        decrease_factor (float): Multiplier applied to the limit on overload.
+        latency_tolerance (float): Ratio to the baseline latency above which a response is a spike.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise SDKConfigError("Concurrency limits must satisfy 1 <= min_limit <= initial_limit <= max_limit.")
+        if not 0 < decrease_factor < 1:
+            raise SDKConfigError("decrease_factor must be in the range (0, 1).")
+        if latency_tolerance <= 1:
+            raise SDKConfigError("latency_tolerance must be greater than 1.")
+
+        self.enabled: bool = enabled
+        self.initial_limit: int = initial_limit
+        self.min_limit: int = min_limit
+        self.max_limit: int = max_limit
+        self.decrease_factor: float = decrease_factor
+        self.latency_tolerance: float = latency_tolerance
+
+    def __repr__(self) -> str:
+        return (f"ConcurrencyConfig(enabled={self.enabled}, initial_limit={self.initial_limit}, "
+                f"min_limit={self.min_limit}, max_limit={self.max_limit}, "
+                f"decrease_factor={self.decrease_factor}, latency_tolerance={self.latency_tolerance})")
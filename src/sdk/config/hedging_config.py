@@ -0,0 +1,52 @@
+from sdk.utils.exceptions import SDKConfigError
+
+
+class HedgingConfig:
+    """
+    Settings of request hedging for `OffersAPI.get_offers`.
+
+    When enabled, a second, identical request is sent if the first one has not
+    answered after the `percentile` of recent response latencies. The first
+    successful response is used and the other request is cancelled. Hedging starts
+    once `min_samples` latencies were observed, never fires before `min_delay_seconds`,
+    and at most `max_hedge_ratio` of the last `window_size` requests are hedged.
+
+    Attributes:
+        enabled (bool): Whether `get_offers` requests are hedged.
+        percentile (float): Latency percentile, between 0 and 1, after which a hedge is sent.
+        min_delay_seconds (float): Shortest wait before a hedge is sent.
+        max_hedge_ratio (float): Largest share of recent requests that may be hedged.
+        window_size (int): Number of recent requests the percentile and ratio are computed over.
+        min_samples (int): Latencies needed before any request is hedged.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        percentile: float = 0.95,
+        min_delay_seconds: float = 0.01,
+        max_hedge_ratio: float = 0.1,
+        window_size: int = 200,
+        min_samples: int = 20,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise SDKConfigError("percentile must be in the range (0, 1).")
+        if min_delay_seconds < 0:
+            raise SDKConfigError("min_delay_seconds must not be negative.")
+        if not 0 <= max_hedge_ratio <= 1:
+            raise SDKConfigError("max_hedge_ratio must be in the range [0, 1].")
+        if not 1 <= min_samples <= window_size:
+            raise SDKConfigError("Hedging windows must satisfy 1 <= min_samples <= window_size.")
+
+        self.enabled: bool = enabled
+        self.percentile: float = percentile
+        self.min_delay_seconds: float = min_delay_seconds
+        self.max_hedge_ratio: float = max_hedge_ratio
+        self.window_size: int = window_size
+        self.min_samples: int = min_samples
+
+    def __repr__(self) -> str:
+        return (f"HedgingConfig(enabled={self.enabled}, percentile={self.percentile}, "
+                f"min_delay_seconds={self.min_delay_seconds}, max_hedge_ratio={self.max_hedge_ratio}, "
+                f"window_size={self.window_size}, min_samples={self.min_samples})")
@@ -0,0 +1,77 @@
+from sdk.utils.exceptions import SDKConfigError
+
+
+class PoolConfig:
+    """
+    Connection pool and timeout settings shared by all HTTP backends.
+
+    Each backend maps these settings onto its own client:
+
+    - httpx: `httpx.Limits` and `httpx.Timeout` (no per-host limit is available).
+    - aiohttp: `TCPConnector(limit, limit_per_host, keepalive_timeout)` and `ClientTimeout`.
+    - requests: an `HTTPAdapter` pool sized to the connection limits, `(connect, read)` timeouts
+      and eviction of pooled connections after `keepalive_expiry` seconds of inactivity.
+
+    Timeouts left as None fall back to the backend's overall `timeout_seconds`.
+    HTTP/2 is only available on the httpx backend and requires the `h2` package;
+    other backends, or httpx without `h2`, use HTTP/1.1.
+
+    Attributes:
+        max_connections (int): Maximum number of open connections.
+        max_connections_per_host (int | None): Maximum number of open connections to one host.
+        max_keepalive_connections (int): Maximum number of idle connections kept for reuse.
+        keepalive_expiry (float): Seconds an idle connection is kept before it is evicted.
+        connect_timeout (float | None): Seconds to establish a connection.
+        read_timeout (float | None): Seconds to wait for response data.
+        pool_timeout (float | None): Seconds to wait for a free connection from the pool.
+        http2 (bool): Whether to negotiate HTTP/2 and multiplex requests over few connections.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_connections_per_host: int | None = None,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        pool_timeout: float | None = None,
+        http2: bool = False,
+    ) -> None:
+        if max_connections < 1:
+            raise SDKConfigError("max_connections must be positive.")
+        if max_connections_per_host is not None and max_connections_per_host < 1:
+            raise SDKConfigError("max_connections_per_host must be positive.")
+        if max_keepalive_connections < 0 or keepalive_expiry < 0:
+            raise SDKConfigError("Keep-alive settings must not be negative.")
+        for timeout_name, timeout_value in (
+            ("connect_timeout", connect_timeout),
+            ("read_timeout", read_timeout),
+            ("pool_timeout", pool_timeout),
+        ):
+            if timeout_value is not None and timeout_value <= 0:
+                raise SDKConfigError(f"{timeout_name} must be positive.")
+
+        self.max_connections: int = max_connections
+        self.max_connections_per_host: int | None = max_connections_per_host
+        self.max_keepalive_connections: int = min(max_keepalive_connections, max_connections)
+        self.keepalive_expiry: float = keepalive_expiry
+        self.connect_timeout: float | None = connect_timeout
+        self.read_timeout: float | None = read_timeout
+        self.pool_timeout: float | None = pool_timeout
+        self.http2: bool = http2
+
+    def __repr__(self) -> str:
+        return (f"PoolConfig(max_connections={self.max_connections}, "
+                f"max_connections_per_host={self.max_connections_per_host}, "
+                f"max_keepalive_connections={self.max_keepalive_connections}, "
+                f"keepalive_expiry={self.keepalive_expiry}, connect_timeout={self.connect_timeout}, "
+                f"read_timeout={self.read_timeout}, pool_timeout={self.pool_timeout}, http2={self.http2})")
+
+    @property
+    def connections_per_host(self) -> int:
+        """
+        The effective per-host connection limit.
+        """
+        return self.max_connections_per_host or self.max_connections
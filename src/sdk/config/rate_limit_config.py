@@ -0,0 +1,93 @@
+from typing import Any, Mapping
+
+from sdk.utils.exceptions import SDKConfigError
+
+
+class RateLimitConfig:
+    """
+    Settings of the client-side rate limiter, shared by all HTTP backends.
+
+    When enabled, each endpoint template (e.g. "/products/{product_id}/offers") gets
+    its own token bucket, refilled at `requests_per_second` and holding up to `burst`
+    tokens. `endpoint_limits` overrides both values for individual templates. A 429
+    response pauses dispatch on every endpoint for its `Retry-After`, or for
+    `default_retry_after_seconds` when the header is missing, capped at
+    `max_retry_after_seconds`.
+
+    Attributes:
+        enabled (bool): Whether requests go through the rate limiter.
+        requests_per_second (float): Sustained request rate of each endpoint.
+        burst (int): Number of requests an idle endpoint may send at once.
+        endpoint_limits (dict[str, tuple[float, int]]): Requests per second and burst by endpoint template.
+        default_retry_after_seconds (float): Pause after a 429 without a `Retry-After` header.
+        max_retry_after_seconds (float): Longest pause a `Retry-After` header can cause.
+    """
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = False,
+        requests_per_second: float = 50.0,
+        burst: int = 50,
+        endpoint_limits: Mapping[str, Any] | None = None,
+        default_retry_after_seconds: float = 1.0,
+        max_retry_after_seconds: float = 60.0,
+    ) -> None:
+        _validate_limit("default", requests_per_second, burst)
+        if default_retry_after_seconds < 0 or max_retry_after_seconds < 0:
+            raise SDKConfigError("Retry-After durations must not be negative.")
+
+        self.enabled: bool = enabled
+        self.requests_per_second: float = requests_per_second
+        self.burst: int = burst
+        self.endpoint_limits: dict[str, tuple[float, int]] = {
+            endpoint: _parse_endpoint_limit(endpoint, endpoint_limit)
+            for endpoint, endpoint_limit in (endpoint_limits or {}).items()
+        }
+        self.default_retry_after_seconds: float = default_retry_after_seconds
+        self.max_retry_after_seconds: float = max_retry_after_seconds
+
+    def limit_for(self, endpoint: str) -> tuple[float, int]:
+        """
+        Return the requests per second and burst size of an endpoint template.
+        """
+        return self.endpoint_limits.get(endpoint, (self.requests_per_second, self.burst))
+
+    def __repr__(self) -> str:
+        return (f"RateLimitConfig(enabled={self.enabled}, requests_per_second={self.requests_per_second}, "
+                f"burst={self.burst}, endpoint_limits={self.endpoint_limits}, "
+                f"default_retry_after_seconds={self.default_retry_after_seconds}, "
+                f"max_retry_after_seconds={self.max_retry_after_seconds})")
+
+
+def _parse_endpoint_limit(endpoint: str, endpoint_limit: Any) -> tuple[float, int]:
+    """
+    Accept an endpoint limit given as a (requests_per_second, burst) pair or as a mapping,
+    the form it takes in a YAML config file.
+    """
+    if isinstance(endpoint_limit, Mapping):
+        try:
+            requests_per_second, burst = endpoint_limit["requests_per_second"], endpoint_limit["burst"]
+        except KeyError as missing_key:
+            raise SDKConfigError(f"Rate limit of {endpoint} is missing {missing_key}.") from missing_key
+    else:
+        try:
+            requests_per_second, burst = endpoint_limit
+        except (TypeError, ValueError) as unpack_error:
+            raise SDKConfigError(
+                f"Rate limit of {endpoint} must be a (requests_per_second, burst) pair."
+            ) from unpack_error
+
+    try:
+        requests_per_second, burst = float(requests_per_second), int(burst)
+    except (TypeError, ValueError) as conversion_error:
+        raise SDKConfigError(f"Invalid rate limit of {endpoint}: {endpoint_limit}") from conversion_error
+    _validate_limit(endpoint, requests_per_second, burst)
+    return requests_per_second, burst
+
+
+def _validate_limit(endpoint: str, requests_per_second: float, burst: int) -> None:
+    if requests_per_second <= 0:
+        raise SDKConfigError(f"requests_per_second of the {endpoint} rate limit must be positive.")
+    if burst < 1:
+        raise SDKConfigError(f"burst of the {endpoint} rate limit must be at least 1.")
@@ -0,0 +1,65 @@
+from typing import Iterable
+
+from sdk.utils.exceptions import SDKConfigError
+
+
+class RetryConfig:
+    """
+    Settings of the retry policy shared by all HTTP backends.
+
+    A request is attempted up to `max_attempts` times. Network errors and responses
+    with a status in `statuses` are retried after a full-jitter exponential backoff,
+    or after the response's `Retry-After` when it is longer. Non-idempotent requests
+    (POST) are only retried on 429, which the server sends before processing them,
+    unless they carry an `Idempotency-Key` header or `retry_non_idempotent` is set.
+    Retries are drawn from a budget that holds `budget_capacity` retries and is
+    refilled by `budget_ratio` per request, so retries stay a bounded fraction of
+    traffic during an outage.
+
+    Attributes:
+        max_attempts (int): Attempts per request, including the first one. 1 disables retries.
+        base_delay_seconds (float): Backoff cap of the first retry, doubled for each further retry.
+        max_delay_seconds (float): Largest backoff cap.
+        statuses (tuple[int, ...]): Response status codes that are retried.
+        retry_non_idempotent (bool): Whether non-idempotent requests are retried like idempotent ones.
+        max_retry_after_seconds (float): Longest `Retry-After` that is waited for; longer ones are not retried.
+        budget_ratio (float): Retries earned per request.
+        budget_capacity (float): Largest number of retries the budget holds.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        base_delay_seconds: float = 0.5,
+        max_delay_seconds: float = 5.0,
+        statuses: Iterable[int] = (429, 502, 503, 504),
+        retry_non_idempotent: bool = False,
+        max_retry_after_seconds: float = 30.0,
+        budget_ratio: float = 0.1,
+        budget_capacity: float = 10.0,
+    ) -> None:
+        if max_attempts < 1:
+            raise SDKConfigError("max_attempts must be at least 1.")
+        if base_delay_seconds < 0 or max_delay_seconds < base_delay_seconds:
+            raise SDKConfigError("Retry delays must satisfy 0 <= base_delay_seconds <= max_delay_seconds.")
+        if max_retry_after_seconds < 0:
+            raise SDKConfigError("max_retry_after_seconds must not be negative.")
+        if budget_ratio < 0 or budget_capacity < 0:
+            raise SDKConfigError("Retry budget settings must not be negative.")
+
+        self.max_attempts: int = max_attempts
+        self.base_delay_seconds: float = base_delay_seconds
+        self.max_delay_seconds: float = max_delay_seconds
+        self.statuses: tuple[int, ...] = tuple(statuses)
+        self.retry_non_idempotent: bool = retry_non_idempotent
+        self.max_retry_after_seconds: float = max_retry_after_seconds
+        self.budget_ratio: float = budget_ratio
+        self.budget_capacity: float = budget_capacity
+
+    def __repr__(self) -> str:
+        return (f"RetryConfig(max_attempts={self.max_attempts}, base_delay_seconds={self.base_delay_seconds}, "
+                f"max_delay_seconds={self.max_delay_seconds}, statuses={self.statuses}, "
+                f"retry_non_idempotent={self.retry_non_idempotent}, "
+                f"max_retry_after_seconds={self.max_retry_after_seconds}, "
+                f"budget_ratio={self.budget_ratio}, budget_capacity={self.budget_capacity})")
@@ -0,0 +1,44 @@
+from sdk.utils.exceptions import SDKConfigError
+
+
+class RoutingConfig:
+    """
+    Settings of latency-aware routing across several base URLs of the API.
+
+    Each request attempt goes to the better of two randomly picked healthy base URLs,
+    scored by an exponentially weighted moving average (EWMA) of their latency and by
+    their requests in flight. A base URL that fails `failures_to_eject` times in a row
+    (network errors and 5xx responses) is ejected for `eject_seconds`, then re-admitted
+    once a single probe request to it succeeds. Each failed probe doubles the ejection
+    time, up to `max_eject_seconds`.
+
+    Attributes:
+        ewma_alpha (float): Weight of the newest latency in the moving average, between 0 and 1.
+        failures_to_eject (int): Consecutive failures that eject a base URL.
+        eject_seconds (float): Time an ejected base URL receives no requests before it is probed.
+        max_eject_seconds (float): Longest ejection after repeated failed probes.
+    """
+
+    def __init__(
+        self,
+        *,
+        ewma_alpha: float = 0.3,
+        failures_to_eject: int = 3,
+        eject_seconds: float = 10.0,
+        max_eject_seconds: float = 300.0,
+    ) -> None:
+        if not 0 < ewma_alpha <= 1:
+            raise SDKConfigError("ewma_alpha must be in the range (0, 1].")
+        if failures_to_eject < 1:
+            raise SDKConfigError("failures_to_eject must be at least 1.")
+        if not 0 <= eject_seconds <= max_eject_seconds:
+            raise SDKConfigError("Ejection times must satisfy 0 <= eject_seconds <= max_eject_seconds.")
+
+        self.ewma_alpha: float = ewma_alpha
+        self.failures_to_eject: int = failures_to_eject
+        self.eject_seconds: float = eject_seconds
+        self.max_eject_seconds: float = max_eject_seconds
+
+    def __repr__(self) -> str:
+        return (f"RoutingConfig(ewma_alpha={self.ewma_alpha}, failures_to_eject={self.failures_to_eject}, "
+                f"eject_seconds={self.eject_seconds}, max_eject_seconds={self.max_eject_seconds})")
@@ -1,11 +1,27 @@
+import json
+import logging
 import os
+from typing import Any, Callable
+
 import yaml
-from sdk.utils.logger import logger
+from sdk.utils.logger import logger, redact
 from dotenv import load_dotenv
 
+from sdk.config.circuit_breaker_config import CircuitBreakerConfig
+from sdk.config.compression_config import CompressionConfig
+from sdk.config.concurrency_config import ConcurrencyConfig
+from sdk.config.hedging_config import HedgingConfig
+from sdk.config.pool_config import PoolConfig
+from sdk.config.rate_limit_config import RateLimitConfig
+from sdk.config.retry_config import RetryConfig
+from sdk.config.routing_config import RoutingConfig
+from sdk.config.warmup_config import WarmupConfig
 from sdk.utils.exceptions import SDKConfigError
 
 
+# Large enough for any legitimate response, small enough that a runaway body cannot exhaust memory
+DEFAULT_MAX_RESPONSE_BYTES = 64 * 1024 * 1024
+
 env_loaded = load_dotenv()
 
 if not env_loaded:
@@ -26,18 +42,53 @@ class SDKConfig:
     refresh token, and the HTTP backend to use for sending requests.
 
     Attributes:
-        api_base_url (str): The base URL of the Offers API.
+        api_base_url (str): The base URL of the Offers API; with several base URLs, the primary one,
+            which issues the access tokens.
+        api_base_urls (list[str]): All base URLs requests are routed across, primary first.
         refresh_token (str): The long-lived refresh token used for authentication.
         backend (str): The name of the HTTP backend to use: 'httpx', 'aiohttp', or 'requests'.
+        unix_socket (str | None): Path of a Unix domain socket that all traffic, auth included, is sent
+            through instead of TCP; `api_base_url` then only sets the Host header and path prefix.
+        deadline_seconds (float | None): Time budget of each request, across auth, hooks, attempts
+            and retry backoff; None for no deadline.
+        max_response_bytes (int): Largest response body the backends read; a larger one raises
+            `ResponseTooLargeError` as soon as its size is known.
+        log_level (str | None): Level of the SDK's logger, e.g. "DEBUG"; None leaves it unchanged.
+        log_payload_sample_rate (float | None): Share of requests whose payloads are logged at DEBUG
+            level; None leaves it unchanged.
+        pool_config (PoolConfig): Connection pool and timeout settings for the HTTP backend.
+        compression_config (CompressionConfig): Content encoding settings for requests and responses.
+        concurrency_config (ConcurrencyConfig): Adaptive limit on requests in flight.
+        rate_limit_config (RateLimitConfig): Client-side request rate limits.
+        retry_config (RetryConfig): Retry policy shared by all backends.
+        circuit_breaker_config (CircuitBreakerConfig): Per-endpoint circuit breaker settings.
+        hedging_config (HedgingConfig): Hedged request settings of `get_offers`.
+        warmup_config (WarmupConfig): Settings of `OffersClient.warmup`.
+        routing_config (RoutingConfig): Latency-aware routing settings for several base URLs.
     """
     def __init__(
         self,
         *,
         refresh_token: str | None = None,
         api_base_url: str | None = None,
+        api_base_urls: list[str] | None = None,
         backend: str | None = None,
+        unix_socket: str | None = None,
         config_path: str | None = None,
         ttl_seconds: int | None = None,
+        deadline_seconds: float | None = None,
+        max_response_bytes: int | None = None,
+        log_level: str | None = None,
+        log_payload_sample_rate: float | None = None,
+        pool_config: PoolConfig | None = None,
+        compression_config: CompressionConfig | None = None,
+        concurrency_config: ConcurrencyConfig | None = None,
+        rate_limit_config: RateLimitConfig | None = None,
+        retry_config: RetryConfig | None = None,
+        circuit_breaker_config: CircuitBreakerConfig | None = None,
+        hedging_config: HedgingConfig | None = None,
+        warmup_config: WarmupConfig | None = None,
+        routing_config: RoutingConfig | None = None,
     ) -> None:
         """
         Initializes the SDK configuration.
@@ -46,10 +97,55 @@ class SDKConfig:
             refresh_token (str | None): Optional explicit refresh token.
                 If not provided, it will be read from the REFRESH_TOKEN env var or config file.
             api_base_url (str | None): Optional explicit API base URL.
-                If not provided, it will be read from the API_BASE_URL env var or config file.
+                If not provided, it will be read from the API_BASE_URL env var or config file,
+                or defaults to the first of `api_base_urls`.
+            api_base_urls (list[str] | None): Optional base URLs of replicas of the API to route requests across.
+                If not provided, they will be read from the API_BASE_URLS env var (comma-separated)
+                or config file (a list).
             backend (str | None): Optional HTTP backend to use: 'httpx', 'aiohttp', or 'requests'.
                 If not provided, it will be read from the BACKEND env var or config file.
+            unix_socket (str | None): Optional Unix domain socket, as a path or a `unix://` URL
+                (e.g. unix:///run/offers.sock). If not provided, it will be read from the UNIX_SOCKET
+                env var or config file.
             config_path (str): Path to a YAML config file with fallback values.
+            ttl_seconds (int | None): Optional TTL of cached offers in seconds.
+            deadline_seconds (float | None): Optional time budget of each request in seconds.
+                If not provided, it will be read from the DEADLINE_SECONDS env var or config file.
+            max_response_bytes (int | None): Optional maximum response body size in bytes.
+                If not provided, it will be read from the MAX_RESPONSE_BYTES env var or config file,
+                defaulting to 64 MiB.
+            log_level (str | None): Optional level of the SDK's logger.
+                If not provided, it will be read from the LOG_LEVEL env var or config file.
+            log_payload_sample_rate (float | None): Optional share of requests, from 0 to 1, whose payloads are
+                logged at DEBUG level. If not provided, it will be read from the LOG_PAYLOAD_SAMPLE_RATE env var
+                or config file.
+            pool_config (PoolConfig | None): Optional explicit connection pool settings.
+                If not provided, each setting is read from its env var (e.g. POOL_MAX_CONNECTIONS)
+                or config file key (e.g. pool_max_connections).
+            compression_config (CompressionConfig | None): Optional explicit compression settings.
+                If not provided, each setting is read from its env var (e.g. COMPRESSION_ACCEPT_ENCODING)
+                or config file key (e.g. compression_accept_encoding).
+            concurrency_config (ConcurrencyConfig | None): Optional explicit adaptive concurrency settings.
+                If not provided, each setting is read from its env var (e.g. CONCURRENCY_ENABLED)
+                or config file key (e.g. concurrency_enabled).
+            rate_limit_config (RateLimitConfig | None): Optional explicit rate limit settings.
+                If not provided, each setting is read from its env var (e.g. RATE_LIMIT_REQUESTS_PER_SECOND)
+                or config file key (e.g. rate_limit_requests_per_second).
+            retry_config (RetryConfig | None): Optional explicit retry policy settings.
+                If not provided, each setting is read from its env var (e.g. RETRY_MAX_ATTEMPTS)
+                or config file key (e.g. retry_max_attempts).
+            circuit_breaker_config (CircuitBreakerConfig | None): Optional explicit circuit breaker settings.
+                If not provided, each setting is read from its env var (e.g. CIRCUIT_BREAKER_ENABLED)
+                or config file key (e.g. circuit_breaker_enabled).
+            hedging_config (HedgingConfig | None): Optional explicit request hedging settings.
+                If not provided, each setting is read from its env var (e.g. HEDGING_ENABLED)
+                or config file key (e.g. hedging_enabled).
+            warmup_config (WarmupConfig | None): Optional explicit warmup settings.
+                If not provided, each setting is read from its env var (e.g. WARMUP_ON_ENTER)
+                or config file key (e.g. warmup_on_enter).
+            routing_config (RoutingConfig | None): Optional explicit routing settings.
+                If not provided, each setting is read from its env var (e.g. ROUTING_EJECT_SECONDS)
+                or config file key (e.g. routing_eject_seconds).
         """
         self._config: dict[str, str] = {}
         if config_path:
@@ -61,6 +157,23 @@ class SDKConfig:
             config_key="api_base_url",
             default=""
         )
+        try:
+            self.api_base_urls: list[str] = _parse_str_list(self._get_value(
+                direct_arg=api_base_urls,
+                env_key="API_BASE_URLS",
+                config_key="api_base_urls",
+                default=[]
+            ))
+        except (TypeError, ValueError) as parse_error:
+            raise SDKConfigError(f"Invalid api_base_urls: {parse_error}") from parse_error
+        if not self.api_base_url and self.api_base_urls:
+            self.api_base_url = self.api_base_urls[0]
+        if self.api_base_url:
+            # The primary base URL issues the tokens, is always routed to and comes first
+            self.api_base_urls = [
+                base_url for base_url in self.api_base_urls if base_url.rstrip("/") != self.api_base_url.rstrip("/")
+            ]
+            self.api_base_urls.insert(0, self.api_base_url)
         self.refresh_token = self._get_value(
             direct_arg=refresh_token,
             env_key="REFRESH_TOKEN",
@@ -73,6 +186,12 @@ class SDKConfig:
             config_key="backend",
             default="httpx"
         )
+        self.unix_socket: str | None = _parse_unix_socket(self._get_value(
+            direct_arg=unix_socket,
+            env_key="UNIX_SOCKET",
+            config_key="unix_socket",
+            default=None
+        ))
 
         self.ttl_seconds = int(self._get_value(
             direct_arg=ttl_seconds,
@@ -81,16 +200,301 @@ class SDKConfig:
             default=60
         ))
 
+        raw_deadline_seconds = self._get_value(
+            direct_arg=deadline_seconds,
+            env_key="DEADLINE_SECONDS",
+            config_key="deadline_seconds",
+            default=None
+        )
+        try:
+            self.deadline_seconds: float | None = (
+                float(raw_deadline_seconds) if raw_deadline_seconds is not None else None
+            )
+        except (TypeError, ValueError) as parse_error:
+            raise SDKConfigError(f"Invalid deadline_seconds: {raw_deadline_seconds}") from parse_error
+
+        raw_max_response_bytes = self._get_value(
+            direct_arg=max_response_bytes,
+            env_key="MAX_RESPONSE_BYTES",
+            config_key="max_response_bytes",
+            default=DEFAULT_MAX_RESPONSE_BYTES
+        )
+        try:
+            self.max_response_bytes: int = int(raw_max_response_bytes)
+        except (TypeError, ValueError) as parse_error:
+            raise SDKConfigError(f"Invalid max_response_bytes: {raw_max_response_bytes}") from parse_error
+
+        raw_log_level = self._get_value(
+            direct_arg=log_level,
+            env_key="LOG_LEVEL",
+            config_key="log_level",
+            default=None
+        )
+        self.log_level: str | None = str(raw_log_level).upper() if raw_log_level is not None else None
+
+        raw_log_payload_sample_rate = self._get_value(
+            direct_arg=log_payload_sample_rate,
+            env_key="LOG_PAYLOAD_SAMPLE_RATE",
+            config_key="log_payload_sample_rate",
+            default=None
+        )
+        try:
+            self.log_payload_sample_rate: float | None = (
+                float(raw_log_payload_sample_rate) if raw_log_payload_sample_rate is not None else None
+            )
+        except (TypeError, ValueError) as parse_error:
+            raise SDKConfigError(f"Invalid log_payload_sample_rate: {raw_log_payload_sample_rate}") from parse_error
+
+        self.pool_config: PoolConfig = pool_config or self._load_pool_config()
+        self.compression_config: CompressionConfig = compression_config or self._load_compression_config()
+        self.concurrency_config: ConcurrencyConfig = concurrency_config or self._load_concurrency_config()
+        self.rate_limit_config: RateLimitConfig = rate_limit_config or self._load_rate_limit_config()
+        self.retry_config: RetryConfig = retry_config or self._load_retry_config()
+        self.circuit_breaker_config: CircuitBreakerConfig = (
+            circuit_breaker_config or self._load_circuit_breaker_config()
+        )
+        self.hedging_config: HedgingConfig = hedging_config or self._load_hedging_config()
+        self.warmup_config: WarmupConfig = warmup_config or self._load_warmup_config()
+        self.routing_config: RoutingConfig = routing_config or self._load_routing_config()
+
         if not self.api_base_url:
             raise SDKConfigError("API base URL must be set.")
         if not self.refresh_token:
             raise SDKConfigError("Refresh token must be set.")
         if self.backend not in ("httpx", "aiohttp", "requests"):
             raise SDKConfigError(f"Invalid backend: {self.backend}")
+        if self.unix_socket and not self.api_base_url.startswith("http://"):
+            raise SDKConfigError("A Unix socket carries plain HTTP, so the API base URL must start with http://.")
+        if self.deadline_seconds is not None and self.deadline_seconds <= 0:
+            raise SDKConfigError("deadline_seconds must be positive.")
+        if self.max_response_bytes <= 0:
+            raise SDKConfigError("max_response_bytes must be positive.")
+        if self.log_level is not None and not isinstance(logging.getLevelName(self.log_level), int):
+            raise SDKConfigError(f"Invalid log_level: {self.log_level}")
+        if self.log_payload_sample_rate is not None and not 0.0 <= self.log_payload_sample_rate <= 1.0:
+            raise SDKConfigError("log_payload_sample_rate must be between 0 and 1.")
+
+        logger.debug(
+            "Configuration: base_url=%s, base_urls=%s, refresh_token=%s, backend=%s, unix_socket=%s, "
+            "ttl_seconds=%s, deadline_seconds=%s, max_response_bytes=%s, log_level=%s, log_payload_sample_rate=%s, "
+            "config_path=%s, pool_config=%s, compression_config=%s, concurrency_config=%s, rate_limit_config=%s, "
+            "retry_config=%s, circuit_breaker_config=%s, hedging_config=%s, warmup_config=%s, routing_config=%s",
+            self.api_base_url, self.api_base_urls, redact(self.refresh_token), self.backend, self.unix_socket,
+            self.ttl_seconds, self.deadline_seconds, self.max_response_bytes, self.log_level,
+            self.log_payload_sample_rate, config_path, self.pool_config, self.compression_config,
+            self.concurrency_config, self.rate_limit_config, self.retry_config, self.circuit_breaker_config,
+            self.hedging_config, self.warmup_config, self.routing_config,
+        )
+
+    def _load_pool_config(self) -> PoolConfig:
+        """
+        Resolves connection pool settings from environment variables, the config file and defaults.
+
+        Returns:
+            PoolConfig: The resolved pool configuration.
+
+        Raises:
+            SDKConfigError: If a setting is not a valid number.
+        """
+        return PoolConfig(**self._load_setting_group("pool", PoolConfig(), {
+            "max_connections": int,
+            "max_connections_per_host": int,
+            "max_keepalive_connections": int,
+            "keepalive_expiry": float,
+            "connect_timeout": float,
+            "read_timeout": float,
+            "pool_timeout": float,
+            "http2": _parse_bool,
+        }))
+
+    def _load_compression_config(self) -> CompressionConfig:
+        """
+        Resolves compression settings from environment variables, the config file and defaults.
+
+        Returns:
+            CompressionConfig: The resolved compression configuration.
+
+        Raises:
+            SDKConfigError: If a setting has an invalid value.
+        """
+        return CompressionConfig(**self._load_setting_group("compression", CompressionConfig(), {
+            "accept_encoding": _parse_bool,
+            "compress_requests": _parse_bool,
+            "min_compress_bytes": int,
+            "compression_level": int,
+            "thread_offload_bytes": int,
+        }))
+
+    def _load_concurrency_config(self) -> ConcurrencyConfig:
+        """
+        Resolves adaptive concurrency settings from environment variables, the config file and defaults.
+
+        Returns:
+            ConcurrencyConfig: The resolved concurrency configuration.
+
+        Raises:
+            SDKConfigError: If a setting has an invalid value.
+        """
+        return ConcurrencyConfig(**self._load_setting_group("concurrency", ConcurrencyConfig(), {
+            "enabled": _parse_bool,
+            "initial_limit": int,
+            "min_limit": int,
+            "max_limit": int,
+            "decrease_factor": float,
+            "latency_tolerance": float,
+        }))
+
+    def _load_rate_limit_config(self) -> RateLimitConfig:
+        """
+        Resolves rate limit settings from environment variables, the config file and defaults.
+
+        Per-endpoint limits are read from `RATE_LIMIT_ENDPOINT_LIMITS` as a JSON object, or from
+        the `rate_limit_endpoint_limits` config key as a mapping, keyed by endpoint template.
+
+        Returns:
+            RateLimitConfig: The resolved rate limit configuration.
+
+        Raises:
+            SDKConfigError: If a setting has an invalid value.
+        """
+        return RateLimitConfig(**self._load_setting_group("rate_limit", RateLimitConfig(), {
+            "enabled": _parse_bool,
+            "requests_per_second": float,
+            "burst": int,
+            "endpoint_limits": _parse_mapping,
+            "default_retry_after_seconds": float,
+            "max_retry_after_seconds": float,
+        }))
+
+    def _load_retry_config(self) -> RetryConfig:
+        """
+        Resolves retry policy settings from environment variables, the config file and defaults.
+
+        Returns:
+            RetryConfig: The resolved retry configuration.
+
+        Raises:
+            SDKConfigError: If a setting has an invalid value.
+        """
+        return RetryConfig(**self._load_setting_group("retry", RetryConfig(), {
+            "max_attempts": int,
+            "base_delay_seconds": float,
+            "max_delay_seconds": float,
+            "statuses": _parse_int_list,
+            "retry_non_idempotent": _parse_bool,
+            "max_retry_after_seconds": float,
+            "budget_ratio": float,
+            "budget_capacity": float,
+        }))
+
+    def _load_circuit_breaker_config(self) -> CircuitBreakerConfig:
+        """
+        Resolves circuit breaker settings from environment variables, the config file and defaults.
+
+        Returns:
+            CircuitBreakerConfig: The resolved circuit breaker configuration.
 
-        logger.debug(f"Configuration: "
-                     f"base_url={self.api_base_url}, refresh_token={self.refresh_token}, backend={self.backend}, "
-                     f"ttl_seconds={self.ttl_seconds}, config_path={config_path}")
+        Raises:
+            SDKConfigError: If a setting has an invalid value.
+        """
+        return CircuitBreakerConfig(**self._load_setting_group("circuit_breaker", CircuitBreakerConfig(), {
+            "enabled": _parse_bool,
+            "failure_rate_threshold": float,
+            "slow_call_rate_threshold": float,
+            "slow_call_seconds": float,
+            "window_size": int,
+            "minimum_calls": int,
+            "open_seconds": float,
+            "half_open_calls": int,
+        }))
+
+    def _load_hedging_config(self) -> HedgingConfig:
+        """
+        Resolves request hedging settings from environment variables, the config file and defaults.
+
+        Returns:
+            HedgingConfig: The resolved request hedging configuration.
+
+        Raises:
+            SDKConfigError: If a setting has an invalid value.
+        """
+        return HedgingConfig(**self._load_setting_group("hedging", HedgingConfig(), {
+            "enabled": _parse_bool,
+            "percentile": float,
+            "min_delay_seconds": float,
+            "max_hedge_ratio": float,
+            "window_size": int,
+            "min_samples": int,
+        }))
+
+    def _load_warmup_config(self) -> WarmupConfig:
+        """
+        Resolves warmup settings from environment variables, the config file and defaults.
+
+        Returns:
+            WarmupConfig: The resolved warmup configuration.
+
+        Raises:
+            SDKConfigError: If a setting has an invalid value.
+        """
+        return WarmupConfig(**self._load_setting_group("warmup", WarmupConfig(), {
+            "on_enter": _parse_bool,
+            "connections": int,
+        }))
+
+    def _load_routing_config(self) -> RoutingConfig:
+        """
+        Resolves routing settings from environment variables, the config file and defaults.
+
+        Returns:
+            RoutingConfig: The resolved routing configuration.
+
+        Raises:
+            SDKConfigError: If a setting has an invalid value.
+        """
+        return RoutingConfig(**self._load_setting_group("routing", RoutingConfig(), {
+            "ewma_alpha": float,
+            "failures_to_eject": int,
+            "eject_seconds": float,
+            "max_eject_seconds": float,
+        }))
+
+    def _load_setting_group(
+        self,
+        group_name: str,
+        defaults: Any,
+        setting_types: dict[str, Callable[[Any], Any]],
+    ) -> dict[str, Any]:
+        """
+        Resolves a group of settings read from `<GROUP>_<NAME>` env vars and `<group>_<name>` config keys.
+
+        Args:
+            group_name (str): Prefix of the env vars and config keys.
+            defaults (Any): Object whose attributes provide the default values.
+            setting_types (dict[str, Callable[[Any], Any]]): Converter of each setting's raw value.
+
+        Returns:
+            dict[str, Any]: The converted settings, keyed by name.
+
+        Raises:
+            SDKConfigError: If a raw value cannot be converted.
+        """
+        resolved_settings: dict[str, Any] = {}
+        for setting_name, setting_type in setting_types.items():
+            raw_value = self._get_value(
+                direct_arg=None,
+                env_key=f"{group_name.upper()}_{setting_name.upper()}",
+                config_key=f"{group_name}_{setting_name}",
+                default=getattr(defaults, setting_name),
+            )
+            try:
+                resolved_settings[setting_name] = setting_type(raw_value) if raw_value is not None else None
+            except (TypeError, ValueError) as conversion_error:
+                raise SDKConfigError(
+                    f"Invalid value for {group_name} setting {setting_name}: {raw_value}"
+                ) from conversion_error
+
+        return resolved_settings
 
     def _load_config_file(self, config_path: str) -> None:
         """
@@ -108,10 +512,10 @@ class SDKConfig:
                 try:
                     self._config = yaml.safe_load(f) or {}
                 except yaml.YAMLError as e:
-                    logger.warning(f"YAML parsing error in {config_path}: {e}")
+                    logger.warning("YAML parsing error in %s: %s", config_path, e)
                     self._config = {}
         except (FileNotFoundError, PermissionError, OSError) as e:
-            logger.warning(f"Could not open config file {config_path}: {e}")
+            logger.warning("Could not open config file %s: %s", config_path, e)
             self._config = {}
 
     def _get_value(
@@ -147,3 +551,67 @@ class SDKConfig:
             return env_value.strip()
         
         return self._config.get(config_key, default)
+
+
+def _parse_bool(raw_value: str | bool) -> bool:
+    """
+    Parse a boolean setting given as a bool or as a string such as "true", "1", "yes" or "off".
+
+    Raises:
+        ValueError: If the string is not a recognized boolean value.
+    """
+    if isinstance(raw_value, bool):
+        return raw_value
+
+    normalized_value: str = str(raw_value).strip().lower()
+    if normalized_value in ("1", "true", "yes", "on"):
+        return True
+    if normalized_value in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"Not a boolean value: {raw_value}")
+
+
+def _parse_mapping(raw_value: str | dict) -> dict:
+    """
+    Parse a mapping setting given as a dict, from the config file, or as a JSON object string.
+
+    Raises:
+        ValueError: If the string is not a JSON object.
+    """
+    if isinstance(raw_value, dict):
+        return raw_value
+
+    parsed_value: Any = json.loads(raw_value)
+    if not isinstance(parsed_value, dict):
+        raise ValueError(f"Expected a JSON object, got {raw_value}")
+    return parsed_value
+
+
+def _parse_int_list(raw_value: str | list | tuple) -> tuple[int, ...]:
+    """
+    Parse a list of integers given as a list, from the config file, or as a comma-separated string.
+
+    Raises:
+        ValueError: If an item is not an integer.
+    """
+    if isinstance(raw_value, (list, tuple)):
+        return tuple(int(item) for item in raw_value)
+    return tuple(int(item) for item in str(raw_value).split(",") if item.strip())
+
+
+def _parse_str_list(raw_value: str | list | tuple) -> list[str]:
+    """
+    Parse a list of strings given as a list, from the config file, or as a comma-separated string.
+    """
+    if isinstance(raw_value, (list, tuple)):
+        return [str(item).strip() for item in raw_value if str(item).strip()]
+    return [item.strip() for item in str(raw_value).split(",") if item.strip()]
+
+
+def _parse_unix_socket(raw_value: str | None) -> str | None:
+    """
+    Parse a Unix domain socket given as a path or as a `unix://` URL into its path.
+    """
+    if not raw_value:
+        return None
+    return raw_value[len("unix://"):] if raw_value.startswith("unix://") else raw_value
@@ -0,0 +1,21 @@
+from sdk.utils.exceptions import SDKConfigError
+
+
+class WarmupConfig:
+    """
+    Settings of `OffersClient.warmup`, which pays the start-up costs of a client before its first request.
+
+    Attributes:
+        on_enter (bool): Whether `async with OffersClient(...)` warms the client up on entry.
+        connections (int): Number of pooled connections to open to the base URL.
+    """
+
+    def __init__(self, *, on_enter: bool = False, connections: int = 4) -> None:
+        if connections < 0:
+            raise SDKConfigError("Warmup connections must not be negative.")
+
+        self.on_enter: bool = on_enter
+        self.connections: int = connections
+
+    def __repr__(self) -> str:
+        return f"WarmupConfig(on_enter={self.on_enter}, connections={self.connections})"
@@ -1,29 +1,74 @@
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Mapping
 
-from aiohttp import ClientResponse, ClientSession, ClientTimeout, ContentTypeError
+from aiohttp import BaseConnector, ClientError, ClientResponse, ClientSession, ClientTimeout, TCPConnector, UnixConnector
 
 from sdk.auth.client import AuthClient
+from sdk.config.compression_config import CompressionConfig
+from sdk.config.pool_config import PoolConfig
 from sdk.http.backends.base_async_backend import AbstractAsyncBackend
+from sdk.http.circuit_breaker import CircuitBreakerRegistry
+from sdk.http.compression import StreamDecoder
+from sdk.http.concurrency import AdaptiveConcurrencyLimiter
+from sdk.http.rate_limit import ClientRateLimiter
+from sdk.http.retry import RetryPolicy
+from sdk.http.routing import EndpointRouter
+from sdk.http.transport import SharedTransport
 from sdk.http.hooks.type import RequestHook
 from sdk.http.interfaces import BaseResponse, HTTPBackend
+from sdk.http.response import STREAM_CHUNK_BYTES, BufferedResponse, StreamingResponse
+from sdk.utils.exceptions import RequestExecutionError
+from sdk.utils.metrics import MetricsRegistry
 
 
-class AioHttpResponseAdapter(BaseResponse):
-    def __init__(self, client_response: ClientResponse, response_body: str, parsed_json: Any | None):
+class AioHttpResponseAdapter(BufferedResponse, BaseResponse):
+    def __init__(self, client_response: ClientResponse, response_body: bytes):
+        super().__init__(response_body, client_response.charset)
         self._client_response: ClientResponse = client_response
-        self._response_body: str = response_body
-        self._parsed_json: Any | None = parsed_json
 
     @property
     def status_code(self) -> int:
         return self._client_response.status
 
     @property
-    def text(self) -> str:
-        return self._response_body
+    def headers(self) -> Mapping[str, str]:
+        return self._client_response.headers
 
     async def json(self) -> Any | None:
-        return self._parsed_json
+        # Matches aiohttp's own behavior, which refuses to parse non-JSON content types
+        if "json" not in (self._client_response.content_type or ""):
+            return None
+        return await super().json()
+
+
+class AioHttpStreamingResponse(StreamingResponse):
+    def __init__(
+        self,
+        client_response: ClientResponse,
+        *,
+        stream_decoder: StreamDecoder | None = None,
+        metrics: MetricsRegistry | None = None,
+        max_bytes: int | None = None,
+    ):
+        super().__init__(
+            client_response.charset, stream_decoder=stream_decoder, metrics=metrics, max_bytes=max_bytes
+        )
+        self._client_response: ClientResponse = client_response
+
+    @property
+    def status_code(self) -> int:
+        return self._client_response.status
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._client_response.headers
+
+    async def _aiter_network_bytes(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._client_response.content.iter_chunked(STREAM_CHUNK_BYTES):
+                yield chunk
+        except ClientError as client_error:
+            raise RequestExecutionError(f"aiohttp stream failed: {str(client_error)}") from client_error
 
 
 class AioHttpBackend(AbstractAsyncBackend, HTTPBackend):
@@ -32,26 +77,84 @@ class AioHttpBackend(AbstractAsyncBackend, HTTPBackend):
         auth_client: AuthClient,
         timeout_seconds: float = 10.0,
         request_hooks: list[RequestHook] | None = None,
+        pool_config: PoolConfig | None = None,
+        unix_socket_path: str | None = None,
+        compression_config: CompressionConfig | None = None,
+        metrics: MetricsRegistry | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        rate_limiter: ClientRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        deadline_seconds: float | None = None,
+        max_response_bytes: int | None = None,
+        router: EndpointRouter | None = None,
+        transport: SharedTransport | None = None,
     ):
-        super().__init__(auth_client, request_hooks)
-        self._client_timeout: ClientTimeout = ClientTimeout(total=timeout_seconds)
-        self._client_session: ClientSession = ClientSession(timeout=self._client_timeout)
+        super().__init__(
+            auth_client,
+            request_hooks,
+            compression_config=compression_config,
+            metrics=metrics,
+            concurrency_limiter=concurrency_limiter,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            circuit_breakers=circuit_breakers,
+            deadline_seconds=deadline_seconds,
+            max_response_bytes=max_response_bytes,
+            router=router,
+            transport=transport,
+        )
+        self._pool_config: PoolConfig = transport.pool_config if transport else (pool_config or PoolConfig())
+        # Created on first use: a ClientSession must be created inside the event loop it runs on
+        self._init_pool(self._pool_config, unix_socket_path, timeout_seconds)
+
+    @property
+    def _client_session(self) -> ClientSession:
+        return self._current_pool()
+
+    @property
+    def _client_timeout(self) -> ClientTimeout:
+        return self._client_session.timeout
+
+    @classmethod
+    def build_transport(
+        cls, pool_config: PoolConfig, unix_socket_path: str | None, timeout_seconds: float
+    ) -> ClientSession:
+        return ClientSession(
+            timeout=ClientTimeout(
+                total=timeout_seconds,
+                connect=pool_config.pool_timeout,
+                sock_connect=pool_config.connect_timeout,
+                sock_read=pool_config.read_timeout,
+            ),
+            connector=_build_connector(pool_config, unix_socket_path),
+        )
+
+    @classmethod
+    async def close_transport(cls, pool: ClientSession) -> None:
+        await pool.close()
 
     async def request(self, http_method: str, endpoint_url: str, **request_params: Any) -> BaseResponse:
         async def execute_request(method_: str, url_: str, token: str, **params: Any) -> BaseResponse:
-            headers: dict[str, str] = params.pop("headers", {})
-            headers["Bearer"] = token
+            headers: dict[str, str] = self._build_headers(params, token)
+            if "content" in params:
+                params["data"] = params.pop("content")
 
             async with self._client_session.request(
-                method=http_method, url=endpoint_url, headers=headers, **params
+                method=method_, url=url_, headers=headers,
+                # Bodies are decoded by the SDK when it negotiates the encoding itself
+                auto_decompress=not self._decodes_content, **params
             ) as client_response:
-                response_body: str = await client_response.text()
-                try:
-                    parsed_json: Any | None = await client_response.json()
-                except ContentTypeError:
-                    parsed_json = None
-
-                return AioHttpResponseAdapter(client_response, response_body, parsed_json)
+                response_body: bytes = await self._read_body(
+                    client_response.headers,
+                    lambda: client_response.content.iter_chunked(STREAM_CHUNK_BYTES),
+                    client_response.read,
+                )
+                if self._decodes_content:
+                    response_body = await self._decode_body(
+                        response_body, client_response.headers.get("Content-Encoding")
+                    )
+                return AioHttpResponseAdapter(client_response, response_body)
 
         return await self._request_with_auth(
             http_method,
@@ -60,5 +163,49 @@ class AioHttpBackend(AbstractAsyncBackend, HTTPBackend):
             **request_params,
         )
 
+    def stream(self, http_method: str, endpoint_url: str, **request_params: Any) -> AsyncContextManager[StreamingResponse]:
+        @asynccontextmanager
+        async def open_stream(method_: str, url_: str, token: str, **params: Any) -> AsyncIterator[StreamingResponse]:
+            headers: dict[str, str] = self._build_headers(params, token)
+            if "content" in params:
+                params["data"] = params.pop("content")
+
+            try:
+                async with self._client_session.request(
+                    method=method_, url=url_, headers=headers,
+                    auto_decompress=not self._decodes_content, **params
+                ) as client_response:
+                    yield AioHttpStreamingResponse(
+                        client_response,
+                        stream_decoder=self._stream_decoder(client_response.headers.get("Content-Encoding")),
+                        metrics=self._metrics,
+                        max_bytes=self._max_response_bytes,
+                    )
+            except ClientError as client_error:
+                raise RequestExecutionError(f"aiohttp request failed: {str(client_error)}") from client_error
+
+        return self._stream_with_auth(http_method, endpoint_url, open_stream=open_stream, **request_params)
+
+    async def _open_warm_connection(self, url: str) -> None:
+        try:
+            async with self._client_session.head(url) as client_response:
+                await client_response.read()
+        except ClientError as client_error:
+            raise RequestExecutionError(f"aiohttp request failed: {str(client_error)}") from client_error
+
     async def aclose(self) -> None:
-        await self._client_session.close()
+        await self._close_transport()
+
+
+def _build_connector(pool_config: PoolConfig, unix_socket_path: str | None) -> BaseConnector:
+    """
+    Build the connection pool: over TCP, or over a Unix domain socket when a path is given.
+    """
+    pool_limits: dict[str, Any] = {
+        "limit": pool_config.max_connections,
+        "limit_per_host": pool_config.max_connections_per_host or 0,
+        "keepalive_timeout": pool_config.keepalive_expiry,
+    }
+    if unix_socket_path:
+        return UnixConnector(path=unix_socket_path, **pool_limits)
+    return TCPConnector(**pool_limits)
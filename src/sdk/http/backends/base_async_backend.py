@@ -1,86 +1,734 @@
-from abc import ABC
-from typing import Any, Awaitable, Callable
-
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterable, AsyncIterator, Awaitable, Callable, Mapping
+from urllib.parse import urlsplit
 
 from sdk.auth.client import AuthClient
+from sdk.config.compression_config import CompressionConfig
+from sdk.config.pool_config import PoolConfig
+from sdk.config.retry_config import RetryConfig
+from sdk.http.circuit_breaker import CircuitBreakerRegistry, CircuitPermit
+from sdk.http.concurrency import AdaptiveConcurrencyLimiter, ConcurrencyPermit
+from sdk.http.compression import ACCEPT_ENCODING, StreamDecoder, decompress_response_body
+from sdk.http.deadline import deadline, deadline_expired, enforce_deadline, remaining_seconds
+from sdk.http.fork import ForkGuard, abandon
 from sdk.http.hooks.type import RequestHook
 from sdk.http.interfaces import BaseResponse
+from sdk.http.rate_limit import ClientRateLimiter
+from sdk.http.response import RESPONSE_TOO_LARGE, BodySizeLimit, StreamingResponse
+from sdk.http.retry import RetryPolicy
+from sdk.http.routing import EndpointPermit, EndpointRouter
+from sdk.http.transport import SharedTransport
+from sdk.http.utils import parse_retry_after
 from sdk.utils.logger import logger
-from sdk.utils.exceptions import OffersAPIError, RequestExecutionError
+from sdk.utils.exceptions import OffersAPIError, RequestExecutionError, ResponseTooLargeError
+from sdk.utils.metrics import MetricsRegistry
 
 
 class AbstractAsyncBackend(ABC):
-    def __init__(self, auth_client: AuthClient, request_hooks: list[RequestHook] | None = None):
+    def __init__(
+        self,
+        auth_client: AuthClient,
+        request_hooks: list[RequestHook] | None = None,
+        *,
+        compression_config: CompressionConfig | None = None,
+        metrics: MetricsRegistry | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        rate_limiter: ClientRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        deadline_seconds: float | None = None,
+        max_response_bytes: int | None = None,
+        router: EndpointRouter | None = None,
+        transport: SharedTransport | None = None,
+    ):
         self.auth_client: AuthClient = auth_client
         self._request_hooks: list[RequestHook] = request_hooks or []
+        self._compression_config: CompressionConfig = compression_config or CompressionConfig()
+        self._metrics: MetricsRegistry = metrics or MetricsRegistry()
+        self._concurrency_limiter: AdaptiveConcurrencyLimiter | None = concurrency_limiter
+        self._rate_limiter: ClientRateLimiter | None = rate_limiter
+        self._retry_policy: RetryPolicy = retry_policy or RetryPolicy(RetryConfig(), self._metrics)
+        self._circuit_breakers: CircuitBreakerRegistry | None = circuit_breakers
+        self._deadline_seconds: float | None = deadline_seconds
+        self._max_response_bytes: int | None = max_response_bytes
+        self._router: EndpointRouter | None = router
+        self._shared_transport: SharedTransport | None = transport
+        self._transport_closed: bool = False
+        # Built on first use, inside the event loop, and rebuilt in forked children
+        self._pool: Any = None
+        self._pool_settings: tuple[PoolConfig, str | None, float] | None = None
+        self._fork_guard: ForkGuard = ForkGuard()
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        return self._metrics
+
+    @property
+    def concurrency_limiter(self) -> AdaptiveConcurrencyLimiter | None:
+        return self._concurrency_limiter
+
+    @property
+    def rate_limiter(self) -> ClientRateLimiter | None:
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self._retry_policy
+
+    @property
+    def circuit_breakers(self) -> CircuitBreakerRegistry | None:
+        return self._circuit_breakers
+
+    @property
+    def deadline_seconds(self) -> float | None:
+        return self._deadline_seconds
+
+    @property
+    def max_response_bytes(self) -> int | None:
+        return self._max_response_bytes
+
+    @property
+    def router(self) -> EndpointRouter | None:
+        return self._router
+
+    @property
+    def transport(self) -> SharedTransport | None:
+        return self._shared_transport
+
+    @classmethod
+    @abstractmethod
+    def build_transport(cls, pool_config: PoolConfig, unix_socket_path: str | None, timeout_seconds: float) -> Any:
+        """
+        Build the HTTP library client that holds the backend's connection pool.
+        """
+
+    @classmethod
+    @abstractmethod
+    async def close_transport(cls, pool: Any) -> None:
+        """
+        Close a connection pool built by `build_transport`.
+        """
+
+    def _init_pool(self, pool_config: PoolConfig, unix_socket_path: str | None, timeout_seconds: float) -> None:
+        """
+        Attach to the shared transport if one was given; the backend's own pool is built on first use.
+        """
+        self._pool_settings = (pool_config, unix_socket_path, timeout_seconds)
+        if self._shared_transport is not None:
+            self._shared_transport.attach(type(self))
+
+    def _current_pool(self) -> Any:
+        """
+        Return the connection pool, building it on first use and again in a forked child process.
+
+        Raises:
+            RuntimeError: If the backend is closed.
+        """
+        if self._transport_closed:
+            raise RuntimeError(f"{self.__class__.__name__} is closed.")
+        if self._fork_guard.forked():
+            # The parent's pool is dropped, not closed: its sockets are still the parent's
+            logger.debug("%s is running in a forked process, rebuilding its pool.", self.__class__.__name__)
+            abandon(self._pool)
+            self._pool = None
+            self._reset_after_fork()
+        if self._shared_transport is not None:
+            return self._shared_transport.pool()
+        if self._pool is None:
+            self._pool = self.build_transport(*self._pool_settings)
+        return self._pool
+
+    def _reset_after_fork(self) -> None:
+        """
+        Reset per-process state of the backend in a forked child; the pool itself is rebuilt by `_current_pool`.
+        """
+
+    async def _close_transport(self) -> None:
+        """
+        Detach from the shared transport, or close the backend's own pool; only the first call has an effect.
+        """
+        if self._transport_closed:
+            return
+        self._transport_closed = True
+        if self._shared_transport is not None:
+            await self._shared_transport.release()
+            return
+        pool, self._pool = self._pool, None
+        if self._fork_guard.forked():
+            # Closed before any request in the forked child, so the pool is still the parent's
+            abandon(pool)
+        elif pool is not None:
+            await self.close_transport(pool)
+
+    async def _await_rate_limit(self, endpoint_key: str) -> None:
+        """
+        Wait for the endpoint's rate limit, if one is configured.
+        """
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(endpoint_key)
+
+    def _observe_rate_limit(self, response: BaseResponse | StreamingResponse) -> None:
+        """
+        Pause all requests for the `Retry-After` of a 429 response, if rate limiting is configured.
+        """
+        if self._rate_limiter is not None and response.status_code == 429:
+            self._rate_limiter.pause(parse_retry_after(response.headers.get("Retry-After")))
+
+    def _acquire_circuit(self, endpoint_key: str) -> CircuitPermit | None:
+        """
+        Admit a call through the endpoint's circuit breaker, if circuit breaking is configured.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open.
+        """
+        if self._circuit_breakers is None:
+            return None
+        return self._circuit_breakers.acquire(endpoint_key)
+
+    def _record_circuit(
+        self,
+        endpoint_key: str,
+        circuit_permit: CircuitPermit | None,
+        *,
+        failed: bool,
+        started_at: float,
+    ) -> None:
+        if circuit_permit is not None:
+            self._circuit_breakers.release(
+                endpoint_key, circuit_permit, failed=failed, duration=time.monotonic() - started_at
+            )
+
+    def _abandon_circuit(self, endpoint_key: str, circuit_permit: CircuitPermit | None) -> None:
+        if circuit_permit is not None:
+            self._circuit_breakers.abandon(endpoint_key, circuit_permit)
+
+    def _route(self, endpoint_url: str) -> tuple[EndpointPermit | None, str]:
+        """
+        Send the request to the base URL chosen by the router, if several base URLs are configured.
+        """
+        if self._router is None:
+            return None, endpoint_url
+        return self._router.route(endpoint_url)
+
+    def _record_route(self, route_permit: EndpointPermit | None, *, failed: bool, started_at: float) -> None:
+        if route_permit is not None:
+            self._router.record(route_permit, latency=time.monotonic() - started_at, failed=failed)
+
+    def _abandon_route(self, route_permit: EndpointPermit | None) -> None:
+        if route_permit is not None:
+            self._router.abandon(route_permit)
+
+    async def _execute_limited(
+        self,
+        execute_request: Callable[..., Awaitable[BaseResponse]],
+        http_method: str,
+        endpoint_url: str,
+        access_token: str,
+        request_params: dict[str, Any],
+        endpoint: str | None = None,
+    ) -> BaseResponse:
+        """
+        Execute one HTTP exchange through the circuit breaker, rate limit and adaptive concurrency
+        limit that are configured.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open; the request is not sent.
+        """
+        endpoint_key: str = endpoint or urlsplit(endpoint_url).path
+        circuit_permit: CircuitPermit | None = self._acquire_circuit(endpoint_key)
+        try:
+            await self._await_rate_limit(endpoint_key)
+            if self._concurrency_limiter is None:
+                return await self._execute_observed(
+                    execute_request, http_method, endpoint_url, access_token, request_params,
+                    endpoint_key, circuit_permit,
+                )
+
+            permit: ConcurrencyPermit = await self._concurrency_limiter.acquire()
+            try:
+                response: BaseResponse = await self._execute_observed(
+                    execute_request, http_method, endpoint_url, access_token, request_params,
+                    endpoint_key, circuit_permit,
+                )
+            except RequestExecutionError:
+                self._concurrency_limiter.release(permit, overloaded=True)
+                raise
+            except BaseException:
+                # A call cancelled at the deadline stalled for its whole budget, which signals overload;
+                # other cancellations say nothing about the server's load
+                self._concurrency_limiter.release(permit, overloaded=deadline_expired(), measure_latency=False)
+                raise
+            self._concurrency_limiter.release(
+                permit,
+                overloaded=_signals_overload(response.status_code),
+                measure_latency=response.status_code < 400,
+            )
+            return response
+        except BaseException:
+            # Frees a half-open probe slot if the call was cancelled before it had an outcome
+            self._abandon_circuit(endpoint_key, circuit_permit)
+            raise
+
+    async def _execute_observed(
+        self,
+        execute_request: Callable[..., Awaitable[BaseResponse]],
+        http_method: str,
+        endpoint_url: str,
+        access_token: str,
+        request_params: dict[str, Any],
+        endpoint_key: str,
+        circuit_permit: CircuitPermit | None,
+    ) -> BaseResponse:
+        """
+        Execute one HTTP exchange on the routed base URL and report its outcome to the circuit breaker,
+        router and rate limiter.
+        """
+        route_permit, endpoint_url = self._route(endpoint_url)
+        started_at: float = time.monotonic()
+        try:
+            response: BaseResponse = await execute_request(http_method, endpoint_url, access_token, **request_params)
+        except (RequestExecutionError, OSError):
+            self._record_circuit(endpoint_key, circuit_permit, failed=True, started_at=started_at)
+            self._record_route(route_permit, failed=True, started_at=started_at)
+            raise
+        except BaseException:
+            if deadline_expired():
+                # Cancelled by the deadline: a stalled call, recorded as failed and as slow as it got
+                self._record_circuit(endpoint_key, circuit_permit, failed=True, started_at=started_at)
+                self._record_route(route_permit, failed=True, started_at=started_at)
+            else:
+                # E.g. cancellation by the caller, which says nothing about the base URL's health
+                self._abandon_route(route_permit)
+            raise
+        failed: bool = response.status_code >= 500
+        self._record_circuit(endpoint_key, circuit_permit, failed=failed, started_at=started_at)
+        self._record_route(route_permit, failed=failed, started_at=started_at)
+        self._observe_rate_limit(response)
+        return response
+
+    @asynccontextmanager
+    async def _open_limited_stream(
+        self,
+        open_stream: Callable[..., AsyncContextManager[StreamingResponse]],
+        http_method: str,
+        endpoint_url: str,
+        access_token: str,
+        request_params: dict[str, Any],
+        endpoint: str | None = None,
+    ) -> AsyncIterator[StreamingResponse]:
+        """
+        Open a stream through the circuit breaker and rate limit, holding a concurrency slot
+        until it is closed, as far as these are configured.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open; the request is not sent.
+        """
+        endpoint_key: str = endpoint or urlsplit(endpoint_url).path
+        circuit_permit: CircuitPermit | None = self._acquire_circuit(endpoint_key)
+        try:
+            await self._await_rate_limit(endpoint_key)
+            if self._concurrency_limiter is None:
+                async with self._open_observed_stream(
+                    open_stream, http_method, endpoint_url, access_token, request_params,
+                    endpoint_key, circuit_permit,
+                ) as response:
+                    yield response
+                return
+
+            permit: ConcurrencyPermit = await self._concurrency_limiter.acquire()
+            overloaded: bool = False
+            try:
+                async with self._open_observed_stream(
+                    open_stream, http_method, endpoint_url, access_token, request_params,
+                    endpoint_key, circuit_permit,
+                ) as response:
+                    overloaded = _signals_overload(response.status_code)
+                    yield response
+            except RequestExecutionError:
+                overloaded = True
+                raise
+            except BaseException:
+                # A stream cancelled at the deadline, e.g. while opening, signals overload
+                overloaded = overloaded or deadline_expired()
+                raise
+            finally:
+                # Streams stay open while the body is consumed, so their duration is not a latency sample
+                self._concurrency_limiter.release(permit, overloaded=overloaded, measure_latency=False)
+        except BaseException:
+            self._abandon_circuit(endpoint_key, circuit_permit)
+            raise
+
+    @asynccontextmanager
+    async def _open_observed_stream(
+        self,
+        open_stream: Callable[..., AsyncContextManager[StreamingResponse]],
+        http_method: str,
+        endpoint_url: str,
+        access_token: str,
+        request_params: dict[str, Any],
+        endpoint_key: str,
+        circuit_permit: CircuitPermit | None,
+    ) -> AsyncIterator[StreamingResponse]:
+        """
+        Open a stream on the routed base URL and report how it started, up to its headers, to the
+        circuit breaker, router and rate limiter.
+        """
+        route_permit, endpoint_url = self._route(endpoint_url)
+        started_at: float = time.monotonic()
+        opened: bool = False
+        try:
+            async with open_stream(http_method, endpoint_url, access_token, **request_params) as response:
+                opened = True
+                failed: bool = response.status_code >= 500
+                self._record_circuit(endpoint_key, circuit_permit, failed=failed, started_at=started_at)
+                self._record_route(route_permit, failed=failed, started_at=started_at)
+                self._observe_rate_limit(response)
+                yield response
+        except (RequestExecutionError, OSError):
+            if not opened:
+                self._record_circuit(endpoint_key, circuit_permit, failed=True, started_at=started_at)
+                self._record_route(route_permit, failed=True, started_at=started_at)
+            raise
+        except BaseException:
+            if not opened and deadline_expired():
+                # Cancelled by the deadline before the headers arrived: a stalled call
+                self._record_circuit(endpoint_key, circuit_permit, failed=True, started_at=started_at)
+                self._record_route(route_permit, failed=True, started_at=started_at)
+            raise
+        finally:
+            # A no-op once the outcome is recorded; frees the slot of a stream cancelled while opening
+            self._abandon_route(route_permit)
+
+    async def warm_connections(self, url: str, count: int) -> int:
+        """
+        Open up to `count` pooled connections to a URL's host ahead of the first requests.
+
+        The connections are opened by concurrent unauthenticated HEAD requests, which skip
+        the rate limit, concurrency limit, circuit breakers and retries. Any response,
+        including an error status, leaves its connection in the pool.
+
+        Args:
+            url (str): URL whose host the connections are opened to.
+            count (int): Number of connections to open.
+
+        Returns:
+            int: Number of connections opened; failures are logged, not raised.
+        """
+        return await self._gather_warm_connections(url, count, self._open_warm_connection)
+
+    async def _gather_warm_connections(
+        self, url: str, count: int, open_connection: Callable[[str], Awaitable[None]]
+    ) -> int:
+        """
+        Run `count` connection openers concurrently, logging failures.
+        """
+        results: list[Any] = await asyncio.gather(
+            *(open_connection(url) for _ in range(count)), return_exceptions=True
+        )
+        failures: list[BaseException] = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            logger.warning("Opened %s of %s warm connections to %s: %s", count - len(failures), count, url, failures[0])
+        return count - len(failures)
+
+    @abstractmethod
+    async def _open_warm_connection(self, url: str) -> None:
+        """
+        Send one HEAD request to a URL, leaving its connection in the pool.
+        """
+
+    @property
+    def _decodes_content(self) -> bool:
+        """
+        Whether the SDK negotiates and decodes response encodings instead of the HTTP library.
+        """
+        return self._compression_config.accept_encoding
+
+    def _build_headers(self, request_params: dict[str, Any], access_token: str) -> dict[str, str]:
+        """
+        Pop the caller's headers from the request parameters and add the SDK's own.
+
+        Returns:
+            dict[str, str]: A new headers dict with the access token and, if enabled, `Accept-Encoding`.
+        """
+        headers: dict[str, str] = dict(request_params.pop("headers", None) or {})
+        headers["Bearer"] = access_token
+        if self._decodes_content:
+            headers.setdefault("Accept-Encoding", ACCEPT_ENCODING)
+        return headers
+
+    async def _read_body(
+        self,
+        headers: Mapping[str, str],
+        read_chunks: Callable[[], AsyncIterable[bytes]],
+        read_all: Callable[[], Awaitable[bytes]] | None = None,
+    ) -> bytes:
+        """
+        Read a response body into memory, up to `max_response_bytes`.
+
+        A body with a Content-Length within the limit is read at once with `read_all`, as the
+        HTTP library stops at the declared length; any other body is read chunk by chunk and
+        abandoned as soon as it exceeds the limit.
+
+        Args:
+            headers (Mapping[str, str]): The response headers.
+            read_chunks (Callable[[], AsyncIterable[bytes]]): Returns the body's chunks as they arrive.
+            read_all (Callable[[], Awaitable[bytes]] | None): Reads the whole body, if the library can.
+
+        Raises:
+            ResponseTooLargeError: If the body exceeds `max_response_bytes`.
+        """
+        body_limit: BodySizeLimit = BodySizeLimit(self._max_response_bytes)
+        # A body the HTTP library decodes can be far larger than its Content-Length
+        library_decoded: bool = not self._decodes_content and bool(headers.get("Content-Encoding"))
+        try:
+            if body_limit.check_content_length(headers) and read_all is not None and not library_decoded:
+                return body_limit.add(await read_all())
+            return b"".join([body_limit.add(chunk) async for chunk in read_chunks()])
+        finally:
+            body_limit.record(self._metrics)
+
+    async def _decode_body(self, raw_body: bytes, content_encoding: str | None) -> bytes:
+        """
+        Decode a response body received without automatic decompression, up to `max_response_bytes`.
+
+        Raises:
+            ResponseTooLargeError: If the decoded body exceeds `max_response_bytes`.
+        """
+        try:
+            return await decompress_response_body(
+                raw_body, content_encoding, self._compression_config, self._metrics, self._max_response_bytes
+            )
+        except ResponseTooLargeError:
+            if self._metrics is not None:
+                self._metrics.increment(RESPONSE_TOO_LARGE)
+            raise
+
+    def _stream_decoder(self, content_encoding: str | None) -> StreamDecoder | None:
+        """
+        Build the decoder for a streamed body, or None when the HTTP library decodes it.
+        """
+        return StreamDecoder(content_encoding, self._max_response_bytes) if self._decodes_content else None
+
+    async def _prepare_request(self, http_method: str, endpoint_url: str, request_params: dict[str, Any]) -> str:
+        """
+        Fetch the access token and run the request hooks.
+
+        Returns:
+            str: The access token to send with the request.
+
+        Raises:
+            OffersAPIError: If no token is available or a request hook fails.
+            DeadlineExceededError: If the deadline passes while fetching the token or running the hooks.
+        """
+        async with enforce_deadline("authentication"):
+            access_token: str | None = await self.auth_client.get_access_token()
+        if not access_token:
+            raise OffersAPIError("Failed to retrieve access token.")
+
+        # Execute request hooks before making the request
+        async with enforce_deadline("request hooks"):
+            for hook in self._request_hooks:
+                try:
+                    await hook(http_method, endpoint_url, request_params)
+                except Exception as hook_error:
+                    raise OffersAPIError(
+                        f"Request hook {hook.__class__.__name__} failed: {hook_error}"
+                    ) from hook_error
+
+        return access_token
+
+    async def _refresh_access_token(self) -> str:
+        async with enforce_deadline("authentication"):
+            new_access_token: str | None = await self.auth_client.get_access_token(force_refresh=True)
+        if not new_access_token:
+            raise OffersAPIError("Failed to retrieve refreshed access token.")
+        logger.debug("Retrying request with refreshed access token...")
+        return new_access_token
+
+    @asynccontextmanager
+    async def _stream_with_auth(
+        self,
+        http_method: str,
+        endpoint_url: str,
+        *,
+        open_stream: Callable[..., AsyncContextManager[StreamingResponse]],
+        endpoint: str | None = None,
+        **request_params: Any,
+    ) -> AsyncIterator[StreamingResponse]:
+        """
+        Open an authenticated streamed HTTP request.
+
+        Behaves like `_request_with_auth`, except that the response body is left unread.
+        Streams are not retried, because part of the body may already have been consumed.
+
+        Args:
+            http_method (str): HTTP method (e.g., 'GET', 'POST').
+            endpoint_url (str): Target URL for the request.
+            open_stream (Callable[..., AsyncContextManager[StreamingResponse]]): Opens the
+                streamed request for a method, URL and access token.
+            endpoint (str | None): Endpoint template that selects the rate limit; defaults to the URL path.
+            **request_params (Any): Additional parameters for the request.
+
+        Yields:
+            StreamingResponse: The response, with its body not yet read.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before the response headers arrive.
+        """
+        async with AsyncExitStack() as stream_stack:
+            # The deadline covers opening the stream; reading the body is up to the caller
+            with deadline(self._deadline_seconds):
+                access_token: str = await self._prepare_request(http_method, endpoint_url, request_params)
+                response: StreamingResponse = await self._enter_stream(
+                    stream_stack, open_stream, http_method, endpoint_url, access_token, request_params, endpoint
+                )
+
+                if response.status_code == 401:
+                    # Only a 401 body is read, to tell an expired token from other auth errors
+                    async with enforce_deadline("response"):
+                        await response.aread()
+                    if "Access token expired" in response.text:
+                        await stream_stack.aclose()
+                        new_access_token: str = await self._refresh_access_token()
+                        response = await self._enter_stream(
+                            stream_stack, open_stream, http_method, endpoint_url, new_access_token,
+                            request_params, endpoint,
+                        )
+
+            yield response
+
+    async def _enter_stream(
+        self,
+        stream_stack: AsyncExitStack,
+        open_stream: Callable[..., AsyncContextManager[StreamingResponse]],
+        http_method: str,
+        endpoint_url: str,
+        access_token: str,
+        request_params: dict[str, Any],
+        endpoint: str | None,
+    ) -> StreamingResponse:
+        """
+        Open a stream on `stream_stack`, within the current deadline.
+        """
+        async with enforce_deadline("request"):
+            return await stream_stack.enter_async_context(
+                self._open_limited_stream(open_stream, http_method, endpoint_url, access_token, request_params, endpoint)
+            )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
-        retry=retry_if_exception_type((OSError, RuntimeError)),
-        reraise=True,
-    )
     async def _request_with_auth(
         self,
         http_method: str,
         endpoint_url: str,
         *,
         execute_request: Callable[[str, str, str], Awaitable[BaseResponse]],
+        endpoint: str | None = None,
         **request_params: Any,
     ) -> BaseResponse:
         """
-        Perform an authenticated HTTP request with retry logic.
+        Perform an authenticated HTTP request, retried according to the retry policy.
+
+        Network errors and retryable statuses are retried by every backend alike. Each
+        attempt fetches the token and runs the request hooks again. All of it draws from
+        the client's `deadline_seconds` and any enclosing `deadline`; a retry whose backoff
+        would overrun the deadline is not attempted.
 
         Args:
             http_method (str): HTTP method (e.g., 'GET', 'POST').
             endpoint_url (str): Target URL for the request.
             execute_request (Callable[[str, str, Any], BaseResponse]): Function to execute the HTTP request.
+            endpoint (str | None): Endpoint template that selects the rate limit; defaults to the URL path.
             **request_params (Any): Additional parameters for the request.
 
         Returns:
-            BaseResponse: The HTTP response.
+            BaseResponse: The HTTP response, which is the last attempt's when all attempts failed.
 
         Raises:
             OffersAPIError: If a request hook fails.
-            RequestExecutionError: If the request execution fails.
+            RequestExecutionError: If the request execution fails on the last attempt.
+            DeadlineExceededError: If the deadline passes before a response arrives.
         """
-        access_token: str | None = await self.auth_client.get_access_token()
-        if not access_token:
-            raise OffersAPIError("Failed to retrieve access token.")
+        with deadline(self._deadline_seconds):
+            self._retry_policy.record_request()
+            request_headers: Mapping[str, str] | None = request_params.get("headers")
+            attempt: int = 1
+            while True:
+                try:
+                    response: BaseResponse = await self._send_with_auth(
+                        http_method, endpoint_url, execute_request, endpoint, dict(request_params)
+                    )
+                except (RequestExecutionError, OSError) as request_error:
+                    retry_delay: float | None = self._retry_policy.next_delay(
+                        http_method, attempt, request_headers=request_headers
+                    )
+                    if retry_delay is None or not _fits_deadline(retry_delay):
+                        raise
+                    logger.warning("%s %s failed: %s. Retrying in %.2fs (attempt %s).",
+                                   http_method, endpoint_url, request_error, retry_delay, attempt + 1)
+                else:
+                    retry_delay = self._retry_policy.next_delay(
+                        http_method, attempt, response=response, request_headers=request_headers
+                    )
+                    if retry_delay is None or not _fits_deadline(retry_delay):
+                        return response
+                    logger.warning("%s %s returned %s. Retrying in %.2fs (attempt %s).",
+                                   http_method, endpoint_url, response.status_code, retry_delay, attempt + 1)
 
-        # Execute request hooks before making the request
-        for hook in self._request_hooks:
-            try:
-                await hook(http_method, endpoint_url, request_params)
-            except Exception as hook_error:
-                raise OffersAPIError(f"Request hook {hook.__class__.__name__} failed: {hook_error}") from hook_error
+                await asyncio.sleep(retry_delay)
+                attempt += 1
+
+    async def _send_with_auth(
+        self,
+        http_method: str,
+        endpoint_url: str,
+        execute_request: Callable[[str, str, str], Awaitable[BaseResponse]],
+        endpoint: str | None,
+        request_params: dict[str, Any],
+    ) -> BaseResponse:
+        """
+        Perform one attempt of an authenticated request, refreshing an expired token once.
+        """
+        access_token: str = await self._prepare_request(http_method, endpoint_url, request_params)
 
         try:
-            response: BaseResponse = await execute_request(http_method, endpoint_url, access_token, **request_params)
+            async with enforce_deadline("request"):
+                response: BaseResponse = await self._execute_limited(
+                    execute_request, http_method, endpoint_url, access_token, request_params, endpoint
+                )
         except RequestExecutionError as request_error:
             raise request_error
 
+        # The body is only decoded for a 401, to tell an expired token from other auth errors
         if response.status_code == 401 and "Access token expired" in response.text:
-            new_access_token: str | None = await self.auth_client.get_access_token(force_refresh=True)
-            if not new_access_token:
-                raise OffersAPIError("Failed to retrieve refreshed access token.")
-
-            logger.debug("Retrying request with refreshed access token...")
+            new_access_token: str = await self._refresh_access_token()
 
             try:
-                response: BaseResponse = await execute_request(
-                    http_method,
-                    endpoint_url,
-                    new_access_token,
-                    **request_params
-                )
+                async with enforce_deadline("request"):
+                    response: BaseResponse = await self._execute_limited(
+                        execute_request, http_method, endpoint_url, new_access_token, request_params, endpoint
+                    )
             except RequestExecutionError as retry_error:
                 raise retry_error
 
         return response
+
+
+def _fits_deadline(retry_delay: float) -> bool:
+    """
+    Whether a retry can still be sent after `retry_delay` seconds without overrunning the deadline.
+    """
+    remaining: float | None = remaining_seconds()
+    if remaining is None or retry_delay < remaining:
+        return True
+    logger.warning("Not retrying: a %.2fs backoff exceeds the %.2fs left until the deadline.",
+                   retry_delay, max(remaining, 0))
+    return False
+
+
+def _signals_overload(status_code: int) -> bool:
+    """
+    Whether a response status tells the client to send less: 429 Too Many Requests or any 5xx.
+    """
+    return status_code == 429 or status_code >= 500
@@ -1,16 +1,31 @@
-from typing import Any
+import importlib.util
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Mapping
 
 import httpx
 
 from sdk.auth.client import AuthClient
+from sdk.config.compression_config import CompressionConfig
+from sdk.config.pool_config import PoolConfig
 from sdk.http.backends.base_async_backend import AbstractAsyncBackend
+from sdk.http.circuit_breaker import CircuitBreakerRegistry
+from sdk.http.compression import StreamDecoder
+from sdk.http.concurrency import AdaptiveConcurrencyLimiter
+from sdk.http.rate_limit import ClientRateLimiter
+from sdk.http.retry import RetryPolicy
+from sdk.http.routing import EndpointRouter
+from sdk.http.transport import SharedTransport
 from sdk.http.hooks.type import RequestHook
 from sdk.http.interfaces import BaseResponse, HTTPBackend
+from sdk.http.response import STREAM_CHUNK_BYTES, BufferedResponse, StreamingResponse
+from sdk.utils.logger import logger
 from sdk.utils.exceptions import RequestExecutionError
+from sdk.utils.metrics import MetricsRegistry
 
 
-class HttpxResponseAdapter(BaseResponse):
-    def __init__(self, httpx_response: httpx.Response):
+class HttpxResponseAdapter(BufferedResponse, BaseResponse):
+    def __init__(self, httpx_response: httpx.Response, content: bytes | None = None):
+        super().__init__(httpx_response.content if content is None else content, httpx_response.charset_encoding)
         self._httpx_response: httpx.Response = httpx_response
 
     @property
@@ -18,11 +33,43 @@ class HttpxResponseAdapter(BaseResponse):
         return self._httpx_response.status_code
 
     @property
-    def text(self) -> str:
-        return self._httpx_response.text
+    def headers(self) -> Mapping[str, str]:
+        return self._httpx_response.headers
 
-    async def json(self) -> Any:
-        return self._httpx_response.json()
+
+class HttpxStreamingResponse(StreamingResponse):
+    def __init__(
+        self,
+        httpx_response: httpx.Response,
+        *,
+        stream_decoder: StreamDecoder | None = None,
+        metrics: MetricsRegistry | None = None,
+        max_bytes: int | None = None,
+    ):
+        super().__init__(
+            httpx_response.charset_encoding, stream_decoder=stream_decoder, metrics=metrics, max_bytes=max_bytes
+        )
+        self._httpx_response: httpx.Response = httpx_response
+
+    @property
+    def status_code(self) -> int:
+        return self._httpx_response.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._httpx_response.headers
+
+    async def _aiter_network_bytes(self) -> AsyncIterator[bytes]:
+        # With an SDK decoder the body is read as received, otherwise httpx decodes it
+        network_chunks: AsyncIterator[bytes] = (
+            self._httpx_response.aiter_raw(STREAM_CHUNK_BYTES) if self._stream_decoder
+            else self._httpx_response.aiter_bytes(STREAM_CHUNK_BYTES)
+        )
+        try:
+            async for chunk in network_chunks:
+                yield chunk
+        except httpx.RequestError as httpx_error:
+            raise RequestExecutionError(f"HTTPX stream failed: {str(httpx_error)}") from httpx_error
 
 
 class HttpxBackend(AbstractAsyncBackend, HTTPBackend):
@@ -31,26 +78,92 @@ class HttpxBackend(AbstractAsyncBackend, HTTPBackend):
         auth_client: AuthClient,
         timeout_seconds: float = 10.0,
         request_hooks: list[RequestHook] | None = None,
+        pool_config: PoolConfig | None = None,
+        unix_socket_path: str | None = None,
+        compression_config: CompressionConfig | None = None,
+        metrics: MetricsRegistry | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        rate_limiter: ClientRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        deadline_seconds: float | None = None,
+        max_response_bytes: int | None = None,
+        router: EndpointRouter | None = None,
+        transport: SharedTransport | None = None,
     ):
-        super().__init__(auth_client, request_hooks)
-        self._httpx_client: httpx.AsyncClient = httpx.AsyncClient(
-            timeout=timeout_seconds,
+        super().__init__(
+            auth_client,
+            request_hooks,
+            compression_config=compression_config,
+            metrics=metrics,
+            concurrency_limiter=concurrency_limiter,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            circuit_breakers=circuit_breakers,
+            deadline_seconds=deadline_seconds,
+            max_response_bytes=max_response_bytes,
+            router=router,
+            transport=transport,
+        )
+        self._pool_config: PoolConfig = transport.pool_config if transport else (pool_config or PoolConfig())
+        self._init_pool(self._pool_config, unix_socket_path, timeout_seconds)
+
+    @property
+    def _httpx_client(self) -> httpx.AsyncClient:
+        return self._current_pool()
+
+    @classmethod
+    def build_transport(
+        cls, pool_config: PoolConfig, unix_socket_path: str | None, timeout_seconds: float
+    ) -> httpx.AsyncClient:
+        http2: bool = pool_config.http2 and _http2_available()
+        limits: httpx.Limits = httpx.Limits(
+            max_connections=pool_config.max_connections,
+            max_keepalive_connections=pool_config.max_keepalive_connections,
+            keepalive_expiry=pool_config.keepalive_expiry,
+        )
+        return httpx.AsyncClient(
+            timeout=_build_timeout(timeout_seconds, pool_config),
             follow_redirects=True,
-            limits=httpx.Limits(max_connections=10),
+            http2=http2,
+            limits=limits,
+            # A custom transport ignores the client's pool settings, so they are repeated on it
+            transport=(
+                httpx.AsyncHTTPTransport(uds=unix_socket_path, http2=http2, limits=limits)
+                if unix_socket_path else None
+            ),
         )
 
+    @classmethod
+    async def close_transport(cls, pool: httpx.AsyncClient) -> None:
+        await pool.aclose()
+
     async def request(self, http_method: str, endpoint_url: str, **request_params: Any) -> BaseResponse:
         async def execute_request(method_: str, url_: str, token: str, **params: Any) -> BaseResponse:
-            headers: dict[str, str] = params.pop("headers", {})
-            headers["Bearer"] = token
+            headers: dict[str, str] = self._build_headers(params, token)
             try:
-                httpx_response: BaseResponse = await self._httpx_client.request(
-                    method=http_method, url=endpoint_url, headers=headers, **params
+                httpx_request: httpx.Request = self._httpx_client.build_request(
+                    method=method_, url=url_, headers=headers, **params
                 )
+                # Streamed, so an oversized body is abandoned instead of read into memory
+                httpx_response: httpx.Response = await self._httpx_client.send(httpx_request, stream=True)
+                try:
+                    # With the SDK's decoders the body is read as received, otherwise httpx decodes it
+                    content: bytes = await self._read_body(
+                        httpx_response.headers,
+                        lambda: (
+                            httpx_response.aiter_raw(STREAM_CHUNK_BYTES) if self._decodes_content
+                            else httpx_response.aiter_bytes(STREAM_CHUNK_BYTES)
+                        ),
+                    )
+                finally:
+                    await httpx_response.aclose()
             except httpx.RequestError as httpx_error:
                 raise RequestExecutionError(f"HTTPX request failed: {str(httpx_error)}") from httpx_error
 
-            return HttpxResponseAdapter(httpx_response)
+            if self._decodes_content:
+                content = await self._decode_body(content, httpx_response.headers.get("Content-Encoding"))
+            return HttpxResponseAdapter(httpx_response, content)
 
         return await self._request_with_auth(
             http_method,
@@ -59,5 +172,52 @@ class HttpxBackend(AbstractAsyncBackend, HTTPBackend):
             **request_params,
         )
 
+    def stream(self, http_method: str, endpoint_url: str, **request_params: Any) -> AsyncContextManager[StreamingResponse]:
+        @asynccontextmanager
+        async def open_stream(method_: str, url_: str, token: str, **params: Any) -> AsyncIterator[StreamingResponse]:
+            headers: dict[str, str] = self._build_headers(params, token)
+            try:
+                async with self._httpx_client.stream(method=method_, url=url_, headers=headers, **params) as response:
+                    yield HttpxStreamingResponse(
+                        response,
+                        stream_decoder=self._stream_decoder(response.headers.get("Content-Encoding")),
+                        metrics=self._metrics,
+                        max_bytes=self._max_response_bytes,
+                    )
+            except httpx.RequestError as httpx_error:
+                raise RequestExecutionError(f"HTTPX request failed: {str(httpx_error)}") from httpx_error
+
+        return self._stream_with_auth(http_method, endpoint_url, open_stream=open_stream, **request_params)
+
+    async def _open_warm_connection(self, url: str) -> None:
+        try:
+            await self._httpx_client.head(url)
+        except httpx.RequestError as httpx_error:
+            raise RequestExecutionError(f"HTTPX request failed: {str(httpx_error)}") from httpx_error
+
     async def aclose(self) -> None:
-        await self._httpx_client.aclose()
+        await self._close_transport()
+
+
+def _build_timeout(timeout_seconds: float, pool_config: PoolConfig) -> httpx.Timeout:
+    """
+    Build the httpx timeout, using timeout_seconds for every phase the pool config leaves unset.
+    """
+    return httpx.Timeout(
+        timeout_seconds,
+        connect=pool_config.connect_timeout or timeout_seconds,
+        read=pool_config.read_timeout or timeout_seconds,
+        write=pool_config.read_timeout or timeout_seconds,
+        pool=pool_config.pool_timeout or timeout_seconds,
+    )
+
+
+def _http2_available() -> bool:
+    """
+    Check whether the optional `h2` package needed for HTTP/2 is installed.
+    """
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 was requested but the 'h2' package is not installed; falling back to HTTP/1.1. "
+                       "Install it with: pip install 'httpx[http2]'")
+        return False
+    return True
@@ -1,25 +1,47 @@
 import asyncio
-from typing import Any
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Iterator, Mapping, TypeVar
 
 import requests
 from requests import RequestException
+from requests.adapters import HTTPAdapter
 from requests import Response as RequestsResponse
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.exceptions import HTTPError, NewConnectionError
 
 from sdk.auth.client import AuthClient
+from sdk.config.compression_config import CompressionConfig
+from sdk.config.pool_config import PoolConfig
+from sdk.http.backends.base_async_backend import AbstractAsyncBackend
+from sdk.http.circuit_breaker import CircuitBreakerRegistry
+from sdk.http.compression import StreamDecoder
+from sdk.http.deadline import bound_timeout
+from sdk.http.concurrency import AdaptiveConcurrencyLimiter
+from sdk.http.rate_limit import ClientRateLimiter
+from sdk.http.retry import RetryPolicy
+from sdk.http.routing import EndpointRouter
+from sdk.http.transport import SharedTransport
 from sdk.http.hooks.type import RequestHook
 from sdk.http.interfaces import BaseResponse, HTTPBackend
+from sdk.http.response import STREAM_CHUNK_BYTES, BodySizeLimit, BufferedResponse, StreamingResponse
 from sdk.utils.logger import logger
-from sdk.utils.exceptions import OffersAPIError, RequestExecutionError
+from sdk.utils.exceptions import RequestExecutionError
+from sdk.utils.metrics import MetricsRegistry
 
+T = TypeVar("T")
 
-class RequestsResponseAdapter(BaseResponse):
-    def __init__(self, requests_response: RequestsResponse):
+
+class RequestsResponseAdapter(BufferedResponse, BaseResponse):
+    def __init__(self, requests_response: RequestsResponse, content: bytes | None = None):
+        # The declared charset only; requests' own `text` may run costly charset detection
+        super().__init__(
+            requests_response.content if content is None else content, requests_response.encoding
+        )
         self._requests_response: RequestsResponse = requests_response
 
     @property
@@ -27,65 +49,415 @@ class RequestsResponseAdapter(BaseResponse):
         return self._requests_response.status_code
 
     @property
-    def text(self) -> str:
-        return self._requests_response.text
+    def headers(self) -> Mapping[str, str]:
+        return self._requests_response.headers
+
+
+class RequestsStreamingResponse(StreamingResponse):
+    def __init__(
+        self,
+        requests_response: RequestsResponse,
+        backend: "RequestsBackend",
+        *,
+        stream_decoder: StreamDecoder | None = None,
+        metrics: MetricsRegistry | None = None,
+        max_bytes: int | None = None,
+    ):
+        super().__init__(
+            requests_response.encoding, stream_decoder=stream_decoder, metrics=metrics, max_bytes=max_bytes
+        )
+        self._requests_response: RequestsResponse = requests_response
+        self._backend: RequestsBackend = backend
+
+    @property
+    def status_code(self) -> int:
+        return self._requests_response.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._requests_response.headers
+
+    async def _aiter_network_bytes(self) -> AsyncIterator[bytes]:
+        # With an SDK decoder the body is read as received, otherwise urllib3 decodes it
+        chunks: Iterator[bytes] = (
+            self._requests_response.raw.stream(STREAM_CHUNK_BYTES, decode_content=False) if self._stream_decoder
+            else self._requests_response.iter_content(STREAM_CHUNK_BYTES)
+        )
+        while True:
+            # Every read blocks on the socket, so each one runs on the backend's thread pool
+            try:
+                chunk: bytes | None = await self._backend._run_in_pool(lambda: next(chunks, None))
+            except (RequestException, HTTPError) as request_exception:
+                raise RequestExecutionError(f"Network error (requests): {request_exception}") from request_exception
+            if chunk is None:
+                return
+            yield chunk
+
+
+def _read_body(response: RequestsResponse, body_limit: BodySizeLimit, *, decode_content: bool) -> bytes:
+    """
+    Read a streamed response body on a worker thread, up to the limit's maximum size.
+
+    A body with a Content-Length within the limit is read at once; any other body is
+    read chunk by chunk and abandoned as soon as it exceeds the limit. Without
+    `decode_content`, the body is read as received, for the SDK's own decoders.
+    """
+    # Decoded by urllib3, an encoded body can be far larger than its Content-Length
+    library_decoded: bool = decode_content and bool(response.headers.get("Content-Encoding"))
+    if body_limit.check_content_length(response.headers) and not library_decoded:
+        return body_limit.add(response.content if decode_content else response.raw.read(decode_content=False))
+    chunks: Iterator[bytes] = (
+        response.iter_content(STREAM_CHUNK_BYTES) if decode_content
+        else response.raw.stream(STREAM_CHUNK_BYTES, decode_content=False)
+    )
+    return b"".join([body_limit.add(chunk) for chunk in chunks])
 
-    async def json(self) -> dict[str, Any] | list[Any] | None:
-        return await asyncio.to_thread(self._requests_response.json)
 
+class UnixSocketConnection(HTTPConnection):
+    """
+    urllib3 connection to the Unix domain socket in `socket_path`, set by subclasses.
+    """
+    socket_path: str = ""
+
+    def _new_conn(self) -> socket.socket:
+        unix_socket: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            unix_socket.settimeout(self.timeout)
+        try:
+            unix_socket.connect(self.socket_path)
+        except OSError as socket_error:
+            unix_socket.close()
+            raise NewConnectionError(
+                self, f"Failed to connect to Unix socket {self.socket_path}: {socket_error}"
+            ) from socket_error
+        return unix_socket
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """
+    Transport adapter that sends every http:// request through one Unix domain socket.
+
+    The URL's host only fills the Host header; connections are pooled like TCP ones.
+    """
+
+    def __init__(self, socket_path: str, **adapter_params: Any) -> None:
+        self._socket_path: str = socket_path
+        super().__init__(**adapter_params)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        connection_cls: type[HTTPConnection] = type(
+            "BoundUnixSocketConnection", (UnixSocketConnection,), {"socket_path": self._socket_path}
+        )
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": type("UnixSocketConnectionPool", (HTTPConnectionPool,), {"ConnectionCls": connection_cls}),
+        }
+
+
+class RequestsTransport:
+    """
+    The connection pool of a `RequestsBackend`: a session, its adapter and the worker threads.
+    """
+    __slots__ = ("session", "http_adapter", "executor", "pool_size", "last_request_time")
+
+    def __init__(self, pool_size: int, unix_socket_path: str | None) -> None:
+        self.pool_size: int = pool_size
+        self.session: requests.Session = requests.Session()
+        self.http_adapter: HTTPAdapter = (
+            UnixSocketAdapter(unix_socket_path, pool_maxsize=pool_size) if unix_socket_path
+            else HTTPAdapter(pool_maxsize=pool_size)
+        )
+        self.session.mount("http://", self.http_adapter)
+        self.session.mount("https://", self.http_adapter)
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="sdk-requests"
+        )
+        # Shared by every backend on the pool, so one idle client does not clear a busy pool
+        self.last_request_time: float = time.monotonic()
+
+    def close(self) -> None:
+        """
+        Close the session and shut down the worker threads, cancelling requests that have not started.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+
+class RequestsBackend(AbstractAsyncBackend, HTTPBackend):
+    """
+    Runs blocking `requests` calls on a thread pool owned by the backend.
+
+    The pool has one thread per pooled connection of the session's `HTTPAdapter`,
+    so every worker can hold a connection and bulk traffic never competes with
+    other users of the event loop's default executor.
+    """
 
-class RequestsBackend(HTTPBackend):
     def __init__(
         self,
         auth_client: AuthClient,
         timeout_seconds: float = 10.0,
         request_hooks: list[RequestHook] | None = None,
+        pool_config: PoolConfig | None = None,
+        unix_socket_path: str | None = None,
+        compression_config: CompressionConfig | None = None,
+        metrics: MetricsRegistry | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        rate_limiter: ClientRateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        deadline_seconds: float | None = None,
+        max_response_bytes: int | None = None,
+        router: EndpointRouter | None = None,
+        transport: SharedTransport | None = None,
     ):
-        self.auth_client: AuthClient = auth_client
-        self._timeout_seconds: float = timeout_seconds
-        self._session: requests.Session = requests.Session()
-        self._request_hooks: list[RequestHook] = request_hooks or []
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
-        retry=retry_if_exception_type(RequestException),
-        reraise=True,
-    )
-    async def request(self, http_method: str, endpoint_url: str, **request_params: Any) -> BaseResponse:
-        def execute_request_with_token(access_token: str) -> RequestsResponse:
-            headers: dict[str, str] = request_params.get("headers", {})
-            headers["Bearer"] = access_token
-            return self._session.request(
-                method=http_method, url=endpoint_url, timeout=self._timeout_seconds, headers=headers, **request_params
-            )
-
-        access_token: str | None = await self.auth_client.get_access_token()
-        if not access_token:
-            raise OffersAPIError("Failed to retrieve access token.")
-
-        # Execute request hooks before making the request
-        for hook in self._request_hooks:
+        super().__init__(
+            auth_client,
+            request_hooks,
+            compression_config=compression_config,
+            metrics=metrics,
+            concurrency_limiter=concurrency_limiter,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            circuit_breakers=circuit_breakers,
+            deadline_seconds=deadline_seconds,
+            max_response_bytes=max_response_bytes,
+            router=router,
+            transport=transport,
+        )
+        self._pool_config: PoolConfig = transport.pool_config if transport else (pool_config or PoolConfig())
+        self._timeout: tuple[float, float] = (
+            self._pool_config.connect_timeout or timeout_seconds,
+            self._pool_config.read_timeout or timeout_seconds,
+        )
+        self._init_pool(self._pool_config, unix_socket_path, timeout_seconds)
+        self._pool_size: int = self._pool_config.connections_per_host
+        self._counter_lock: threading.Lock = threading.Lock()
+        self._queued_requests: int = 0
+        self._active_requests: int = 0
+
+    @classmethod
+    def build_transport(
+        cls, pool_config: PoolConfig, unix_socket_path: str | None, timeout_seconds: float
+    ) -> RequestsTransport:
+        return RequestsTransport(pool_config.connections_per_host, unix_socket_path)
+
+    @classmethod
+    async def close_transport(cls, pool: RequestsTransport) -> None:
+        pool.close()
+
+    @property
+    def _requests_transport(self) -> RequestsTransport:
+        try:
+            return self._current_pool()
+        except RuntimeError as closed_error:
+            raise RequestExecutionError("Requests backend is closed.") from closed_error
+
+    @property
+    def _session(self) -> requests.Session:
+        return self._requests_transport.session
+
+    @property
+    def _http_adapter(self) -> HTTPAdapter:
+        return self._requests_transport.http_adapter
+
+    @property
+    def _executor(self) -> ThreadPoolExecutor:
+        return self._requests_transport.executor
+
+    def _reset_after_fork(self) -> None:
+        # Another thread may have held the lock at the fork, and the parent's worker threads do not exist here
+        self._counter_lock = threading.Lock()
+        self._queued_requests = 0
+        self._active_requests = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of requests waiting for a free worker thread.
+        """
+        return self._queued_requests
+
+    @property
+    def active_requests(self) -> int:
+        """
+        Number of requests currently being executed by worker threads.
+        """
+        return self._active_requests
+
+    def _evict_idle_connections(self) -> None:
+        """
+        Drop pooled connections once the backend has been idle longer than the keep-alive expiry.
+
+        urllib3 has no per-connection idle timeout, so the whole pool is cleared instead.
+        """
+        now: float = time.monotonic()
+        if now - self._requests_transport.last_request_time > self._pool_config.keepalive_expiry:
+            logger.debug("Evicting idle pooled connections.")
+            self._http_adapter.poolmanager.clear()
+        self._requests_transport.last_request_time = now
+
+    def _attempt_timeout(self) -> tuple[float, float]:
+        """
+        The (connect, read) timeouts of one attempt, shortened to the time left until the deadline.
+        """
+        connect_timeout, read_timeout = self._timeout
+        return bound_timeout(connect_timeout), bound_timeout(read_timeout)
+
+    async def _run_in_pool(self, blocking_call: Callable[[], T]) -> T:
+        """
+        Run a blocking call on the backend's thread pool while tracking queue depth.
+        """
+        dequeued: bool = False
+
+        def dequeue() -> None:
+            # Called when the call starts, and when it finishes or is cancelled; counts only once
+            nonlocal dequeued
+            with self._counter_lock:
+                if not dequeued:
+                    dequeued = True
+                    self._queued_requests -= 1
+
+        def run_counted() -> T:
+            dequeue()
+            with self._counter_lock:
+                self._active_requests += 1
             try:
-                await hook(http_method, endpoint_url, request_params)
-            except Exception as hook_error:
-                raise OffersAPIError(f"Request hook {hook.__class__.__name__} failed: {hook_error}") from hook_error
+                return blocking_call()
+            finally:
+                with self._counter_lock:
+                    self._active_requests -= 1
 
+        # Resolved first: in a forked child, it rebuilds the pool and resets the counters
+        executor: ThreadPoolExecutor = self._executor
+        with self._counter_lock:
+            self._queued_requests += 1
         try:
-            response: RequestsResponse = await asyncio.to_thread(execute_request_with_token, access_token)
+            future: asyncio.Future = asyncio.get_running_loop().run_in_executor(executor, run_counted)
+        except RuntimeError:
+            # The executor has been shut down
+            dequeue()
+            raise RequestExecutionError("Requests backend is closed.")
+        # A call cancelled while still queued never starts, so it leaves the queue here
+        future.add_done_callback(lambda _: dequeue())
+        return await future
 
-            if response.status_code == 401 and "Access token expired" in response.text:
-                new_access_token: str | None = await self.auth_client.get_access_token(force_refresh=True)
-                if not new_access_token:
-                    raise OffersAPIError("Failed to retrieve refreshed access token.")
+    async def request(self, http_method: str, endpoint_url: str, **request_params: Any) -> BaseResponse:
+        async def execute_request(method_: str, url_: str, token: str, **params: Any) -> BaseResponse:
+            headers: dict[str, str] = self._build_headers(params, token)
+            if "content" in params:
+                params["data"] = params.pop("content")
+            decodes_content: bool = self._decodes_content
+            # A cancelled worker thread runs on, so its timeouts are cut to the deadline instead
+            timeout: tuple[float, float] = self._attempt_timeout()
+
+            body_limit: BodySizeLimit = BodySizeLimit(self._max_response_bytes)
+
+            def send() -> tuple[RequestsResponse, bytes]:
+                # Streamed, so an oversized body is abandoned instead of read into memory
+                response: RequestsResponse = self._session.request(
+                    method=method_, url=url_, timeout=timeout, headers=headers, stream=True, **params
+                )
+                try:
+                    return response, _read_body(response, body_limit, decode_content=not decodes_content)
+                finally:
+                    # Returns the connection to the pool, or drops it if the body was not fully read
+                    response.close()
+
+            self._evict_idle_connections()
+            try:
+                response, content = await self._run_in_pool(send)
+            except (RequestException, HTTPError) as request_exception:
+                raise RequestExecutionError(f"Network error (requests): {request_exception}") from request_exception
+            finally:
+                body_limit.record(self._metrics)
+
+            if decodes_content:
+                content = await self._decode_body(content, response.headers.get("Content-Encoding"))
+            return RequestsResponseAdapter(response, content)
+
+        return await self._request_with_auth(
+            http_method,
+            endpoint_url,
+            execute_request=execute_request,
+            **request_params,
+        )
+
+    def stream(self, http_method: str, endpoint_url: str, **request_params: Any) -> AsyncContextManager[StreamingResponse]:
+        @asynccontextmanager
+        async def open_stream(method_: str, url_: str, token: str, **params: Any) -> AsyncIterator[StreamingResponse]:
+            headers: dict[str, str] = self._build_headers(params, token)
+            if "content" in params:
+                params["data"] = params.pop("content")
+            timeout: tuple[float, float] = self._attempt_timeout()
+
+            def send() -> RequestsResponse:
+                return self._session.request(
+                    method=method_, url=url_, timeout=timeout, headers=headers, stream=True, **params
+                )
 
-                logger.debug("Retrying request with refreshed access token...")
-                response = await asyncio.to_thread(execute_request_with_token, new_access_token)
+            self._evict_idle_connections()
+            try:
+                response: RequestsResponse = await self._run_in_pool(send)
+            except RequestException as request_exception:
+                raise RequestExecutionError(f"Network error (requests): {request_exception}") from request_exception
+
+            try:
+                yield RequestsStreamingResponse(
+                    response,
+                    self,
+                    stream_decoder=self._stream_decoder(response.headers.get("Content-Encoding")),
+                    metrics=self._metrics,
+                    max_bytes=self._max_response_bytes,
+                )
+            finally:
+                # Returns the connection to the pool, or drops it if the body was not fully read
+                response.close()
 
-            return RequestsResponseAdapter(response)
+        return self._stream_with_auth(http_method, endpoint_url, open_stream=open_stream, **request_params)
 
+    async def warm_connections(self, url: str, count: int) -> int:
+        """
+        Open up to `count` pooled connections, as many as the connection pool keeps.
+        """
+        count = min(count, self._pool_size)
+        # Every worker holds its connection until all have one, so none reuses another's
+        barrier: threading.Barrier = threading.Barrier(max(count, 1), timeout=self._timeout[0])
+        return await self._gather_warm_connections(
+            url, count, lambda warm_url: self._open_warm_connection(warm_url, barrier)
+        )
+
+    async def _open_warm_connection(self, url: str, barrier: threading.Barrier | None = None) -> None:
+        def send() -> None:
+            try:
+                response: RequestsResponse = self._session.head(url, timeout=self._timeout, stream=True)
+            except BaseException:
+                if barrier is not None:
+                    barrier.abort()
+                raise
+            try:
+                if barrier is not None:
+                    barrier.wait()
+            except threading.BrokenBarrierError:
+                pass
+            finally:
+                # Closing a fully read response returns its connection to the pool
+                response.content
+                response.close()
+
+        self._evict_idle_connections()
+        try:
+            await self._run_in_pool(send)
         except RequestException as request_exception:
             raise RequestExecutionError(f"Network error (requests): {request_exception}") from request_exception
 
+    async def aclose(self) -> None:
+        """
+        Close the session and shut down the thread pool, cancelling requests that have not started.
+        """
+        await self._close_transport()
+
     async def close(self) -> None:
-        self._session.close()
+        """
+        Alias of `aclose`, kept for backward compatibility.
+        """
+        await self.aclose()
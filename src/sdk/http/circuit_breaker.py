@@ -0,0 +1,221 @@
+import time
+from collections import deque
+from enum import Enum
+
+from sdk.config.circuit_breaker_config import CircuitBreakerConfig
+from sdk.utils.exceptions import CircuitOpenError
+from sdk.utils.logger import logger
+from sdk.utils.metrics import MetricsRegistry
+
+CIRCUIT_OPENED = "circuit_breaker.opened"
+CIRCUIT_REJECTED = "circuit_breaker.rejected"
+CIRCUIT_OPEN_CIRCUITS = "circuit_breaker.open_circuits"
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitPermit:
+    """
+    Admission of one call by a `CircuitBreaker`, settled with `release` or `abandon`.
+    """
+    __slots__ = ("generation", "probe", "settled")
+
+    def __init__(self, generation: int, probe: bool) -> None:
+        self.generation: int = generation
+        self.probe: bool = probe
+        self.settled: bool = False
+
+
+class CircuitBreaker:
+    """
+    Failure-rate and slow-call circuit breaker of one endpoint.
+
+    Every state change starts a new generation; outcomes of calls admitted in an
+    earlier generation are ignored, so calls that were in flight when the circuit
+    opened cannot close it again, nor count towards the next closed window.
+    """
+
+    def __init__(self, endpoint: str, config: CircuitBreakerConfig, metrics: MetricsRegistry | None = None) -> None:
+        self.endpoint: str = endpoint
+        self._config: CircuitBreakerConfig = config
+        self._metrics: MetricsRegistry | None = metrics
+        self._state: CircuitState = CircuitState.CLOSED
+        self._generation: int = 0
+        self._opened_at: float = 0.0
+        # (failed, slow) outcome of each recent call while closed
+        self._window: deque[tuple[bool, bool]] = deque(maxlen=config.window_size)
+        self._probes_started: int = 0
+        self._probes_succeeded: int = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """
+        The current state; an open circuit whose open period is over reports half-open.
+        """
+        if self._state is CircuitState.OPEN and self._open_seconds_left() <= 0:
+            return CircuitState.HALF_OPEN
+        return self._state
+
+    def acquire(self) -> CircuitPermit:
+        """
+        Admit a call, or reject it while the circuit is open.
+
+        Returns:
+            CircuitPermit: The permit to pass to `release` or `abandon`.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all probe calls taken.
+        """
+        if self._state is CircuitState.OPEN:
+            open_seconds_left: float = self._open_seconds_left()
+            if open_seconds_left > 0:
+                self._reject(f"Circuit breaker of {self.endpoint} is open.", open_seconds_left)
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self._state is CircuitState.HALF_OPEN:
+            if self._probes_started >= self._config.half_open_calls:
+                self._reject(f"Circuit breaker of {self.endpoint} is half-open and waiting for its probes.", None)
+            self._probes_started += 1
+            return CircuitPermit(self._generation, probe=True)
+
+        return CircuitPermit(self._generation, probe=False)
+
+    def release(self, permit: CircuitPermit, *, failed: bool, duration: float) -> None:
+        """
+        Record the outcome of an admitted call.
+
+        Args:
+            permit (CircuitPermit): The permit returned by `acquire`.
+            failed (bool): Whether the call failed with a network error or a 5xx response.
+            duration (float): Seconds the call took, compared with `slow_call_seconds`.
+        """
+        if permit.settled:
+            return
+        permit.settled = True
+        if permit.generation != self._generation:
+            return
+
+        slow: bool = duration >= self._config.slow_call_seconds
+        if self._state is CircuitState.HALF_OPEN:
+            if failed or slow:
+                self._transition(CircuitState.OPEN)
+                return
+            self._probes_succeeded += 1
+            if self._probes_succeeded >= self._config.half_open_calls:
+                self._transition(CircuitState.CLOSED)
+            return
+
+        self._window.append((failed, slow))
+        if len(self._window) < self._config.minimum_calls:
+            return
+        failure_rate: float = sum(call_failed for call_failed, _ in self._window) / len(self._window)
+        slow_call_rate: float = sum(call_slow for _, call_slow in self._window) / len(self._window)
+        if (failure_rate >= self._config.failure_rate_threshold
+                or slow_call_rate >= self._config.slow_call_rate_threshold):
+            self._transition(CircuitState.OPEN)
+
+    def abandon(self, permit: CircuitPermit) -> None:
+        """
+        Settle a permit whose call was cancelled before it had an outcome.
+        """
+        if permit.settled:
+            return
+        permit.settled = True
+        if permit.probe and permit.generation == self._generation:
+            self._probes_started -= 1
+
+    def _open_seconds_left(self) -> float:
+        return self._opened_at + self._config.open_seconds - time.monotonic()
+
+    def _reject(self, message: str, retry_after_seconds: float | None) -> None:
+        if self._metrics is not None:
+            self._metrics.increment(CIRCUIT_REJECTED)
+        raise CircuitOpenError(message, endpoint=self.endpoint, retry_after_seconds=retry_after_seconds)
+
+    def _transition(self, state: CircuitState) -> None:
+        previous_state: CircuitState = self._state
+        self._state = state
+        self._generation += 1
+        self._window.clear()
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+            if self._metrics is not None:
+                self._metrics.increment(CIRCUIT_OPENED)
+            logger.warning("Circuit breaker of %s opened for %ss.", self.endpoint, self._config.open_seconds)
+        else:
+            logger.info("Circuit breaker of %s changed from %s to %s.", self.endpoint, previous_state.value, state.value)
+
+
+class CircuitBreakerRegistry:
+    """
+    The circuit breakers of a client, one per endpoint template, created on first use.
+
+    Examples:
+        >>> breakers = CircuitBreakerRegistry(CircuitBreakerConfig(enabled=True))
+        >>> permit = breakers.acquire("/products/{product_id}/offers")
+        >>> response = await send()
+        >>> breakers.release("/products/{product_id}/offers", permit, failed=response.status_code >= 500, duration=0.2)
+        >>> breakers.states()
+        {'/products/{product_id}/offers': <CircuitState.CLOSED: 'closed'>}
+    """
+
+    def __init__(self, config: CircuitBreakerConfig, metrics: MetricsRegistry | None = None) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            config (CircuitBreakerConfig): Thresholds and timings shared by all breakers.
+            metrics (MetricsRegistry | None): Registry receiving the opened, rejected and open circuit metrics.
+        """
+        self._config: CircuitBreakerConfig = config
+        self._metrics: MetricsRegistry | None = metrics
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        """
+        Return the circuit breaker of an endpoint template, creating it if needed.
+        """
+        breaker: CircuitBreaker | None = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(endpoint, self._config, self._metrics)
+        return breaker
+
+    def state(self, endpoint: str) -> CircuitState:
+        """
+        Return the state of an endpoint's circuit; endpoints never called are closed.
+        """
+        breaker: CircuitBreaker | None = self._breakers.get(endpoint)
+        return breaker.state if breaker is not None else CircuitState.CLOSED
+
+    def states(self) -> dict[str, CircuitState]:
+        """
+        Return the state of every endpoint called so far.
+        """
+        return {endpoint: breaker.state for endpoint, breaker in self._breakers.items()}
+
+    def acquire(self, endpoint: str) -> CircuitPermit:
+        """
+        Admit a call to an endpoint.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit rejects calls.
+        """
+        return self.breaker(endpoint).acquire()
+
+    def release(self, endpoint: str, permit: CircuitPermit, *, failed: bool, duration: float) -> None:
+        self.breaker(endpoint).release(permit, failed=failed, duration=duration)
+        self._publish()
+
+    def abandon(self, endpoint: str, permit: CircuitPermit) -> None:
+        self.breaker(endpoint).abandon(permit)
+
+    def _publish(self) -> None:
+        if self._metrics is not None:
+            open_circuits: int = sum(state is CircuitState.OPEN for state in self.states().values())
+            self._metrics.set_gauge(CIRCUIT_OPEN_CIRCUITS, open_circuits)
@@ -0,0 +1,234 @@
+import asyncio
+import gzip
+import zlib
+from typing import Callable, Iterator
+
+from sdk.config.compression_config import CompressionConfig
+from sdk.utils.exceptions import RequestExecutionError, ResponseTooLargeError
+from sdk.utils.metrics import MetricsRegistry
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Encodings the SDK can decode, in order of preference
+SUPPORTED_ENCODINGS: tuple[str, ...] = tuple(
+    encoding for encoding, available in (("zstd", zstandard), ("br", brotli), ("gzip", True)) if available
+)
+ACCEPT_ENCODING: str = ", ".join(SUPPORTED_ENCODINGS)
+
+REQUEST_BYTES_UNCOMPRESSED = "compression.request.bytes_uncompressed"
+REQUEST_BYTES_COMPRESSED = "compression.request.bytes_compressed"
+RESPONSE_BYTES_COMPRESSED = "compression.response.bytes_compressed"
+RESPONSE_BYTES_DECOMPRESSED = "compression.response.bytes_decompressed"
+
+# Most output one zlib decompression step may produce, so a compression bomb is stopped early
+_DECODE_PIECE_BYTES = 64 * 1024
+# Input fed at once to decoders without an output bound, which caps their output at this times the ratio
+_DECODE_INPUT_BYTES = 4 * 1024
+
+_ZLIB_DECOMPRESSOR_TYPE: type = type(zlib.decompressobj())
+
+
+class StreamDecoder:
+    """
+    Incrementally decodes a body sent with a `Content-Encoding`.
+
+    Input is decoded in bounded pieces, and decoding stops as soon as the output
+    exceeds `max_bytes`, so a small compressed body cannot inflate past the limit.
+    """
+
+    def __init__(self, content_encoding: str | None, max_bytes: int | None = None) -> None:
+        self._decompressors: list = [
+            _make_decompressor(encoding) for encoding in reversed(_parse_content_encoding(content_encoding))
+        ]
+        self._max_bytes: int | None = max_bytes
+        self.bytes_decoded: int = 0
+
+    def decompress(self, chunk: bytes) -> bytes:
+        """
+        Decode a chunk of the body.
+
+        Raises:
+            ResponseTooLargeError: If the body decoded so far exceeds the maximum size.
+        """
+        return b"".join([self._count(piece) for piece in self._decode(0, chunk)])
+
+    def flush(self) -> bytes:
+        """
+        Decode what the decompressors still buffer once the body has been received.
+
+        Raises:
+            ResponseTooLargeError: If the decoded body exceeds the maximum size.
+        """
+        remaining: bytes = b""
+        for decompressor in self._decompressors:
+            if remaining:
+                remaining = b"".join(_decode_bounded(decompressor, remaining))
+            flush: Callable[[], bytes] | None = getattr(decompressor, "flush", None)
+            if flush is not None:
+                remaining += flush()
+        return self._count(remaining)
+
+    def _decode(self, level: int, data: bytes) -> Iterator[bytes]:
+        if level == len(self._decompressors):
+            if data:
+                yield data
+            return
+        for piece in _decode_bounded(self._decompressors[level], data):
+            yield from self._decode(level + 1, piece)
+
+    def _count(self, piece: bytes) -> bytes:
+        self.bytes_decoded += len(piece)
+        if self._max_bytes is not None and self.bytes_decoded > self._max_bytes:
+            raise ResponseTooLargeError(
+                f"Response body decodes to more than the maximum of {self._max_bytes} bytes.",
+                limit_bytes=self._max_bytes,
+                received_bytes=self.bytes_decoded,
+            )
+        return piece
+
+
+def _decode_bounded(decompressor, data: bytes) -> Iterator[bytes]:
+    """
+    Feed data to a decompressor, yielding its output in bounded pieces.
+    """
+    if isinstance(decompressor, _ZLIB_DECOMPRESSOR_TYPE):
+        while data:
+            piece: bytes = decompressor.decompress(data, _DECODE_PIECE_BYTES)
+            data = decompressor.unconsumed_tail
+            if piece:
+                yield piece
+        return
+    for start in range(0, len(data), _DECODE_INPUT_BYTES):
+        piece = decompressor.decompress(data[start:start + _DECODE_INPUT_BYTES])
+        if piece:
+            yield piece
+
+
+def decompress(body: bytes, content_encoding: str | None, max_bytes: int | None = None) -> bytes:
+    """
+    Decode a complete body sent with a `Content-Encoding`.
+
+    Args:
+        body (bytes): The body as received.
+        content_encoding (str | None): The `Content-Encoding` header, possibly listing several encodings.
+        max_bytes (int | None): Largest decoded body to produce; None for no limit.
+
+    Returns:
+        bytes: The decoded body.
+
+    Raises:
+        RequestExecutionError: If the encoding is unsupported or the body is corrupt.
+        ResponseTooLargeError: If the decoded body exceeds `max_bytes`.
+    """
+    if not _parse_content_encoding(content_encoding):
+        return body
+    stream_decoder: StreamDecoder = StreamDecoder(content_encoding, max_bytes)
+    try:
+        return stream_decoder.decompress(body) + stream_decoder.flush()
+    except ResponseTooLargeError:
+        raise
+    except Exception as decode_error:
+        raise RequestExecutionError(f"Failed to decode {content_encoding} response body: {decode_error}") from decode_error
+
+
+async def compress_request_body(
+    body: bytes,
+    compression_config: CompressionConfig,
+    metrics: MetricsRegistry | None = None,
+) -> bytes:
+    """
+    gzip-compress a request body, in a worker thread when it is large.
+
+    Args:
+        body (bytes): The uncompressed body.
+        compression_config (CompressionConfig): Compression level and thread offload threshold.
+        metrics (MetricsRegistry | None): Registry receiving the byte counts before and after compression.
+
+    Returns:
+        bytes: The compressed body.
+    """
+    if len(body) >= compression_config.thread_offload_bytes:
+        compressed_body: bytes = await asyncio.to_thread(gzip.compress, body, compression_config.compression_level)
+    else:
+        compressed_body = gzip.compress(body, compression_config.compression_level)
+
+    if metrics is not None:
+        metrics.increment(REQUEST_BYTES_UNCOMPRESSED, len(body))
+        metrics.increment(REQUEST_BYTES_COMPRESSED, len(compressed_body))
+    return compressed_body
+
+
+async def decompress_response_body(
+    body: bytes,
+    content_encoding: str | None,
+    compression_config: CompressionConfig,
+    metrics: MetricsRegistry | None = None,
+    max_bytes: int | None = None,
+) -> bytes:
+    """
+    Decode a complete response body, in a worker thread when it is large.
+
+    Args:
+        body (bytes): The body as received.
+        content_encoding (str | None): The response's `Content-Encoding` header.
+        compression_config (CompressionConfig): Thread offload threshold.
+        metrics (MetricsRegistry | None): Registry receiving the byte counts before and after decoding.
+        max_bytes (int | None): Largest decoded body to produce; None for no limit.
+
+    Returns:
+        bytes: The decoded body.
+
+    Raises:
+        RequestExecutionError: If the encoding is unsupported or the body is corrupt.
+        ResponseTooLargeError: If the decoded body exceeds `max_bytes`.
+    """
+    if len(body) >= compression_config.thread_offload_bytes:
+        decoded_body: bytes = await asyncio.to_thread(decompress, body, content_encoding, max_bytes)
+    else:
+        decoded_body = decompress(body, content_encoding, max_bytes)
+
+    if metrics is not None:
+        metrics.increment(RESPONSE_BYTES_COMPRESSED, len(body))
+        metrics.increment(RESPONSE_BYTES_DECOMPRESSED, len(decoded_body))
+    return decoded_body
+
+
+class _BrotliDecompressor:
+    """
+    Gives `brotli.Decompressor` the `decompress` method of the zlib and zstandard decompressors.
+    """
+
+    def __init__(self) -> None:
+        self._decompressor = brotli.Decompressor()
+
+    def decompress(self, chunk: bytes) -> bytes:
+        return self._decompressor.process(chunk)
+
+
+def _parse_content_encoding(content_encoding: str | None) -> list[str]:
+    if not content_encoding:
+        return []
+    return [
+        encoding for encoding in (part.strip().lower() for part in content_encoding.split(","))
+        if encoding and encoding != "identity"
+    ]
+
+
+def _make_decompressor(encoding: str):
+    if encoding in ("gzip", "x-gzip"):
+        return zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    if encoding == "deflate":
+        return zlib.decompressobj()
+    if encoding == "br" and brotli is not None:
+        return _BrotliDecompressor()
+    if encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdDecompressor().decompressobj()
+    raise RequestExecutionError(f"Unsupported Content-Encoding: {encoding}")
@@ -0,0 +1,181 @@
+import asyncio
+import time
+from collections import deque
+
+from sdk.config.concurrency_config import ConcurrencyConfig
+from sdk.http.fork import ForkGuard
+from sdk.utils.logger import logger
+from sdk.utils.metrics import MetricsRegistry
+
+CONCURRENCY_LIMIT = "concurrency.limit"
+CONCURRENCY_IN_FLIGHT = "concurrency.in_flight"
+CONCURRENCY_QUEUE_DEPTH = "concurrency.queue_depth"
+
+# Weight of a new latency sample in the baseline's moving average, so one fast outlier cannot pin it low
+_BASELINE_WEIGHT = 0.1
+# Weight of a latency spike, so a lasting slowdown slowly becomes the new baseline instead of holding the limit down
+_SPIKE_WEIGHT = 0.02
+
+
+class ConcurrencyPermit:
+    """
+    A slot obtained from `AdaptiveConcurrencyLimiter.acquire`, returned with `release`.
+    """
+    __slots__ = ("started_at", "epoch", "saturated")
+
+    def __init__(self, epoch: int, saturated: bool) -> None:
+        self.started_at: float = time.monotonic()
+        self.epoch: int = epoch
+        self.saturated: bool = saturated
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits in-flight requests with an additive-increase/multiplicative-decrease (AIMD) limit.
+
+    While responses arrive with latency close to the baseline and the limit is fully
+    used, the limit grows by one per limit's worth of completed requests. A 429, a 5xx,
+    a network error or a latency spike cuts it by `decrease_factor`. Requests that were
+    already in flight when the limit was cut do not cut it again, so one overload burst
+    reduces the limit once. Callers waiting for a slot are served in arrival order.
+
+    Examples:
+        >>> limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True))
+        >>> permit = await limiter.acquire()
+        >>> try:
+        >>>     response = await send()
+        >>> finally:
+        >>>     limiter.release(permit, overloaded=response.status_code == 429)
+    """
+
+    def __init__(self, config: ConcurrencyConfig, metrics: MetricsRegistry | None = None) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            config (ConcurrencyConfig): Initial, minimum and maximum limit and the adjustment factors.
+            metrics (MetricsRegistry | None): Registry receiving the limit, in-flight and queue depth gauges.
+        """
+        self._config: ConcurrencyConfig = config
+        self._metrics: MetricsRegistry | None = metrics
+        self._limit: float = float(config.initial_limit)
+        self._in_flight: int = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._fork_guard: ForkGuard = ForkGuard()
+        self._baseline_latency: float | None = None
+        # Incremented on every decrease; permits from an older epoch cannot decrease the limit again
+        self._epoch: int = 0
+        self._publish()
+
+    @property
+    def limit(self) -> int:
+        """
+        The current maximum number of requests in flight.
+        """
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of callers waiting for a slot.
+        """
+        return len(self._waiters)
+
+    async def acquire(self) -> ConcurrencyPermit:
+        """
+        Wait for a free slot, after every caller that started waiting earlier.
+
+        Returns:
+            ConcurrencyPermit: The permit to pass to `release`.
+        """
+        if self._fork_guard.forked():
+            # Requests in flight or waiting at the fork belong to the parent; the learned limit is kept
+            self._in_flight = 0
+            self._waiters.clear()
+        if self._waiters or self._in_flight >= self.limit:
+            waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            self._publish()
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was handed over just before the cancellation; pass it on
+                    self._in_flight -= 1
+                    self._wake_waiters()
+                else:
+                    self._waiters.remove(waiter)
+                self._publish()
+                raise
+            saturated: bool = True
+        else:
+            self._in_flight += 1
+            saturated = self._in_flight >= self.limit
+
+        self._publish()
+        return ConcurrencyPermit(self._epoch, saturated)
+
+    def release(self, permit: ConcurrencyPermit, *, overloaded: bool, measure_latency: bool = True) -> None:
+        """
+        Return a slot and adjust the limit from the request's outcome.
+
+        Args:
+            permit (ConcurrencyPermit): The permit returned by `acquire`.
+            overloaded (bool): Whether the request signalled overload (429, 5xx or a network error).
+            measure_latency (bool): Whether the time since `acquire` is a latency sample. False for
+                streams, which stay open while the caller consumes the body, and for error responses,
+                which are often much faster than real work.
+        """
+        self._in_flight -= 1
+
+        latency: float = time.monotonic() - permit.started_at
+        latency_spike: bool = False
+        if measure_latency and not overloaded:
+            latency_spike = self._record_latency(latency)
+
+        if overloaded or latency_spike:
+            if permit.epoch == self._epoch:
+                self._decrease(reason="latency spike" if latency_spike else "overload")
+        elif permit.saturated:
+            # Additive increase: about one slot per limit's worth of successful requests
+            self._limit = min(float(self._config.max_limit), self._limit + 1 / self._limit)
+
+        self._wake_waiters()
+        self._publish()
+
+    def _record_latency(self, latency: float) -> bool:
+        """
+        Update the baseline latency, a moving average of the samples, and report whether the sample is a spike.
+        """
+        if self._baseline_latency is None:
+            self._baseline_latency = latency
+            return False
+
+        latency_spike: bool = latency > self._baseline_latency * self._config.latency_tolerance
+        weight: float = _SPIKE_WEIGHT if latency_spike else _BASELINE_WEIGHT
+        self._baseline_latency += (latency - self._baseline_latency) * weight
+        return latency_spike
+
+    def _decrease(self, *, reason: str) -> None:
+        self._epoch += 1
+        self._limit = max(float(self._config.min_limit), self._limit * self._config.decrease_factor)
+        logger.debug("Concurrency limit decreased to %s after %s.", self.limit, reason)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter: asyncio.Future = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            waiter.set_result(None)
+
+    def _publish(self) -> None:
+        if self._metrics is None:
+            return
+        self._metrics.set_gauge(CONCURRENCY_LIMIT, self.limit)
+        self._metrics.set_gauge(CONCURRENCY_IN_FLIGHT, self._in_flight)
+        self._metrics.set_gauge(CONCURRENCY_QUEUE_DEPTH, len(self._waiters))
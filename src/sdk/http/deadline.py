@@ -0,0 +1,97 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Iterator
+
+from sdk.utils.exceptions import DeadlineExceededError
+
+# Monotonic time by which the current call must finish, or None without a deadline
+_deadline_at: ContextVar[float | None] = ContextVar("sdk_deadline_at", default=None)
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """
+    Bound every SDK call made in the block, including from tasks it starts, to `seconds`.
+
+    Token acquisition, request hooks, each attempt and the waits between retries all
+    draw from the same budget. Nested deadlines never extend an enclosing one.
+
+    Args:
+        seconds (float | None): Time budget of the block; None leaves the current deadline unchanged.
+
+    Examples:
+        >>> with deadline(2.0):
+        >>>     offers = await client.offers.get_offers(product_id)
+    """
+    if seconds is None:
+        yield
+        return
+
+    deadline_at: float = time.monotonic() + seconds
+    current_deadline_at: float | None = _deadline_at.get()
+    if current_deadline_at is not None and current_deadline_at <= deadline_at:
+        yield
+        return
+
+    token = _deadline_at.set(deadline_at)
+    try:
+        yield
+    finally:
+        _deadline_at.reset(token)
+
+
+def remaining_seconds() -> float | None:
+    """
+    Seconds left until the current deadline, or None without a deadline.
+    """
+    deadline_at: float | None = _deadline_at.get()
+    if deadline_at is None:
+        return None
+    return deadline_at - time.monotonic()
+
+
+def deadline_expired() -> bool:
+    """
+    Whether the current deadline has passed, e.g. to tell a cancellation by `enforce_deadline` from others.
+    """
+    remaining: float | None = remaining_seconds()
+    return remaining is not None and remaining <= 0
+
+
+def bound_timeout(timeout_seconds: float) -> float:
+    """
+    Shorten a per-attempt timeout to the time left until the current deadline.
+    """
+    remaining: float | None = remaining_seconds()
+    if remaining is None:
+        return timeout_seconds
+    return max(min(timeout_seconds, remaining), 0.001)
+
+
+@asynccontextmanager
+async def enforce_deadline(phase: str) -> AsyncIterator[None]:
+    """
+    Cancel the block when the current deadline passes.
+
+    Args:
+        phase (str): Name of the work in the block, reported in the error.
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed, or passes during the block.
+    """
+    remaining: float | None = remaining_seconds()
+    if remaining is None:
+        yield
+        return
+    if remaining <= 0:
+        raise DeadlineExceededError(f"Deadline exceeded before {phase}.", phase=phase)
+
+    try:
+        async with asyncio.timeout(remaining) as timeout_scope:
+            yield
+    except TimeoutError as timeout_error:
+        if not timeout_scope.expired():
+            raise
+        raise DeadlineExceededError(f"Deadline exceeded during {phase}.", phase=phase) from timeout_error
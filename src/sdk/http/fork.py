@@ -0,0 +1,64 @@
+import os
+from typing import Any
+
+# Number of forks between the first import and the current process
+_fork_generation: int = 0
+
+# Resources of parent processes, kept alive so their finalizers never run in this process
+_abandoned_resources: list[Any] = []
+
+
+def _after_fork_in_child() -> None:
+    global _fork_generation
+    _fork_generation += 1
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def fork_generation() -> int:
+    """
+    Number of times the process was forked since the SDK was imported, counted in each child.
+    """
+    return _fork_generation
+
+
+def abandon(resource: Any) -> None:
+    """
+    Drop a resource inherited from the parent process without closing it.
+
+    Finalizers of HTTP clients close their connections, which for TLS writes a close
+    notification to a socket the parent still uses, so the resource is kept referenced
+    for the lifetime of the child instead of being garbage collected.
+    """
+    if resource is not None:
+        _abandoned_resources.append(resource)
+
+
+class ForkGuard:
+    """
+    Tells an object holding sockets, threads or event-loop-bound state that it now lives in a forked child.
+
+    Such state is copied into the child but belongs to the parent: the child must not
+    close it, since closing a TLS connection writes to a socket the parent still uses,
+    and must not reuse it. Owners check `forked` before each use and rebuild lazily.
+
+    Examples:
+        >>> if self._fork_guard.forked():
+        >>>     abandon(self._pool)
+        >>>     self._pool = None
+    """
+    __slots__ = ("_generation",)
+
+    def __init__(self) -> None:
+        self._generation: int = _fork_generation
+
+    def forked(self) -> bool:
+        """
+        Whether the process was forked since the previous call, or since the guard was created.
+        """
+        if self._generation == _fork_generation:
+            return False
+        self._generation = _fork_generation
+        return True
@@ -1,10 +1,20 @@
-from typing import Any, Protocol
+from typing import Any, AsyncContextManager, Mapping, Protocol
+
+from sdk.http.response import StreamingResponse
 
 
 class BaseResponse(Protocol):
     @property
     def status_code(self) -> int:
         ...
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        ...
+
+    @property
+    def content(self) -> bytes:
+        ...
     
     @property
     def text(self) -> str:
@@ -15,7 +25,17 @@ class BaseResponse(Protocol):
 
 
 class HTTPBackend(Protocol):
-    async def request(self, method: str, url: str, **kwargs: Any) -> BaseResponse:
+    # `endpoint` is the path template of the request, e.g. "/products/{product_id}/offers", which selects
+    # its rate limit and circuit breaker; backends fall back to the URL path without it
+    async def request(self, method: str, url: str, *, endpoint: str | None = None, **kwargs: Any) -> BaseResponse:
+        ...
+
+    def stream(
+        self, method: str, url: str, *, endpoint: str | None = None, **kwargs: Any
+    ) -> AsyncContextManager[StreamingResponse]:
+        ...
+
+    async def warm_connections(self, url: str, count: int) -> int:
         ...
 
     async def aclose(self) -> None:
@@ -0,0 +1,174 @@
+import asyncio
+import time
+from collections import deque
+
+from sdk.config.rate_limit_config import RateLimitConfig
+from sdk.utils.logger import logger
+from sdk.utils.metrics import MetricsRegistry
+
+RATE_LIMIT_CURRENT_RATE = "rate_limit.current_rate"
+RATE_LIMIT_THROTTLED_SECONDS = "rate_limit.throttled_seconds"
+RATE_LIMIT_PAUSES = "rate_limit.pauses"
+
+# Window over which the current request rate is measured
+_RATE_WINDOW_SECONDS = 1.0
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `requests_per_second` up to `burst` tokens.
+
+    A reservation always takes a token, running the bucket into debt when it is
+    empty, and returns how long the caller has to wait for that token. Callers are
+    therefore dispatched in the order they reserved, without a queue of waiters.
+    """
+
+    def __init__(self, requests_per_second: float, burst: int) -> None:
+        self.requests_per_second: float = requests_per_second
+        self.burst: int = burst
+        self._tokens: float = float(burst)
+        self._updated_at: float = time.monotonic()
+
+    def reserve(self, now: float) -> float:
+        """
+        Take a token.
+
+        Args:
+            now (float): The current `time.monotonic()` value.
+
+        Returns:
+            float: Seconds to wait before the request may be sent.
+        """
+        self._refill(now)
+        self._tokens -= 1
+        wait_seconds: float = max(0.0, self._updated_at - now)
+        if self._tokens < 0:
+            wait_seconds += -self._tokens / self.requests_per_second
+        return wait_seconds
+
+    def refund(self) -> None:
+        """
+        Return the token of a reservation that was abandoned before its request was sent.
+        """
+        self._tokens = min(float(self.burst), self._tokens + 1)
+
+    def drain(self, until: float) -> None:
+        """
+        Empty the bucket and stop refilling it before `until`.
+        """
+        self._tokens = min(self._tokens, 0.0)
+        self._updated_at = max(self._updated_at, until)
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated_at:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated_at) * self.requests_per_second)
+            self._updated_at = now
+
+
+class ClientRateLimiter:
+    """
+    Paces requests per endpoint template and pauses all dispatch after a 429.
+
+    Each endpoint template has a `TokenBucket` sized by `RateLimitConfig.limit_for`.
+    `pause` is called with the `Retry-After` of a 429 response and holds back every
+    request, on every endpoint, until that time. The buckets restart empty after a
+    pause, so dispatch resumes at the configured rate instead of with a burst.
+
+    Examples:
+        >>> limiter = ClientRateLimiter(RateLimitConfig(enabled=True, requests_per_second=10, burst=5))
+        >>> await limiter.acquire("/products/{product_id}/offers")
+        >>> response = await send()
+        >>> if response.status_code == 429:
+        >>>     limiter.pause(parse_retry_after(response.headers.get("Retry-After")))
+    """
+
+    def __init__(self, config: RateLimitConfig, metrics: MetricsRegistry | None = None) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            config (RateLimitConfig): Default and per-endpoint limits and the Retry-After bounds.
+            metrics (MetricsRegistry | None): Registry receiving the current rate, throttled time and pauses.
+        """
+        self._config: RateLimitConfig = config
+        self._metrics: MetricsRegistry | None = metrics
+        self._buckets: dict[str, TokenBucket] = {}
+        self._paused_until: float = 0.0
+        self._dispatched_at: deque[float] = deque()
+
+    @property
+    def current_rate(self) -> float:
+        """
+        Requests dispatched per second over the last second.
+        """
+        self._expire_dispatches(time.monotonic())
+        return len(self._dispatched_at) / _RATE_WINDOW_SECONDS
+
+    @property
+    def paused_for(self) -> float:
+        """
+        Seconds left until dispatch resumes after a 429, or 0 when not paused.
+        """
+        return max(0.0, self._paused_until - time.monotonic())
+
+    async def acquire(self, endpoint: str) -> None:
+        """
+        Wait until a request to the endpoint may be sent.
+
+        Args:
+            endpoint (str): The endpoint template, which selects the token bucket.
+        """
+        bucket: TokenBucket = self._bucket(endpoint)
+        wait_seconds: float = bucket.reserve(time.monotonic())
+        throttled_seconds: float = 0.0
+        try:
+            # Also wait out pauses that start while this request waits for its token
+            while (wait_seconds := max(wait_seconds, self._paused_until - time.monotonic())) > 0:
+                await asyncio.sleep(wait_seconds)
+                throttled_seconds += wait_seconds
+                wait_seconds = 0.0
+        except asyncio.CancelledError:
+            bucket.refund()
+            raise
+        finally:
+            if throttled_seconds and self._metrics is not None:
+                self._metrics.increment(RATE_LIMIT_THROTTLED_SECONDS, throttled_seconds)
+
+        now: float = time.monotonic()
+        self._dispatched_at.append(now)
+        self._expire_dispatches(now)
+        if self._metrics is not None:
+            self._metrics.set_gauge(RATE_LIMIT_CURRENT_RATE, len(self._dispatched_at) / _RATE_WINDOW_SECONDS)
+
+    def pause(self, retry_after_seconds: float | None) -> None:
+        """
+        Hold back all requests after a 429 response.
+
+        Args:
+            retry_after_seconds (float | None): The response's `Retry-After` in seconds, or None
+                when it has none, in which case `default_retry_after_seconds` applies.
+        """
+        if retry_after_seconds is None:
+            retry_after_seconds = self._config.default_retry_after_seconds
+        pause_seconds: float = min(retry_after_seconds, self._config.max_retry_after_seconds)
+
+        self._paused_until = max(self._paused_until, time.monotonic() + pause_seconds)
+        for bucket in self._buckets.values():
+            bucket.drain(self._paused_until)
+
+        if self._metrics is not None:
+            self._metrics.increment(RATE_LIMIT_PAUSES)
+        logger.warning("Rate limited by the API, pausing requests for %.2fs.", pause_seconds)
+
+    def _bucket(self, endpoint: str) -> TokenBucket:
+        bucket: TokenBucket | None = self._buckets.get(endpoint)
+        if bucket is None:
+            requests_per_second, burst = self._config.limit_for(endpoint)
+            bucket = self._buckets[endpoint] = TokenBucket(requests_per_second, burst)
+            if self._paused_until > time.monotonic():
+                bucket.drain(self._paused_until)
+        return bucket
+
+    def _expire_dispatches(self, now: float) -> None:
+        while self._dispatched_at and self._dispatched_at[0] <= now - _RATE_WINDOW_SECONDS:
+            self._dispatched_at.popleft()
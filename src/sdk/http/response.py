@@ -0,0 +1,275 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Mapping
+
+from sdk.http.compression import RESPONSE_BYTES_COMPRESSED, RESPONSE_BYTES_DECOMPRESSED, StreamDecoder
+from sdk.utils.exceptions import OffersAPIError, RequestExecutionError, ResponseTooLargeError
+from sdk.utils.metrics import MetricsRegistry
+
+RESPONSE_BYTES_READ = "response.bytes_read"
+RESPONSE_TOO_LARGE = "response.too_large"
+
+# Bodies larger than this are JSON-decoded in a worker thread to keep the event loop responsive
+JSON_THREAD_OFFLOAD_BYTES = 1_000_000
+
+# Size of the chunks read from the network by streamed responses
+STREAM_CHUNK_BYTES = 64 * 1024
+
+_NOT_DECODED: Any = object()
+
+
+class BodySizeLimit:
+    """
+    Counts the bytes of one response body as they are read and stops the read past a maximum size.
+
+    A body declaring a larger Content-Length is rejected before any of it is read; any
+    other body is rejected by `add` as soon as the bytes read exceed the maximum, so at
+    most one network chunk past the limit is ever held in memory.
+
+    Examples:
+        >>> body_limit = BodySizeLimit(max_bytes=1024)
+        >>> if body_limit.check_content_length(response.headers):
+        >>>     body = body_limit.add(await response.read())
+        >>> else:
+        >>>     body = b"".join([body_limit.add(chunk) async for chunk in response.chunks()])
+    """
+    __slots__ = ("max_bytes", "bytes_read", "exceeded")
+
+    def __init__(self, max_bytes: int | None) -> None:
+        self.max_bytes: int | None = max_bytes
+        self.bytes_read: int = 0
+        self.exceeded: bool = False
+
+    def check_content_length(self, headers: Mapping[str, str]) -> bool:
+        """
+        Check the body size declared by the response headers.
+
+        Returns:
+            bool: Whether the body declares a Content-Length, and so cannot outgrow it.
+
+        Raises:
+            ResponseTooLargeError: If the declared Content-Length exceeds the maximum.
+        """
+        declared_bytes: int | None = _content_length(headers)
+        if declared_bytes is None:
+            return False
+        if self.max_bytes is not None and declared_bytes > self.max_bytes:
+            self._raise_too_large(declared_bytes, "declares")
+        return True
+
+    def add(self, chunk: bytes) -> bytes:
+        """
+        Count a chunk of the body.
+
+        Returns:
+            bytes: The chunk, unchanged.
+
+        Raises:
+            ResponseTooLargeError: If the body read so far exceeds the maximum.
+        """
+        self.bytes_read += len(chunk)
+        if self.max_bytes is not None and self.bytes_read > self.max_bytes:
+            self._raise_too_large(self.bytes_read, "exceeded")
+        return chunk
+
+    def record(self, metrics: MetricsRegistry | None) -> None:
+        """
+        Add the bytes read, and whether the body was rejected, to a metrics registry.
+        """
+        if metrics is None:
+            return
+        metrics.increment(RESPONSE_BYTES_READ, self.bytes_read)
+        if self.exceeded:
+            metrics.increment(RESPONSE_TOO_LARGE)
+
+    def _raise_too_large(self, received_bytes: int, verb: str) -> None:
+        self.exceeded = True
+        raise ResponseTooLargeError(
+            f"Response body {verb} {received_bytes} bytes, more than the maximum of {self.max_bytes}.",
+            limit_bytes=self.max_bytes,
+            received_bytes=received_bytes,
+        )
+
+
+def _content_length(headers: Mapping[str, str]) -> int | None:
+    """
+    The body size declared by the Content-Length header, or None if it is missing or malformed.
+    """
+    declared_length: str | None = headers.get("Content-Length")
+    if declared_length is None:
+        return None
+    try:
+        declared_bytes: int = int(declared_length)
+    except (TypeError, ValueError):
+        return None
+    return declared_bytes if declared_bytes >= 0 else None
+
+
+class BufferedResponse:
+    """
+    Base for response adapters that hold the raw body bytes exactly once.
+
+    The body is kept as the bytes object produced by the HTTP client, without
+    copying. `text` and `json()` are only decoded when first accessed and the
+    result is memoized, so a response that is never inspected is never decoded.
+    JSON is parsed straight from the bytes, without an intermediate text decode.
+    """
+
+    def __init__(self, content: bytes, encoding: str | None = None) -> None:
+        self._content: bytes = content
+        self._encoding: str = encoding or "utf-8"
+        self._decoded_text: str | None = None
+        self._decoded_json: Any = _NOT_DECODED
+
+    @property
+    def content(self) -> bytes:
+        return self._content
+
+    @property
+    def text(self) -> str:
+        if self._decoded_text is None:
+            self._decoded_text = self._content.decode(self._encoding, errors="replace")
+        return self._decoded_text
+
+    async def json(self) -> Any:
+        if self._decoded_json is _NOT_DECODED:
+            if len(self._content) > JSON_THREAD_OFFLOAD_BYTES:
+                self._decoded_json = await asyncio.to_thread(json.loads, self._content)
+            else:
+                self._decoded_json = json.loads(self._content)
+        return self._decoded_json
+
+
+class StreamingResponse(ABC):
+    """
+    Base for response adapters whose body is consumed incrementally.
+
+    The status code and headers are available as soon as the response starts.
+    The body is read chunk by chunk with `aiter_bytes()`, or buffered with
+    `aread()`, after which `content`, `text` and `json()` behave like those of
+    a buffered response. Subclasses provide the body through `_aiter_network_bytes()`;
+    when a stream decoder is given, the body arrives encoded and is decoded here.
+    Reading more than `max_bytes` from the network, or decoding the body to more than
+    `max_bytes`, raises `ResponseTooLargeError`.
+    """
+
+    def __init__(
+        self,
+        encoding: str | None = None,
+        *,
+        stream_decoder: StreamDecoder | None = None,
+        metrics: MetricsRegistry | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self._encoding: str | None = encoding
+        self._stream_decoder: StreamDecoder | None = stream_decoder
+        self._metrics: MetricsRegistry | None = metrics
+        self._body_limit: BodySizeLimit = BodySizeLimit(max_bytes)
+        self._buffered: BufferedResponse | None = None
+
+    @property
+    @abstractmethod
+    def status_code(self) -> int:
+        """
+        The HTTP status code of the response.
+        """
+
+    @property
+    @abstractmethod
+    def headers(self) -> Mapping[str, str]:
+        """
+        The response headers.
+        """
+
+    @property
+    def encoding(self) -> str | None:
+        """
+        The charset declared by the response, if any.
+        """
+        return self._encoding
+
+    @abstractmethod
+    def _aiter_network_bytes(self) -> AsyncIterator[bytes]:
+        """
+        Yield the body in chunks as they arrive from the network; implemented as an async generator.
+        """
+
+    async def _aiter_limited_bytes(self) -> AsyncIterator[bytes]:
+        """
+        Yield the body as it arrives from the network, stopping once it exceeds the maximum size.
+        """
+        try:
+            self._body_limit.check_content_length(self.headers)
+            async for chunk in self._aiter_network_bytes():
+                yield self._body_limit.add(chunk)
+        finally:
+            self._body_limit.record(self._metrics)
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        """
+        Yield the decoded body in chunks as they arrive from the network.
+
+        Raises:
+            ResponseTooLargeError: If the body is larger than the maximum response size.
+        """
+        if self._stream_decoder is None:
+            async for chunk in self._aiter_limited_bytes():
+                yield chunk
+            return
+
+        received_bytes: int = 0
+        decoded_bytes: int = 0
+        try:
+            async for chunk in self._aiter_limited_bytes():
+                received_bytes += len(chunk)
+                decoded_chunk: bytes = self._decode_chunk(chunk)
+                decoded_bytes += len(decoded_chunk)
+                if decoded_chunk:
+                    yield decoded_chunk
+            decoded_tail: bytes = self._decode_chunk(None)
+            decoded_bytes += len(decoded_tail)
+            if decoded_tail:
+                yield decoded_tail
+        finally:
+            if self._metrics is not None:
+                self._metrics.increment(RESPONSE_BYTES_COMPRESSED, received_bytes)
+                self._metrics.increment(RESPONSE_BYTES_DECOMPRESSED, decoded_bytes)
+
+    def _decode_chunk(self, chunk: bytes | None) -> bytes:
+        try:
+            return self._stream_decoder.flush() if chunk is None else self._stream_decoder.decompress(chunk)
+        except ResponseTooLargeError:
+            if self._metrics is not None:
+                self._metrics.increment(RESPONSE_TOO_LARGE)
+            raise
+        except Exception as decode_error:
+            raise RequestExecutionError(f"Failed to decode response stream: {decode_error}") from decode_error
+
+    async def aread(self) -> bytes:
+        """
+        Read the remaining body into memory.
+
+        Returns:
+            bytes: The response body.
+        """
+        if self._buffered is None:
+            body: bytes = b"".join([chunk async for chunk in self.aiter_bytes()])
+            self._buffered = BufferedResponse(body, self._encoding)
+        return self._buffered.content
+
+    @property
+    def content(self) -> bytes:
+        return self._require_buffered().content
+
+    @property
+    def text(self) -> str:
+        return self._require_buffered().text
+
+    async def json(self) -> Any:
+        return await self._require_buffered().json()
+
+    def _require_buffered(self) -> BufferedResponse:
+        if self._buffered is None:
+            raise OffersAPIError("The body of a streamed response must be read with aread() first.")
+        return self._buffered
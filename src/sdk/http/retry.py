@@ -0,0 +1,151 @@
+import random
+import threading
+from typing import Any, Mapping
+
+from sdk.config.retry_config import RetryConfig
+from sdk.http.interfaces import BaseResponse
+from sdk.http.utils import parse_retry_after
+from sdk.utils.metrics import MetricsRegistry
+
+RETRY_ATTEMPTS = "retry.attempts"
+RETRY_BUDGET_EXHAUSTED = "retry.budget_exhausted"
+
+# Methods that have the same effect when sent twice (RFC 9110, section 9.2.2)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Rejected before processing, so retrying a non-idempotent request cannot apply it twice
+_NOT_PROCESSED_STATUS = 429
+
+
+class RetryBudget:
+    """
+    Token bucket of retries, refilled by a fixed ratio of the requests sent.
+
+    With a ratio of 0.1, at most about one retry is sent per ten requests once the
+    initial capacity is spent, however many requests fail.
+    """
+
+    def __init__(self, ratio: float, capacity: float) -> None:
+        self._ratio: float = ratio
+        self._capacity: float = capacity
+        self._balance: float = capacity
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        return self._balance
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self._capacity, self._balance + self._ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Take one retry from the budget.
+
+        Returns:
+            bool: False if the budget is exhausted.
+        """
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    One policy, and with it one retry budget, is shared by every request of an
+    `OffersClient`, whichever backend sends them.
+
+    Examples:
+        >>> policy = RetryPolicy(RetryConfig(max_attempts=4))
+        >>> policy.record_request()
+        >>> delay = policy.next_delay("GET", attempt=1, response=response)
+        >>> if delay is not None:
+        >>>     await asyncio.sleep(delay)
+    """
+
+    def __init__(self, config: RetryConfig, metrics: MetricsRegistry | None = None) -> None:
+        """
+        Initialize the retry policy.
+
+        Args:
+            config (RetryConfig): Attempts, backoff, retryable statuses and budget settings.
+            metrics (MetricsRegistry | None): Registry receiving the retry and exhausted budget counts.
+        """
+        self._config: RetryConfig = config
+        self._metrics: MetricsRegistry | None = metrics
+        self._budget: RetryBudget = RetryBudget(config.budget_ratio, config.budget_capacity)
+
+    @property
+    def config(self) -> RetryConfig:
+        return self._config
+
+    @property
+    def budget(self) -> RetryBudget:
+        return self._budget
+
+    def record_request(self) -> None:
+        """
+        Count a new request, which earns the budget `budget_ratio` retries.
+        """
+        self._budget.deposit()
+
+    def next_delay(
+        self,
+        http_method: str,
+        attempt: int,
+        *,
+        response: BaseResponse | None = None,
+        request_headers: Mapping[str, str] | None = None,
+    ) -> float | None:
+        """
+        Return how long to wait before retrying a request, or None if it must not be retried.
+
+        Args:
+            http_method (str): The request's HTTP method.
+            attempt (int): Number of the attempt that just failed, starting at 1.
+            response (BaseResponse | None): The attempt's response, or None if it raised a network error.
+            request_headers (Mapping[str, str] | None): The request's headers, checked for an `Idempotency-Key`.
+
+        Returns:
+            float | None: Seconds to wait before the next attempt, or None to give up.
+        """
+        if attempt >= self._config.max_attempts:
+            return None
+
+        status_code: int | None = response.status_code if response is not None else None
+        if status_code is not None and status_code not in self._config.statuses:
+            return None
+        if status_code != _NOT_PROCESSED_STATUS and not self._may_repeat(http_method, request_headers):
+            return None
+
+        retry_after: float | None = None
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None and retry_after > self._config.max_retry_after_seconds:
+                return None
+
+        if not self._budget.withdraw():
+            if self._metrics is not None:
+                self._metrics.increment(RETRY_BUDGET_EXHAUSTED)
+            return None
+
+        if self._metrics is not None:
+            self._metrics.increment(RETRY_ATTEMPTS)
+        # Full jitter: a uniform delay up to the exponential cap spreads out clients that failed together
+        backoff_cap: float = min(self._config.max_delay_seconds, self._config.base_delay_seconds * 2 ** (attempt - 1))
+        delay: float = random.uniform(0, backoff_cap)
+        return max(delay, retry_after) if retry_after is not None else delay
+
+    def _may_repeat(self, http_method: str, request_headers: Mapping[str, str] | None) -> bool:
+        if self._config.retry_non_idempotent or http_method.upper() in IDEMPOTENT_METHODS:
+            return True
+        return _has_idempotency_key(request_headers)
+
+
+def _has_idempotency_key(request_headers: Mapping[str, Any] | None) -> bool:
+    return any(str(name).lower() == "idempotency-key" for name in request_headers or {})
@@ -0,0 +1,220 @@
+import random
+import time
+from typing import Sequence
+
+from sdk.config.routing_config import RoutingConfig
+from sdk.http.fork import ForkGuard
+from sdk.utils.logger import logger
+from sdk.utils.metrics import MetricsRegistry
+
+ROUTING_EJECTIONS = "routing.ejections"
+ROUTING_EJECTED_ENDPOINTS = "routing.ejected_endpoints"
+
+
+class EndpointStats:
+    """
+    Health and latency of one base URL, as seen by an `EndpointRouter`.
+    """
+    __slots__ = ("base_url", "latency_ewma", "in_flight", "consecutive_failures",
+                 "ejections", "ejected_until", "probing")
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url: str = base_url
+        # None until the first response, so new base URLs are tried first
+        self.latency_ewma: float | None = None
+        self.in_flight: int = 0
+        self.consecutive_failures: int = 0
+        # Consecutive ejections, which double the ejection time
+        self.ejections: int = 0
+        self.ejected_until: float | None = None
+        self.probing: bool = False
+
+    @property
+    def ejected(self) -> bool:
+        return self.ejected_until is not None
+
+    @property
+    def score(self) -> float:
+        """
+        Expected cost of one more request: the average latency scaled by the requests already in flight.
+        """
+        return (self.latency_ewma or 0.0) * (self.in_flight + 1)
+
+
+class EndpointPermit:
+    """
+    One request routed by an `EndpointRouter`, settled with `record` or `abandon`.
+    """
+    __slots__ = ("base_url", "probe", "settled")
+
+    def __init__(self, base_url: str, probe: bool) -> None:
+        self.base_url: str = base_url
+        self.probe: bool = probe
+        self.settled: bool = False
+
+
+class EndpointRouter:
+    """
+    Routes each request to a healthy, low-latency base URL out of several replicas of the API.
+
+    Base URLs are chosen by power of two choices: two healthy ones are picked at random
+    and the one with the lower score wins, which spreads load without herding every
+    client onto the single fastest replica. Requests are built against the primary
+    base URL and `route` swaps in the chosen one.
+
+    Examples:
+        >>> router = EndpointRouter(["https://eu.api", "https://us.api"], RoutingConfig())
+        >>> permit, url = router.route("https://eu.api/products/1/offers")
+        >>> response = await send(url)
+        >>> router.record(permit, latency=0.12, failed=response.status_code >= 500)
+    """
+
+    def __init__(
+        self,
+        base_urls: Sequence[str],
+        config: RoutingConfig,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        """
+        Initialize the router.
+
+        Args:
+            base_urls (Sequence[str]): The base URLs of the replicas; the first one is the primary.
+            config (RoutingConfig): Latency averaging and ejection settings.
+            metrics (MetricsRegistry | None): Registry receiving the ejection count and ejected base URLs.
+        """
+        if not base_urls:
+            raise ValueError("At least one base URL is required.")
+        self._config: RoutingConfig = config
+        self._metrics: MetricsRegistry | None = metrics
+        self._endpoints: dict[str, EndpointStats] = {
+            base_url.rstrip("/"): EndpointStats(base_url.rstrip("/")) for base_url in base_urls
+        }
+        self._primary: str = next(iter(self._endpoints))
+        self._fork_guard: ForkGuard = ForkGuard()
+
+    @property
+    def primary(self) -> str:
+        return self._primary
+
+    def stats(self) -> dict[str, EndpointStats]:
+        """
+        Return the health and latency of every base URL, keyed by base URL.
+        """
+        return dict(self._endpoints)
+
+    def route(self, url: str) -> tuple[EndpointPermit | None, str]:
+        """
+        Choose a base URL for a request built against the primary base URL.
+
+        Args:
+            url (str): The request URL, starting with the primary base URL.
+
+        Returns:
+            tuple[EndpointPermit | None, str]: The permit to pass to `record` or `abandon`, and the URL
+                rewritten to the chosen base URL; (None, url) for URLs that do not start with the
+                primary base URL, which are sent unchanged.
+        """
+        # The base URL must end at a path boundary, so "https://eu.api" does not match "https://eu.api2"
+        if not url.startswith(self._primary) or url[len(self._primary):][:1] not in ("", "/", "?", "#"):
+            return None, url
+        if self._fork_guard.forked():
+            # Requests in flight at the fork belong to the parent; latencies and ejections are kept
+            for endpoint_stats in self._endpoints.values():
+                endpoint_stats.in_flight = 0
+                endpoint_stats.probing = False
+        endpoint, probe = self._choose()
+        endpoint.in_flight += 1
+        return EndpointPermit(endpoint.base_url, probe), endpoint.base_url + url[len(self._primary):]
+
+    def record(self, permit: EndpointPermit, *, latency: float, failed: bool) -> None:
+        """
+        Record the outcome of a routed request.
+
+        Args:
+            permit (EndpointPermit): The permit returned by `route`.
+            latency (float): Seconds until the response, or until the failure.
+            failed (bool): Whether the request failed with a network error or a 5xx response.
+        """
+        endpoint: EndpointStats | None = self._settle(permit)
+        if endpoint is None:
+            return
+
+        if permit.probe:
+            endpoint.probing = False
+        if failed:
+            endpoint.consecutive_failures += 1
+            if permit.probe or (not endpoint.ejected
+                             and endpoint.consecutive_failures >= self._config.failures_to_eject):
+                self._eject(endpoint)
+            return
+
+        alpha: float = self._config.ewma_alpha
+        endpoint.latency_ewma = (
+            latency if endpoint.latency_ewma is None else alpha * latency + (1 - alpha) * endpoint.latency_ewma
+        )
+        endpoint.consecutive_failures = 0
+        if endpoint.ejected:
+            endpoint.ejected_until = None
+            endpoint.ejections = 0
+            logger.info("Re-admitted %s after a successful probe.", endpoint.base_url)
+            self._publish()
+
+    def abandon(self, permit: EndpointPermit) -> None:
+        """
+        Settle a routed request that was cancelled before it had an outcome.
+        """
+        endpoint: EndpointStats | None = self._settle(permit)
+        if endpoint is not None and permit.probe:
+            endpoint.probing = False
+
+    def _choose(self) -> tuple[EndpointStats, bool]:
+        """
+        Pick the base URL of the next request.
+
+        Returns:
+            tuple[EndpointStats, bool]: The base URL's stats, and whether the request probes an ejected base URL.
+        """
+        now: float = time.monotonic()
+        healthy: list[EndpointStats] = []
+        for endpoint in self._endpoints.values():
+            if not endpoint.ejected:
+                healthy.append(endpoint)
+            elif endpoint.ejected_until <= now and not endpoint.probing:
+                # One probe at a time decides whether an ejected base URL is back
+                endpoint.probing = True
+                return endpoint, True
+
+        if not healthy:
+            # Everything is ejected: try the base URL whose ejection ends first rather than fail
+            return min(self._endpoints.values(), key=lambda endpoint: endpoint.ejected_until), False
+        if len(healthy) == 1:
+            return healthy[0], False
+        first, second = random.sample(healthy, 2)
+        return (first if first.score <= second.score else second), False
+
+    def _settle(self, permit: EndpointPermit) -> EndpointStats | None:
+        if permit.settled:
+            return None
+        permit.settled = True
+        endpoint: EndpointStats = self._endpoints[permit.base_url]
+        endpoint.in_flight -= 1
+        return endpoint
+
+    def _eject(self, endpoint: EndpointStats) -> None:
+        eject_seconds: float = min(
+            self._config.eject_seconds * 2 ** endpoint.ejections, self._config.max_eject_seconds
+        )
+        endpoint.ejections += 1
+        endpoint.ejected_until = time.monotonic() + eject_seconds
+        if self._metrics is not None:
+            self._metrics.increment(ROUTING_EJECTIONS)
+        logger.warning("Ejected %s for %.1fs after %s consecutive failures.",
+                       endpoint.base_url, eject_seconds, endpoint.consecutive_failures)
+        self._publish()
+
+    def _publish(self) -> None:
+        if self._metrics is not None:
+            self._metrics.set_gauge(
+                ROUTING_EJECTED_ENDPOINTS, sum(endpoint.ejected for endpoint in self._endpoints.values())
+            )
@@ -0,0 +1,110 @@
+from typing import Any
+
+from sdk.config.pool_config import PoolConfig
+from sdk.http.fork import ForkGuard, abandon
+from sdk.utils.logger import logger
+
+
+class SharedTransport:
+    """
+    A connection pool that many `OffersClient` instances attach to instead of opening their own.
+
+    The pool is the backend's HTTP library client: an `httpx.AsyncClient`, an aiohttp
+    `ClientSession`, or a `requests.Session` with its worker threads. It is opened by the
+    first client that uses it and closed when the last attached client is closed; a
+    client attaching after that opens a new one. In a forked child, the parent's pool is
+    left alone and a new one is opened. Authentication, hooks, plugins, limits,
+    retries and metrics stay per client.
+
+    Examples:
+        >>> transport = SharedTransport("aiohttp", pool_config=PoolConfig(max_connections=200))
+        >>> async with OffersClient(refresh_token=tenant_token, transport=transport) as client:
+        >>>     offers = await client.offers.get_offers(product_id)
+    """
+
+    def __init__(
+        self,
+        backend_name: str = "httpx",
+        *,
+        pool_config: PoolConfig | None = None,
+        unix_socket: str | None = None,
+        timeout_seconds: float = 10.0,
+    ) -> None:
+        """
+        Initialize the transport; the pool itself is opened when the first client attaches.
+
+        Args:
+            backend_name (str): HTTP backend of every attached client: "httpx", "aiohttp" or "requests".
+            pool_config (PoolConfig | None): Connection pool and timeout settings of the shared pool.
+            unix_socket (str | None): Unix domain socket path that every request is sent through.
+            timeout_seconds (float): Timeout of each phase of a request that `pool_config` leaves unset.
+        """
+        self.backend_name: str = backend_name
+        self.pool_config: PoolConfig = pool_config or PoolConfig()
+        self.unix_socket: str | None = unix_socket
+        self.timeout_seconds: float = timeout_seconds
+        self._backend_cls: type | None = None
+        self._pool: Any = None
+        self._references: int = 0
+        self._fork_guard: ForkGuard = ForkGuard()
+
+    @property
+    def references(self) -> int:
+        """
+        Number of clients attached to the pool.
+        """
+        return self._references
+
+    def attach(self, backend_cls: type) -> None:
+        """
+        Attach a backend to the transport; the pool is opened when it is first used.
+
+        Args:
+            backend_cls (type): The attaching backend's class, which builds and closes the pool
+                with its `build_transport` and `close_transport` methods.
+
+        Raises:
+            ValueError: If backends of a different class are attached.
+        """
+        if self._references and backend_cls is not self._backend_cls:
+            raise ValueError(
+                f"Transport is attached to {self._backend_cls.__name__}, not {backend_cls.__name__}."
+            )
+        self._backend_cls = backend_cls
+        self._references += 1
+
+    def pool(self) -> Any:
+        """
+        Return the pool, opening it on first use and again in a forked child process.
+
+        Returns:
+            Any: The pool, in the attached backends' own representation.
+        """
+        if self._fork_guard.forked():
+            # The parent's pool is dropped, not closed: its sockets are still the parent's
+            abandon(self._pool)
+            self._pool = None
+        if self._pool is None:
+            self._pool = self._backend_cls.build_transport(self.pool_config, self.unix_socket, self.timeout_seconds)
+            logger.debug("Opened shared %s transport.", self.backend_name)
+        return self._pool
+
+    async def release(self) -> None:
+        """
+        Detach a backend, closing the pool when no backend is left attached.
+        """
+        if self._references == 0:
+            return
+        self._references -= 1
+        if self._references == 0:
+            pool, self._pool = self._pool, None
+            if self._fork_guard.forked():
+                # Released before any request in the forked child, so the pool is still the parent's
+                abandon(pool)
+            elif pool is not None:
+                await self._backend_cls.close_transport(pool)
+                logger.debug("Closed shared %s transport.", self.backend_name)
+
+    def __repr__(self) -> str:
+        return (f"SharedTransport(backend_name={self.backend_name}, references={self._references}, "
+                f"pool_config={self.pool_config})")
@@ -1,5 +1,8 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
 from sdk.http.interfaces import BaseResponse
-from sdk.utils.logger import logger
+from sdk.utils.logger import logger, payload_sampled
 from sdk.utils.exceptions import (
     AuthenticationError,
     ConflictError,
@@ -29,23 +32,73 @@ def raise_for_status_with_text(response: BaseResponse) -> None:
         OffersAPIError: For all other non-success status codes.
     """
     status_code: int = response.status_code
+    if 200 <= status_code < 400:
+        # Successful bodies are left undecoded until the caller asks for them
+        logger.debug("Response status: %s", status_code)
+        return
+
     response_text: str = response.text
-    logger.debug(f"Response status: {status_code} | {response_text}")
+    if payload_sampled():
+        logger.debug("Response status: %s | %s", status_code, response_text)
+    else:
+        logger.debug("Response status: %s", status_code)
+    api_error: OffersAPIError | None = exception_for_status(status_code, response_text)
+    if api_error is not None:
+        raise api_error
+
 
+def exception_for_status(status_code: int, response_text: str) -> OffersAPIError | None:
+    """
+    Build the exception matching an HTTP status code without raising it.
+
+    Args:
+        status_code (int): The HTTP status code.
+        response_text (str): The response body used as the error message.
+
+    Returns:
+        OffersAPIError | None: The matching exception, or None for success codes.
+    """
     if 200 <= status_code < 400:
-        return
+        return None
 
     if status_code == 401:
-        raise AuthenticationError(response_text)
+        return AuthenticationError(response_text)
     elif status_code == 404:
-        raise NotFoundError(response_text)
+        return NotFoundError(response_text)
     elif status_code == 408:
-        raise TimeoutError(response_text)
+        return TimeoutError(response_text)
     elif status_code == 409:
-        raise ConflictError(response_text)
+        return ConflictError(response_text)
     elif status_code == 429:
-        raise RateLimitError(response_text)
+        return RateLimitError(response_text)
     elif status_code >= 500:
-        raise ServerError(response_text)
+        return ServerError(response_text, status_code=status_code)
     else:
-        raise OffersAPIError(response_text, status_code=status_code)
+        return OffersAPIError(response_text, status_code=status_code)
+
+
+def parse_retry_after(retry_after: str | None) -> float | None:
+    """
+    Parse a `Retry-After` header given as delay seconds or as an HTTP date.
+
+    Args:
+        retry_after (str | None): The header value.
+
+    Returns:
+        float | None: Seconds to wait, never negative, or None if the header is missing or invalid.
+    """
+    if not isinstance(retry_after, str) or not retry_after.strip():
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_at: datetime = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,59 @@
+from pydantic import BaseModel
+
+from sdk.models.auth import AuthApiResponse
+from sdk.models.offer import Offer
+from sdk.models.product import Product
+
+WARMUP_TOKEN_SECONDS = "warmup.token_seconds"
+WARMUP_CONNECTIONS_SECONDS = "warmup.connections_seconds"
+WARMUP_VALIDATORS_SECONDS = "warmup.validators_seconds"
+
+# One valid payload per response model, validated once to exercise each validator
+_VALIDATION_SAMPLES: tuple[tuple[type[BaseModel], dict], ...] = (
+    (AuthApiResponse, {"access_token": "warmup"}),
+    (Offer, {"id": "00000000-0000-0000-0000-000000000000", "price": 0, "items_in_stock": 0}),
+    (Product, {"id": "00000000-0000-0000-0000-000000000000", "name": "warmup", "description": "warmup"}),
+)
+
+
+class WarmupReport:
+    """
+    Durations of the steps of `OffersClient.warmup`.
+
+    Attributes:
+        token_seconds (float): Time to fetch the access token.
+        connections_seconds (float): Time to open the pooled connections.
+        connections_opened (int): Number of connections that were opened.
+        validators_seconds (float): Time to prepare the response model validators.
+    """
+    __slots__ = ("token_seconds", "connections_seconds", "connections_opened", "validators_seconds")
+
+    def __init__(
+        self,
+        token_seconds: float,
+        connections_seconds: float,
+        connections_opened: int,
+        validators_seconds: float,
+    ) -> None:
+        self.token_seconds: float = token_seconds
+        self.connections_seconds: float = connections_seconds
+        self.connections_opened: int = connections_opened
+        self.validators_seconds: float = validators_seconds
+
+    @property
+    def total_seconds(self) -> float:
+        return self.token_seconds + self.connections_seconds + self.validators_seconds
+
+    def __repr__(self) -> str:
+        return (f"WarmupReport(token_seconds={self.token_seconds:.3f}, "
+                f"connections_seconds={self.connections_seconds:.3f}, connections_opened={self.connections_opened}, "
+                f"validators_seconds={self.validators_seconds:.3f})")
+
+
+def preload_validators() -> None:
+    """
+    Complete the validators of the response models, so the first response is not the one to build them.
+    """
+    for model, sample in _VALIDATION_SAMPLES:
+        model.model_rebuild()
+        model.model_validate(sample)
@@ -1,4 +1,5 @@
 from .interfaces import RequestPlugin, ResponsePlugin
+from .chain import MiddlewareChain
 
 
-__all__ = ["RequestPlugin", "ResponsePlugin"]
+__all__ = ["MiddlewareChain", "RequestPlugin", "ResponsePlugin"]
@@ -0,0 +1,187 @@
+from typing import Any, Awaitable, Callable, Sequence
+
+from sdk.http.hooks.type import RequestHook
+from sdk.http.interfaces import BaseResponse
+from sdk.http.response import StreamingResponse
+from sdk.plugins.interfaces import Plugin, RequestPlugin, ResponsePlugin
+from sdk.utils.exceptions import OffersAPIError, PluginError
+
+
+class RouteFilter:
+    """
+    The HTTP methods and endpoint templates a plugin applies to; None matches everything.
+    """
+    __slots__ = ("methods", "routes")
+
+    def __init__(self, methods: frozenset[str] | None = None, routes: frozenset[str] | None = None) -> None:
+        self.methods: frozenset[str] | None = methods
+        self.routes: frozenset[str] | None = routes
+
+    @classmethod
+    def of(cls, plugin: Any) -> "RouteFilter":
+        """
+        Read the filters a plugin declares; objects that are not `Plugin`s apply everywhere.
+        """
+        if not isinstance(plugin, Plugin):
+            return cls()
+        return cls(
+            frozenset(method.upper() for method in plugin.methods) if plugin.methods is not None else None,
+            frozenset(plugin.routes) if plugin.routes is not None else None,
+        )
+
+    def matches(self, method: str, route: str) -> bool:
+        return (self.methods is None or method in self.methods) and (self.routes is None or route in self.routes)
+
+
+class RequestStage:
+    """
+    One request plugin or request hook of a `MiddlewareChain`.
+    """
+    __slots__ = ("process", "name", "is_hook", "route_filter")
+
+    def __init__(
+        self,
+        process: Callable[[str, str, dict[str, Any]], Awaitable[None]],
+        name: str,
+        *,
+        is_hook: bool,
+        route_filter: RouteFilter,
+    ) -> None:
+        self.process: Callable[[str, str, dict[str, Any]], Awaitable[None]] = process
+        self.name: str = name
+        self.is_hook: bool = is_hook
+        self.route_filter: RouteFilter = route_filter
+
+    def failure(self, stage_error: Exception) -> OffersAPIError:
+        """
+        The error raised in place of an exception from the stage.
+        """
+        if self.is_hook:
+            return OffersAPIError(f"Request hook {self.name} failed: {stage_error}")
+        return PluginError(f"Request plugin {self.name} failed: {stage_error}")
+
+
+class RouteStages:
+    """
+    The request stages and response plugins that apply to one method and route, in registration order.
+    """
+    __slots__ = ("request_stages", "response_plugins")
+
+    def __init__(self, request_stages: tuple[RequestStage, ...], response_plugins: tuple[ResponsePlugin, ...]) -> None:
+        self.request_stages: tuple[RequestStage, ...] = request_stages
+        self.response_plugins: tuple[ResponsePlugin, ...] = response_plugins
+
+    async def process_request(self, method: str, url: str, request_params: dict[str, Any]) -> None:
+        """
+        Run the request plugins, then the request hooks.
+
+        Raises:
+            PluginError: If a request plugin fails.
+            OffersAPIError: If a request hook fails.
+        """
+        stage: RequestStage | None = None
+        try:
+            for stage in self.request_stages:
+                await stage.process(method, url, request_params)
+        except Exception as stage_error:
+            raise stage.failure(stage_error) from stage_error
+
+    async def process_response(self, response: BaseResponse | StreamingResponse) -> None:
+        """
+        Run the response plugins.
+
+        Raises:
+            PluginError: If a response plugin fails.
+        """
+        response_plugin: ResponsePlugin | None = None
+        try:
+            for response_plugin in self.response_plugins:
+                await response_plugin.process_response(response)
+        except Exception as plugin_error:
+            raise PluginError(
+                f"Response plugin {response_plugin.__class__.__name__} failed: {plugin_error}"
+            ) from plugin_error
+
+
+_NO_STAGES: RouteStages = RouteStages((), ())
+
+
+class MiddlewareChain:
+    """
+    The request plugins, request hooks and response plugins of a client, compiled once.
+
+    The chain is immutable: registering plugins builds a new one. The stages that
+    apply to a method and route are selected on the first request to that route and
+    reused afterwards, so a request only runs the stages it needs, and a request
+    through an empty chain runs none at all.
+
+    Examples:
+        >>> chain = MiddlewareChain([AuditPlugin()], [MetricsPlugin()], [add_trace_header])
+        >>> stages = chain.stages("GET", GET_OFFERS_ENDPOINT)
+        >>> await stages.process_request("GET", url, request_params)
+    """
+
+    def __init__(
+        self,
+        request_plugins: Sequence[RequestPlugin] = (),
+        response_plugins: Sequence[ResponsePlugin] = (),
+        request_hooks: Sequence[RequestHook] = (),
+    ) -> None:
+        """
+        Compile the chain.
+
+        Args:
+            request_plugins (Sequence[RequestPlugin]): Plugins run before each request, in order.
+            response_plugins (Sequence[ResponsePlugin]): Plugins run on each response, in order.
+            request_hooks (Sequence[RequestHook]): Hooks run before each request, after the request plugins.
+        """
+        self._request_stages: tuple[RequestStage, ...] = tuple(
+            [
+                RequestStage(
+                    request_plugin.process_request, request_plugin.__class__.__name__,
+                    is_hook=False, route_filter=RouteFilter.of(request_plugin),
+                )
+                for request_plugin in request_plugins
+            ] + [
+                RequestStage(
+                    hook, getattr(hook, "__name__", hook.__class__.__name__), is_hook=True, route_filter=RouteFilter()
+                )
+                for hook in request_hooks
+            ]
+        )
+        self._response_plugins: tuple[tuple[ResponsePlugin, RouteFilter], ...] = tuple(
+            (response_plugin, RouteFilter.of(response_plugin)) for response_plugin in response_plugins
+        )
+        self._routes: dict[tuple[str, str], RouteStages] = {}
+
+    @property
+    def empty(self) -> bool:
+        return not self._request_stages and not self._response_plugins
+
+    def stages(self, method: str, route: str) -> RouteStages:
+        """
+        Return the stages that apply to a request.
+
+        Args:
+            method (str): The HTTP method.
+            route (str): The endpoint template of the request.
+
+        Returns:
+            RouteStages: The request stages and response plugins to run.
+        """
+        if self.empty:
+            return _NO_STAGES
+        route_key: tuple[str, str] = (method, route)
+        route_stages: RouteStages | None = self._routes.get(route_key)
+        if route_stages is None:
+            route_stages = self._routes[route_key] = self._compile(method.upper(), route)
+        return route_stages
+
+    def _compile(self, method: str, route: str) -> RouteStages:
+        return RouteStages(
+            tuple(stage for stage in self._request_stages if stage.route_filter.matches(method, route)),
+            tuple(
+                response_plugin for response_plugin, route_filter in self._response_plugins
+                if route_filter.matches(method, route)
+            ),
+        )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Collection
 
 from sdk.http.interfaces import BaseResponse
 
@@ -11,8 +11,21 @@ class Plugin(ABC):
     Plugins are used to extend the functionality of the SDK by processing
     HTTP requests and responses. Subclasses should implement specific
     behaviors for request or response handling.
+
+    A plugin applies to every request unless it narrows itself down with
+    `methods` and `routes`. Routes are endpoint templates such as
+    "/products/{product_id}/offers", from `sdk.api.constatns`. Both are read
+    when the plugin is registered.
+
+    Examples:
+        >>> class OffersAuditPlugin(ResponsePlugin):
+        >>>     methods = {"GET"}
+        >>>     routes = {GET_OFFERS_ENDPOINT}
     """
-    pass
+    # HTTP methods the plugin applies to, e.g. {"GET"}; None for all methods
+    methods: Collection[str] | None = None
+    # Endpoint templates the plugin applies to; None for all routes
+    routes: Collection[str] | None = None
 
 
 class RequestPlugin(Plugin):
@@ -1,4 +1,5 @@
 import asyncio
+from typing import AsyncIterator, Iterator
 from uuid import UUID
 
 from sdk.api.offers import OffersAPI
@@ -28,3 +29,23 @@ class SyncOffersAPI:
             list[Offer]: A list of offers for the specified product.
         """
         return self._event_loop.run_until_complete(self._offers_api.get_offers(product_id))
+
+    def iter_offers(self, product_id: UUID) -> Iterator[Offer]:
+        """
+        Stream the offers of a product synchronously, one validated offer at a time.
+
+        Args:
+            product_id (UUID): The unique identifier of the product.
+
+        Yields:
+            Offer: Each offer, in response order.
+        """
+        offers: AsyncIterator[Offer] = self._offers_api.iter_offers(product_id)
+        try:
+            while True:
+                try:
+                    yield self._event_loop.run_until_complete(anext(offers))
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._event_loop.run_until_complete(offers.aclose())
@@ -1,6 +1,8 @@
 import asyncio
 from typing import Any
 
+from sdk.api.bulk_result import BulkResult
+from sdk.api.journal import RegistrationJournal
 from sdk.api.products import ProductsAPI
 
 
@@ -28,14 +30,37 @@ class SyncProductsAPI:
         """
         return self._event_loop.run_until_complete(self._products_api.register_product(product_data))
 
-    def register_products(self, product_list: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    def register_products(
+        self,
+        product_list: list[dict[str, Any]],
+        *,
+        journal: RegistrationJournal | None = None,
+    ) -> BulkResult:
         """
         Register multiple products synchronously.
 
         Args:
             product_list (list[dict[str, Any]]): A list of product data to register.
+            journal (RegistrationJournal | None): Optional checkpoint journal used to resume imports.
 
         Returns:
-            list[dict[str, Any]]: A list of registered product data.
+            BulkResult: Index-aligned per-product outcomes.
         """
-        return self._event_loop.run_until_complete(self._products_api.register_products(product_list))
+        return self._event_loop.run_until_complete(
+            self._products_api.register_products(product_list, journal=journal)
+        )
+
+    def register_products_batch(self, product_list: list[dict[str, Any]], **batch_options: Any) -> BulkResult:
+        """
+        Register multiple products through the batch endpoint synchronously.
+
+        Args:
+            product_list (list[dict[str, Any]]): A list of product data to register.
+            **batch_options (Any): Chunking and compression options of `ProductsAPI.register_products_batch`.
+
+        Returns:
+            BulkResult: Index-aligned per-product outcomes.
+        """
+        return self._event_loop.run_until_complete(
+            self._products_api.register_products_batch(product_list, **batch_options)
+        )
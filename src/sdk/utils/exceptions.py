@@ -137,3 +137,52 @@ class SDKConfigError(OffersAPIError):
         error_code: str = "SDK_CONFIG_ERROR"
     ):
         super().__init__(message, status_code=status_code, error_code=error_code)
+
+
+class CircuitOpenError(OffersAPIError):
+    """Raised without sending the request while an endpoint's circuit breaker is open."""
+
+    def __init__(
+        self,
+        message: str = "Circuit breaker is open",
+        *,
+        endpoint: str | None = None,
+        retry_after_seconds: float | None = None,
+        status_code: int | None = None,
+        error_code: str = "CIRCUIT_OPEN"
+    ):
+        self.endpoint = endpoint
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(message, status_code=status_code, error_code=error_code)
+
+
+class DeadlineExceededError(OffersAPIError):
+    """Raised when a call cannot finish within its deadline; `phase` names the step that ran out of time."""
+
+    def __init__(
+        self,
+        message: str = "Deadline exceeded",
+        *,
+        phase: str | None = None,
+        status_code: int | None = None,
+        error_code: str = "DEADLINE_EXCEEDED"
+    ):
+        self.phase = phase
+        super().__init__(message, status_code=status_code, error_code=error_code)
+
+
+class ResponseTooLargeError(OffersAPIError):
+    """Raised when a response body exceeds the configured maximum size; the rest of the body is not read."""
+
+    def __init__(
+        self,
+        message: str = "Response body too large",
+        *,
+        limit_bytes: int | None = None,
+        received_bytes: int | None = None,
+        status_code: int | None = None,
+        error_code: str = "RESPONSE_TOO_LARGE"
+    ):
+        self.limit_bytes = limit_bytes
+        self.received_bytes = received_bytes
+        super().__init__(message, status_code=status_code, error_code=error_code)
@@ -0,0 +1,172 @@
+import codecs
+import json
+from typing import Any, AsyncIterable, AsyncIterator
+
+NDJSON_CONTENT_TYPES = frozenset({"application/x-ndjson", "application/jsonl"})
+
+_WHITESPACE = " \t\r\n"
+
+_NUMBER_CONTINUATION = frozenset("0123456789.eE+-")
+
+# Consumed input is dropped from the buffer once it grows beyond this many characters
+_COMPACT_THRESHOLD = 64 * 1024
+
+
+class JSONArrayDecoder:
+    """
+    Incrementally decodes the items of a top-level JSON array.
+
+    Text is fed in arbitrary pieces and every item is returned as soon as it is
+    complete, so only the current item and the unread tail are held in memory.
+
+    Examples:
+        >>> decoder = JSONArrayDecoder()
+        >>> decoder.feed('[{"a": 1}, {"a"')
+        [{'a': 1}]
+        >>> decoder.feed(': 2}]')
+        [{'a': 2}]
+        >>> decoder.close()
+    """
+
+    def __init__(self) -> None:
+        self._decoder: json.JSONDecoder = json.JSONDecoder()
+        self._buffer: str = ""
+        self._position: int = 0
+        self._started: bool = False
+        self._finished: bool = False
+        # Whether the next token is an item, rather than a separator or the closing bracket
+        self._expect_item: bool = True
+        self._item_count: int = 0
+
+    def feed(self, text: str) -> list[Any]:
+        """
+        Add text to the decoder.
+
+        Args:
+            text (str): The next piece of the document.
+
+        Returns:
+            list[Any]: Items completed by this piece, in document order.
+
+        Raises:
+            ValueError: If the document is not a JSON array.
+        """
+        self._buffer += text
+        return self._decode_items(final=False)
+
+    def close(self) -> list[Any]:
+        """
+        Signal the end of the document.
+
+        Returns:
+            list[Any]: Items that could only be completed at the end of the input.
+
+        Raises:
+            ValueError: If the document is incomplete or not a JSON array.
+        """
+        items: list[Any] = self._decode_items(final=True)
+        if not self._finished:
+            raise ValueError("Unexpected end of JSON array.")
+        if self._buffer[self._position:].strip(_WHITESPACE):
+            raise ValueError("Unexpected data after the end of the JSON array.")
+        return items
+
+    def _skip_whitespace(self) -> None:
+        while self._position < len(self._buffer) and self._buffer[self._position] in _WHITESPACE:
+            self._position += 1
+
+    def _decode_items(self, *, final: bool) -> list[Any]:
+        items: list[Any] = []
+        while not self._finished:
+            self._skip_whitespace()
+            if self._position >= len(self._buffer):
+                break
+
+            character: str = self._buffer[self._position]
+            if not self._started:
+                if character != "[":
+                    raise ValueError("Expected a JSON array.")
+                self._started = True
+                self._position += 1
+                continue
+
+            if character == "]" and (not self._expect_item or self._item_count == 0):
+                self._finished = True
+                self._position += 1
+                break
+
+            if not self._expect_item:
+                if character != ",":
+                    raise ValueError(f"Expected ',' or ']' at position {self._position}.")
+                self._expect_item = True
+                self._position += 1
+                continue
+
+            try:
+                item, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                # The item is incomplete; wait for more text
+                break
+
+            # A number at the end of the buffer, or cut inside its fraction or exponent,
+            # may still continue in the next piece
+            if not final and isinstance(item, (int, float)) and (
+                end >= len(self._buffer) or self._buffer[end] in _NUMBER_CONTINUATION
+            ):
+                break
+
+            items.append(item)
+            self._item_count += 1
+            self._expect_item = False
+            self._position = end
+
+        if self._position > _COMPACT_THRESHOLD:
+            self._buffer = self._buffer[self._position:]
+            self._position = 0
+        return items
+
+
+async def iter_json_items(
+    byte_chunks: AsyncIterable[bytes],
+    *,
+    ndjson: bool = False,
+    encoding: str = "utf-8",
+) -> AsyncIterator[Any]:
+    """
+    Decode the items of a streamed JSON array, or the lines of an NDJSON stream.
+
+    Args:
+        byte_chunks (AsyncIterable[bytes]): The body as it arrives from the network.
+        ndjson (bool): Whether the body holds one JSON value per line instead of an array.
+        encoding (str): The character encoding of the body.
+
+    Yields:
+        Any: Each decoded item, as soon as it is complete.
+
+    Raises:
+        ValueError: If the body is not valid JSON of the expected shape.
+    """
+    text_decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder(encoding)()
+
+    if ndjson:
+        pending_line: str = ""
+        async for chunk in byte_chunks:
+            lines: list[str] = (pending_line + text_decoder.decode(chunk)).split("\n")
+            pending_line = lines.pop()
+            for line in lines:
+                if line.strip(_WHITESPACE):
+                    yield json.loads(line)
+        pending_line += text_decoder.decode(b"", final=True)
+        if pending_line.strip(_WHITESPACE):
+            yield json.loads(pending_line)
+        return
+
+    array_decoder: JSONArrayDecoder = JSONArrayDecoder()
+    async for chunk in byte_chunks:
+        for item in array_decoder.feed(text_decoder.decode(chunk)):
+            yield item
+    array_decoder.feed(text_decoder.decode(b"", final=True))
+    for item in array_decoder.close():
+        yield item
@@ -1,10 +1,92 @@
 import logging
+import random
+from typing import Any, Mapping
 
 logger = logging.getLogger("sdk")
-logger.setLevel(logging.DEBUG)
+logger.setLevel(logging.WARNING)
+# Where messages go is up to the application's logging setup, or `configure_logging(log_to_stderr=True)`
+logger.addHandler(logging.NullHandler())
 
-if not logger.handlers:
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter("[%(levelname)s] %(asctime)s - %(name)s - %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+# Handler attached by `configure_logging(log_to_stderr=True)`, or None
+_stderr_handler: logging.Handler | None = None
+
+# Share of requests whose parameters and response bodies are logged at DEBUG level
+_payload_sample_rate: float = 1.0
+
+# Header names whose values are credentials, lowercased
+_SECRET_HEADERS: frozenset[str] = frozenset({"authorization", "bearer", "cookie", "proxy-authorization", "set-cookie"})
+
+
+def configure_logging(
+    level: int | str | None = None,
+    *,
+    payload_sample_rate: float | None = None,
+    log_to_stderr: bool = False,
+) -> None:
+    """
+    Configure the SDK's "sdk" logger; settings left as None are unchanged.
+
+    The logger defaults to WARNING, so debug messages cost one level check. At DEBUG
+    level, request parameters and response bodies are only logged for a sampled share
+    of requests, since formatting them can cost more than sending the request.
+
+    The SDK attaches no handler of its own, so its messages go wherever the application's
+    logging setup sends them; `log_to_stderr` is for applications without one.
+
+    Args:
+        level (int | str | None): Logging level, e.g. logging.DEBUG or "INFO".
+        payload_sample_rate (float | None): Share of requests, from 0 to 1, whose payloads are logged.
+        log_to_stderr (bool): Whether to attach a handler that writes the SDK's messages to stderr;
+            it is attached once however often this is called.
+
+    Raises:
+        ValueError: If the level is unknown or the sample rate is outside [0, 1].
+
+    Examples:
+        >>> configure_logging("DEBUG", payload_sample_rate=0.01)
+    """
+    global _payload_sample_rate, _stderr_handler
+    if log_to_stderr and _stderr_handler is None:
+        _stderr_handler = logging.StreamHandler()
+        _stderr_handler.setFormatter(logging.Formatter("[%(levelname)s] %(asctime)s - %(name)s - %(message)s"))
+        logger.addHandler(_stderr_handler)
+    if payload_sample_rate is not None:
+        if not 0.0 <= payload_sample_rate <= 1.0:
+            raise ValueError(f"Payload sample rate must be between 0 and 1, not {payload_sample_rate}.")
+        _payload_sample_rate = payload_sample_rate
+    if level is not None:
+        logger.setLevel(level.upper() if isinstance(level, str) else level)
+
+
+def payload_sampled() -> bool:
+    """
+    Whether the payload of the current request should be logged: DEBUG is enabled and the request is sampled.
+    """
+    if not logger.isEnabledFor(logging.DEBUG) or _payload_sample_rate <= 0.0:
+        return False
+    return _payload_sample_rate >= 1.0 or random.random() < _payload_sample_rate
+
+
+def redact(secret: str | None) -> str:
+    """
+    Mask a token for logging, keeping its last four characters when it is long enough to stay secret.
+    """
+    if not secret:
+        return "<empty>"
+    return f"***{secret[-4:]}" if len(secret) >= 16 else "***"
+
+
+def redact_params(request_params: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Copy request parameters for logging, with the values of credential headers masked.
+    """
+    headers: Mapping[str, Any] | None = request_params.get("headers")
+    if not headers:
+        return dict(request_params)
+    return {
+        **request_params,
+        "headers": {
+            name: redact(str(value)) if name.lower() in _SECRET_HEADERS else value
+            for name, value in headers.items()
+        },
+    }
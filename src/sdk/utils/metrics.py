@@ -0,0 +1,68 @@
+import threading
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of named counters and gauges.
+
+    Counters only grow and are updated with `increment`; gauges hold the latest
+    value set with `set_gauge`. Each `OffersClient` owns one registry, shared by
+    its HTTP backend and APIs, and exposes it as `client.metrics`. Updates are
+    guarded by a lock because the requests backend records from worker threads.
+
+    Examples:
+        >>> metrics = MetricsRegistry()
+        >>> metrics.increment("compression.request.bytes_in", 2048)
+        >>> metrics.snapshot()
+        {'compression.request.bytes_in': 2048}
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._counters: dict[str, int | float] = {}
+        self._gauges: dict[str, int | float] = {}
+
+    def increment(self, name: str, amount: int | float = 1) -> None:
+        """
+        Add to a counter, creating it at zero if needed.
+
+        Args:
+            name (str): The counter name.
+            amount (int | float): The amount to add.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def set_gauge(self, name: str, value: int | float) -> None:
+        """
+        Set a gauge to its current value.
+
+        Args:
+            name (str): The gauge name.
+            value (int | float): The current value.
+        """
+        with self._lock:
+            self._gauges[name] = value
+
+    def get(self, name: str, default: int | float = 0) -> int | float:
+        """
+        Return the current value of a counter or gauge.
+
+        Args:
+            name (str): The metric name.
+            default (int | float): Value returned for a metric that was never recorded.
+        """
+        with self._lock:
+            if name in self._counters:
+                return self._counters[name]
+            return self._gauges.get(name, default)
+
+    def snapshot(self) -> dict[str, int | float]:
+        """
+        Return a point-in-time copy of all counters and gauges.
+
+        Returns:
+            dict[str, int | float]: Metric values keyed by name.
+        """
+        with self._lock:
+            return {**self._counters, **self._gauges}
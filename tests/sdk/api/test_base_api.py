@@ -23,7 +23,7 @@ async def test_request_with_plugins_and_successful_response():
 
     # assert full request sent
     http_mock.request.assert_awaited_once_with(
-        HTTPMethod.GET, "https://api.example.com/test", params={"foo": "bar"}
+        HTTPMethod.GET, "https://api.example.com/test", endpoint="/test", params={"foo": "bar"}
     )
     # plugins executed
     request_plugin.process_request.assert_awaited_once()
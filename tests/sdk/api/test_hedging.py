@@ -0,0 +1,177 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from sdk.api.hedging import HEDGING_DELAY_SECONDS, HEDGING_HEDGE_WINS, HEDGING_HEDGED, RequestHedger
+from sdk.client import OffersClient
+from sdk.config.hedging_config import HedgingConfig
+from sdk.config.retry_config import RetryConfig
+from sdk.utils.exceptions import DeadlineExceededError, SDKConfigError
+from sdk.utils.metrics import MetricsRegistry
+
+
+HEDGE_AT_MEDIAN = HedgingConfig(
+    enabled=True, percentile=0.5, min_delay_seconds=0.0, max_hedge_ratio=1.0, window_size=10, min_samples=2
+)
+
+
+def with_latencies(hedger, count=2):
+    """Give the hedger `count` samples of 10 ms, so that it hedges from the first request."""
+    hedger._latencies.extend([0.01] * count)
+    return hedger
+
+
+class ScriptedSend:
+    """Sends that take the scripted durations in call order, failing where the script holds an exception."""
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.calls = 0
+        self.cancelled = []
+
+    async def __call__(self):
+        call = self.calls
+        self.calls += 1
+        outcome = self.script[call]
+        try:
+            await asyncio.sleep(outcome if isinstance(outcome, float) else 0.0)
+        except asyncio.CancelledError:
+            self.cancelled.append(call)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return call
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_and_loser_cancelled():
+    metrics = MetricsRegistry()
+    hedger = with_latencies(RequestHedger(HEDGE_AT_MEDIAN, metrics))
+    send = ScriptedSend(1.0, 0.01)
+
+    assert await hedger.run(send) == 1
+    assert send.cancelled == [0]
+    assert metrics.get(HEDGING_HEDGED) == 1
+    assert metrics.get(HEDGING_HEDGE_WINS) == 1
+    assert metrics.get(HEDGING_DELAY_SECONDS) == pytest.approx(0.01)
+
+
+@pytest.mark.asyncio
+async def test_fast_request_is_not_hedged():
+    hedger = with_latencies(RequestHedger(HEDGE_AT_MEDIAN))
+    send = ScriptedSend(0.0)
+
+    assert await hedger.run(send) == 0
+    assert send.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_before_min_samples():
+    hedger = RequestHedger(HedgingConfig(enabled=True, min_samples=5, min_delay_seconds=0.0))
+    send = ScriptedSend(0.05)
+
+    assert hedger.hedge_delay is None
+    assert await hedger.run(send) == 0
+    assert send.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_ratio_caps_hedged_requests():
+    metrics = MetricsRegistry()
+    hedger = with_latencies(RequestHedger(HedgingConfig(
+        enabled=True, percentile=0.5, min_delay_seconds=0.02, max_hedge_ratio=0.5, window_size=10, min_samples=2
+    ), metrics))
+
+    for _ in range(4):
+        await hedger.run(ScriptedSend(0.05, 0.0))
+
+    assert metrics.get(HEDGING_HEDGED) == 2
+
+
+@pytest.mark.asyncio
+async def test_primary_wins_when_hedge_fails():
+    hedger = with_latencies(RequestHedger(HEDGE_AT_MEDIAN))
+    send = ScriptedSend(0.05, ValueError("hedge failed"))
+
+    assert await hedger.run(send) == 0
+
+
+@pytest.mark.asyncio
+async def test_primary_error_raised_when_both_fail():
+    hedger = with_latencies(RequestHedger(HEDGE_AT_MEDIAN))
+    calls = []
+
+    async def slow_failure():
+        calls.append(None)
+        if len(calls) == 1:
+            await asyncio.sleep(0.05)
+            raise ValueError("primary failed")
+        raise ValueError("hedge failed")
+
+    with pytest.raises(ValueError, match="primary failed"):
+        await hedger.run(slow_failure)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_caller_cancels_both_requests():
+    hedger = with_latencies(RequestHedger(HEDGE_AT_MEDIAN))
+    send = ScriptedSend(1.0, 1.0)
+
+    task = asyncio.create_task(hedger.run(send))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert sorted(send.cancelled) == [0, 1]
+
+
+def test_invalid_hedging_config_raises():
+    with pytest.raises(SDKConfigError):
+        HedgingConfig(percentile=1.0)
+    with pytest.raises(SDKConfigError):
+        HedgingConfig(window_size=5, min_samples=10)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_get_offers_hedges_slow_request(stand_in_server, backend_name):
+    async with OffersClient(
+        base_url=stand_in_server.base_url,
+        refresh_token="tok",
+        backend_name=backend_name,
+        retry_config=RetryConfig(max_attempts=1),
+        hedging_config=HedgingConfig(enabled=True, min_samples=2, max_hedge_ratio=1.0),
+    ) as client:
+        for _ in range(2):
+            await client.offers.get_offers(uuid4())
+
+        stand_in_server.offers_delays = [2.0]
+        offers = await asyncio.wait_for(client.offers.get_offers(uuid4()), timeout=1.5)
+
+        assert len(offers) == 1
+        assert client.metrics.get(HEDGING_HEDGE_WINS) == 1
+    assert len(stand_in_server.offers_request_times) == 4
+
+
+@pytest.mark.asyncio
+async def test_hedged_get_offers_fails_within_one_deadline(stand_in_server):
+    async with OffersClient(
+        base_url=stand_in_server.base_url,
+        refresh_token="tok",
+        retry_config=RetryConfig(max_attempts=1),
+        hedging_config=HedgingConfig(enabled=True, min_samples=2, max_hedge_ratio=1.0, min_delay_seconds=0.3),
+        deadline_seconds=0.5,
+    ) as client:
+        for _ in range(2):
+            await client.offers.get_offers(uuid4())
+
+        stand_in_server.offers_delays = [2.0, 2.0]
+        started_at = time.monotonic()
+        with pytest.raises(DeadlineExceededError):
+            await client.offers.get_offers(uuid4())
+
+        assert time.monotonic() - started_at < 0.7
+        assert client.metrics.get(HEDGING_HEDGED) == 1
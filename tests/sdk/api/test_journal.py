@@ -0,0 +1,82 @@
+from uuid import uuid4
+
+import pytest
+
+from sdk.api.bulk_result import ItemCategory
+from sdk.api.journal import RegistrationJournal
+from sdk.client import OffersClient
+
+
+def test_journal_persists_completed_ids(tmp_path):
+    journal_path = tmp_path / "import.journal"
+
+    with RegistrationJournal(journal_path) as journal:
+        journal.record("a")
+        journal.record_many(["b", "a", "c"])
+
+    assert journal_path.read_text() == "a\nb\nc\n"
+
+    with RegistrationJournal(journal_path) as reopened:
+        assert len(reopened) == 3
+        assert "b" in reopened
+        assert "d" not in reopened
+
+
+def test_journal_ignores_truncated_trailing_entry(tmp_path):
+    journal_path = tmp_path / "import.journal"
+    journal_path.write_text("a\nb\nhalf-writ")
+
+    with RegistrationJournal(journal_path) as journal:
+        assert len(journal) == 2
+        assert "half-writ" not in journal
+
+
+def test_journal_recovers_from_crash_mid_write(tmp_path):
+    journal_path = tmp_path / "import.journal"
+    journal_path.write_text("a\nb\nhalf")
+
+    with RegistrationJournal(journal_path) as journal:
+        journal.record("c")
+
+    assert journal_path.read_text() == "a\nb\nc\n"
+    with RegistrationJournal(journal_path) as reopened:
+        assert "c" in reopened
+        assert "half" not in reopened
+
+
+@pytest.mark.asyncio
+async def test_register_products_resumes_from_journal(stand_in_server, tmp_path):
+    products = [{"id": str(uuid4()), "name": f"P{index}", "description": "d"} for index in range(6)]
+    journal_path = tmp_path / "import.journal"
+
+    # Simulate a crashed run: the first three products were journaled, the fourth reached
+    # the server but the process died before it was journaled.
+    journal_path.write_text("".join(f"{product['id']}\n" for product in products[:3]))
+    for product in products[:4]:
+        stand_in_server.registered[product["id"]] = product
+
+    async with OffersClient(base_url=stand_in_server.base_url, refresh_token="tok") as client:
+        with RegistrationJournal(journal_path) as journal:
+            registered = await client.products.register_products(products, journal=journal)
+
+    assert stand_in_server.single_requests == 3
+    assert [product["id"] for product in registered.succeeded()] == [product["id"] for product in products]
+    assert [registered.category(index) for index in range(4)] == [
+        ItemCategory.SKIPPED, ItemCategory.SKIPPED, ItemCategory.SKIPPED, ItemCategory.ALREADY_REGISTERED
+    ]
+    assert journal_path.read_text().splitlines() == [product["id"] for product in products]
+
+
+@pytest.mark.asyncio
+async def test_register_products_batch_skips_journaled(stand_in_server, tmp_path):
+    products = [{"id": str(uuid4()), "name": f"P{index}", "description": "d"} for index in range(5)]
+
+    async with OffersClient(base_url=stand_in_server.base_url, refresh_token="tok") as client:
+        with RegistrationJournal(tmp_path / "import.journal") as journal:
+            journal.record(products[1]["id"])
+            results = await client.products.register_products_batch(products, max_batch_size=10, journal=journal)
+            assert len(journal) == 5
+
+    assert stand_in_server.batch_requests == [4]
+    assert results.payload(1) == products[1]
+    assert results.category(1) == ItemCategory.SKIPPED
@@ -1,11 +1,16 @@
 import pytest
 import time
+from contextlib import asynccontextmanager
 from uuid import uuid4
 from unittest.mock import AsyncMock, MagicMock
 
 from sdk.api.offers import OffersAPI
+from sdk.client import OffersClient
+from sdk.config.compression_config import CompressionConfig
+from sdk.http.compression import RESPONSE_BYTES_COMPRESSED, RESPONSE_BYTES_DECOMPRESSED
+from sdk.http.response import StreamingResponse
 from sdk.models.offer import Offer
-from sdk.utils.exceptions import OffersAPIError
+from sdk.utils.exceptions import NotFoundError, OffersAPIError
 
 
 @pytest.fixture
@@ -76,3 +81,100 @@ async def test_raises_if_invalid_response_data():
 
     with pytest.raises(OffersAPIError, match="Invalid offer data"):
         await api.get_offers(product_id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+@pytest.mark.parametrize("ndjson_supported", [False, True])
+async def test_iter_offers_streams_every_offer(stand_in_server, backend_name, ndjson_supported):
+    stand_in_server.offers_per_product = 3000
+    stand_in_server.ndjson_supported = ndjson_supported
+
+    async with OffersClient(
+        base_url=stand_in_server.base_url, refresh_token="tok", backend_name=backend_name
+    ) as client:
+        prices = [offer.price async for offer in client.offers.iter_offers(uuid4())]
+
+    assert prices == [100 + index for index in range(3000)]
+
+
+@pytest.mark.asyncio
+async def test_iter_offer_chunks_groups_offers(stand_in_server):
+    stand_in_server.offers_per_product = 25
+
+    async with OffersClient(base_url=stand_in_server.base_url, refresh_token="tok") as client:
+        chunk_sizes = [len(chunk) async for chunk in client.offers.iter_offer_chunks(uuid4(), chunk_size=10)]
+
+    assert chunk_sizes == [10, 10, 5]
+
+
+class FakeStreamingResponse(StreamingResponse):
+    def __init__(self, status_code, body, content_type="application/json"):
+        super().__init__()
+        self._status_code = status_code
+        self._body = body
+        self._headers = {"Content-Type": content_type}
+
+    @property
+    def status_code(self):
+        return self._status_code
+
+    @property
+    def headers(self):
+        return self._headers
+
+    async def _aiter_network_bytes(self):
+        for index in range(0, len(self._body), 7):
+            yield self._body[index:index + 7]
+
+
+def make_streaming_backend(response):
+    @asynccontextmanager
+    async def stream(method, url, **kwargs):
+        yield response
+
+    backend = MagicMock()
+    backend.stream = stream
+    return backend
+
+
+@pytest.mark.asyncio
+async def test_iter_offers_rejects_invalid_offer():
+    body = b'[{"id": "%s", "price": 1, "items_in_stock": 1}, {"price": "free"}]' % str(uuid4()).encode()
+    api = OffersAPI(http_backend=make_streaming_backend(FakeStreamingResponse(200, body)), base_url="https://api.test")
+
+    offers = []
+    with pytest.raises(OffersAPIError, match="Invalid offer data"):
+        async for offer in api.iter_offers(uuid4()):
+            offers.append(offer)
+    assert len(offers) == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_offers_raises_for_error_status():
+    response = FakeStreamingResponse(404, b'{"detail": "Product not found"}')
+    api = OffersAPI(http_backend=make_streaming_backend(response), base_url="https://api.test")
+
+    with pytest.raises(NotFoundError, match="Product not found"):
+        async for _ in api.iter_offers(uuid4()):
+            pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_negotiated_compression_is_decoded_by_sdk(stand_in_server, backend_name):
+    stand_in_server.offers_per_product = 500
+    stand_in_server.compress_responses = True
+
+    async with OffersClient(
+        base_url=stand_in_server.base_url,
+        refresh_token="tok",
+        backend_name=backend_name,
+        compression_config=CompressionConfig(accept_encoding=True),
+    ) as client:
+        offers = await client.offers.get_offers(uuid4())
+        streamed_offers = [offer async for offer in client.offers.iter_offers(uuid4())]
+
+    assert len(offers) == len(streamed_offers) == 500
+    snapshot = client.metrics.snapshot()
+    assert 0 < snapshot[RESPONSE_BYTES_COMPRESSED] < snapshot[RESPONSE_BYTES_DECOMPRESSED]
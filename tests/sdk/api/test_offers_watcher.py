@@ -0,0 +1,75 @@
+import asyncio
+from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sdk.api.watcher import OffersWatcher
+from sdk.models.offer import Offer
+
+
+def _offer(price):
+    return Offer(id="5f2b1f8e-3c4d-4e9a-9d5b-2a4b6c8d0e1f", price=price, items_in_stock=1)
+
+
+@pytest.mark.asyncio
+async def test_watcher_calls_back_only_when_offers_change():
+    product_id = uuid4()
+    offers_api = MagicMock()
+    offers_api.get_offers = AsyncMock(side_effect=[[_offer(100)], [_offer(100)], [_offer(90)]] + [[_offer(90)]] * 50)
+    changes = []
+
+    async with OffersWatcher(offers_api, jitter_ratio=0) as watcher:
+        watcher.watch(product_id, interval_seconds=0.01, callback=lambda pid, offers: changes.append(offers[0].price))
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if offers_api.get_offers.await_count >= 4:
+                break
+
+    assert changes == [100, 90]
+    offers_api.get_offers.assert_awaited_with(product_id, force_refresh=True)
+
+
+@pytest.mark.asyncio
+async def test_watcher_uses_fixed_number_of_tasks_and_unwatch_stops_polling():
+    offers_api = MagicMock()
+    offers_api.get_offers = AsyncMock(return_value=[])
+    callback = AsyncMock()
+    tasks_before = len(asyncio.all_tasks())
+
+    watcher = OffersWatcher(offers_api, max_concurrency=4)
+    watcher.start()
+    product_ids = [uuid4() for _ in range(2_000)]
+    for product_id in product_ids:
+        watcher.watch(product_id, interval_seconds=0.05, callback=callback)
+
+    await asyncio.sleep(0.1)
+    assert len(asyncio.all_tasks()) - tasks_before == 5
+    assert callback.await_count > 0
+
+    for product_id in product_ids:
+        watcher.unwatch(product_id)
+    await asyncio.sleep(0.02)
+    polls_after_unwatch = offers_api.get_offers.await_count
+    await asyncio.sleep(0.1)
+    await watcher.stop()
+
+    assert len(watcher) == 0
+    assert offers_api.get_offers.await_count == polls_after_unwatch
+
+
+@pytest.mark.asyncio
+async def test_rewatch_after_unwatch_keeps_a_single_poll_chain():
+    product_id = uuid4()
+    offers_api = MagicMock()
+    offers_api.get_offers = AsyncMock(return_value=[])
+
+    async with OffersWatcher(offers_api, jitter_ratio=0) as watcher:
+        for _ in range(5):
+            watcher.watch(product_id, interval_seconds=0.05, callback=AsyncMock())
+            watcher.unwatch(product_id)
+        watcher.watch(product_id, interval_seconds=0.05, callback=AsyncMock())
+        await asyncio.sleep(0.5)
+
+    # One poll every 50 ms, plus the first one spread over the interval
+    assert offers_api.get_offers.await_count <= 11
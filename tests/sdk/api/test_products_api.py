@@ -1,8 +1,13 @@
 import pytest
 from unittest.mock import AsyncMock
+from uuid import uuid4
 
+from sdk.api.bulk_result import ItemCategory
 from sdk.api.constatns import HTTPMethod
-from sdk.api.products import ProductsAPI
+from sdk.api.products import ProductsAPI, _chunk_encoded
+from sdk.client import OffersClient
+from sdk.config.compression_config import CompressionConfig
+from sdk.http.compression import REQUEST_BYTES_COMPRESSED, REQUEST_BYTES_UNCOMPRESSED
 from sdk.utils.exceptions import OffersAPIError
 from sdk.http.interfaces import HTTPBackend
 
@@ -92,5 +97,116 @@ async def test_register_products_mixed_results(mock_backend, dummy_product_data,
         dummy_product_data
     ])
 
-    assert len(results) == 1
-    assert results[0] == dummy_response
+    assert results.succeeded() == [dummy_response]
+    assert results.failed_indices() == [1, 2]
+    assert list(results.status_codes) == [200, 500, 0]
+    assert [results.category(index) for index in range(3)] == [
+        ItemCategory.OK, ItemCategory.SERVER, ItemCategory.UNEXPECTED
+    ]
+
+
+@pytest.mark.asyncio
+async def test_register_products_batch_fails_only_malformed_items(mock_backend, dummy_response):
+    batch_response = AsyncMock()
+    batch_response.status_code = 207
+    batch_response.json.return_value = [None, "registered", {"status_code": 201, "data": dummy_response}]
+    mock_backend.request.return_value = batch_response
+    api = ProductsAPI(http_backend=mock_backend, base_url="https://api.example.com")
+
+    results = await api.register_products_batch(_make_products(3))
+
+    assert results.failed_indices() == [0, 1]
+    assert [results.category(index) for index in range(3)] == [
+        ItemCategory.CLIENT, ItemCategory.CLIENT, ItemCategory.OK
+    ]
+    assert results.succeeded() == [dummy_response]
+
+
+def _make_products(count):
+    return [
+        {"id": str(uuid4()), "name": f"Product {index}", "description": "Batch test product"}
+        for index in range(count)
+    ]
+
+
+def test_chunk_encoded_respects_count_and_bytes():
+    encoded = [b"x" * 10 for _ in range(7)]
+
+    by_count = list(_chunk_encoded(encoded, max_items=3, max_bytes=10_000))
+    assert [(start, len(chunk)) for start, chunk in by_count] == [(0, 3), (3, 3), (6, 1)]
+
+    # Each item is 10 bytes, brackets are 2 and separators 1: two items fit into 23 bytes
+    by_bytes = list(_chunk_encoded(encoded, max_items=100, max_bytes=23))
+    assert [(start, len(chunk)) for start, chunk in by_bytes] == [(0, 2), (2, 2), (4, 2), (6, 1)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_register_products_batch_maps_results_to_inputs(stand_in_server, backend_name):
+    products = _make_products(5)
+    stand_in_server.registered[products[3]["id"]] = products[3]
+
+    async with OffersClient(
+        base_url=stand_in_server.base_url, refresh_token="tok", backend_name=backend_name
+    ) as client:
+        results = await client.products.register_products_batch(products, max_batch_size=2, compress=True)
+
+    assert sorted(stand_in_server.batch_requests) == [1, 2, 2]
+    assert stand_in_server.compressed_batches == 3
+    assert stand_in_server.single_requests == 0
+    assert [results.payload(index)["id"] for index in (0, 1, 2, 4)] == [
+        products[index]["id"] for index in (0, 1, 2, 4)
+    ]
+    assert results.category(3) == ItemCategory.CONFLICT
+    assert results.status_codes[3] == 409
+    assert results.failed() == [products[3]]
+
+
+@pytest.mark.asyncio
+async def test_register_products_batch_falls_back_to_single_requests(stand_in_server):
+    stand_in_server.batch_supported = False
+    products = _make_products(4)
+
+    async with OffersClient(base_url=stand_in_server.base_url, refresh_token="tok") as client:
+        results = await client.products.register_products_batch(products, max_batch_size=2, max_concurrent_batches=1)
+        assert client.products._batch_supported is False
+
+    assert stand_in_server.single_requests == 4
+    assert [result["id"] for result in results.succeeded()] == [product["id"] for product in products]
+
+
+@pytest.mark.asyncio
+async def test_register_products_retries_only_failed_subset(stand_in_server):
+    products = _make_products(3)
+    stand_in_server.registered[products[1]["id"]] = products[1]
+
+    async with OffersClient(base_url=stand_in_server.base_url, refresh_token="tok") as client:
+        first_pass = await client.products.register_products(products)
+        assert first_pass.failed() == [products[1]]
+
+        stand_in_server.registered.pop(products[1]["id"])
+        retry_pass = await client.products.register_products(first_pass.failed())
+
+    assert retry_pass.all_ok
+    assert stand_in_server.single_requests == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_request_bodies_above_threshold_are_compressed(stand_in_server, backend_name):
+    small_product, large_product = _make_products(2)
+    large_product["description"] = "x" * 5000
+
+    async with OffersClient(
+        base_url=stand_in_server.base_url,
+        refresh_token="tok",
+        backend_name=backend_name,
+        compression_config=CompressionConfig(compress_requests=True, min_compress_bytes=1024),
+    ) as client:
+        await client.products.register_product(small_product)
+        await client.products.register_product(large_product)
+
+    assert stand_in_server.compressed_requests == 1
+    assert set(stand_in_server.registered) == {small_product["id"], large_product["id"]}
+    snapshot = client.metrics.snapshot()
+    assert snapshot[REQUEST_BYTES_COMPRESSED] < snapshot[REQUEST_BYTES_UNCOMPRESSED]
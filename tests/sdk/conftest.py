@@ -0,0 +1,216 @@
+import asyncio
+import gzip
+import json
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from sdk.http.backends.base_async_backend import AbstractAsyncBackend
+
+
+class StandInState:
+    """Mutable state of the local stand-in Offers API used by integration-style tests."""
+
+    def __init__(self):
+        self.base_url: str = ""
+        self.batch_supported: bool = True
+        self.registered: dict[str, dict] = {}
+        self.single_requests: int = 0
+        self.batch_requests: list[int] = []
+        self.compressed_batches: int = 0
+        self.register_delay: float = 0.0
+        self.events: list[str] = []
+        self.offers_per_product: int = 1
+        self.ndjson_supported: bool = False
+        self.compress_responses: bool = False
+        self.compressed_requests: int = 0
+        self.offers_rate_limited: int = 0
+        self.retry_after: str | None = "1"
+        self.offers_request_times: list[float] = []
+        self.offers_unavailable: int = 0
+        self.offers_delays: list[float] = []
+        self.auth_requests: int = 0
+        self.client_connections: set[tuple] = set()
+
+
+def build_stand_in_app(state: StandInState) -> web.Application:
+    @web.middleware
+    async def track_connections(request: web.Request, handler):
+        # The auth client has its own connection, which is not part of the backend's pool
+        if request.path != "/auth":
+            state.client_connections.add(request.transport.get_extra_info("peername"))
+        return await handler(request)
+
+    async def auth(request: web.Request) -> web.Response:
+        state.auth_requests += 1
+        return web.json_response({"access_token": "stand-in-token"})
+
+    def register(product: dict) -> tuple[int, dict]:
+        if product["id"] in state.registered:
+            return 409, {"detail": "Product already registered"}
+        state.registered[product["id"]] = product
+        return 201, product
+
+    async def read_json(request: web.Request):
+        body = await request.read()
+        if request.headers.get("Content-Encoding") == "gzip":
+            state.compressed_requests += 1
+            if body[:2] == b"\x1f\x8b":
+                body = gzip.decompress(body)
+        return json.loads(body)
+
+    async def register_product(request: web.Request) -> web.Response:
+        state.single_requests += 1
+        state.events.append("register")
+        await asyncio.sleep(state.register_delay)
+        status, payload = register(await read_json(request))
+        return web.json_response(payload, status=status)
+
+    async def register_batch(request: web.Request) -> web.Response:
+        if not state.batch_supported:
+            return web.json_response({"detail": "Not Found"}, status=404)
+
+        if request.headers.get("Content-Encoding") == "gzip":
+            state.compressed_batches += 1
+        products = await read_json(request)
+        state.batch_requests.append(len(products))
+        results = []
+        for product in products:
+            status, payload = register(product)
+            if status == 201:
+                results.append({"status_code": status, "data": payload})
+            else:
+                results.append({"status_code": status, "detail": payload["detail"]})
+        return web.json_response(results, status=207)
+
+    async def get_offers(request: web.Request) -> web.StreamResponse:
+        state.events.append("offers")
+        state.offers_request_times.append(asyncio.get_running_loop().time())
+        if state.offers_rate_limited:
+            state.offers_rate_limited -= 1
+            headers = {"Retry-After": state.retry_after} if state.retry_after is not None else {}
+            return web.json_response({"detail": "Too Many Requests"}, status=429, headers=headers)
+        if state.offers_unavailable:
+            state.offers_unavailable -= 1
+            return web.json_response({"detail": "Service Unavailable"}, status=503)
+        if state.offers_delays:
+            await asyncio.sleep(state.offers_delays.pop(0))
+
+        offers = ({"id": str(uuid4()), "price": 100 + index, "items_in_stock": 5}
+                  for index in range(state.offers_per_product))
+        # Offers are written one by one, so clients receive them as a chunked stream
+        ndjson = state.ndjson_supported and "ndjson" in request.headers.get("Accept", "")
+        response = web.StreamResponse(
+            headers={"Content-Type": "application/x-ndjson" if ndjson else "application/json"}
+        )
+        if state.compress_responses:
+            response.enable_compression()
+        await response.prepare(request)
+        if ndjson:
+            for offer in offers:
+                await response.write(json.dumps(offer).encode() + b"\n")
+        else:
+            await response.write(b"[")
+            for index, offer in enumerate(offers):
+                await response.write((b"," if index else b"") + json.dumps(offer).encode())
+            await response.write(b"]")
+        await response.write_eof()
+        return response
+
+    app = web.Application(middlewares=[track_connections])
+    app.router.add_post("/auth", auth)
+    app.router.add_post("/products/register", register_product)
+    app.router.add_post("/products/register/batch", register_batch)
+    app.router.add_get("/products/{product_id}/offers", get_offers)
+    return app
+
+
+class DummyBackend(AbstractAsyncBackend):
+    """A backend without transport, for tests that pass their own `execute_request`."""
+
+    async def request(self, method: str, url: str, **kwargs):
+        pass
+
+    async def _open_warm_connection(self, url: str) -> None:
+        pass
+
+    @classmethod
+    def build_transport(cls, pool_config, unix_socket_path, timeout_seconds):
+        return None
+
+    @classmethod
+    async def close_transport(cls, pool) -> None:
+        pass
+
+
+class FakeClock:
+    """A monotonic clock that only moves when a test advances `now` or sleeps on it."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def pytest_generate_tests(metafunc):
+    # Test modules name the module whose clock the `clock` fixture replaces in CLOCKED_MODULE
+    clocked_module = getattr(metafunc.module, "CLOCKED_MODULE", None)
+    if "clock" in metafunc.fixturenames and clocked_module is not None:
+        metafunc.parametrize("clock", [clocked_module], indirect=True, ids=[clocked_module.__name__])
+
+
+@pytest.fixture
+def clock(request, monkeypatch):
+    """A FakeClock in place of `time.monotonic`, and `asyncio.sleep` if used, of the module given as parameter."""
+    fake_clock = FakeClock()
+    monkeypatch.setattr(request.param.time, "monotonic", fake_clock.monotonic)
+    if hasattr(request.param, "asyncio"):
+        monkeypatch.setattr(request.param.asyncio, "sleep", fake_clock.sleep)
+    return fake_clock
+
+
+@pytest.fixture
+def auth_client():
+    mock = AsyncMock()
+    mock.get_access_token = AsyncMock(return_value="valid-token")
+    return mock
+
+
+@pytest_asyncio.fixture
+async def stand_in_server():
+    state = StandInState()
+    server = TestServer(build_stand_in_app(state))
+    await server.start_server()
+    state.base_url = str(server.make_url("")).rstrip("/")
+    try:
+        yield state
+    finally:
+        await server.close()
+
+
+@pytest_asyncio.fixture
+async def stand_in_unix_server():
+    """The stand-in Offers API listening on a Unix domain socket; `base_url` is the socket's `unix://` URL."""
+    state = StandInState()
+    runner = web.AppRunner(build_stand_in_app(state))
+    await runner.setup()
+    with tempfile.TemporaryDirectory() as socket_dir:
+        socket_path = str(Path(socket_dir) / "offers.sock")
+        await web.UnixSite(runner, socket_path).start()
+        state.base_url = f"unix://{socket_path}"
+        try:
+            yield state
+        finally:
+            await runner.cleanup()
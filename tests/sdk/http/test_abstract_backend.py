@@ -1,8 +1,10 @@
 import pytest
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock
-from sdk.http.backends.base_async_backend import AbstractAsyncBackend
 from sdk.utils.exceptions import OffersAPIError, RequestExecutionError
 from sdk.http.interfaces import BaseResponse
+from sdk.http.response import StreamingResponse
+from tests.sdk.conftest import DummyBackend
 
 
 class DummyResponse(BaseResponse):
@@ -22,18 +24,6 @@ class DummyResponse(BaseResponse):
         return {"dummy": True}
 
 
-class DummyBackend(AbstractAsyncBackend):
-    async def request(self, method: str, url: str, **kwargs):
-        pass
-
-
-@pytest.fixture
-def auth_client():
-    mock = AsyncMock()
-    mock.get_access_token = AsyncMock(return_value="valid-token")
-    return mock
-
-
 @pytest.mark.asyncio
 async def test_request_with_auth_success(auth_client):
     backend = DummyBackend(auth_client)
@@ -91,3 +81,45 @@ async def test_request_with_auth_request_execution_error(auth_client):
 
     with pytest.raises(RequestExecutionError, match="Network failure"):
         await backend._request_with_auth("GET", "https://example.com", execute_request=request_fn)
+
+
+class DummyStreamingResponse(StreamingResponse):
+    def __init__(self, status_code: int, body: bytes):
+        super().__init__()
+        self._status_code = status_code
+        self._body = body
+        self.closed = False
+
+    @property
+    def status_code(self) -> int:
+        return self._status_code
+
+    @property
+    def headers(self):
+        return {}
+
+    async def _aiter_network_bytes(self):
+        yield self._body
+
+
+@pytest.mark.asyncio
+async def test_stream_with_auth_reopens_stream_on_expired_token(auth_client):
+    auth_client.get_access_token = AsyncMock(side_effect=["expired-token", "refreshed-token"])
+    backend = DummyBackend(auth_client)
+    opened = []
+
+    @asynccontextmanager
+    async def open_stream(method: str, url: str, token: str, **kwargs):
+        response = DummyStreamingResponse(401 if token == "expired-token" else 200, b"Access token expired")
+        opened.append(response)
+        try:
+            yield response
+        finally:
+            response.closed = True
+
+    async with backend._stream_with_auth("GET", "https://example.com", open_stream=open_stream) as response:
+        assert response.status_code == 200
+        assert opened[0].closed
+
+    assert len(opened) == 2
+    assert opened[1].closed
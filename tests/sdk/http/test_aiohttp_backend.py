@@ -1,8 +1,9 @@
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from aiohttp import ClientResponse, ContentTypeError
+from aiohttp import ClientResponse
 from sdk.http.backends.aiohttp_backend import AioHttpBackend, AioHttpResponseAdapter
 from sdk.auth.client import AuthClient
+from sdk.config.pool_config import PoolConfig
 
 
 @pytest.fixture
@@ -18,8 +19,10 @@ async def test_aiohttp_backend_success(auth_client):
 
     mock_response = MagicMock(spec=ClientResponse)
     mock_response.status = 200
-    mock_response.text = AsyncMock(return_value="OK")
-    mock_response.json = AsyncMock(return_value={"ok": True})
+    mock_response.charset = "utf-8"
+    mock_response.content_type = "application/json"
+    mock_response.read = AsyncMock(return_value=b'{"ok": true}')
+    mock_response.headers = {"Content-Length": str(len(b'{"ok": true}'))}
 
     class MockContextManager:
         async def __aenter__(self):
@@ -32,8 +35,10 @@ async def test_aiohttp_backend_success(auth_client):
         response = await backend.request("GET", "https://example.com")
 
         assert response.status_code == 200
-        assert response.text == "OK"
+        assert response.content == b'{"ok": true}'
+        assert response.text == '{"ok": true}'
         assert await response.json() == {"ok": True}
+        mock_response.read.assert_awaited_once()
 
     await backend.aclose()
 
@@ -49,8 +54,10 @@ async def test_aiohttp_token_is_injected(auth_client):
         async def __aenter__(self):
             mock_resp = MagicMock(spec=ClientResponse)
             mock_resp.status = 200
-            mock_resp.text = AsyncMock(return_value="OK")
-            mock_resp.json = AsyncMock(return_value={"ok": True})
+            mock_resp.charset = None
+            mock_resp.content_type = "text/plain"
+            mock_resp.read = AsyncMock(return_value=b"OK")
+            mock_resp.headers = {"Content-Length": str(len(b"OK"))}
             return mock_resp
 
         async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -77,10 +84,10 @@ async def test_aiohttp_backend_json_parse_failure(auth_client):
 
     mock_response = MagicMock(spec=ClientResponse)
     mock_response.status = 200
-    mock_response.text = AsyncMock(return_value="Not a JSON")
-    mock_response.json = AsyncMock(side_effect=ContentTypeError(
-        request_info=None, history=None, message="Invalid"
-    ))
+    mock_response.charset = None
+    mock_response.content_type = "text/plain"
+    mock_response.read = AsyncMock(return_value=b"Not a JSON")
+    mock_response.headers = {"Content-Length": str(len(b"Not a JSON"))}
 
     class MockContextManager:
         async def __aenter__(self):
@@ -105,11 +112,14 @@ async def test_aiohttp_backend_json_parse_failure(auth_client):
 async def test_aiohttp_response_adapter():
     mock_response = MagicMock(spec=ClientResponse)
     mock_response.status = 201
-    body = '{"key":"value"}'
+    mock_response.charset = "utf-8"
+    mock_response.content_type = "application/json"
+    body = b'{"key":"value"}'
 
-    adapter = AioHttpResponseAdapter(mock_response, body, {"key": "value"})
+    adapter = AioHttpResponseAdapter(mock_response, body)
     assert adapter.status_code == 201
-    assert adapter.text == body
+    assert adapter.content is body
+    assert adapter.text == body.decode()
     assert await adapter.json() == {"key": "value"}
 
 
@@ -119,3 +129,16 @@ async def test_aiohttp_aclose_closes_session(auth_client):
     with patch.object(backend._client_session, "close", new=AsyncMock()) as close_mock:
         await backend.aclose()
         close_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_pool_config_is_mapped_to_aiohttp(auth_client):
+    pool_config = PoolConfig(max_connections=64, max_connections_per_host=8, keepalive_expiry=30.0, read_timeout=3.0)
+    backend = AioHttpBackend(auth_client, pool_config=pool_config)
+
+    connector = backend._client_session.connector
+    assert connector.limit == 64
+    assert connector.limit_per_host == 8
+    assert backend._client_timeout.sock_read == 3.0
+
+    await backend.aclose()
@@ -0,0 +1,149 @@
+from uuid import uuid4
+
+import pytest
+
+from sdk.api.constatns import GET_OFFERS_ENDPOINT
+from sdk.client import OffersClient
+from sdk.config.circuit_breaker_config import CircuitBreakerConfig
+from sdk.config.retry_config import RetryConfig
+from sdk.http import circuit_breaker
+from sdk.http.circuit_breaker import (
+    CIRCUIT_OPEN_CIRCUITS,
+    CIRCUIT_OPENED,
+    CIRCUIT_REJECTED,
+    CircuitBreakerRegistry,
+    CircuitState,
+)
+from sdk.utils.exceptions import CircuitOpenError, SDKConfigError, ServerError
+from sdk.utils.metrics import MetricsRegistry
+
+ENDPOINT = "/products/{product_id}/offers"
+CLOCKED_MODULE = circuit_breaker
+
+
+def record_calls(breakers, outcomes, duration=0.1):
+    for failed in outcomes:
+        breakers.release(ENDPOINT, breakers.acquire(ENDPOINT), failed=failed, duration=duration)
+
+
+def test_opens_at_failure_rate_and_fails_fast(clock):
+    metrics = MetricsRegistry()
+    breakers = CircuitBreakerRegistry(
+        CircuitBreakerConfig(enabled=True, window_size=4, minimum_calls=4, open_seconds=10.0), metrics
+    )
+
+    record_calls(breakers, [True, False, True])
+    assert breakers.state(ENDPOINT) is CircuitState.CLOSED
+
+    record_calls(breakers, [False])
+    assert breakers.state(ENDPOINT) is CircuitState.OPEN
+
+    with pytest.raises(CircuitOpenError) as error_info:
+        breakers.acquire(ENDPOINT)
+    assert error_info.value.endpoint == ENDPOINT
+    assert error_info.value.retry_after_seconds == pytest.approx(10.0)
+    assert metrics.get(CIRCUIT_OPENED) == 1
+    assert metrics.get(CIRCUIT_REJECTED) == 1
+    assert metrics.get(CIRCUIT_OPEN_CIRCUITS) == 1
+
+
+def test_opens_on_slow_calls(clock):
+    breakers = CircuitBreakerRegistry(CircuitBreakerConfig(
+        enabled=True, window_size=4, minimum_calls=4, slow_call_seconds=1.0, slow_call_rate_threshold=0.75
+    ))
+
+    record_calls(breakers, [False, False, False], duration=2.0)
+    record_calls(breakers, [False], duration=0.1)
+
+    assert breakers.state(ENDPOINT) is CircuitState.OPEN
+
+
+def test_half_open_probes_close_circuit(clock):
+    breakers = CircuitBreakerRegistry(
+        CircuitBreakerConfig(enabled=True, window_size=4, minimum_calls=4, open_seconds=10.0, half_open_calls=2)
+    )
+    record_calls(breakers, [True] * 4)
+
+    clock.now += 10.0
+    assert breakers.state(ENDPOINT) is CircuitState.HALF_OPEN
+
+    first_probe = breakers.acquire(ENDPOINT)
+    second_probe = breakers.acquire(ENDPOINT)
+    with pytest.raises(CircuitOpenError):
+        breakers.acquire(ENDPOINT)
+
+    breakers.release(ENDPOINT, first_probe, failed=False, duration=0.1)
+    breakers.release(ENDPOINT, second_probe, failed=False, duration=0.1)
+    assert breakers.state(ENDPOINT) is CircuitState.CLOSED
+
+
+def test_failed_probe_reopens_circuit(clock):
+    breakers = CircuitBreakerRegistry(
+        CircuitBreakerConfig(enabled=True, window_size=4, minimum_calls=4, open_seconds=10.0, half_open_calls=2)
+    )
+    record_calls(breakers, [True] * 4)
+    clock.now += 10.0
+
+    breakers.release(ENDPOINT, breakers.acquire(ENDPOINT), failed=True, duration=0.1)
+
+    assert breakers.state(ENDPOINT) is CircuitState.OPEN
+
+
+def test_abandoned_probe_frees_its_slot(clock):
+    breakers = CircuitBreakerRegistry(
+        CircuitBreakerConfig(enabled=True, window_size=4, minimum_calls=4, open_seconds=10.0, half_open_calls=1)
+    )
+    record_calls(breakers, [True] * 4)
+    clock.now += 10.0
+
+    breakers.abandon(ENDPOINT, breakers.acquire(ENDPOINT))
+
+    breakers.release(ENDPOINT, breakers.acquire(ENDPOINT), failed=False, duration=0.1)
+    assert breakers.state(ENDPOINT) is CircuitState.CLOSED
+
+
+def test_calls_from_before_opening_are_ignored(clock):
+    breakers = CircuitBreakerRegistry(
+        CircuitBreakerConfig(enabled=True, window_size=4, minimum_calls=4, open_seconds=10.0, half_open_calls=1)
+    )
+    in_flight = breakers.acquire(ENDPOINT)
+    record_calls(breakers, [True] * 4)
+    clock.now += 10.0
+    probe = breakers.acquire(ENDPOINT)
+
+    breakers.release(ENDPOINT, in_flight, failed=False, duration=0.1)
+    assert breakers.state(ENDPOINT) is CircuitState.HALF_OPEN
+
+    breakers.release(ENDPOINT, probe, failed=False, duration=0.1)
+    assert breakers.state(ENDPOINT) is CircuitState.CLOSED
+
+
+def test_invalid_circuit_breaker_config_raises():
+    with pytest.raises(SDKConfigError):
+        CircuitBreakerConfig(failure_rate_threshold=0)
+    with pytest.raises(SDKConfigError):
+        CircuitBreakerConfig(window_size=5, minimum_calls=10)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_open_circuit_sheds_offers_requests(stand_in_server, backend_name):
+    stand_in_server.offers_unavailable = 2
+
+    async with OffersClient(
+        base_url=stand_in_server.base_url,
+        refresh_token="tok",
+        backend_name=backend_name,
+        retry_config=RetryConfig(max_attempts=1),
+        circuit_breaker_config=CircuitBreakerConfig(enabled=True, window_size=2, minimum_calls=2),
+    ) as client:
+        for _ in range(2):
+            with pytest.raises(ServerError):
+                await client.offers.get_offers(uuid4())
+
+        with pytest.raises(CircuitOpenError):
+            await client.offers.get_offers(uuid4())
+
+        assert client.circuit_states() == {GET_OFFERS_ENDPOINT: CircuitState.OPEN}
+
+    assert len(stand_in_server.offers_request_times) == 2
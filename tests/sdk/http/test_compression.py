@@ -0,0 +1,80 @@
+import gzip
+import zlib
+
+import pytest
+
+from sdk.config.compression_config import CompressionConfig
+from sdk.http.compression import (
+    ACCEPT_ENCODING,
+    REQUEST_BYTES_COMPRESSED,
+    REQUEST_BYTES_UNCOMPRESSED,
+    StreamDecoder,
+    compress_request_body,
+    decompress,
+    decompress_response_body,
+)
+from sdk.utils.exceptions import RequestExecutionError, ResponseTooLargeError
+from sdk.utils.metrics import MetricsRegistry
+
+
+def test_accept_encoding_always_offers_gzip():
+    assert "gzip" in ACCEPT_ENCODING.split(", ")
+
+
+def test_decompress_handles_gzip_deflate_and_identity():
+    body = b'{"offers": []}' * 100
+
+    assert decompress(gzip.compress(body), "gzip") == body
+    assert decompress(zlib.compress(body), "deflate") == body
+    assert decompress(body, "identity") == body
+    assert decompress(body, None) == body
+
+
+def test_decompress_applies_stacked_encodings_in_reverse():
+    body = b"payload" * 50
+    assert decompress(gzip.compress(zlib.compress(body)), "deflate, gzip") == body
+
+
+def test_decompress_rejects_unknown_and_corrupt_bodies():
+    with pytest.raises(RequestExecutionError, match="Unsupported Content-Encoding"):
+        decompress(b"data", "compress")
+    with pytest.raises(RequestExecutionError, match="Failed to decode"):
+        decompress(b"not gzip", "gzip")
+
+
+def test_stream_decoder_decodes_arbitrary_chunks():
+    body = b"0123456789" * 1000
+    compressed = gzip.compress(body)
+    decoder = StreamDecoder("gzip")
+
+    decoded = b"".join(decoder.decompress(compressed[index:index + 7]) for index in range(0, len(compressed), 7))
+    assert decoded + decoder.flush() == body
+
+
+def test_decoding_stops_once_the_decoded_body_exceeds_the_maximum():
+    # About 50 KB that inflate to 50 MB
+    bomb = gzip.compress(b"\0" * 50_000_000)
+
+    with pytest.raises(ResponseTooLargeError, match="decodes to more than the maximum of 1000000") as error_info:
+        decompress(bomb, "gzip", max_bytes=1_000_000)
+    assert error_info.value.received_bytes <= 1_000_000 + 64 * 1024
+
+    decoder = StreamDecoder("gzip", max_bytes=1_000_000)
+    with pytest.raises(ResponseTooLargeError):
+        for index in range(0, len(bomb), 4096):
+            decoder.decompress(bomb[index:index + 4096])
+    assert decoder.bytes_decoded <= 1_000_000 + 64 * 1024
+
+
+@pytest.mark.asyncio
+async def test_compression_records_byte_counts_and_offloads_large_bodies():
+    metrics = MetricsRegistry()
+    config = CompressionConfig(thread_offload_bytes=0)
+    body = b"x" * 10_000
+
+    compressed = await compress_request_body(body, config, metrics)
+    assert await decompress_response_body(compressed, "gzip", config, metrics) == body
+
+    snapshot = metrics.snapshot()
+    assert snapshot[REQUEST_BYTES_UNCOMPRESSED] == 10_000
+    assert snapshot[REQUEST_BYTES_COMPRESSED] == len(compressed) < 10_000
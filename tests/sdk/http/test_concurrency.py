@@ -0,0 +1,206 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from sdk.config.concurrency_config import ConcurrencyConfig
+from sdk.config.retry_config import RetryConfig
+from sdk.http.backends.base_async_backend import AbstractAsyncBackend
+from sdk.http.retry import RetryPolicy
+from sdk.http.concurrency import (
+    CONCURRENCY_IN_FLIGHT,
+    CONCURRENCY_LIMIT,
+    CONCURRENCY_QUEUE_DEPTH,
+    AdaptiveConcurrencyLimiter,
+)
+from sdk.utils.exceptions import RequestExecutionError, SDKConfigError
+from sdk.utils.metrics import MetricsRegistry
+from tests.sdk.conftest import DummyBackend
+
+NO_RETRIES = RetryPolicy(RetryConfig(max_attempts=1))
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_in_arrival_order():
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=1))
+    first_permit = await limiter.acquire()
+    served = []
+
+    async def wait_for_slot(name):
+        permit = await limiter.acquire()
+        served.append(name)
+        limiter.release(permit, overloaded=False, measure_latency=False)
+
+    tasks = [asyncio.create_task(wait_for_slot(name)) for name in ("a", "b", "c")]
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 3
+
+    limiter.release(first_permit, overloaded=False, measure_latency=False)
+    await asyncio.gather(*tasks)
+
+    assert served == ["a", "b", "c"]
+    assert limiter.queue_depth == 0
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_overload_burst_decreases_limit_once():
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=8))
+    permits = [await limiter.acquire() for _ in range(4)]
+
+    for permit in permits:
+        limiter.release(permit, overloaded=True)
+
+    assert limiter.limit == 4
+
+    permit = await limiter.acquire()
+    limiter.release(permit, overloaded=True)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limit_never_drops_below_minimum():
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=2, min_limit=2))
+    permit = await limiter.acquire()
+    limiter.release(permit, overloaded=True)
+    assert limiter.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_only_while_saturated():
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=2))
+
+    permit = await limiter.acquire()
+    limiter.release(permit, overloaded=False, measure_latency=False)
+    assert limiter.limit == 2
+
+    for _ in range(4):
+        permits = [await limiter.acquire() for _ in range(limiter.limit)]
+        for permit in permits:
+            limiter.release(permit, overloaded=False, measure_latency=False)
+
+    assert limiter.limit > 2
+
+
+@pytest.mark.asyncio
+async def test_latency_spike_decreases_limit():
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=8, latency_tolerance=2.0))
+
+    permit = await limiter.acquire()
+    permit.started_at -= 0.01
+    limiter.release(permit, overloaded=False)
+
+    permit = await limiter.acquire()
+    permit.started_at -= 1.0
+    limiter.release(permit, overloaded=False)
+
+    assert limiter.limit == 4
+
+
+@pytest.mark.asyncio
+async def test_limit_recovers_after_fast_outlier():
+    # With a limit of one, every request uses the whole limit and may grow it
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=1, latency_tolerance=2.0))
+
+    async def complete(latency: float) -> None:
+        permit = await limiter.acquire()
+        permit.started_at = time.monotonic() - latency
+        limiter.release(permit, overloaded=False)
+
+    # E.g. a response served from a warm cache, far below the usual 10 ms
+    await complete(0.0)
+    for _ in range(100):
+        await complete(0.01)
+
+    assert limiter.limit > 1
+
+
+@pytest.mark.asyncio
+async def test_error_responses_are_not_latency_samples(auth_client):
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=4, latency_tolerance=2.0))
+    backend: AbstractAsyncBackend = DummyBackend(auth_client, concurrency_limiter=limiter, retry_policy=NO_RETRIES)
+
+    async def execute(method, url, token, **kwargs):
+        return MagicMock(status_code=404, text="")
+
+    await backend._request_with_auth("GET", "https://x", execute_request=execute)
+
+    assert limiter._baseline_latency is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_queue():
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=1))
+    permit = await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.queue_depth == 0
+    limiter.release(permit, overloaded=False, measure_latency=False)
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_gauges_follow_limiter_state():
+    metrics = MetricsRegistry()
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=1), metrics)
+
+    permit = await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+
+    assert metrics.get(CONCURRENCY_LIMIT) == 1
+    assert metrics.get(CONCURRENCY_IN_FLIGHT) == 1
+    assert metrics.get(CONCURRENCY_QUEUE_DEPTH) == 1
+
+    limiter.release(permit, overloaded=False, measure_latency=False)
+    limiter.release(await waiter, overloaded=False, measure_latency=False)
+
+    assert metrics.get(CONCURRENCY_IN_FLIGHT) == 0
+    assert metrics.get(CONCURRENCY_QUEUE_DEPTH) == 0
+
+
+def test_invalid_concurrency_config_raises():
+    with pytest.raises(SDKConfigError):
+        ConcurrencyConfig(initial_limit=0)
+    with pytest.raises(SDKConfigError):
+        ConcurrencyConfig(decrease_factor=1.5)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code, expected_limit", [(200, 4), (429, 2), (503, 2)])
+async def test_backend_adjusts_limit_from_response_status(auth_client, status_code, expected_limit):
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=4))
+    backend: AbstractAsyncBackend = DummyBackend(auth_client, concurrency_limiter=limiter, retry_policy=NO_RETRIES)
+
+    async def execute(method, url, token, **kwargs):
+        assert limiter.in_flight == 1
+        return MagicMock(status_code=status_code, text="")
+
+    response = await backend._request_with_auth("GET", "https://x", execute_request=execute)
+
+    assert response.status_code == status_code
+    assert limiter.limit == expected_limit
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_backend_counts_network_error_as_overload(auth_client):
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=4))
+    backend: AbstractAsyncBackend = DummyBackend(auth_client, concurrency_limiter=limiter, retry_policy=NO_RETRIES)
+
+    async def execute(method, url, token, **kwargs):
+        raise RequestExecutionError("connection reset")
+
+    with pytest.raises(RequestExecutionError):
+        await backend._request_with_auth("GET", "https://x", execute_request=execute)
+
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
@@ -0,0 +1,192 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from sdk.api.offers import OffersAPI
+from sdk.client import OffersClient
+from sdk.config.circuit_breaker_config import CircuitBreakerConfig
+from sdk.config.concurrency_config import ConcurrencyConfig
+from sdk.config.retry_config import RetryConfig
+from sdk.http.circuit_breaker import CircuitBreakerRegistry, CircuitState
+from sdk.http.concurrency import AdaptiveConcurrencyLimiter
+from sdk.http.deadline import bound_timeout, deadline, enforce_deadline, remaining_seconds
+from sdk.http import retry
+from sdk.http.retry import RetryPolicy
+from sdk.plugins import ResponsePlugin
+from sdk.utils.exceptions import CircuitOpenError, DeadlineExceededError
+from tests.sdk.conftest import DummyBackend
+
+
+def make_response(status_code):
+    return MagicMock(status_code=status_code, text="", headers={})
+
+
+def test_nested_deadline_never_extends_enclosing_one():
+    assert remaining_seconds() is None
+
+    with deadline(1.0):
+        with deadline(60.0):
+            assert remaining_seconds() <= 1.0
+        with deadline(0.5):
+            assert remaining_seconds() <= 0.5
+        assert 0.5 < remaining_seconds() <= 1.0
+
+    assert remaining_seconds() is None
+
+
+def test_timeouts_are_bound_to_remaining_time():
+    assert bound_timeout(10.0) == 10.0
+    with deadline(2.0):
+        assert bound_timeout(10.0) <= 2.0
+        assert bound_timeout(1.0) == 1.0
+
+
+@pytest.mark.asyncio
+async def test_enforce_deadline_reports_phase():
+    with deadline(0.05):
+        with pytest.raises(DeadlineExceededError) as error_info:
+            async with enforce_deadline("request hooks"):
+                await asyncio.sleep(1.0)
+    assert error_info.value.phase == "request hooks"
+
+
+@pytest.mark.asyncio
+async def test_enforce_deadline_keeps_unrelated_timeouts():
+    with deadline(10.0):
+        with pytest.raises(TimeoutError):
+            async with enforce_deadline("request"):
+                raise TimeoutError("socket timeout")
+
+
+@pytest.mark.asyncio
+async def test_slow_token_acquisition_exceeds_client_deadline(auth_client):
+    async def slow_token(**kwargs):
+        await asyncio.sleep(1.0)
+        return "valid-token"
+
+    auth_client.get_access_token = slow_token
+    backend = DummyBackend(auth_client=auth_client, deadline_seconds=0.05)
+    execute = AsyncMock(return_value=make_response(200))
+
+    with pytest.raises(DeadlineExceededError) as error_info:
+        await backend._request_with_auth("GET", "https://api.test/offers", execute_request=execute)
+
+    assert error_info.value.phase == "authentication"
+    execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_attempt_is_cancelled_at_deadline(auth_client):
+    async def slow_execute(method, url, token, **kwargs):
+        await asyncio.sleep(1.0)
+
+    backend = DummyBackend(auth_client=auth_client)
+    started_at = time.monotonic()
+
+    with deadline(0.05), pytest.raises(DeadlineExceededError) as error_info:
+        await backend._request_with_auth("GET", "https://api.test/offers", execute_request=slow_execute)
+
+    assert error_info.value.phase == "request"
+    assert time.monotonic() - started_at < 0.5
+
+
+@pytest.mark.asyncio
+async def test_attempts_stalled_until_deadline_open_circuit_and_shrink_limit(auth_client):
+    async def stalled_execute(method, url, token, **kwargs):
+        await asyncio.sleep(1.0)
+
+    breakers = CircuitBreakerRegistry(CircuitBreakerConfig(enabled=True, window_size=2, minimum_calls=2))
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=8))
+    backend = DummyBackend(auth_client=auth_client, circuit_breakers=breakers, concurrency_limiter=limiter)
+
+    for _ in range(2):
+        with deadline(0.05), pytest.raises(DeadlineExceededError):
+            await backend._request_with_auth("GET", "https://api.test/offers", execute_request=stalled_execute)
+
+    assert breakers.state("/offers") is CircuitState.OPEN
+    assert limiter.limit < 8
+    with pytest.raises(CircuitOpenError):
+        await backend._request_with_auth("GET", "https://api.test/offers", execute_request=stalled_execute)
+
+
+@pytest.mark.asyncio
+async def test_retry_backoff_beyond_deadline_is_skipped(auth_client, monkeypatch):
+    monkeypatch.setattr(retry.random, "uniform", lambda low, high: high)
+    backend = DummyBackend(
+        auth_client=auth_client,
+        retry_policy=RetryPolicy(RetryConfig(base_delay_seconds=5.0, max_delay_seconds=5.0)),
+        deadline_seconds=1.0,
+    )
+    execute = AsyncMock(return_value=make_response(503))
+    started_at = time.monotonic()
+
+    response = await backend._request_with_auth("GET", "https://api.test/offers", execute_request=execute)
+
+    assert response.status_code == 503
+    assert execute.await_count == 1
+    assert time.monotonic() - started_at < 0.5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_offers_call_fails_fast_at_deadline(stand_in_server, backend_name):
+    stand_in_server.offers_delays = [2.0]
+
+    async with OffersClient(
+        base_url=stand_in_server.base_url,
+        refresh_token="tok",
+        backend_name=backend_name,
+        retry_config=RetryConfig(max_attempts=1),
+    ) as client:
+        started_at = time.monotonic()
+        with deadline(0.2), pytest.raises(DeadlineExceededError):
+            await client.offers.get_offers(uuid4())
+        assert time.monotonic() - started_at < 1.0
+
+        stand_in_server.offers_delays = [2.0]
+        with deadline(0.2), pytest.raises(DeadlineExceededError):
+            async for _ in client.offers.iter_offers(uuid4()):
+                pass
+
+        with deadline(5.0):
+            assert len(await client.offers.get_offers(uuid4())) == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_response_plugin_exceeds_client_deadline(stand_in_server):
+    class SlowPlugin(ResponsePlugin):
+        async def process_response(self, response):
+            await asyncio.sleep(1.0)
+
+    async with OffersClient(base_url=stand_in_server.base_url, refresh_token="tok", deadline_seconds=0.2) as client:
+        client.register_plugins(SlowPlugin())
+        started_at = time.monotonic()
+
+        with pytest.raises(DeadlineExceededError) as error_info:
+            await client.offers.get_offers(uuid4())
+
+        assert error_info.value.phase == "response plugins"
+        assert time.monotonic() - started_at < 0.5
+
+
+@pytest.mark.asyncio
+async def test_offers_are_not_parsed_after_deadline():
+    response = MagicMock(status_code=200, text="", headers={})
+    response.json = AsyncMock(return_value=[])
+
+    async def late_request(method, url, **kwargs):
+        await asyncio.sleep(0.1)
+        return response
+
+    backend = MagicMock()
+    backend.request = late_request
+    api = OffersAPI(http_backend=backend, base_url="https://api.test", deadline_seconds=0.05)
+
+    with pytest.raises(DeadlineExceededError) as error_info:
+        await api.get_offers(uuid4())
+
+    assert error_info.value.phase == "response parsing"
+    response.json.assert_not_awaited()
@@ -0,0 +1,135 @@
+import asyncio
+import os
+import threading
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from sdk.client import OffersClient
+from sdk.config.concurrency_config import ConcurrencyConfig
+from sdk.http import fork
+from sdk.http.backends.httpx_backend import HttpxBackend
+from sdk.http.concurrency import AdaptiveConcurrencyLimiter
+from sdk.http.fork import ForkGuard
+from sdk.http.transport import SharedTransport
+
+
+@pytest.fixture
+def simulate_fork(monkeypatch):
+    monkeypatch.setattr(fork, "_abandoned_resources", [])
+
+    def forked() -> None:
+        monkeypatch.setattr(fork, "_fork_generation", fork.fork_generation() + 1)
+    return forked
+
+
+def test_fork_guard_reports_each_fork_once(simulate_fork):
+    guard = ForkGuard()
+    assert not guard.forked()
+
+    simulate_fork()
+
+    assert guard.forked()
+    assert not guard.forked()
+
+
+@pytest.mark.asyncio
+async def test_backend_rebuilds_pool_in_child_without_closing_parents(auth_client, simulate_fork):
+    backend = HttpxBackend(auth_client)
+    parent_client = backend._httpx_client
+    assert backend._httpx_client is parent_client
+
+    simulate_fork()
+
+    with patch.object(parent_client, "aclose", new=AsyncMock()) as parent_close:
+        child_client = backend._httpx_client
+        assert child_client is not parent_client
+        await backend.aclose()
+    parent_close.assert_not_awaited()
+    assert child_client.is_closed
+    # Kept referenced, so its finalizers never close the parent's connections
+    assert fork._abandoned_resources == [parent_client]
+    await parent_client.aclose()
+
+
+def test_shared_transport_rebuilds_pool_in_child(simulate_fork):
+    transport = SharedTransport("httpx")
+    transport.attach(HttpxBackend)
+    parent_pool = transport.pool()
+
+    simulate_fork()
+
+    assert transport.pool() is not parent_pool
+    assert transport.references == 1
+
+
+@pytest.mark.asyncio
+async def test_closing_in_child_keeps_parents_pools_referenced(auth_client, simulate_fork):
+    backend = HttpxBackend(auth_client)
+    parent_client = backend._httpx_client
+    transport = SharedTransport("httpx")
+    transport.attach(HttpxBackend)
+    parent_pool = transport.pool()
+
+    simulate_fork()
+
+    with patch.object(HttpxBackend, "close_transport", new=AsyncMock()) as close_transport:
+        await backend.aclose()
+        await transport.release()
+    close_transport.assert_not_awaited()
+    assert fork._abandoned_resources == [parent_client, parent_pool]
+    await parent_client.aclose()
+    await parent_pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_limiter_forgets_parents_requests_in_flight(simulate_fork):
+    limiter = AdaptiveConcurrencyLimiter(ConcurrencyConfig(enabled=True, initial_limit=1, min_limit=1))
+    await limiter.acquire()
+
+    simulate_fork()
+
+    await asyncio.wait_for(limiter.acquire(), timeout=1.0)
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork")
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_forked_child_starts_hot_on_fresh_connections(stand_in_server, backend_name):
+    product_id = uuid4()
+    client = OffersClient(base_url=stand_in_server.base_url, refresh_token="tok", backend_name=backend_name)
+    cached_offers = await client.offers.get_offers(product_id)
+    parent_connections = set(stand_in_server.client_connections)
+
+    async def use_client_in_child() -> bool:
+        cache_hit: bool = await client.offers.get_offers(product_id) == cached_offers
+        fetched: bool = len(await client.offers.get_offers(uuid4())) == 1
+        await client.aclose()
+        return cache_hit and fetched
+
+    def run_child() -> None:
+        # The parent's event loop is still marked as running in this thread, so the child uses another
+        outcome: list[bool] = []
+        worker = threading.Thread(target=lambda: outcome.append(asyncio.run(use_client_in_child())))
+        worker.start()
+        worker.join()
+        os._exit(0 if outcome == [True] else 1)
+
+    child_pid = os.fork()
+    if child_pid == 0:
+        try:
+            run_child()
+        finally:
+            os._exit(2)
+
+    # The stand-in server keeps serving the child while the parent waits
+    _, wait_status = await asyncio.get_running_loop().run_in_executor(None, os.waitpid, child_pid, 0)
+    assert os.waitstatus_to_exitcode(wait_status) == 0
+
+    assert stand_in_server.auth_requests == 1
+    assert len(stand_in_server.client_connections - parent_connections) == 1
+    # The parent's pooled connection is still usable
+    assert len(await client.offers.get_offers(uuid4())) == 1
+    await client.aclose()
@@ -6,6 +6,7 @@ from sdk.utils.exceptions import RequestExecutionError
 import httpx
 
 from sdk.auth.client import AuthClient
+from sdk.config.pool_config import PoolConfig
 
 
 @pytest.fixture
@@ -19,8 +20,8 @@ def auth_client():
 async def test_httpx_backend_success(auth_client):
     backend = HttpxBackend(auth_client)
 
-    with patch.object(backend._httpx_client, "request", new=AsyncMock()) as mock_request:
-        mock_request.return_value = httpx.Response(200, text="OK")
+    with patch.object(backend._httpx_client, "send", new=AsyncMock()) as mock_send:
+        mock_send.return_value = httpx.Response(200, text="OK")
 
         resp = await backend.request("GET", "https://example.com")
         assert resp.status_code == 200
@@ -34,12 +35,12 @@ async def test_token_is_injected_in_headers(auth_client):
     backend = HttpxBackend(auth_client)
     captured_headers = {}
 
-    async def mock_httpx_request(method, url, **kwargs):
+    async def mock_httpx_send(request, **kwargs):
         nonlocal captured_headers
-        captured_headers = kwargs.get("headers", {})
+        captured_headers = request.headers
         return httpx.Response(200)
 
-    with patch.object(backend._httpx_client, "request", new=mock_httpx_request):
+    with patch.object(backend._httpx_client, "send", new=mock_httpx_send):
         await backend.request("GET", "https://example.com", headers={})
 
     assert "Bearer" in captured_headers
@@ -52,7 +53,7 @@ async def test_token_is_injected_in_headers(auth_client):
 async def test_httpx_backend_request_error(auth_client):
     backend = HttpxBackend(auth_client)
 
-    with patch.object(backend._httpx_client, "request", new=AsyncMock(side_effect=httpx.RequestError("fail"))):
+    with patch.object(backend._httpx_client, "send", new=AsyncMock(side_effect=httpx.RequestError("fail"))):
         with pytest.raises(RequestExecutionError, match="HTTPX request failed"):
             await backend.request("GET", "https://example.com")
 
@@ -77,3 +78,38 @@ async def test_response_adapter():
 
     json_data = await adapter.json()
     assert json_data == data
+
+
+@pytest.mark.asyncio
+async def test_pool_config_is_mapped_to_httpx(auth_client):
+    pool_config = PoolConfig(max_connections=64, max_keepalive_connections=16, keepalive_expiry=30.0, read_timeout=3.0)
+    backend = HttpxBackend(auth_client, timeout_seconds=7.0, pool_config=pool_config)
+
+    pool = backend._httpx_client._transport._pool
+    assert pool._max_connections == 64
+    assert pool._max_keepalive_connections == 16
+    assert pool._keepalive_expiry == 30.0
+    assert backend._httpx_client.timeout.read == 3.0
+    assert backend._httpx_client.timeout.connect == 7.0
+
+    await backend.aclose()
+
+
+@pytest.mark.asyncio
+async def test_http2_mode_falls_back_without_h2(auth_client):
+    with patch("sdk.http.backends.httpx_backend.importlib.util.find_spec", return_value=None):
+        backend = HttpxBackend(auth_client, pool_config=PoolConfig(http2=True))
+
+    assert backend._httpx_client._transport._pool._http2 is False
+
+    await backend.aclose()
+
+
+@pytest.mark.asyncio
+async def test_http2_mode_enabled_with_h2(auth_client):
+    pytest.importorskip("h2")
+    backend = HttpxBackend(auth_client, pool_config=PoolConfig(http2=True))
+
+    assert backend._httpx_client._transport._pool._http2 is True
+
+    await backend.aclose()
@@ -0,0 +1,152 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from uuid import uuid4
+
+import pytest
+
+from sdk.client import OffersClient
+from sdk.config.rate_limit_config import RateLimitConfig
+from sdk.config.retry_config import RetryConfig
+from sdk.http import rate_limit
+from sdk.http.rate_limit import (
+    RATE_LIMIT_CURRENT_RATE,
+    RATE_LIMIT_PAUSES,
+    RATE_LIMIT_THROTTLED_SECONDS,
+    ClientRateLimiter,
+)
+from sdk.http.utils import parse_retry_after
+from sdk.utils.exceptions import RateLimitError, SDKConfigError
+from sdk.utils.metrics import MetricsRegistry
+
+CLOCKED_MODULE = rate_limit
+
+
+@pytest.mark.asyncio
+async def test_burst_is_sent_at_once_then_paced(clock):
+    limiter = ClientRateLimiter(RateLimitConfig(enabled=True, requests_per_second=10.0, burst=2))
+
+    for _ in range(4):
+        await limiter.acquire("/offers")
+
+    assert clock.sleeps == pytest.approx([0.1, 0.1])
+
+
+@pytest.mark.asyncio
+async def test_endpoints_have_separate_buckets(clock):
+    limiter = ClientRateLimiter(
+        RateLimitConfig(enabled=True, requests_per_second=10.0, burst=1, endpoint_limits={"/slow": (1.0, 1)})
+    )
+
+    await limiter.acquire("/slow")
+    await limiter.acquire("/fast")
+    await limiter.acquire("/slow")
+
+    assert clock.sleeps == pytest.approx([1.0])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("endpoint", ["/offers", "/register"])
+async def test_pause_holds_every_endpoint_and_restarts_empty(clock, endpoint):
+    metrics = MetricsRegistry()
+    limiter = ClientRateLimiter(RateLimitConfig(enabled=True, requests_per_second=4.0, burst=4), metrics)
+    await limiter.acquire("/offers")
+
+    limiter.pause(2.0)
+    assert limiter.paused_for == pytest.approx(2.0)
+
+    await limiter.acquire(endpoint)
+
+    # The request waits out the pause, then draws from an empty bucket at 4 requests per second
+    assert clock.sleeps == pytest.approx([2.25])
+    assert metrics.get(RATE_LIMIT_PAUSES) == 1
+    assert metrics.get(RATE_LIMIT_THROTTLED_SECONDS) == pytest.approx(2.25)
+
+
+@pytest.mark.asyncio
+async def test_pause_uses_default_and_cap(clock):
+    limiter = ClientRateLimiter(RateLimitConfig(
+        enabled=True, default_retry_after_seconds=3.0, max_retry_after_seconds=5.0
+    ))
+
+    limiter.pause(None)
+    assert limiter.paused_for == pytest.approx(3.0)
+
+    limiter.pause(3600.0)
+    assert limiter.paused_for == pytest.approx(5.0)
+
+
+@pytest.mark.asyncio
+async def test_current_rate_counts_last_second(clock):
+    metrics = MetricsRegistry()
+    limiter = ClientRateLimiter(RateLimitConfig(enabled=True, requests_per_second=100.0, burst=100), metrics)
+
+    for _ in range(5):
+        await limiter.acquire("/offers")
+    assert metrics.get(RATE_LIMIT_CURRENT_RATE) == 5
+
+    clock.now += 1.5
+    assert limiter.current_rate == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_acquire_returns_its_token():
+    limiter = ClientRateLimiter(RateLimitConfig(enabled=True, requests_per_second=1.0, burst=1))
+    await limiter.acquire("/offers")
+
+    waiter = asyncio.create_task(limiter.acquire("/offers"))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter._bucket("/offers").reserve(rate_limit.time.monotonic()) == pytest.approx(1.0, abs=0.05)
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("3", 3.0),
+    ("0.5", 0.5),
+    ("-1", 0.0),
+    ("soon", None),
+    (None, None),
+])
+def test_parse_retry_after_seconds(header, expected):
+    assert parse_retry_after(header) == expected
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(30, abs=2)
+
+
+def test_endpoint_limits_accept_mappings():
+    config = RateLimitConfig(endpoint_limits={"/offers": {"requests_per_second": "2.5", "burst": 3}})
+    assert config.limit_for("/offers") == (2.5, 3)
+    assert config.limit_for("/other") == (50.0, 50)
+
+    with pytest.raises(SDKConfigError):
+        RateLimitConfig(endpoint_limits={"/offers": (0, 1)})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_429_pauses_requests_for_retry_after(stand_in_server, backend_name):
+    stand_in_server.offers_rate_limited = 1
+    stand_in_server.retry_after = "0.3"
+
+    async with OffersClient(
+        base_url=stand_in_server.base_url,
+        refresh_token="tok",
+        backend_name=backend_name,
+        rate_limit_config=RateLimitConfig(enabled=True),
+        retry_config=RetryConfig(max_attempts=1),
+    ) as client:
+        with pytest.raises(RateLimitError):
+            await client.offers.get_offers(uuid4())
+        offers = await client.offers.get_offers(uuid4())
+
+    assert len(offers) == 1
+    first_request_at, second_request_at = stand_in_server.offers_request_times
+    assert second_request_at - first_request_at >= 0.25
+    assert client.metrics.get(RATE_LIMIT_PAUSES) == 1
+    assert client.metrics.get(RATE_LIMIT_THROTTLED_SECONDS) > 0
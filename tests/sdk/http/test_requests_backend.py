@@ -1,8 +1,16 @@
+import asyncio
+import gzip
+import io
+import threading
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from requests import Response as RequestsResponse, RequestException
-from sdk.http.backends.requests_backend import RequestsBackend, RequestsResponseAdapter
-from sdk.utils.exceptions import OffersAPIError, RequestExecutionError
+from requests.structures import CaseInsensitiveDict
+from urllib3 import HTTPResponse
+from sdk.config.pool_config import PoolConfig
+from sdk.http.backends.requests_backend import RequestsBackend, RequestsResponseAdapter, _read_body
+from sdk.http.response import STREAM_CHUNK_BYTES, BodySizeLimit
+from sdk.utils.exceptions import OffersAPIError, RequestExecutionError, ResponseTooLargeError
 
 
 @pytest.fixture
@@ -12,11 +20,12 @@ def auth_client():
     return mock
 
 
-def make_fake_response(status_code=200, text="OK"):
+def make_fake_response(status_code=200, text='{"ok": true}'):
     response = MagicMock(spec=RequestsResponse)
     response.status_code = status_code
-    response.text = text
-    response.json.return_value = {"ok": True}
+    response.content = text.encode()
+    response.headers = {"Content-Length": str(len(response.content))}
+    response.encoding = "utf-8"
     return response
 
 
@@ -28,7 +37,7 @@ async def test_requests_backend_success(auth_client):
         resp = await backend.request("GET", "https://example.com")
 
         assert resp.status_code == 200
-        assert resp.text == "OK"
+        assert resp.text == '{"ok": true}'
         assert await resp.json() == {"ok": True}
 
         mock_req.assert_called_once()
@@ -84,4 +93,100 @@ async def test_response_adapter():
     assert adapter.status_code == 201
     assert adapter.text == '{"hello": "world"}'
     json_data = await adapter.json()
-    assert json_data == {"ok": True}
+    assert json_data == {"hello": "world"}
+    assert await adapter.json() is json_data
+
+
+def test_pool_config_is_mapped_to_requests(auth_client):
+    backend = RequestsBackend(auth_client, timeout_seconds=7.0, pool_config=PoolConfig(
+        max_connections=64, max_connections_per_host=32, connect_timeout=1.5
+    ))
+
+    assert backend._session.get_adapter("https://example.com")._pool_maxsize == 32
+    assert backend._timeout == (1.5, 7.0)
+
+
+@pytest.mark.asyncio
+async def test_requests_run_on_owned_pool_sized_to_connection_pool(auth_client):
+    backend = RequestsBackend(auth_client, pool_config=PoolConfig(max_connections=2))
+    release = threading.Event()
+    thread_names = []
+
+    def slow_request(*args, **kwargs):
+        thread_names.append(threading.current_thread().name)
+        release.wait(timeout=5)
+        return make_fake_response()
+
+    assert backend._executor._max_workers == 2
+    assert backend._session.get_adapter("https://example.com")._pool_maxsize == 2
+
+    with patch.object(backend._session, "request", side_effect=slow_request):
+        requests_in_flight = [asyncio.create_task(backend.request("GET", "https://example.com")) for _ in range(3)]
+        for _ in range(100):
+            if backend.active_requests == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert backend.active_requests == 2
+        assert backend.queue_depth == 1
+
+        release.set()
+        await asyncio.gather(*requests_in_flight)
+
+    assert backend.queue_depth == 0
+    assert all(name.startswith("sdk-requests") for name in thread_names)
+    await backend.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_request_leaves_queue(auth_client):
+    backend = RequestsBackend(auth_client, pool_config=PoolConfig(max_connections=1))
+    release = threading.Event()
+
+    def slow_request(*args, **kwargs):
+        release.wait(timeout=5)
+        return make_fake_response()
+
+    with patch.object(backend._session, "request", side_effect=slow_request):
+        running = asyncio.create_task(backend.request("GET", "https://example.com"))
+        queued = asyncio.create_task(backend.request("GET", "https://example.com"))
+        for _ in range(100):
+            if backend.queue_depth == 1:
+                break
+            await asyncio.sleep(0.01)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        assert backend.queue_depth == 0
+
+        release.set()
+        await running
+
+    assert backend.queue_depth == 0
+    assert backend.active_requests == 0
+    await backend.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_shuts_down_pool(auth_client):
+    backend = RequestsBackend(auth_client)
+    await backend.aclose()
+
+    with pytest.raises(RequestExecutionError, match="closed"):
+        await backend.request("GET", "https://example.com")
+
+
+def test_library_decoded_body_is_capped_despite_content_length():
+    bomb = gzip.compress(b"\0" * 50_000_000)
+    response = RequestsResponse()
+    response.raw = HTTPResponse(
+        body=io.BytesIO(bomb), headers={"Content-Encoding": "gzip", "Content-Length": str(len(bomb))},
+        preload_content=False,
+    )
+    response.headers = CaseInsensitiveDict(response.raw.headers)
+
+    body_limit = BodySizeLimit(1_000_000)
+    with pytest.raises(ResponseTooLargeError):
+        _read_body(response, body_limit, decode_content=True)
+    assert body_limit.bytes_read <= 1_000_000 + STREAM_CHUNK_BYTES
@@ -0,0 +1,116 @@
+from uuid import uuid4
+
+import pytest
+
+from sdk.client import OffersClient
+from sdk.config.compression_config import CompressionConfig
+from sdk.http.response import RESPONSE_BYTES_READ, RESPONSE_TOO_LARGE, STREAM_CHUNK_BYTES, BodySizeLimit
+from sdk.utils.exceptions import ResponseTooLargeError
+from sdk.utils.metrics import MetricsRegistry
+
+
+def test_body_size_limit_counts_chunks_until_the_maximum():
+    body_limit = BodySizeLimit(max_bytes=10)
+    assert body_limit.check_content_length({}) is False
+    assert body_limit.add(b"123456") == b"123456"
+
+    with pytest.raises(ResponseTooLargeError) as error_info:
+        body_limit.add(b"789012")
+
+    assert error_info.value.limit_bytes == 10
+    assert error_info.value.received_bytes == 12
+    metrics = MetricsRegistry()
+    body_limit.record(metrics)
+    assert metrics.snapshot() == {RESPONSE_BYTES_READ: 12, RESPONSE_TOO_LARGE: 1}
+
+
+def test_body_size_limit_rejects_declared_length_before_reading():
+    body_limit = BodySizeLimit(max_bytes=10)
+    assert body_limit.check_content_length({"Content-Length": "10"}) is True
+
+    with pytest.raises(ResponseTooLargeError, match="declares 11 bytes"):
+        body_limit.check_content_length({"Content-Length": "11"})
+    assert body_limit.bytes_read == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_oversized_chunked_body_is_abandoned_mid_stream(stand_in_server, backend_name):
+    # About 1.5 MB, sent without a Content-Length
+    stand_in_server.offers_per_product = 20_000
+    client = OffersClient(
+        base_url=stand_in_server.base_url, refresh_token="tok", backend_name=backend_name, max_response_bytes=4096,
+    )
+
+    with pytest.raises(ResponseTooLargeError) as error_info:
+        await client.offers.get_offers(uuid4())
+
+    assert error_info.value.limit_bytes == 4096
+    metrics = client.metrics.snapshot()
+    assert 4096 < metrics[RESPONSE_BYTES_READ] <= 4096 + STREAM_CHUNK_BYTES
+    assert metrics[RESPONSE_TOO_LARGE] == 1
+    # Not retried, and the client keeps working
+    assert len(stand_in_server.offers_request_times) == 1
+    stand_in_server.offers_per_product = 1
+    assert len(await client.offers.get_offers(uuid4())) == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_declared_content_length_is_rejected_before_reading(stand_in_server, backend_name):
+    client = OffersClient(
+        base_url=stand_in_server.base_url, refresh_token="tok", backend_name=backend_name, max_response_bytes=16,
+    )
+
+    with pytest.raises(ResponseTooLargeError, match="declares"):
+        await client.products.register_product({"id": str(uuid4()), "name": "Phone", "description": "A phone"})
+
+    assert client.metrics.snapshot()[RESPONSE_BYTES_READ] == 0
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_streamed_body_is_capped(stand_in_server, backend_name):
+    stand_in_server.offers_per_product = 20_000
+    stand_in_server.ndjson_supported = True
+    max_response_bytes = 2 * STREAM_CHUNK_BYTES
+    client = OffersClient(
+        base_url=stand_in_server.base_url, refresh_token="tok", backend_name=backend_name,
+        max_response_bytes=max_response_bytes,
+    )
+
+    received_offers = []
+    with pytest.raises(ResponseTooLargeError):
+        async for offer in client.offers.iter_offers(uuid4()):
+            received_offers.append(offer)
+
+    # Offers within the limit are delivered before the stream is abandoned
+    assert 0 < len(received_offers) < 20_000
+    metrics = client.metrics.snapshot()
+    assert metrics[RESPONSE_BYTES_READ] <= max_response_bytes + STREAM_CHUNK_BYTES
+    assert metrics[RESPONSE_TOO_LARGE] == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("accept_encoding", [True, False])
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_compressed_body_is_capped_after_decoding(stand_in_server, backend_name, accept_encoding):
+    # About 1.5 MB of offers, which compress to well under the limit
+    stand_in_server.offers_per_product = 20_000
+    stand_in_server.compress_responses = True
+    client = OffersClient(
+        base_url=stand_in_server.base_url, refresh_token="tok", backend_name=backend_name,
+        max_response_bytes=1_000_000, compression_config=CompressionConfig(accept_encoding=accept_encoding),
+    )
+
+    with pytest.raises(ResponseTooLargeError):
+        await client.offers.get_offers(uuid4())
+
+    stand_in_server.ndjson_supported = True
+    with pytest.raises(ResponseTooLargeError):
+        async for _ in client.offers.iter_offers(uuid4()):
+            pass
+    await client.aclose()
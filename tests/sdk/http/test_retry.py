@@ -0,0 +1,159 @@
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from sdk.client import OffersClient
+from sdk.config.retry_config import RetryConfig
+from sdk.http import retry
+from sdk.http.retry import RETRY_ATTEMPTS, RETRY_BUDGET_EXHAUSTED, RetryPolicy
+from sdk.utils.exceptions import RequestExecutionError, SDKConfigError
+from sdk.utils.metrics import MetricsRegistry
+from tests.sdk.conftest import DummyBackend
+
+FAST_RETRIES = RetryConfig(base_delay_seconds=0.001, max_delay_seconds=0.001)
+
+
+@pytest.fixture
+def max_jitter(monkeypatch):
+    monkeypatch.setattr(retry.random, "uniform", lambda low, high: high)
+
+
+def make_response(status_code, retry_after=None):
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return MagicMock(status_code=status_code, text="", headers=headers)
+
+
+@pytest.mark.parametrize("status_code, expected_retry", [(429, True), (502, True), (503, True), (504, True),
+                                                         (500, False), (404, False)])
+def test_only_retryable_statuses_are_retried(status_code, expected_retry):
+    policy = RetryPolicy(RetryConfig())
+    delay = policy.next_delay("GET", 1, response=make_response(status_code))
+    assert (delay is not None) is expected_retry
+
+
+def test_backoff_is_capped_full_jitter(max_jitter):
+    policy = RetryPolicy(RetryConfig(max_attempts=10, base_delay_seconds=0.5, max_delay_seconds=3.0))
+
+    delays = [policy.next_delay("GET", attempt) for attempt in range(1, 6)]
+
+    assert delays == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_attempts_are_limited():
+    policy = RetryPolicy(RetryConfig(max_attempts=2))
+    assert policy.next_delay("GET", 1) is not None
+    assert policy.next_delay("GET", 2) is None
+
+
+@pytest.mark.parametrize("status_code, request_headers, expected_retry", [
+    (503, None, False),
+    (None, None, False),
+    (429, None, True),
+    (503, {"Idempotency-Key": "abc"}, True),
+])
+def test_non_idempotent_requests(status_code, request_headers, expected_retry):
+    policy = RetryPolicy(RetryConfig())
+    response = make_response(status_code) if status_code is not None else None
+
+    delay = policy.next_delay("POST", 1, response=response, request_headers=request_headers)
+
+    assert (delay is not None) is expected_retry
+
+
+def test_retry_non_idempotent_opt_in():
+    policy = RetryPolicy(RetryConfig(retry_non_idempotent=True))
+    assert policy.next_delay("POST", 1, response=make_response(503)) is not None
+
+
+def test_retry_after_extends_delay_and_is_capped():
+    policy = RetryPolicy(RetryConfig(max_retry_after_seconds=10.0))
+
+    assert policy.next_delay("GET", 1, response=make_response(503, "4")) >= 4.0
+    assert policy.next_delay("GET", 1, response=make_response(503, "60")) is None
+
+
+def test_budget_caps_retries():
+    metrics = MetricsRegistry()
+    policy = RetryPolicy(RetryConfig(max_attempts=5, budget_ratio=0.5, budget_capacity=2), metrics)
+
+    assert policy.next_delay("GET", 1) is not None
+    assert policy.next_delay("GET", 1) is not None
+    assert policy.next_delay("GET", 1) is None
+
+    policy.record_request()
+    policy.record_request()
+    assert policy.next_delay("GET", 1) is not None
+
+    assert metrics.get(RETRY_ATTEMPTS) == 3
+    assert metrics.get(RETRY_BUDGET_EXHAUSTED) == 1
+
+
+def test_invalid_retry_config_raises():
+    with pytest.raises(SDKConfigError):
+        RetryConfig(max_attempts=0)
+    with pytest.raises(SDKConfigError):
+        RetryConfig(base_delay_seconds=2.0, max_delay_seconds=1.0)
+
+
+@pytest.mark.asyncio
+async def test_backend_retries_retryable_status(auth_client):
+    backend = DummyBackend(auth_client, retry_policy=RetryPolicy(FAST_RETRIES))
+    responses = [make_response(503), make_response(200)]
+
+    async def execute(method, url, token, **kwargs):
+        return responses.pop(0)
+
+    response = await backend._request_with_auth("GET", "https://x", execute_request=execute)
+
+    assert response.status_code == 200
+    assert responses == []
+
+
+@pytest.mark.asyncio
+async def test_backend_returns_last_response_when_attempts_run_out(auth_client):
+    backend = DummyBackend(auth_client, retry_policy=RetryPolicy(FAST_RETRIES))
+    execute = AsyncMock(return_value=make_response(502))
+
+    response = await backend._request_with_auth("GET", "https://x", execute_request=execute)
+
+    assert response.status_code == 502
+    assert execute.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_backend_does_not_retry_post_on_network_error(auth_client):
+    backend = DummyBackend(auth_client, retry_policy=RetryPolicy(FAST_RETRIES))
+    execute = AsyncMock(side_effect=RequestExecutionError("connection reset"))
+
+    with pytest.raises(RequestExecutionError):
+        await backend._request_with_auth("POST", "https://x", execute_request=execute, json={})
+
+    assert execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_backend_retries_get_on_network_error(auth_client):
+    backend = DummyBackend(auth_client, retry_policy=RetryPolicy(FAST_RETRIES))
+    execute = AsyncMock(side_effect=[RequestExecutionError("connection reset"), make_response(200)])
+
+    response = await backend._request_with_auth("GET", "https://x", execute_request=execute)
+
+    assert response.status_code == 200
+    assert execute.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_rate_limited_offers_are_retried(stand_in_server, backend_name):
+    stand_in_server.offers_rate_limited = 1
+    stand_in_server.retry_after = "0.1"
+
+    async with OffersClient(
+        base_url=stand_in_server.base_url, refresh_token="tok", backend_name=backend_name
+    ) as client:
+        offers = await client.offers.get_offers(uuid4())
+
+    assert len(offers) == 1
+    assert len(stand_in_server.offers_request_times) == 2
+    assert client.metrics.get(RETRY_ATTEMPTS) == 1
@@ -0,0 +1,139 @@
+from uuid import uuid4
+
+import pytest
+from aiohttp.test_utils import TestServer
+
+from sdk.client import OffersClient
+from sdk.config.routing_config import RoutingConfig
+from sdk.http import routing
+from sdk.http.routing import ROUTING_EJECTED_ENDPOINTS, ROUTING_EJECTIONS, EndpointRouter
+from sdk.utils.exceptions import SDKConfigError
+from sdk.utils.metrics import MetricsRegistry
+
+from tests.sdk.conftest import StandInState, build_stand_in_app
+
+EU, US = "https://eu.api", "https://us.api"
+CLOCKED_MODULE = routing
+
+
+def fail(router, base_url, times):
+    for _ in range(times):
+        permit, url = router.route(f"{EU}/offers")
+        assert url.startswith(base_url)
+        router.record(permit, latency=0.1, failed=True)
+
+
+def test_routing_config_validates_settings():
+    with pytest.raises(SDKConfigError):
+        RoutingConfig(ewma_alpha=0)
+    with pytest.raises(SDKConfigError):
+        RoutingConfig(eject_seconds=10.0, max_eject_seconds=5.0)
+
+
+def test_route_rewrites_primary_base_url_only():
+    router = EndpointRouter([EU + "/", US], RoutingConfig())
+
+    permit, url = router.route(f"{EU}/products/1/offers?force=1")
+    assert url in (f"{EU}/products/1/offers?force=1", f"{US}/products/1/offers?force=1")
+    assert router.stats()[permit.base_url].in_flight == 1
+    router.abandon(permit)
+    assert router.stats()[permit.base_url].in_flight == 0
+
+    assert router.route("https://other.api/offers") == (None, "https://other.api/offers")
+    assert router.route(f"{EU}rope.api/offers") == (None, f"{EU}rope.api/offers")
+
+
+def test_two_choices_prefer_lower_latency_weighted_by_in_flight():
+    router = EndpointRouter([EU, US], RoutingConfig())
+    router.stats()[EU].latency_ewma = 0.5
+    router.stats()[US].latency_ewma = 0.06
+
+    # US stays cheaper until eight requests are in flight to it
+    assert all(router.route(f"{EU}/offers")[1].startswith(US) for _ in range(8))
+    assert router.route(f"{EU}/offers")[1].startswith(EU)
+
+
+def test_latency_is_averaged_per_endpoint():
+    router = EndpointRouter([EU], RoutingConfig(ewma_alpha=0.5))
+    for latency in (0.2, 0.4):
+        permit, _ = router.route(f"{EU}/offers")
+        router.record(permit, latency=latency, failed=False)
+
+    assert router.stats()[EU].latency_ewma == pytest.approx(0.3)
+    assert router.stats()[EU].in_flight == 0
+
+
+def test_consecutive_failures_eject_until_probe_succeeds(clock):
+    metrics = MetricsRegistry()
+    router = EndpointRouter([EU], RoutingConfig(failures_to_eject=2, eject_seconds=10.0), metrics)
+
+    fail(router, EU, 2)
+    assert router.stats()[EU].ejected
+    assert metrics.snapshot()[ROUTING_EJECTIONS] == 1
+    assert metrics.snapshot()[ROUTING_EJECTED_ENDPOINTS] == 1
+
+    clock.now += 10.0
+    probe, _ = router.route(f"{EU}/offers")
+    assert probe.probe
+    router.record(probe, latency=0.1, failed=False)
+
+    assert not router.stats()[EU].ejected
+    assert metrics.snapshot()[ROUTING_EJECTED_ENDPOINTS] == 0
+
+
+def test_ejected_endpoint_gets_single_probe_and_failed_probe_doubles_ejection(clock):
+    router = EndpointRouter([EU, US], RoutingConfig(failures_to_eject=1, eject_seconds=10.0))
+    while not router.stats()[US].ejected:
+        permit, url = router.route(f"{EU}/offers")
+        router.record(permit, latency=0.1, failed=url.startswith(US))
+
+    assert all(url.startswith(EU) for url in (router.route(f"{EU}/offers")[1] for _ in range(10)))
+
+    clock.now += 10.0
+    probe, url = router.route(f"{EU}/offers")
+    assert probe.probe and url.startswith(US)
+    # The probe is still in flight, so other requests keep avoiding the ejected base URL
+    assert router.route(f"{EU}/offers")[1].startswith(EU)
+
+    router.record(probe, latency=0.1, failed=True)
+    router.record(probe, latency=0.1, failed=False)  # Settled permits are ignored
+    assert router.stats()[US].ejected_until == pytest.approx(clock.now + 20.0)
+
+
+def test_all_ejected_routes_to_endpoint_whose_ejection_ends_first(clock):
+    router = EndpointRouter([EU, US], RoutingConfig(failures_to_eject=1, eject_seconds=10.0))
+    router.stats()[EU].latency_ewma = 0.01
+    router.stats()[US].latency_ewma = 1.0
+    fail(router, EU, 1)
+    clock.now += 1.0
+    fail(router, US, 1)
+
+    assert router.route(f"{EU}/offers")[1].startswith(EU)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_failing_replica_is_ejected_and_tokens_come_from_primary(stand_in_server, backend_name):
+    replica = StandInState()
+    replica.offers_unavailable = 100
+    replica_server = TestServer(build_stand_in_app(replica))
+    await replica_server.start_server()
+    replica_url = str(replica_server.make_url("")).rstrip("/")
+    try:
+        async with OffersClient(
+            base_url=stand_in_server.base_url,
+            # The primary is listed after the replica, and still used for tokens and as the routing prefix
+            base_urls=[replica_url, stand_in_server.base_url],
+            refresh_token="tok",
+            backend_name=backend_name,
+            routing_config=RoutingConfig(failures_to_eject=2, eject_seconds=60.0),
+        ) as client:
+            for _ in range(10):
+                assert len(await client.offers.get_offers(uuid4())) == 1
+
+            assert client.router.stats()[replica_url].ejected
+            assert len(replica.events) <= 2
+            assert replica.auth_requests == 0
+            assert stand_in_server.auth_requests == 1
+    finally:
+        await replica_server.close()
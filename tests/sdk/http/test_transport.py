@@ -0,0 +1,106 @@
+from uuid import uuid4
+
+import pytest
+
+from sdk.client import OffersClient
+from sdk.config.pool_config import PoolConfig
+from sdk.http.transport import SharedTransport
+
+
+class FakeBackend:
+    built: list = []
+    closed: list = []
+
+    @classmethod
+    def build_transport(cls, pool_config, unix_socket_path, timeout_seconds):
+        pool = object()
+        cls.built.append(pool)
+        return pool
+
+    @classmethod
+    async def close_transport(cls, pool):
+        cls.closed.append(pool)
+
+
+class OtherBackend(FakeBackend):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_backend():
+    FakeBackend.built, FakeBackend.closed = [], []
+
+
+@pytest.mark.asyncio
+async def test_pool_is_closed_with_last_reference_and_reopened_on_demand():
+    transport = SharedTransport(pool_config=PoolConfig(max_connections=8))
+
+    transport.attach(FakeBackend)
+    transport.attach(FakeBackend)
+    assert FakeBackend.built == []
+    first_pool = transport.pool()
+    assert transport.pool() is first_pool
+    assert transport.references == 2
+
+    await transport.release()
+    assert FakeBackend.closed == []
+    await transport.release()
+    await transport.release()
+    assert FakeBackend.closed == [first_pool]
+    assert transport.references == 0
+
+    transport.attach(FakeBackend)
+    assert transport.pool() is not first_pool
+    assert len(FakeBackend.built) == 2
+
+
+def test_attached_transport_rejects_other_backend():
+    transport = SharedTransport()
+    transport.attach(FakeBackend)
+
+    with pytest.raises(ValueError, match="FakeBackend"):
+        transport.attach(OtherBackend)
+
+
+def test_client_backend_must_match_transport():
+    with pytest.raises(ValueError, match="shared transport"):
+        OffersClient(
+            base_url="https://api.example.com",
+            refresh_token="tok",
+            backend_name="requests",
+            transport=SharedTransport("httpx"),
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_clients_share_connections_but_not_auth_or_hooks(stand_in_server, backend_name):
+    transport = SharedTransport(backend_name)
+    hooked_urls: list[str] = []
+
+    async def record_hook(method: str, url: str, params: dict) -> None:
+        hooked_urls.append(url)
+
+    first = OffersClient(
+        base_url=stand_in_server.base_url, refresh_token="tenant-a", transport=transport,
+        request_hooks=[record_hook],
+    )
+    second = OffersClient(base_url=stand_in_server.base_url, refresh_token="tenant-b", transport=transport)
+    assert transport.references == 2
+
+    await first.offers.get_offers(uuid4())
+    await second.offers.get_offers(uuid4())
+
+    # Each client authenticates itself, and only its own hooks run
+    assert stand_in_server.auth_requests == 2
+    assert len(hooked_urls) == 1
+    assert len(stand_in_server.client_connections) == 1
+
+    await first.aclose()
+    await first.aclose()
+    assert transport.references == 1
+    assert len(await second.offers.get_offers(uuid4())) == 1
+    assert len(stand_in_server.client_connections) == 1
+
+    await second.aclose()
+    assert transport.references == 0
@@ -0,0 +1,35 @@
+from uuid import uuid4
+
+import pytest
+
+from sdk.client import OffersClient
+from sdk.config.sdk_config import SDKConfig
+from sdk.utils.exceptions import SDKConfigError
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_auth_and_api_traffic_use_unix_socket(stand_in_unix_server, backend_name):
+    async with OffersClient(
+        base_url="http://offers.local",
+        refresh_token="tok",
+        backend_name=backend_name,
+        unix_socket=stand_in_unix_server.base_url,
+    ) as client:
+        offers = await client.offers.get_offers(uuid4())
+        streamed_offers = [offer async for offer in client.offers.iter_offers(uuid4())]
+
+    assert stand_in_unix_server.auth_requests == 1
+    assert len(offers) == len(streamed_offers) == 1
+    assert stand_in_unix_server.events == ["offers", "offers"]
+
+
+@pytest.mark.parametrize("raw_value", ["unix:///run/offers.sock", "/run/offers.sock"])
+def test_unix_socket_accepts_url_or_path(raw_value):
+    config = SDKConfig(api_base_url="http://offers.local", refresh_token="y", unix_socket=raw_value)
+    assert config.unix_socket == "/run/offers.sock"
+
+
+def test_unix_socket_requires_plain_http_base_url():
+    with pytest.raises(SDKConfigError, match="http://"):
+        SDKConfig(api_base_url="https://offers.local", refresh_token="y", unix_socket="/run/offers.sock")
@@ -0,0 +1,97 @@
+import logging
+from uuid import uuid4
+
+import pytest
+
+from sdk.client import OffersClient
+from sdk.utils import logger as sdk_logger
+from sdk.utils.logger import configure_logging, logger, redact, redact_params
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def log_messages(monkeypatch):
+    monkeypatch.setattr(sdk_logger, "_payload_sample_rate", sdk_logger._payload_sample_rate)
+    previous_level = logger.level
+    handler = RecordingHandler()
+    logger.addHandler(handler)
+    try:
+        yield handler.messages
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(previous_level)
+
+
+def test_logger_defaults_to_warning():
+    assert logger.level == logging.WARNING
+
+
+def test_logger_leaves_output_to_application(monkeypatch):
+    assert [type(handler) for handler in logger.handlers] == [logging.NullHandler]
+
+    monkeypatch.setattr(sdk_logger, "_stderr_handler", None)
+    try:
+        configure_logging(log_to_stderr=True)
+        configure_logging(log_to_stderr=True)
+        assert [type(handler) for handler in logger.handlers] == [logging.NullHandler, logging.StreamHandler]
+    finally:
+        logger.removeHandler(sdk_logger._stderr_handler)
+
+
+def test_configure_logging_rejects_invalid_sample_rate():
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        configure_logging(payload_sample_rate=1.5)
+
+
+def test_tokens_and_credential_headers_are_redacted():
+    assert redact("eyJhbGciOiJIUzI1NiJ9.payload.signature") == "***ture"
+    assert redact("short-token") == "***"
+    assert redact_params({"json": {"id": 1}, "headers": {"Authorization": "Bearer abc", "Accept": "*/*"}}) == {
+        "json": {"id": 1}, "headers": {"Authorization": "***", "Accept": "*/*"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_debug_messages_are_not_formatted_at_warning_level(stand_in_server, log_messages):
+    client = OffersClient(base_url=stand_in_server.base_url, refresh_token="tok")
+
+    await client.offers.get_offers(uuid4())
+
+    assert log_messages == []
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_access_token_is_redacted(stand_in_server, log_messages):
+    client = OffersClient(base_url=stand_in_server.base_url, refresh_token="tok", log_level="DEBUG")
+
+    await client.offers.get_offers(uuid4())
+
+    assert "Received new access token: ***" in log_messages
+    assert not any("stand-in-token" in message for message in log_messages)
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sample_rate, payloads_logged", [(0.0, False), (1.0, True)])
+async def test_payloads_are_logged_for_sampled_requests(stand_in_server, log_messages, sample_rate, payloads_logged):
+    client = OffersClient(
+        base_url=stand_in_server.base_url, refresh_token="tok", log_level="DEBUG",
+        log_payload_sample_rate=sample_rate,
+    )
+
+    await client.products.register_product({"id": str(uuid4()), "name": "Phone", "description": "A phone"})
+
+    request_messages = [message for message in log_messages if message.startswith("[ProductsAPI]")]
+    assert len(request_messages) == 1
+    assert ("request_params=" in request_messages[0]) is payloads_logged
+    assert any(message.startswith("Registering Response data") for message in log_messages) is payloads_logged
+    await client.aclose()
@@ -0,0 +1,102 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from sdk.api.constatns import GET_OFFERS_ENDPOINT, PRODUCTS_ENDPOINT
+from sdk.client import OffersClient
+from sdk.http.interfaces import BaseResponse
+from sdk.plugins import MiddlewareChain, RequestPlugin, ResponsePlugin
+from sdk.utils.exceptions import OffersAPIError, PluginError
+
+
+class RecordingPlugin(RequestPlugin, ResponsePlugin):
+    def __init__(self, calls: list[str], name: str, **filters: Any):
+        self.calls: list[str] = calls
+        self.name: str = name
+        for attribute, value in filters.items():
+            setattr(self, attribute, value)
+
+    async def process_request(self, method: str, url: str, kwargs: dict[str, Any]) -> None:
+        self.calls.append(f"{self.name}:request")
+
+    async def process_response(self, response: BaseResponse) -> None:
+        self.calls.append(f"{self.name}:response")
+
+
+def test_empty_chain_selects_no_stages():
+    stages = MiddlewareChain().stages("GET", GET_OFFERS_ENDPOINT)
+
+    assert stages.request_stages == ()
+    assert stages.response_plugins == ()
+
+
+def test_stages_are_filtered_by_method_and_route_and_cached():
+    calls: list[str] = []
+    offers_only = RecordingPlugin(calls, "offers", methods={"get"}, routes={GET_OFFERS_ENDPOINT})
+    everywhere = RecordingPlugin(calls, "everywhere")
+    chain = MiddlewareChain([offers_only, everywhere], [offers_only, everywhere])
+
+    offers_stages = chain.stages("GET", GET_OFFERS_ENDPOINT)
+    register_stages = chain.stages("POST", PRODUCTS_ENDPOINT)
+
+    assert [stage.name for stage in offers_stages.request_stages] == ["RecordingPlugin", "RecordingPlugin"]
+    assert offers_stages.response_plugins == (offers_only, everywhere)
+    assert register_stages.response_plugins == (everywhere,)
+    assert chain.stages("GET", PRODUCTS_ENDPOINT).response_plugins == (everywhere,)
+    assert chain.stages("GET", GET_OFFERS_ENDPOINT) is offers_stages
+
+
+@pytest.mark.asyncio
+async def test_request_plugins_run_before_hooks():
+    calls: list[str] = []
+
+    async def trace_hook(method: str, url: str, params: dict) -> None:
+        calls.append("hook:request")
+
+    chain = MiddlewareChain([RecordingPlugin(calls, "plugin")], request_hooks=[trace_hook])
+
+    await chain.stages("GET", GET_OFFERS_ENDPOINT).process_request("GET", "https://api/offers", {})
+
+    assert calls == ["plugin:request", "hook:request"]
+
+
+@pytest.mark.asyncio
+async def test_failures_name_the_failing_stage():
+    class FailingPlugin(RequestPlugin):
+        async def process_request(self, method: str, url: str, kwargs: dict[str, Any]) -> None:
+            raise ValueError("Boom")
+
+    async def failing_hook(method: str, url: str, params: dict) -> None:
+        raise ValueError("Boom")
+
+    with pytest.raises(PluginError, match="Request plugin FailingPlugin failed: Boom"):
+        await MiddlewareChain([FailingPlugin()]).stages("GET", "/").process_request("GET", "https://api/", {})
+    with pytest.raises(OffersAPIError, match="Request hook failing_hook failed: Boom") as error_info:
+        await MiddlewareChain(request_hooks=[failing_hook]).stages("GET", "/").process_request("GET", "https://api/", {})
+    assert not isinstance(error_info.value, PluginError)
+
+
+@pytest.mark.asyncio
+async def test_client_runs_hooks_once_per_call_and_rebuilds_chain_on_register(stand_in_server):
+    calls: list[str] = []
+
+    async def trace_hook(method: str, url: str, params: dict) -> None:
+        calls.append("hook:request")
+
+    client = OffersClient(base_url=stand_in_server.base_url, refresh_token="tok", request_hooks=[trace_hook])
+    initial_chain = client._middleware
+
+    await client.offers.get_offers(uuid4())
+    assert calls == ["hook:request"]
+
+    calls.clear()
+    client.register_plugins(RecordingPlugin(calls, "offers", routes={GET_OFFERS_ENDPOINT}))
+    assert client._middleware is not initial_chain
+    assert client.products._middleware is client.offers._middleware is client._middleware
+
+    await client.offers.get_offers(uuid4())
+    await client.products.register_product({"id": str(uuid4()), "name": "Phone", "description": "A phone"})
+
+    assert calls == ["offers:request", "hook:request", "offers:response", "hook:request"]
+    await client.aclose()
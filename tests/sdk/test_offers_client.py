@@ -3,6 +3,15 @@ from unittest.mock import AsyncMock, MagicMock, patch, ANY
 import pytest
 
 from sdk.client import OffersClient, BACKEND_MAPPING
+from sdk.config.circuit_breaker_config import CircuitBreakerConfig
+from sdk.config.compression_config import CompressionConfig
+from sdk.config.concurrency_config import ConcurrencyConfig
+from sdk.config.hedging_config import HedgingConfig
+from sdk.config.rate_limit_config import RateLimitConfig
+from sdk.config.retry_config import RetryConfig
+from sdk.config.routing_config import RoutingConfig
+from sdk.config.warmup_config import WarmupConfig
+from sdk.config.pool_config import PoolConfig
 from sdk.plugins.interfaces import RequestPlugin, ResponsePlugin
 from sdk.utils.exceptions import SDKConfigError
 
@@ -37,33 +46,48 @@ def test_offers_client_initialization(
     mock_products_api_cls.return_value = mock_products_instance
     mock_offers_api_cls.return_value = mock_offers_instance
 
-    BACKEND_MAPPING["httpx"] = MagicMock(return_value=mock_http_backend_instance)
+    mock_backend_cls = MagicMock(return_value=mock_http_backend_instance)
 
-    OffersClient(
-        base_url="https://api.example.com",
-        refresh_token="tok",
-        backend_name="httpx",
-        cache_ttl_seconds=60,
-        request_hooks=None,
-        auth_client_factory=mock_auth_cls,
-    )
+    with patch.dict(BACKEND_MAPPING, {"httpx": mock_backend_cls}):
+        OffersClient(
+            base_url="https://api.example.com",
+            refresh_token="tok",
+            backend_name="httpx",
+            cache_ttl_seconds=60,
+            max_response_bytes=1024,
+            request_hooks=None,
+            auth_client_factory=mock_auth_cls,
+        )
 
     mock_auth_cls.assert_called_once_with(
         refresh_token="tok",
         base_url="https://api.example.com",
     )
 
-    BACKEND_MAPPING["httpx"].assert_called_once_with(
+    mock_backend_cls.assert_called_once_with(
         auth_client=mock_auth_instance,
-        request_hooks=ANY,
+        pool_config=ANY,
+        unix_socket_path=None,
+        compression_config=ANY,
+        metrics=ANY,
+        concurrency_limiter=None,
+        rate_limiter=None,
+        retry_policy=ANY,
+        circuit_breakers=None,
+        router=None,
+        transport=None,
+        deadline_seconds=None,
+        max_response_bytes=1024,
     )
 
     mock_products_api_cls.assert_called_once_with(
-        mock_http_backend_instance, "https://api.example.com"
+        mock_http_backend_instance, "https://api.example.com", compression_config=ANY, metrics=ANY,
+        deadline_seconds=None,
     )
 
     mock_offers_api_cls.assert_called_once_with(
-        mock_http_backend_instance, "https://api.example.com", cache_ttl_seconds=60
+        mock_http_backend_instance, "https://api.example.com", cache_ttl_seconds=60, hedging_config=ANY, metrics=ANY,
+        deadline_seconds=None,
     )
 
 
@@ -82,12 +106,24 @@ async def test_offers_client_with_aiohttp_backend():
             refresh_token="tok",
             backend_name="aiohttp",
             cache_ttl_seconds=60,
+            max_response_bytes=1024,
             auth_client_factory=lambda *args, **kwargs: mock_auth,
         )
 
         mock_backend.assert_called_once_with(
             auth_client=mock_auth,
-            request_hooks=[],
+            pool_config=ANY,
+            unix_socket_path=None,
+            compression_config=ANY,
+            metrics=ANY,
+            concurrency_limiter=None,
+            rate_limiter=None,
+            retry_policy=ANY,
+            circuit_breakers=None,
+            router=None,
+            transport=None,
+            deadline_seconds=None,
+            max_response_bytes=1024,
         )
         assert client._http_backend is mock_backend.return_value
 
@@ -98,9 +134,24 @@ async def test_offers_client_with_aiohttp_backend():
 @patch("sdk.client.SDKConfig")
 def test_offers_client_invalid_backend(mock_config):
     mock_config.return_value.api_base_url = "https://api"
+    mock_config.return_value.api_base_urls = ["https://api"]
     mock_config.return_value.refresh_token = "tok"
     mock_config.return_value.backend = "invalid"
     mock_config.return_value.ttl_seconds = 60
+    mock_config.return_value.deadline_seconds = None
+    mock_config.return_value.max_response_bytes = 1024
+    mock_config.return_value.log_level = None
+    mock_config.return_value.log_payload_sample_rate = None
+    mock_config.return_value.unix_socket = None
+    mock_config.return_value.pool_config = PoolConfig()
+    mock_config.return_value.compression_config = CompressionConfig()
+    mock_config.return_value.concurrency_config = ConcurrencyConfig()
+    mock_config.return_value.rate_limit_config = RateLimitConfig()
+    mock_config.return_value.retry_config = RetryConfig()
+    mock_config.return_value.circuit_breaker_config = CircuitBreakerConfig()
+    mock_config.return_value.hedging_config = HedgingConfig()
+    mock_config.return_value.warmup_config = WarmupConfig()
+    mock_config.return_value.routing_config = RoutingConfig()
 
     with pytest.raises(ValueError, match="Unsupported backend: invalid"):
         OffersClient()
@@ -122,9 +173,24 @@ def test_plugin_registration(
     mock_httpx_backend, mock_auth, mock_config,
 ):
     mock_config.return_value.api_base_url = "https://api"
+    mock_config.return_value.api_base_urls = ["https://api"]
     mock_config.return_value.refresh_token = "tok"
     mock_config.return_value.backend = "httpx"
     mock_config.return_value.ttl_seconds = 60
+    mock_config.return_value.deadline_seconds = None
+    mock_config.return_value.max_response_bytes = 1024
+    mock_config.return_value.log_level = None
+    mock_config.return_value.log_payload_sample_rate = None
+    mock_config.return_value.unix_socket = None
+    mock_config.return_value.pool_config = PoolConfig()
+    mock_config.return_value.compression_config = CompressionConfig()
+    mock_config.return_value.concurrency_config = ConcurrencyConfig()
+    mock_config.return_value.rate_limit_config = RateLimitConfig()
+    mock_config.return_value.retry_config = RetryConfig()
+    mock_config.return_value.circuit_breaker_config = CircuitBreakerConfig()
+    mock_config.return_value.hedging_config = HedgingConfig()
+    mock_config.return_value.warmup_config = WarmupConfig()
+    mock_config.return_value.routing_config = RoutingConfig()
 
     mock_product_instance = MagicMock()
     mock_offer_instance = MagicMock()
@@ -133,8 +199,8 @@ def test_plugin_registration(
 
     OffersClient(plugins=[MagicMock()])
 
-    mock_product_instance.set_plugins.assert_called_once()
-    mock_offer_instance.set_plugins.assert_called_once()
+    mock_product_instance.set_middleware.assert_called_once()
+    mock_offer_instance.set_middleware.assert_called_once()
 
 
 @pytest.mark.parametrize("plugin_list, expected_call_count", [
@@ -151,9 +217,24 @@ def test_plugins_applied_correctly(
     plugin_list, expected_call_count,
 ):
     mock_config.return_value.api_base_url = "https://api"
+    mock_config.return_value.api_base_urls = ["https://api"]
     mock_config.return_value.refresh_token = "tok"
     mock_config.return_value.backend = "httpx"
     mock_config.return_value.ttl_seconds = 60
+    mock_config.return_value.deadline_seconds = None
+    mock_config.return_value.max_response_bytes = 1024
+    mock_config.return_value.log_level = None
+    mock_config.return_value.log_payload_sample_rate = None
+    mock_config.return_value.unix_socket = None
+    mock_config.return_value.pool_config = PoolConfig()
+    mock_config.return_value.compression_config = CompressionConfig()
+    mock_config.return_value.concurrency_config = ConcurrencyConfig()
+    mock_config.return_value.rate_limit_config = RateLimitConfig()
+    mock_config.return_value.retry_config = RetryConfig()
+    mock_config.return_value.circuit_breaker_config = CircuitBreakerConfig()
+    mock_config.return_value.hedging_config = HedgingConfig()
+    mock_config.return_value.warmup_config = WarmupConfig()
+    mock_config.return_value.routing_config = RoutingConfig()
 
     products_instance = MagicMock()
     offers_instance = MagicMock()
@@ -162,8 +243,8 @@ def test_plugins_applied_correctly(
 
     OffersClient(plugins=plugin_list)
 
-    assert products_instance.set_plugins.call_count == expected_call_count
-    assert offers_instance.set_plugins.call_count == expected_call_count
+    assert products_instance.set_middleware.call_count == expected_call_count
+    assert offers_instance.set_middleware.call_count == expected_call_count
 
 
 @patch("sdk.client.SDKConfig")
@@ -177,9 +258,24 @@ async def test_offers_client_context_manager(
     mock_backend, mock_auth, mock_config
 ):
     mock_config.return_value.api_base_url = "https://api"
+    mock_config.return_value.api_base_urls = ["https://api"]
     mock_config.return_value.refresh_token = "tok"
     mock_config.return_value.backend = "httpx"
     mock_config.return_value.ttl_seconds = 60
+    mock_config.return_value.deadline_seconds = None
+    mock_config.return_value.max_response_bytes = 1024
+    mock_config.return_value.log_level = None
+    mock_config.return_value.log_payload_sample_rate = None
+    mock_config.return_value.unix_socket = None
+    mock_config.return_value.pool_config = PoolConfig()
+    mock_config.return_value.compression_config = CompressionConfig()
+    mock_config.return_value.concurrency_config = ConcurrencyConfig()
+    mock_config.return_value.rate_limit_config = RateLimitConfig()
+    mock_config.return_value.retry_config = RetryConfig()
+    mock_config.return_value.circuit_breaker_config = CircuitBreakerConfig()
+    mock_config.return_value.hedging_config = HedgingConfig()
+    mock_config.return_value.warmup_config = WarmupConfig()
+    mock_config.return_value.routing_config = RoutingConfig()
 
     client = OffersClient()
     client._http_backend.aclose = AsyncMock()
@@ -188,3 +284,18 @@ async def test_offers_client_context_manager(
         assert c is client
 
     client._http_backend.aclose.assert_awaited_once()
+
+
+def test_offers_client_builds_concurrency_limiter_when_enabled():
+    client = OffersClient(
+        base_url="https://api.example.com",
+        refresh_token="tok",
+        backend_name="httpx",
+        concurrency_config=ConcurrencyConfig(enabled=True, initial_limit=8),
+        auth_client_factory=lambda *args, **kwargs: MagicMock(),
+    )
+
+    assert client.concurrency_limiter is not None
+    assert client.concurrency_limiter.limit == 8
+    assert client._http_backend.concurrency_limiter is client.concurrency_limiter
+    assert client.metrics.get("concurrency.limit") == 8
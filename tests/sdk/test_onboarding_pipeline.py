@@ -0,0 +1,80 @@
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from sdk.api.pipeline import OnboardingPipeline
+from sdk.client import OffersClient
+from sdk.models.offer import Offer
+from sdk.utils.exceptions import OffersAPIError
+
+
+def _make_products(count):
+    return [{"id": str(uuid4()), "name": f"P{index}", "description": "d"} for index in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_onboarding_overlaps_registration_and_offers(stand_in_server):
+    stand_in_server.register_delay = 0.01
+    products = _make_products(6)
+
+    async with OffersClient(base_url=stand_in_server.base_url, refresh_token="tok") as client:
+        results = [
+            result async for result in client.onboard_products(
+                products, register_concurrency=1, offers_concurrency=2, queue_size=1
+            )
+        ]
+
+    assert sorted(result.index for result in results) == list(range(6))
+    assert all(result.ok and isinstance(result.offers[0], Offer) for result in results)
+    # Offers retrieval started while registrations were still being sent
+    assert stand_in_server.events.index("offers") < len(stand_in_server.events) - 1 - \
+        stand_in_server.events[::-1].index("register")
+
+
+@pytest.mark.asyncio
+async def test_onboarding_continues_after_conflict_and_reports_failures(stand_in_server):
+    products = _make_products(2)
+    stand_in_server.registered[products[0]["id"]] = products[0]
+    products.append({"name": "missing id"})
+
+    async with OffersClient(base_url=stand_in_server.base_url, refresh_token="tok") as client:
+        results = {result.index: result async for result in client.onboard_products(products)}
+
+    assert results[0].ok and results[0].offers
+    assert results[1].ok and results[1].registered_product["id"] == products[1]["id"]
+    assert not results[2].ok
+
+
+@pytest.mark.asyncio
+async def test_onboarding_surfaces_input_errors(stand_in_server):
+    def broken_products():
+        yield _make_products(1)[0]
+        raise RuntimeError("input broke")
+
+    async with OffersClient(base_url=stand_in_server.base_url, refresh_token="tok") as client:
+        with pytest.raises(RuntimeError, match="input broke"):
+            async for _ in client.onboard_products(broken_products()):
+                pass
+
+
+
+@pytest.mark.asyncio
+async def test_onboarding_closes_early_with_full_queues():
+    async def register_product(product_data):
+        if product_data["name"] == "P0":
+            raise OffersAPIError("rejected")
+        await asyncio.Event().wait()
+
+    products_api = AsyncMock()
+    products_api.register_product.side_effect = register_product
+    pipeline = OnboardingPipeline(
+        products_api, AsyncMock(), register_concurrency=1, offers_concurrency=1, queue_size=1
+    )
+    results = pipeline.run(_make_products(10))
+
+    assert not (await results.__anext__()).ok
+    # Let the register worker get stuck on P1 and the feed wait for room in the full queue
+    await asyncio.sleep(0.05)
+    await asyncio.wait_for(results.aclose(), timeout=1.0)
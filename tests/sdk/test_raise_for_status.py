@@ -48,3 +48,14 @@ def test_raise_for_status_with_text_passes_on_204():
 def test_raise_for_status_with_text_passes_on_302():
     response = DummyResponse(status_code=302, text="redirect")
     assert raise_for_status_with_text(response) is None
+
+
+def test_raise_for_status_with_text_does_not_decode_successful_body():
+    from sdk.http.response import BufferedResponse
+
+    class LazyResponse(BufferedResponse):
+        status_code = 200
+
+    response = LazyResponse(b'{"ok": true}')
+    raise_for_status_with_text(response)
+    assert response._decoded_text is None
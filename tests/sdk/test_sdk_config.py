@@ -1,5 +1,6 @@
 import pytest
 import yaml
+from sdk.config.pool_config import PoolConfig
 from sdk.config.sdk_config import SDKConfig
 from sdk.utils.exceptions import SDKConfigError
 
@@ -73,3 +74,184 @@ def test_config_raises_on_invalid_backend(monkeypatch):
     monkeypatch.delenv("BACKEND", raising=False)
     with pytest.raises(SDKConfigError, match="Invalid backend: invalid"):
         SDKConfig(api_base_url="https://x", refresh_token="y", backend="invalid")
+
+
+def test_pool_config_resolved_from_env_and_yaml(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump({"pool_max_connections": 50, "pool_read_timeout": 2.5}))
+    monkeypatch.setenv("POOL_MAX_CONNECTIONS", "200")
+    monkeypatch.setenv("POOL_MAX_CONNECTIONS_PER_HOST", "40")
+
+    config = SDKConfig(api_base_url="https://x", refresh_token="y", config_path=str(config_path))
+
+    assert config.pool_config.max_connections == 200
+    assert config.pool_config.max_connections_per_host == 40
+    assert config.pool_config.read_timeout == 2.5
+    assert config.pool_config.connect_timeout is None
+    assert config.pool_config.keepalive_expiry == 5.0
+
+
+def test_explicit_pool_config_wins(monkeypatch):
+    monkeypatch.setenv("POOL_MAX_CONNECTIONS", "200")
+    pool_config = PoolConfig(max_connections=7)
+
+    config = SDKConfig(api_base_url="https://x", refresh_token="y", pool_config=pool_config)
+
+    assert config.pool_config is pool_config
+
+
+def test_invalid_pool_setting_raises(monkeypatch):
+    monkeypatch.setenv("POOL_MAX_CONNECTIONS", "many")
+    with pytest.raises(SDKConfigError, match="Invalid value for pool setting max_connections"):
+        SDKConfig(api_base_url="https://x", refresh_token="y")
+
+
+@pytest.mark.parametrize("raw_value, expected", [("true", True), ("1", True), ("off", False)])
+def test_http2_flag_resolved_from_env(monkeypatch, raw_value, expected):
+    monkeypatch.setenv("POOL_HTTP2", raw_value)
+    config = SDKConfig(api_base_url="https://x", refresh_token="y")
+    assert config.pool_config.http2 is expected
+
+
+def test_compression_config_resolved_from_env(monkeypatch):
+    monkeypatch.setenv("API_BASE_URL", "https://env.example.com")
+    monkeypatch.setenv("REFRESH_TOKEN", "env-token")
+    monkeypatch.setenv("COMPRESSION_ACCEPT_ENCODING", "true")
+    monkeypatch.setenv("COMPRESSION_MIN_COMPRESS_BYTES", "4096")
+
+    config = SDKConfig()
+
+    assert config.compression_config.accept_encoding is True
+    assert config.compression_config.compress_requests is False
+    assert config.compression_config.min_compress_bytes == 4096
+
+
+def test_concurrency_config_resolved_from_env(monkeypatch):
+    monkeypatch.setenv("CONCURRENCY_ENABLED", "yes")
+    monkeypatch.setenv("CONCURRENCY_MAX_LIMIT", "50")
+
+    config = SDKConfig(api_base_url="https://x", refresh_token="y")
+
+    assert config.concurrency_config.enabled is True
+    assert config.concurrency_config.max_limit == 50
+    assert config.concurrency_config.initial_limit == 20
+
+
+def test_invalid_concurrency_limits_raise(monkeypatch):
+    monkeypatch.setenv("CONCURRENCY_MIN_LIMIT", "30")
+    with pytest.raises(SDKConfigError, match="Concurrency limits"):
+        SDKConfig(api_base_url="https://x", refresh_token="y")
+
+
+def test_rate_limit_endpoint_limits_resolved_from_env(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_ENABLED", "true")
+    monkeypatch.setenv("RATE_LIMIT_ENDPOINT_LIMITS", '{"/products/{product_id}/offers": [5, 10]}')
+
+    config = SDKConfig(api_base_url="https://x", refresh_token="y")
+
+    assert config.rate_limit_config.enabled is True
+    assert config.rate_limit_config.limit_for("/products/{product_id}/offers") == (5.0, 10)
+
+
+def test_invalid_rate_limit_endpoint_limits_raise(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_ENDPOINT_LIMITS", "not json")
+    with pytest.raises(SDKConfigError, match="Invalid value for rate_limit setting endpoint_limits"):
+        SDKConfig(api_base_url="https://x", refresh_token="y")
+
+
+def test_retry_config_resolved_from_env(monkeypatch):
+    monkeypatch.setenv("RETRY_MAX_ATTEMPTS", "5")
+    monkeypatch.setenv("RETRY_STATUSES", "429, 503")
+
+    config = SDKConfig(api_base_url="https://x", refresh_token="y")
+
+    assert config.retry_config.max_attempts == 5
+    assert config.retry_config.statuses == (429, 503)
+
+
+def test_hedging_config_resolved_from_env(monkeypatch):
+    monkeypatch.setenv("HEDGING_ENABLED", "true")
+    monkeypatch.setenv("HEDGING_PERCENTILE", "0.9")
+
+    config = SDKConfig(api_base_url="https://x", refresh_token="y")
+
+    assert config.hedging_config.enabled is True
+    assert config.hedging_config.percentile == 0.9
+    assert config.hedging_config.max_hedge_ratio == 0.1
+
+
+def test_deadline_seconds_resolved_from_env(monkeypatch):
+    monkeypatch.setenv("DEADLINE_SECONDS", "2.5")
+    config = SDKConfig(api_base_url="https://x", refresh_token="y")
+    assert config.deadline_seconds == 2.5
+
+
+def test_invalid_deadline_seconds_raise(monkeypatch):
+    monkeypatch.setenv("DEADLINE_SECONDS", "0")
+    with pytest.raises(SDKConfigError, match="deadline_seconds"):
+        SDKConfig(api_base_url="https://x", refresh_token="y")
+
+
+def test_max_response_bytes_resolved_from_env(monkeypatch):
+    monkeypatch.setenv("MAX_RESPONSE_BYTES", "1048576")
+    config = SDKConfig(api_base_url="https://x", refresh_token="y")
+    assert config.max_response_bytes == 1048576
+
+
+def test_invalid_max_response_bytes_raise(monkeypatch):
+    monkeypatch.setenv("MAX_RESPONSE_BYTES", "-1")
+    with pytest.raises(SDKConfigError, match="max_response_bytes"):
+        SDKConfig(api_base_url="https://x", refresh_token="y")
+
+
+def test_log_settings_resolved_from_env(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "debug")
+    monkeypatch.setenv("LOG_PAYLOAD_SAMPLE_RATE", "0.05")
+    config = SDKConfig(api_base_url="https://x", refresh_token="y")
+    assert config.log_level == "DEBUG"
+    assert config.log_payload_sample_rate == 0.05
+
+
+def test_invalid_log_level_raise(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "chatty")
+    with pytest.raises(SDKConfigError, match="log_level"):
+        SDKConfig(api_base_url="https://x", refresh_token="y")
+
+
+def test_warmup_config_resolved_from_env(monkeypatch):
+    monkeypatch.setenv("WARMUP_ON_ENTER", "true")
+    monkeypatch.setenv("WARMUP_CONNECTIONS", "8")
+
+    config = SDKConfig(api_base_url="https://x", refresh_token="y")
+
+    assert config.warmup_config.on_enter is True
+    assert config.warmup_config.connections == 8
+
+
+def test_base_urls_resolved_from_env_with_primary_first(monkeypatch):
+    monkeypatch.delenv("API_BASE_URL", raising=False)
+    monkeypatch.setenv("API_BASE_URLS", "https://eu.api, https://us.api")
+    monkeypatch.setenv("ROUTING_FAILURES_TO_EJECT", "5")
+
+    config = SDKConfig(refresh_token="y")
+    assert config.api_base_url == "https://eu.api"
+    assert config.api_base_urls == ["https://eu.api", "https://us.api"]
+    assert config.routing_config.failures_to_eject == 5
+
+    config = SDKConfig(api_base_url="https://primary.api", refresh_token="y")
+    assert config.api_base_urls == ["https://primary.api", "https://eu.api", "https://us.api"]
+
+    config = SDKConfig(api_base_url="https://us.api", refresh_token="y")
+    assert config.api_base_urls == ["https://us.api", "https://eu.api"]
+
+
+def test_base_urls_resolved_from_yaml_list(tmp_path, monkeypatch):
+    monkeypatch.delenv("API_BASE_URL", raising=False)
+    monkeypatch.delenv("API_BASE_URLS", raising=False)
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.safe_dump({"api_base_urls": ["https://eu.api", "https://us.api"]}))
+
+    config = SDKConfig(refresh_token="y", config_path=str(config_file))
+
+    assert config.api_base_url == "https://eu.api"
+    assert config.api_base_urls == ["https://eu.api", "https://us.api"]
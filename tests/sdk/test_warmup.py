@@ -0,0 +1,78 @@
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from sdk.client import OffersClient
+from sdk.config.warmup_config import WarmupConfig
+from sdk.http.warmup import WARMUP_TOKEN_SECONDS, preload_validators
+from sdk.utils.exceptions import AuthRequestError, SDKConfigError
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend_name", ["httpx", "aiohttp", "requests"])
+async def test_warmup_fetches_token_and_opens_connections(stand_in_server, backend_name):
+    async with OffersClient(
+        base_url=stand_in_server.base_url,
+        refresh_token="tok",
+        backend_name=backend_name,
+    ) as client:
+        report = await client.warmup(connections=3)
+
+        assert stand_in_server.auth_requests == 1
+        assert report.connections_opened == 3
+        assert len(stand_in_server.client_connections) == 3
+        assert report.total_seconds >= report.token_seconds > 0
+        assert client.metrics.get(WARMUP_TOKEN_SECONDS) == report.token_seconds
+
+        # The first request reuses the token and a warm connection
+        await client.offers.get_offers(uuid4())
+        assert stand_in_server.auth_requests == 1
+        assert len(stand_in_server.client_connections) == 3
+
+
+@pytest.mark.asyncio
+async def test_warmup_runs_on_enter_when_configured(stand_in_server):
+    async with OffersClient(
+        base_url=stand_in_server.base_url,
+        refresh_token="tok",
+        warmup_config=WarmupConfig(on_enter=True, connections=2),
+    ):
+        assert stand_in_server.auth_requests == 1
+        assert len(stand_in_server.client_connections) == 2
+
+
+@pytest.mark.asyncio
+async def test_client_is_closed_when_warmup_on_enter_fails(stand_in_server):
+    client = OffersClient(
+        base_url=stand_in_server.base_url,
+        refresh_token="tok",
+        warmup_config=WarmupConfig(on_enter=True),
+    )
+
+    with patch.object(client, "warmup", AsyncMock(side_effect=AuthRequestError("auth server down"))), \
+            patch.object(client._http_backend, "aclose", AsyncMock()) as backend_close:
+        with pytest.raises(AuthRequestError):
+            async with client:
+                pass
+
+    backend_close.assert_awaited_once()
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_connections_are_reported_not_raised(stand_in_server):
+    async with OffersClient(base_url=stand_in_server.base_url, refresh_token="tok") as client:
+        opened = await client._http_backend.warm_connections("http://127.0.0.1:1", 2)
+
+    assert opened == 0
+
+
+def test_preload_validators_is_repeatable():
+    preload_validators()
+    preload_validators()
+
+
+def test_invalid_warmup_config_raises():
+    with pytest.raises(SDKConfigError):
+        WarmupConfig(connections=-1)